@@ -0,0 +1,16 @@
+# Compiles shadowcraft/objects/class_data_tables.py into the
+# shadowcraft/objects/class_data.bundle that class_data.Util maps at run
+# time. Run it after changing the tables.
+from os import path
+import sys
+sys.path.append(path.abspath(path.join(path.dirname(__file__), '..')))
+
+from shadowcraft.core import data_bundle
+from shadowcraft.core import i18n
+from shadowcraft.objects import class_data
+
+i18n.set_language('local')
+
+tables = class_data.build_tables()
+data_bundle.write_bundle(class_data.bundle_path, tables, class_data.get_tables_digest())
+print 'Wrote {count} tables to {path}'.format(count=len(tables), path=class_data.bundle_path)
@@ -3,8 +3,8 @@ from os import path
 import sys
 sys.path.append(path.abspath(path.join(path.dirname(__file__), '..')))
 
-from shadowcraft.calcs.rogue.darkmantle import DarkmantleCalculator
-from shadowcraft.calcs.rogue.darkmantle import settings
+from shadowcraft.calcs.darkmantle import DarkmantleCalculator
+from shadowcraft.calcs.darkmantle import settings
 
 from shadowcraft.objects import buffs
 from shadowcraft.objects import race
@@ -34,9 +34,8 @@ test_buffs = buffs.Buffs(
         'stat_multiplier_buff',
         'crit_chance_buff',
         'mastery_buff',
-        'melee_haste_buff',
+        'haste_buff',
         'attack_power_buff',
-        'spell_haste_buff',
         'armor_debuff',
         'physical_vulnerability_debuff',
         'spell_damage_debuff',
@@ -50,10 +49,10 @@ test_mh = stats.Weapon(18846.0, 2.6, 'axe', 'dancing_steel')
 test_oh = stats.Weapon(13047.0, 1.8, 'dagger', 'dancing_steel')
 
 # Set up procs.
-test_procs = procs.ProcsList(('heroic_war_assurance_of_consequence', 2), ('heroic_war_haromms_talisman', 2), 'legendary_capacitive_meta', 'fury_of_xuen')
+test_procs = procs.ProcsList(('assurance_of_consequence', 580), ('haromms_talisman', 580), 'legendary_capacitive_meta', 'fury_of_xuen')
 
 # Set up gear buffs.
-test_gear_buffs = stats.GearBuffs('rogue_t16_2pc', 'rogue_t16_4pc', 'leather_specialization', 'virmens_bite', 'virmens_bite_prepot')
+test_gear_buffs = stats.GearBuffs('rogue_t16_2pc', 'rogue_t16_4pc', 'leather_specialization')
 
 # Set up a calcs object..
 test_stats = stats.Stats(test_mh, test_oh, test_procs, test_gear_buffs,
@@ -62,18 +61,21 @@ test_stats = stats.Stats(test_mh, test_oh, test_procs, test_gear_buffs,
                          stam=35869,
                          crit=3851,
                          haste=18871,
-                         mastery=8574)
+                         mastery=8574,
+                         readiness=6000,
+                         multistrike=6000)
 
 # Initialize talents..
-test_talents = talents.Talents('332213', test_class, test_level)
+test_talents = talents.Talents('3322131', test_class, test_level)
 
 # Set up glyphs.
-glyph_list = ['recuperate']
+glyph_list = ['energy', 'disappearance']
 test_glyphs = glyphs.Glyphs(test_class, *glyph_list)
 
 # Set up settings.
-test_cycle = settings.CombatCycle(stack_cds=True, weapon_swap=False)
-test_settings = settings.Settings(test_cycle, response_time=.5, latency=.03, merge_damage=True)
+test_cycle = settings.CombatCycle(revealing_strike_pooling=True, blade_flurry=False)
+test_settings = settings.Settings(test_cycle, response_time=.5, duration=360, dmg_poison='dp', utl_poison='lp',
+                                  latency=.03, merge_damage=True, use_opener='always', opener_name='ambush')
 
 # Build a DPS object.
 calculator = DarkmantleCalculator(test_stats, test_talents, test_glyphs, test_buffs, test_race, test_settings, test_level)
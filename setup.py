@@ -8,6 +8,7 @@ setup(
         'shadowcraft.calcs', 'shadowcraft.calcs.rogue', 'shadowcraft.calcs.rogue.Aldriana',
         'shadowcraft.core',
         'shadowcraft.objects'],
+    package_data={'shadowcraft.objects': ['class_data.bundle']},
     license='LGPL',
     long_description=open('README').read(),
 )
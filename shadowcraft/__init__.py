@@ -1,4 +1,13 @@
-import gettext
 import __builtin__
 
-__builtin__._ = gettext.gettext
+# Messages are wrapped in _() throughout the package. This is the only place
+# it's installed; core.i18n.set_language replaces it with a translation.
+# Until then messages go through gettext's default domain, and gettext is
+# only imported once a message is actually needed, which is usually when an
+# exception is raised.
+
+def _(message):
+    import gettext
+    return gettext.gettext(message)
+
+__builtin__._ = _
@@ -1,11 +1,9 @@
-import gettext
-import __builtin__
 import math
 
-__builtin__._ = gettext.gettext
-
 from shadowcraft.core import exceptions
 from shadowcraft.calcs import armor_mitigation
+from shadowcraft.calcs import parallel
+from shadowcraft.calcs import proc_uptime
 from shadowcraft.objects import class_data
 from shadowcraft.objects import talents
 from shadowcraft.objects import procs
@@ -30,6 +28,17 @@ class DamageCalculator(object):
     default_ep_stats = []
     # normalize_ep_stat is the stat with value 1 EP, override in your subclass
     normalize_ep_stat = None
+    # See build_rppm_uptime_table.
+    rppm_uptime_table = None
+    # The methods a shadowcraft.calcs.profiling.Profiler times, by span name.
+    # Extend it in your subclass with the stages of your model.
+    profiled_methods = {
+        'get_dps': 'get_dps',
+        'get_dps_for_stat_deltas': 'ep_perturbations',
+        'get_dps_gradient': 'ep_gradient',
+        'set_uptimes': 'proc_uptimes',
+        'set_rppm_uptimes': 'proc_uptimes',
+    }
 
     def __init__(self, stats, talents, glyphs, buffs, race, settings=None, level=100, target_level=None, char_class='rogue'):
         self.WOW_BUILD_TARGET = '6.0.0' # should reflect the game patch being targetted
@@ -117,45 +126,61 @@ class DamageCalculator(object):
         if self.get_version_number:
             damage_breakdown['version_' + self.WOW_BUILD_TARGET + '_' + self.SHADOWCRAFT_BUILD] = [.0, 0]
     
+    def get_span_args(self, method, args):
+        # What a profiling span records besides its timing, once method has
+        # returned: args are the positional arguments it was called with.
+        # Uptimes are worked out for lists of procs at once, so their spans
+        # name the procs.
+        if method in ('set_uptimes', 'set_rppm_uptimes'):
+            return {'procs': [proc.proc_name for proc in args[0]]}
+        return None
+
+    def get_proc_haste_multiplier(self, haste_rating=None):
+        if haste_rating is None:
+            haste_rating = self.base_stats['haste']
+        return self.stats.get_haste_multiplier_from_rating(haste_rating) * self.buffs.haste_multiplier() * self.true_haste_mod
+
     def set_rppm_uptime(self, proc):
-        #http://iam.yellingontheinternet.com/2013/04/12/theorycraft-201-advanced-rppm/
-        haste = 1.
-        if proc.haste_scales:
-            haste *= self.stats.get_haste_multiplier_from_rating(self.base_stats['haste']) * self.buffs.haste_multiplier() * self.true_haste_mod
-        #The 1.1307 is a value that increases the proc rate due to bad luck prevention. It /should/ be constant among all rppm proc styles
-        if not proc.icd:
-            if proc.max_stacks <= 1:
-                proc.uptime = 1.1307 * (1 - math.e ** (-1 * haste * proc.get_rppm_proc_rate() * proc.duration / 60))
-            else:
-                lambd = haste * proc.get_rppm_proc_rate() * proc.duration / 60
-                e_lambda = math.e ** lambd
-                e_minus_lambda = math.e ** (-1 * lambd)
-                proc.uptime = 1.1307 * (e_lambda - 1) * (1 - ((1 - e_minus_lambda) ** proc.max_stacks))
-        else:
-            mean_proc_time = 60. / (haste * proc.get_rppm_proc_rate()) + proc.icd - min(proc.icd, 10)
-            proc.uptime = 1.1307 * proc.duration / mean_proc_time
-    
-    def set_uptime(self, proc, attacks_per_second, crit_rates):
-        if proc.is_real_ppm():
-            self.set_rppm_uptime(proc)
-        else:
-            procs_per_second = self.get_procs_per_second(proc, attacks_per_second, crit_rates)
+        self.set_rppm_uptimes([proc])
+
+    def set_rppm_uptimes(self, procs):
+        if self.rppm_uptime_table is not None and self.base_stats['haste'] in self.rppm_uptime_table:
+            uptimes = self.rppm_uptime_table[self.base_stats['haste']]
+            if all(proc in uptimes for proc in procs):
+                for proc in procs:
+                    proc.uptime = uptimes[proc]
+                return
+        for proc, row in zip(procs, proc_uptime.rppm_uptimes(procs, [self.get_proc_haste_multiplier()])):
+            proc.uptime = row[0]
+
+    def build_rppm_uptime_table(self, procs, haste_ratings):
+        # Uptimes of the procs for each of the haste ratings, all in one
+        # kernel call; while it is set as rppm_uptime_table, set_rppm_uptimes
+        # looks the uptimes up instead of working them out. Meant for the
+        # batched ep runs, where only a handful of haste values ever come up.
+        haste_ratings = list(set(haste_ratings))
+        rows = proc_uptime.rppm_uptimes(procs, [self.get_proc_haste_multiplier(rating) for rating in haste_ratings])
+        table = {}
+        for index, rating in enumerate(haste_ratings):
+            table[rating] = dict((proc, row[index]) for proc, row in zip(procs, rows))
+        return table
 
-            if proc.icd:
-                proc.uptime = proc.duration / (proc.icd + 1. / procs_per_second)
-            else:
-                if procs_per_second >= 1:
-                    self.set_uptime_for_ramping_proc(proc, procs_per_second)
-                else:
-                # See http://elitistjerks.com/f31/t20747-advanced_rogue_mechanics_discussion/#post621369
-                # for the derivation of this formula.
-                    q = 1 - procs_per_second
-                    Q = q ** proc.duration
-                    if Q < .0001:
-                        self.set_uptime_for_ramping_proc(proc, procs_per_second)
-                    else:
-                        P = 1 - Q
-                        proc.uptime = P * (1 - P ** proc.max_stacks) / Q
+    def set_uptime(self, proc, attacks_per_second, crit_rates):
+        self.set_uptimes([proc], attacks_per_second, crit_rates)
+
+    def set_uptimes(self, procs, attacks_per_second, crit_rates):
+        rppm_procs = [proc for proc in procs if proc.is_real_ppm()]
+        if rppm_procs:
+            self.set_rppm_uptimes(rppm_procs)
+        triggered_procs = [proc for proc in procs if not proc.is_real_ppm()]
+        if triggered_procs:
+            procs_per_second = self.get_procs_per_second_for_procs(triggered_procs, attacks_per_second, crit_rates)
+            rows = proc_uptime.triggered_uptimes(triggered_procs, [[rate] for rate in procs_per_second], self.settings.duration)
+            for proc, row in zip(triggered_procs, rows):
+                proc.uptime = row[0]
+
+    def get_procs_per_second_for_procs(self, procs, attacks_per_second, crit_rates):
+        return [self.get_procs_per_second(proc, attacks_per_second, crit_rates) for proc in procs]
     
     def average_damage_breakdowns(self, aps_dict, denom=180):
         final_breakdown = {}
@@ -178,31 +203,263 @@ class DamageCalculator(object):
         
         return dps
 
-    def get_ep(self, ep_stats=None, normalize_ep_stat=None, baseline_dps=None):
+    def get_dps_for_stat_deltas(self, stat_deltas):
+        # Takes a list of {stat: amount} dicts and returns the dps with each
+        # of them added to the current stats, in the same order; an empty
+        # dict gives the baseline dps. This generic version runs get_dps()
+        # once per entry. Override it in your modeler if the perturbations
+        # can share part of the work.
+        dps_values = []
+        for deltas in stat_deltas:
+            for stat, amount in deltas.items():
+                setattr(self.stats, stat, getattr(self.stats, stat) + amount)
+            try:
+                dps_values.append(self.get_dps())
+            finally:
+                for stat, amount in deltas.items():
+                    setattr(self.stats, stat, getattr(self.stats, stat) - amount)
+        return dps_values
+
+    # What a character of get_dps_for_characters can give in place of the
+    # calculator's own inputs.
+    character_inputs = ('stats', 'talents', 'glyphs', 'buffs', 'race')
+
+    def get_dps_for_characters(self, characters, processes=1):
+        # Returns the dps of each of the characters, in the same order. They
+        # share this calculator's settings and level; a character is a dict
+        # of any of the character_inputs, objects like the ones a calculator
+        # is built from, and of {stat: value} pairs for the Stats.stat_names,
+        # which replace the values of its stats. A character that gives any
+        # of the inputs gives its stats too; one that only gives stat values
+        # is this calculator's character with those values. Characters whose
+        # inputs only differ in their stat values share one calculator (see
+        # group_characters) and are evaluated together with
+        # get_dps_for_stat_values. This calculator's own stats are restored
+        # afterwards. With processes other than 1 the characters are split in
+        # chunks over a process pool (None uses one process per cpu), keeping
+        # the groups together.
+        for character in characters:
+            for name in character:
+                if name not in self.character_inputs and name not in self.stats.stat_names:
+                    raise exceptions.InvalidInputException(_('Unknown stat {stat}').format(stat=name))
+            if 'stats' not in character and any(name in character for name in self.character_inputs):
+                raise exceptions.InvalidInputException(_('A character with its own inputs needs its own stats'))
+        groups = self.group_characters(characters)
+        dps_values = [None] * len(characters)
+        if processes != 1:
+            order = [index for inputs, indices in groups for index in indices]
+            results = parallel.get_dps_for_characters(self, [characters[index] for index in order], processes)
+            for index, dps in zip(order, results):
+                dps_values[index] = dps
+            return dps_values
+        stat_names = self.stats.stat_names
+        for inputs, indices in groups:
+            if inputs is None:
+                calculator = self
+                stat_values = [characters[index] for index in indices]
+            else:
+                # Read before building the calculator, which adjusts the
+                # stats of the first of them in place.
+                stat_values = []
+                for index in indices:
+                    character = characters[index]
+                    values = dict((stat, getattr(character['stats'], stat)) for stat in stat_names)
+                    values.update((stat, value) for stat, value in character.items() if stat in stat_names)
+                    stat_values.append(values)
+                calculator, adjustments = self.get_character_calculator(inputs)
+                for values in stat_values:
+                    for stat, amount in adjustments.items():
+                        values[stat] += amount
+            for index, dps in zip(indices, calculator.get_dps_for_stat_values(stat_values)):
+                dps_values[index] = dps
+        return dps_values
+
+    def group_characters(self, characters):
+        # [(inputs, indices)]: the characters of get_dps_for_characters whose
+        # inputs are equal once their stat values are left out, with the
+        # inputs of the first of them, in the order they first come up.
+        # inputs is None for the characters that only give stat values.
+        from shadowcraft.calcs import result_cache
+        groups = {}
+        keys = []
+        for index, character in enumerate(characters):
+            if 'stats' in character:
+                character_stats = character['stats']
+                inputs = dict((name, character.get(name, getattr(self, name))) for name in self.character_inputs)
+                gear = [character_stats.mh, character_stats.oh, character_stats.procs, character_stats.gear_buffs,
+                        character_stats.pvp_target_armor]
+                key = repr(result_cache.canonical([gear] + [inputs[name] for name in self.character_inputs if name != 'stats']))
+            else:
+                inputs = None
+                key = None
+            if key not in groups:
+                groups[key] = (inputs, [])
+                keys.append(key)
+            groups[key][1].append(index)
+        return [groups[key] for key in keys]
+
+    def get_character_calculator(self, inputs):
+        # A calculator like this one for a character's inputs, along with
+        # what building it added to each of the stat values (food for
+        # pandaren, for instance), which the other characters sharing it
+        # need as well. It's built on the character's own objects.
+        character_stats = inputs['stats']
+        raw_values = dict((stat, getattr(character_stats, stat)) for stat in character_stats.stat_names)
+        calculator = self.__class__(character_stats, inputs['talents'], inputs['glyphs'], inputs['buffs'], inputs['race'],
+                                    self.settings, self.level, self.target_level, self.char_class)
+        adjustments = dict((stat, getattr(character_stats, stat) - value) for stat, value in raw_values.items())
+        return calculator, adjustments
+
+    def get_dps_for_stat_values(self, stat_values):
+        # Takes a list of {stat: value} dicts and returns the dps with each
+        # of them in place of the current stats, in the same order; the
+        # current stats are restored afterwards. This generic version runs
+        # get_dps() once per entry; override it in your modeler if they can
+        # share part of the work.
+        dps_values = []
+        for values in stat_values:
+            old_values = dict((stat, getattr(self.stats, stat)) for stat in values)
+            for stat, value in values.items():
+                setattr(self.stats, stat, value)
+            try:
+                dps_values.append(self.get_dps())
+            finally:
+                for stat, value in old_values.items():
+                    setattr(self.stats, stat, value)
+        return dps_values
+
+    def toggle_input(self, toggle):
+        # Flips one of the inputs the ranking methods compare against: a
+        # ('glyphs', name), ('talents', name), ('gear_buffs', name) or
+        # ('procs', name) pair. Calling it twice restores the input.
+        category, name = toggle
+        if category == 'procs':
+            if getattr(self.stats.procs, name):
+                delattr(self.stats.procs, name)
+            else:
+                self.stats.procs.set_proc(name)
+        else:
+            inputs = {'glyphs': self.glyphs, 'talents': self.talents, 'gear_buffs': self.stats.gear_buffs}[category]
+            setattr(inputs, name, not getattr(inputs, name))
+
+    def get_dps_for_toggles(self, toggles, processes=1):
+        # Returns the dps with each of the toggles applied on its own, in the
+        # same order; an entry is the exception instead if the model raised
+        # one. With processes other than 1 the toggles are spread over a
+        # process pool (None uses one process per cpu) working on snapshots
+        # of the calculator, so this instance is left alone.
+        if processes != 1:
+            return parallel.get_dps_for_toggles(self, toggles, processes)
+        dps_values = []
+        for toggle in toggles:
+            try:
+                self.toggle_input(toggle)
+                try:
+                    dps_values.append(self.get_dps())
+                finally:
+                    self.toggle_input(toggle)
+            except Exception as e:
+                dps_values.append(e)
+        return dps_values
+
+    def check_max_targets(self, max_targets):
+        if max_targets is None:
+            return self.AOE_TARGET_CAP
+        if not 1 <= max_targets <= self.AOE_TARGET_CAP:
+            raise exceptions.InvalidInputException(_('Target counts go from 1 to {cap}').format(cap=self.AOE_TARGET_CAP))
+        return max_targets
+
+    def get_dps_for_target_counts(self, max_targets=None):
+        # Returns the dps against 1 to max_targets targets (AOE_TARGET_CAP if
+        # None): the boss and 0 to max_targets - 1 adds, whatever
+        # settings.num_boss_adds says. This generic version runs get_dps()
+        # once per target count; override it if your modeler can share the
+        # work between them.
+        max_targets = self.check_max_targets(max_targets)
+        num_boss_adds = self.settings.num_boss_adds
+        dps_values = []
+        try:
+            for adds in xrange(max_targets):
+                self.settings.num_boss_adds = adds
+                dps_values.append(self.get_dps())
+        finally:
+            self.settings.num_boss_adds = num_boss_adds
+        return dps_values
+
+    def get_dps_gradient(self, stats):
+        # Returns the dps and a dict with the dps gained per point of each
+        # of the stats. This generic version takes a +1 finite difference
+        # per stat; override it if your modeler can differentiate the dps
+        # directly.
+        dps_values = self.get_dps_for_stat_deltas([{}] + [{stat: 1.} for stat in stats])
+        baseline_dps = dps_values[0]
+        gradient = {}
+        for stat, dps in zip(stats, dps_values[1:]):
+            gradient[stat] = dps - baseline_dps
+        return baseline_dps, gradient
+
+    def get_ep(self, ep_stats=None, normalize_ep_stat=None, baseline_dps=None, gradient=False):
         if not normalize_ep_stat:
             normalize_ep_stat = self.normalize_ep_stat
         if not ep_stats:
             ep_stats = self.default_ep_stats
+        if gradient:
+            return self.get_ep_from_gradient(ep_stats, normalize_ep_stat)
         ep_values = {}
         for stat in ep_stats:
             ep_values[stat] = 0
+
+        # Evaluate the baseline, the normalizing stat and every ep stat in a
+        # single batch.
+        stat_deltas = []
         if baseline_dps == None:
-            baseline_dps = self.get_dps()
+            stat_deltas.append({})
+        if normalize_ep_stat != 'dps':
+            stat_deltas.append({normalize_ep_stat: 1.})
+        ep_stats_order = list(ep_values)
+        for stat in ep_stats_order:
+            stat_deltas.append({stat: 1.})
+        dps_values = self.get_dps_for_stat_deltas(stat_deltas)
+        dps_values.reverse()
+
+        if baseline_dps == None:
+            baseline_dps = dps_values.pop()
         
         if normalize_ep_stat == 'dps':
             normalize_dps_difference = 1.
         else:
-            normalize_dps = self.ep_helper(normalize_ep_stat)
+            normalize_dps = dps_values.pop()
             normalize_dps_difference = normalize_dps - baseline_dps
         if normalize_dps_difference == 0:
             normalize_dps_difference = 1
         
-        for stat in ep_values:
-            dps = self.ep_helper(stat)
+        for stat in ep_stats_order:
+            dps = dps_values.pop()
             ep_values[stat] = abs(dps - baseline_dps) / normalize_dps_difference
 
         return ep_values
 
+    def get_ep_from_gradient(self, ep_stats, normalize_ep_stat):
+        # Same values as get_ep, but taken from the derivative of the dps
+        # instead of differencing +1 runs, which leaves out the noise from
+        # the convergence tolerances of the model.
+        gradient_stats = list(ep_stats)
+        if normalize_ep_stat != 'dps' and normalize_ep_stat not in gradient_stats:
+            gradient_stats.append(normalize_ep_stat)
+        dps, gradient = self.get_dps_gradient(gradient_stats)
+
+        if normalize_ep_stat == 'dps':
+            normalize_dps_difference = 1.
+        else:
+            normalize_dps_difference = gradient[normalize_ep_stat]
+        if normalize_dps_difference == 0:
+            normalize_dps_difference = 1
+
+        ep_values = {}
+        for stat in ep_stats:
+            ep_values[stat] = abs(gradient[stat]) / normalize_dps_difference
+        return ep_values
+
     def get_weapon_ep(self, speed_list=None, dps=False, enchants=False, normalize_ep_stat=None):
         if not normalize_ep_stat:
             normalize_ep_stat = self.normalize_ep_stat
@@ -322,290 +579,155 @@ class DamageCalculator(object):
         modifiers = self.get_weapon_type_modifier_helper(setups)
         pass
 
-    def get_other_ep(self, list, normalize_ep_stat=None):
+    def get_other_ep(self, list, normalize_ep_stat=None, processes=1):
         if not normalize_ep_stat:
             normalize_ep_stat = self.normalize_ep_stat
         # This method computes ep for every other buff/proc not covered by
         # get_ep or get_weapon_ep. Weapon enchants, being tied to the
         # weapons they are on, are computed by get_weapon_ep.
         ep_values = {}
-        baseline_dps = self.get_dps()
-        normalize_dps = self.ep_helper(normalize_ep_stat)
+        baseline_dps, normalize_dps = self.get_dps_for_stat_deltas([{}, {normalize_ep_stat: 1.}])
 
-        procs_list = []
-        gear_buffs_list = []
+        toggles = []
         for i in list:
             if i in self.stats.procs.allowed_procs:
-                procs_list.append(i)
+                toggles.append(('procs', i))
             elif i in self.stats.gear_buffs.allowed_buffs:
-                gear_buffs_list.append(i)
+                # Note that activated abilites like trinkets, potions, or
+                # engineering gizmos are handled as gear buffs by the engine.
+                toggles.append(('gear_buffs', i))
             else:
                 ep_values[i] = _('not allowed')
 
-        for i in gear_buffs_list:
-            # Note that activated abilites like trinkets, potions, or
-            # engineering gizmos are handled as gear buffs by the engine.
-            setattr(self.stats.gear_buffs, i, not getattr(self.stats.gear_buffs, i))
-            new_dps = self.get_dps()
-            ep_values[i] = abs(new_dps - baseline_dps) / (normalize_dps - baseline_dps)
-            setattr(self.stats.gear_buffs, i, not getattr(self.stats.gear_buffs, i))
-
-        for i in procs_list:
-            try:
-                if getattr(self.stats.procs, i):
-                    delattr(self.stats.procs, i)
-                else:
-                    self.stats.procs.set_proc(i)
-                new_dps = self.get_dps()
-                ep_values[i] = abs(new_dps - baseline_dps) / (normalize_dps - baseline_dps)
-                if getattr(self.stats.procs, i):
-                    delattr(self.stats.procs, i)
-                else:
-                    self.stats.procs.set_proc(i)
-            except InvalidProcException:
+        for toggle, new_dps in zip(toggles, self.get_dps_for_toggles(toggles, processes)):
+            if isinstance(new_dps, InvalidProcException) and toggle[0] == 'procs':
                 # Data for these procs is not complete/correct
-                ep_values[i] = _('not supported')
-                delattr(self.stats.procs, i)
+                ep_values[toggle[1]] = _('not supported')
+            elif isinstance(new_dps, Exception):
+                raise new_dps
+            else:
+                ep_values[toggle[1]] = abs(new_dps - baseline_dps) / (normalize_dps - baseline_dps)
 
         return ep_values
     
-    def get_upgrades_ep(self, list, normalize_ep_stat=None):
+    # get_upgrades_ep ladders: an upgradable proc goes up
+    # upgrade_item_level_step item levels at a time, max_upgrade_level times.
+    upgrade_item_level_step = 4
+    max_upgrade_level = 2
+
+    def get_upgrades_ep(self, list, normalize_ep_stat=None, processes=1):
+        # Returns {name: [ep at upgrade level 0, 1, ...]} for the procs and
+        # gear buffs in list, each measured against the current gear without
+        # any of them; gear buffs don't upgrade and get a single value, and
+        # items that change nothing get an empty list. A proc's ladder starts
+        # at the item level it has in the procs list (or its data). Every
+        # level is an exact dps evaluation, but levels only differ in the
+        # proc's value, so they share the rest of the work (see
+        # get_dps_for_proc_values) and levels with the same value are
+        # evaluated once. processes is as in get_other_ep.
         if not normalize_ep_stat:
             normalize_ep_stat = self.normalize_ep_stat
-        # This method computes ep for every other buff/proc not covered by
-        # get_ep or get_weapon_ep. Weapon enchants, being tied to the
-        # weapons they are on, are computed by get_weapon_ep.
-        
-        active_procs_cache = []
-        active_gear_buffs_cache = []
-        procs_list = []
-        gear_buffs_list = []
         ep_values = {}
-        for i in list:
-            if i in self.stats.procs.allowed_procs:
-                procs_list.append(i)
-                if getattr(self.stats.procs, i):
-                    active_procs_cache.append((i, getattr(self.stats.procs, i).upgrade_level))
-                    delattr(self.stats.procs, i)
-            elif i in self.stats.gear_buffs.allowed_buffs:
-                gear_buffs_list.append(i)
-                if getattr(self.stats.gear_buffs, i):
-                    active_gear_buffs_cache.append((i, self.stats.gear_buffs.activated_boosts[i]['upgrade_level']))
-                    setattr(self.stats.gear_buffs, i, False)
-            else:
-                ep_values[i] = _('not allowed')
-
-        baseline_dps = self.get_dps()
-        normalize_dps = self.ep_helper(normalize_ep_stat)
-
-        for i in gear_buffs_list:
-            ep_values[i] = []
-            if getattr(self.stats.gear_buffs, i):
-                old_buff = self.stats.gear_buffs.activated_boosts[i]['upgrade_level']
-                setattr(self.stats.gear_buffs, i, False)
-                base_dps = self.get_dps()
-                base_normalize_dps = self.ep_helper(normalize_ep_stat)
-            else:
-                old_buff = -1
-                base_dps = baseline_dps
-                base_normalize_dps = normalize_dps
-            setattr(self.stats.gear_buffs, i, True)
-            if 'upgradable' in self.stats.gear_buffs.activated_boosts[i] and self.stats.gear_buffs.activated_boosts[i]['upgradable'] == True and 'scaling' in self.stats.gear_buffs.activated_boosts[i]:
-                if self.stats.gear_buffs.activated_boosts[i]['scaling']['quality'] == 'blue':
-                    max_upgrade_level = 1
-                else:
-                    max_upgrade_level = 2
-            else:
-                max_upgrade_level = 0
-            for l in xrange(max_upgrade_level+1):
-                self.stats.gear_buffs.activated_boosts[i]['upgrade_level'] = l
-                new_dps = self.get_dps()
-                if new_dps != base_dps:
-                    ep = abs(new_dps - base_dps) / (base_normalize_dps - base_dps)
-                    ep_values[i].append(ep)
-            if old_buff != -1:
-                setattr(self.stats.gear_buffs, i, True)
-                self.stats.gear_buffs.activated_boosts[i]['upgrade_level'] = old_buff
-            else:
-                setattr(self.stats.gear_buffs, i, False)
-                self.stats.gear_buffs.activated_boosts[i]['upgrade_level'] = 0
-
-        for i in procs_list:
-            ep_values[i] = []
-            try:
-                if getattr(self.stats.procs, i):
-                    old_proc = getattr(self.stats.procs, i)
-                    delattr(self.stats.procs, i)
-                    base_dps = self.get_dps()
-                    base_normalize_dps = self.ep_helper(normalize_ep_stat)
-                else:
-                    old_proc = False
-                    base_dps = baseline_dps
-                    base_normalize_dps = normalize_dps
-                self.stats.procs.set_proc(i)
-                if getattr(self.stats.procs, i).upgradable and getattr(self.stats.procs, i).scaling:
-                    if getattr(self.stats.procs, i).scaling['quality'] == 'blue':
-                        max_upgrade_level = 1
-                    else:
-                        max_upgrade_level = 2
-                else:
-                    max_upgrade_level = 0
-                for l in xrange(max_upgrade_level+1):
-                    getattr(self.stats.procs, i).upgrade_level = l
-                    new_dps = self.get_dps()
-                    if new_dps != base_dps:
-                        ep = abs(new_dps - base_dps) / (base_normalize_dps - base_dps)
-                        ep_values[i].append(ep)
-                if old_proc:
-                    self.stats.procs.set_proc(i)
-                    getattr(self.stats.procs, i).upgrade_level = old_proc.upgrade_level
-                else:
-                    delattr(self.stats.procs, i)
-            except InvalidProcException:
-                # Data for these procs is not complete/correct
-                ep_values[i].append(_('not supported'))
-                delattr(self.stats.procs, i)
-
-        for proc in active_procs_cache:
-            self.stats.procs.set_proc(proc[0])
-            getattr(self.stats.procs, proc[0]).upgrade_level = proc[1]
-
-        for gear_buff in active_gear_buffs_cache:
-            setattr(self.stats.gear_buffs, gear_buff[0], True)
-            self.stats.gear_buffs.activated_boosts[gear_buff[0]]['upgrade_level'] = gear_buff[1]
-
-        return ep_values
-
-    # this function is in comparison to get_upgrades_ep a lot faster but not 100% accurate
-    # the error is around 1% which is accurate enough for the ranking in Shadowcraft-UI
-    def get_upgrades_ep_fast(self, list, normalize_ep_stat=None):
-        if not normalize_ep_stat:
-            normalize_ep_stat = self.normalize_ep_stat
-        # This method computes ep for every other buff/proc not covered by
-        # get_ep or get_weapon_ep. Weapon enchants, being tied to the
-        # weapons they are on, are computed by get_weapon_ep.
-        
-        active_procs_cache = []
-        active_gear_buffs_cache = []
+        active_procs = {}
+        active_gear_buffs = []
         procs_list = []
         gear_buffs_list = []
-        ep_values = {}
         for i in list:
             if i in self.stats.procs.allowed_procs:
                 procs_list.append(i)
                 if getattr(self.stats.procs, i):
-                    active_procs_cache.append((i, getattr(self.stats.procs, i).upgrade_level))
+                    active_procs[i] = getattr(self.stats.procs, i)
                     delattr(self.stats.procs, i)
             elif i in self.stats.gear_buffs.allowed_buffs:
                 gear_buffs_list.append(i)
                 if getattr(self.stats.gear_buffs, i):
-                    active_gear_buffs_cache.append((i, self.stats.gear_buffs.activated_boosts[i]['upgrade_level']))
+                    active_gear_buffs.append(i)
                     setattr(self.stats.gear_buffs, i, False)
             else:
                 ep_values[i] = _('not allowed')
 
-        baseline_dps = self.get_dps()
-        normalize_dps = self.ep_helper(normalize_ep_stat)
-
-        for i in gear_buffs_list:
-            ep_values[i] = []
-            if getattr(self.stats.gear_buffs, i):
-                old_buff = self.stats.gear_buffs.activated_boosts[i]['upgrade_level']
-                setattr(self.stats.gear_buffs, i, False)
-                base_dps = self.get_dps()
-                base_normalize_dps = self.ep_helper(normalize_ep_stat)
-            else:
-                old_buff = -1
-                base_dps = baseline_dps
-                base_normalize_dps = normalize_dps
-            setattr(self.stats.gear_buffs, i, True)
-            boost = self.stats.gear_buffs.activated_boosts[i]
-            boost['upgrade_level'] = 0
-            if 'upgradable' in boost and boost['upgradable'] == True and 'scaling' in boost:
-                if self.stats.gear_buffs.activated_boosts[i]['scaling']['quality'] == 'blue':
-                    level_steps = 8
-                    max_upgrade_level = 1
-                else:
-                    level_steps = 4
-                    max_upgrade_level = 4
-                item_level = boost['scaling']['item_level']
-                scale_factor = self.tools.get_random_prop_point(item_level, boost['scaling']['quality'])
-            else:
-                max_upgrade_level = 0
-            new_dps = self.get_dps()
-            for l in xrange(max_upgrade_level+1):
-                if new_dps != base_dps:
-                    ep = abs(new_dps - base_dps) / (base_normalize_dps - base_dps)
-                    if l > 0:
-                        upgraded_scale_factor = self.tools.get_random_prop_point(item_level + level_steps * l, boost['scaling']['quality'])
-                        ep *= float(upgraded_scale_factor) / float(scale_factor)
-                    ep_values[i].append(ep)
-            if old_buff != -1:
+        try:
+            baseline_dps, normalize_dps = self.get_dps_for_stat_deltas([{}, {normalize_ep_stat: 1.}])
+            toggles = [('gear_buffs', i) for i in gear_buffs_list]
+            for i, new_dps in zip(gear_buffs_list, self.get_dps_for_toggles(toggles, processes)):
+                if isinstance(new_dps, Exception):
+                    raise new_dps
+                ep_values[i] = []
+                if new_dps != baseline_dps:
+                    ep_values[i].append(abs(new_dps - baseline_dps) / (normalize_dps - baseline_dps))
+            for i, dps_values in zip(procs_list, self.get_dps_for_upgrades(procs_list, processes)):
+                if isinstance(dps_values, InvalidProcException):
+                    # Data for these procs is not complete/correct
+                    ep_values[i] = [_('not supported')]
+                    continue
+                elif isinstance(dps_values, Exception):
+                    raise dps_values
+                ep_values[i] = []
+                for new_dps in dps_values:
+                    if new_dps != baseline_dps:
+                        ep_values[i].append(abs(new_dps - baseline_dps) / (normalize_dps - baseline_dps))
+        finally:
+            for i, proc in active_procs.items():
+                setattr(self.stats.procs, i, proc)
+            for i in active_gear_buffs:
                 setattr(self.stats.gear_buffs, i, True)
-            else:
-                setattr(self.stats.gear_buffs, i, False)
-                self.stats.gear_buffs.activated_boosts[i]['upgrade_level'] = 0
-
-        for i in procs_list:
-            ep_values[i] = []
-            try:
-                if getattr(self.stats.procs, i):
-                    old_proc = getattr(self.stats.procs, i)
-                    delattr(self.stats.procs, i)
-                    base_dps = self.get_dps()
-                    base_normalize_dps = self.ep_helper(normalize_ep_stat)
-                else:
-                    old_proc = False
-                    base_dps = baseline_dps
-                    base_normalize_dps = normalize_dps
-                self.stats.procs.set_proc(i)
-                proc = getattr(self.stats.procs, i)
-                proc.upgrade_level = 0
-                if proc.upgradable and proc.scaling:
-                    if proc.scaling['quality'] == 'blue':
-                        level_steps = 8
-                        max_upgrade_level = 1
-                    else:
-                        level_steps = 4
-                        max_upgrade_level = 4
-                    item_level = proc.scaling['item_level']
-                    if proc.proc_name == 'Rune of Re-Origination':
-                        scale_factor = 1/(1.15**((528-item_level)/15.0)) * proc.base_ppm
-                    else:
-                        scale_factor = self.tools.get_random_prop_point(item_level, proc.scaling['quality'])
-                else:
-                    max_upgrade_level = 0
-                new_dps = self.get_dps()
-                for l in xrange(max_upgrade_level+1):
-                    if new_dps != base_dps:
-                        ep = abs(new_dps - base_dps) / (base_normalize_dps - base_dps)
-                        if l > 0:
-                            if proc.proc_name == 'Rune of Re-Origination':
-                                 upgraded_scale_factor = 1/(1.15**((528-(item_level + level_steps * l))/15.0)) * proc.base_ppm
-                            else:
-                                upgraded_scale_factor = self.tools.get_random_prop_point(item_level + level_steps * l, proc.scaling['quality'])
-                            ep *= float(upgraded_scale_factor) / float(scale_factor)
-                        ep_values[i].append(ep)
-                if old_proc:
-                    self.stats.procs.set_proc(i)
-                else:
-                    delattr(self.stats.procs, i)
-            except InvalidProcException:
-                # Data for these procs is not complete/correct
-                ep_values[i].append(_('not supported'))
-                delattr(self.stats.procs, i)
-
-        for proc in active_procs_cache:
-            self.stats.procs.set_proc(proc[0])
-            getattr(self.stats.procs, proc[0]).upgrade_level = proc[1]
-
-        for gear_buff in active_gear_buffs_cache:
-            setattr(self.stats.gear_buffs, gear_buff[0], True)
-            self.stats.gear_buffs.activated_boosts[gear_buff[0]]['upgrade_level'] = gear_buff[1]
 
         return ep_values
 
-    def get_glyphs_ranking(self, list=None):
+    def get_upgrades_ep_fast(self, list, normalize_ep_stat=None, processes=1):
+        # This used to scale a single evaluation by item level, which was
+        # off by around 1%; get_upgrades_ep is now exact and about as fast.
+        return self.get_upgrades_ep(list, normalize_ep_stat, processes)
+
+    def get_dps_for_upgrades(self, names, processes=1):
+        # Returns get_dps_for_upgrade_levels for each of the procs names, in
+        # the same order; an entry is the exception instead if the model
+        # raised one. processes is as in get_dps_for_toggles.
+        if processes != 1:
+            return parallel.get_dps_for_upgrades(self, names, processes)
+        dps_values = []
+        for name in names:
+            try:
+                dps_values.append(self.get_dps_for_upgrade_levels(name))
+            except Exception as e:
+                dps_values.append(e)
+        return dps_values
+
+    def get_dps_for_upgrade_levels(self, name):
+        # The dps with the proc name added at each of its upgrade levels.
+        self.stats.procs.set_proc(name)
+        proc = getattr(self.stats.procs, name)
+        try:
+            if not proc.upgradable or proc.source != 'trinket':
+                # Only trinket values scale with item level.
+                return [self.get_dps()]
+            item_levels = [proc.item_level + self.upgrade_item_level_step * level for level in xrange(self.max_upgrade_level + 1)]
+            values = proc.get_values_for_item_levels(item_levels)
+            distinct_values = []
+            for value in values:
+                if value not in distinct_values:
+                    distinct_values.append(value)
+            dps_values = self.get_dps_for_proc_values(proc, distinct_values)
+            return [dps_values[distinct_values.index(value)] for value in values]
+        finally:
+            delattr(self.stats.procs, name)
+
+    def get_dps_for_proc_values(self, proc, values):
+        # Returns the dps with each of the values (dicts of stat: amount) as
+        # the value of proc, in the same order, and leaves the proc as it
+        # was. This generic version runs get_dps() once per value; override
+        # it if your modeler can share the work between them.
+        old_value = proc.value
+        dps_values = []
+        try:
+            for value in values:
+                proc.value = dict(value)
+                dps_values.append(self.get_dps())
+        finally:
+            proc.value = old_value
+        return dps_values
+
+    def get_glyphs_ranking(self, list=None, processes=1):
         glyphs = []
         glyphs_ranking = {}
         baseline_dps = self.get_dps()
@@ -615,19 +737,16 @@ class DamageCalculator(object):
         else:
             glyphs = list
 
-        for i in glyphs:
-            setattr(self.glyphs, i, not getattr(self.glyphs, i))
-            try:
-                new_dps = self.get_dps()
-                if new_dps != baseline_dps:
-                    glyphs_ranking[i] = abs(new_dps - baseline_dps)
-            except:
+        toggles = [('glyphs', i) for i in glyphs]
+        for i, new_dps in zip(glyphs, self.get_dps_for_toggles(toggles, processes)):
+            if isinstance(new_dps, Exception):
                 glyphs_ranking[i] = _('not implemented')
-            setattr(self.glyphs, i, not getattr(self.glyphs, i))
+            elif new_dps != baseline_dps:
+                glyphs_ranking[i] = abs(new_dps - baseline_dps)
 
         return glyphs_ranking
 
-    def get_talents_ranking(self, list=None):
+    def get_talents_ranking(self, list=None, processes=1):
         talents_ranking = {}
         baseline_dps = self.get_dps()
         talent_list = []
@@ -637,15 +756,12 @@ class DamageCalculator(object):
         else:
             talent_list = list
 
-        for talent in talent_list:
-            setattr(self.talents, talent, not getattr(self.talents, talent))
-            try:
-                new_dps = self.get_dps()
-                if new_dps != baseline_dps:
-                    talents_ranking[talent] = abs(new_dps - baseline_dps)
-            except:
+        toggles = [('talents', talent) for talent in talent_list]
+        for talent, new_dps in zip(talent_list, self.get_dps_for_toggles(toggles, processes)):
+            if isinstance(new_dps, Exception):
                 talents_ranking[talent] = _('not implemented')
-            setattr(self.talents, talent, not getattr(self.talents, talent))
+            elif new_dps != baseline_dps:
+                talents_ranking[talent] = abs(new_dps - baseline_dps)
         
         return talents_ranking
 
@@ -654,6 +770,24 @@ class DamageCalculator(object):
         # this is what callers will (initially) be looking at.
         pass
 
+    def get_inputs(self):
+        # Everything the results depend on, for
+        # shadowcraft.calcs.result_cache. Subclasses with inputs of their own
+        # add them.
+        return {
+            'calculator': self.__class__.__module__ + '.' + self.__class__.__name__,
+            'build': (self.WOW_BUILD_TARGET, self.SHADOWCRAFT_BUILD),
+            'stats': self.stats,
+            'talents': self.talents,
+            'glyphs': self.glyphs,
+            'buffs': self.buffs,
+            'race': self.race,
+            'settings': self.settings,
+            'level': self.level,
+            'target_level': self.target_level,
+            'char_class': self.char_class,
+        }
+
     def get_all_activated_stat_boosts(self):
         racial_boosts = self.race.get_racial_stat_boosts()
         gear_boosts = self.stats.gear_buffs.get_all_activated_boosts()
@@ -748,12 +882,26 @@ class DamageCalculator(object):
         total_modifier = 1 + (base_modifier * crit_damage_modifier - 1) * crit_damage_bonus_modifier
         return total_modifier
 
+    def crit_damage_modifiers_key(self, crit_damage_bonus_modifier=1):
+        # The inputs crit_damage_modifiers depends on, for use as a cache key.
+        return (crit_damage_bonus_modifier, self.settings.is_pvp, self.stats.gear_buffs.metagem_crit_multiplier(),
+                self.race.might_of_the_mountain)
+
     def target_armor(self, armor=None):
         # Passes base armor reduced by armor debuffs or overridden armor
         if armor is None:
             armor = self.target_base_armor
         return armor #* self.buffs.armor_reduction_multiplier()
 
+    def raid_settings_modifiers_key(self, attack_kind, armor=None, affect_resil=True):
+        # The inputs raid_settings_modifiers depends on, for use as a cache
+        # key.
+        pvp_inputs = None
+        if self.settings.is_pvp and affect_resil:
+            pvp_inputs = (self.stats.pvp_power, self.stats.pvp_resil, self.stats.pvp_target_armor)
+        return (attack_kind, armor, affect_resil, pvp_inputs, self.buffs.get_active_buffs(), self.target_base_armor,
+                self.armor_mitigation_parameter)
+
     def raid_settings_modifiers(self, attack_kind, armor=None, affect_resil=True):
         # This function wraps spell, bleed and physical debuffs from raid
         # along with all-damage buff and armor reduction. It should be called
@@ -1,107 +1,271 @@
-import copy
-import gettext
-import __builtin__
 import math
+import random
 
-__builtin__._ = gettext.gettext
-
-from shadowcraft.calcs.rogue import RogueDamageCalculator
-from shadowcraft.core import exceptions
-from shadowcraft.objects import procs
-from shadowcraft.objects import proc_data
-
-
-class InputNotModeledException(exceptions.InvalidInputException):
-    # I'll return these when inputs don't make sense to the model.
-    pass
-
-class DarkmantleCalculator(object):
-    #
-
-    def __init__(self, stats, talents, glyphs, buffs, race, settings=None, level=85, target_level=None, char_class='rogue'):
-        self.tools = class_data.Util()
-        self.stats = stats
-        self.talents = talents
-        self.glyphs = glyphs
-        self.buffs = buffs
-        self.race = race
-        self.char_class = char_class
-        self.settings = settings
-        self.target_level = [target_level, level + 3][target_level is None]
-        if self.settings.is_pvp:
-            self.level_difference = 0
-        else:
-            self.level_difference = max(self.target_level - level, 0)
-        self.level = level
-        if self.stats.gear_buffs.mixology and (self.buffs.agi_flask or self.buffs.agi_flask_mop):
-            self.stats.agi += self.stats.gear_buffs.tradeskill_bonus()
-        if self.stats.gear_buffs.master_of_anatomy:
-            self.stats.crit += self.stats.gear_buffs.tradeskill_bonus('master_of_anatomy')
-        if self.race.race_name == 'undead':
-            self.stats.procs.set_proc('touch_of_the_grave')
-        self._set_constants_for_class()
-        
-        if self.settings.is_pvp:
-            self.base_one_hand_miss_rate = .03
-            self.base_parry_chance = .05
-            self.base_dodge_chance = .03
-            self.base_spell_miss_rate = .06
-        else:
-            self.base_one_hand_miss_rate = 0 #.03 + .015 * self.level_difference
-            self.base_parry_chance = .03 + .015 * self.level_difference
-            self.base_dodge_chance = 0 #.03 + .015 * self.level_difference
-            self.base_spell_miss_rate = 0 #.06 + .03 * self.level_difference
-        
-        self.base_dw_miss_rate = self.base_one_hand_miss_rate + .19
-        self.base_block_chance = .03 + .015 * self.level_difference
-        #load stats, class, procs, etc to main content
-        #load class modules
-        #load class global settings to global_settings
-        #load spell/mechanic data to global data
-        return
-    
-    def get_dps(self):
-        super(AldrianasRogueDamageCalculator, self).get_dps()
+from shadowcraft.calcs import parallel
+from shadowcraft.calcs.darkmantle import apl
+from shadowcraft.calcs.darkmantle import montecarlo
+from shadowcraft.calcs.darkmantle import rogue
+from shadowcraft.calcs.rogue.Aldriana import AldrianasRogueDamageCalculator
+from shadowcraft.calcs.rogue.Aldriana import InputNotModeledException
+
+
+class DarkmantleCalculator(AldrianasRogueDamageCalculator):
+    # Damage from a simulated fight. The attack counts come out of a fight
+    # run event by event (see shadowcraft.calcs.darkmantle.engine) instead of
+    # the closed-form cycle; stats and proc uptimes, crit rates and the damage
+    # per attack are the Aldriana model's, so the two can be compared attack
+    # by attack. Fights are seeded with seed, so the same inputs give the same
+    # fight; set it to None for a different fight every time.
+    seed = 0
+
+    # A priority list in the text format of
+    # shadowcraft.calcs.darkmantle.apl, used instead of the spec's own
+    # rotation when set.
+    priority_list = None
+
+    profiled_methods = dict(AldrianasRogueDamageCalculator.profiled_methods, get_fight_breakdown='fight')
+
+    fights = {
+        'assassination': rogue.AssassinationFight,
+        'combat': rogue.CombatFight,
+        'subtlety': rogue.SubtletyFight,
+    }
+
+    def get_inputs(self):
+        inputs = super(DarkmantleCalculator, self).get_inputs()
+        inputs.update({'seed': self.seed, 'priority_list': self.priority_list, 'ep_iterations': self.ep_iterations})
+        return inputs
+
+    def get_character_calculator(self, inputs):
+        calculator, adjustments = super(DarkmantleCalculator, self).get_character_calculator(inputs)
+        calculator.seed = self.seed
+        calculator.priority_list = self.priority_list
+        calculator.ep_iterations = self.ep_iterations
+        return calculator, adjustments
+
+    def timeline_dps_breakdown(self):
+        # A fight is simulated whole; it has no phases to take apart.
+        raise InputNotModeledException(_('Fight timelines are not modeled by the Darkmantle calculator.'))
+
+    def get_dps_gradient(self, stats):
+        # Simulated attack counts don't carry derivatives; use finite
+        # differences.
+        return super(AldrianasRogueDamageCalculator, self).get_dps_gradient(stats)
+
+    def get_fight(self, current_stats, crit_rates, seed=None):
+        try:
+            fight_class = self.fights[self.settings.get_spec()]
+        except KeyError:
+            raise InputNotModeledException(_('You must specify a spec.'))
+        priority_list = None
+        if self.priority_list is not None:
+            priority_list = apl.compile_priority_list(self.priority_list, fight_class)
+        return fight_class(self, current_stats, crit_rates, seed, priority_list)
+
+    def get_fight_inputs(self):
+        # Converges stats and procs on the closed-form attack counts; returns
+        # the (current_stats, crit_rates, damage_procs) every fight of the
+        # initialized spec starts from.
         if self.settings.is_assassination_rogue():
-            #self.init_assassination()
-            return self.assassination_dps_estimate()
+            attack_counts_function = self.assassination_attack_counts_non_execute
         elif self.settings.is_combat_rogue():
-            return self.combat_dps_estimate()
-        elif self.settings.is_subtlety_rogue():
-            return self.subtlety_dps_estimate()
+            self.tmp_phase_length = self.get_spell_cd('adrenaline_rush')
+            attack_counts_function = self.combat_attack_counts_none
         else:
-            raise InputNotModeledException(_('You must specify a spec.'))
+            attack_counts_function = self.subtlety_attack_counts
+        current_stats, attacks_per_second, crit_rates, damage_procs = self.determine_stats(attack_counts_function)
+        return current_stats, crit_rates, damage_procs
 
-    def get_dps_breakdown(self):
+    def get_fight_breakdown(self, fight_inputs, seed):
+        # Simulates one fight and returns the damage breakdown for its attack
+        # counts.
+        current_stats, crit_rates, damage_procs = fight_inputs
+        fight = self.get_fight(current_stats, crit_rates, seed)
+        fight.run()
+        attacks_per_second = fight.get_attacks_per_second()
+        self.get_poison_counts(attacks_per_second)
+        for proc in damage_procs:
+            self.update_with_damaging_proc(proc, attacks_per_second, crit_rates)
+        self.set_uptimes(self.get_active_procs()[4], attacks_per_second, crit_rates)
+        damage_breakdown = self.get_damage_breakdown(current_stats, attacks_per_second, crit_rates, damage_procs)
         if self.settings.is_assassination_rogue():
-            return self.assassination_dps_breakdown()
+            self.update_assassination_breakdown(fight, damage_breakdown)
         elif self.settings.is_combat_rogue():
-            return self.combat_dps_breakdown()
-        elif self.settings.is_subtlety_rogue():
-            return self.subtlety_dps_breakdown()
+            self.update_combat_breakdown(fight, damage_breakdown)
         else:
-            raise InputNotModeledException(_('You must specify a spec.'))
-    
+            self.update_subtlety_breakdown(fight, damage_breakdown)
+        return damage_breakdown
+
+    def get_dps_breakdowns_for_seeds(self, seeds):
+        # One breakdown per seed, from a single initialization and stat
+        # convergence.
+        init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+        init_spec()
+        fight_inputs = self.get_fight_inputs()
+        return [self.get_fight_breakdown(fight_inputs, seed) for seed in seeds]
+
+    def get_dps_distribution(self, iterations=1000, target_error=None, batch_size=50, confidence=.95, processes=1):
+        # Monte Carlo estimate over up to iterations fights, seeded seed,
+        # seed + 1, and so on (a random starting seed if seed is None). With
+        # target_error set, stops at the end of the first batch whose
+        # standard error relative to the mean dps is at or below it. Returns
+        # a dict with the mean 'dps', its 'standard_error' and confidence
+        # 'interval', the number of 'iterations' run, and the 'breakdown'
+        # as {source: (mean, low, high)}. With processes other than 1 each
+        # batch is split over a process pool (None uses one per cpu); the
+        # result doesn't depend on it.
+        batches = self.get_seed_batches(iterations, batch_size)
+        if processes == 1:
+            breakdowns = (self.get_dps_breakdowns_for_seeds(batch) for batch in batches)
+            return montecarlo.summarize(breakdowns, target_error, confidence)
+        pool = parallel.get_pool(self, processes)
+        try:
+            workers = processes or parallel.cpu_count()
+            breakdowns = (parallel.map_chunks(pool, parallel.breakdowns_for_seeds, batch, workers) for batch in batches)
+            return montecarlo.summarize(breakdowns, target_error, confidence)
+        finally:
+            pool.close()
+            pool.join()
+
+    def get_seed_batches(self, iterations, batch_size):
+        first_seed = self.seed
+        if first_seed is None:
+            first_seed = random.randrange(2 ** 31)
+        seeds = range(first_seed, first_seed + iterations)
+        return [seeds[i:i + batch_size] for i in xrange(0, iterations, batch_size)]
+
+    ###########################################################################
+    # Paired stat evaluation. Every fight draws its random numbers from
+    # streams seeded by the fight's seed (see engine.RandomStreams), so fights
+    # with the same seed and slightly different stats stay in step and the
+    # difference between them is mostly the effect of the stats rather than
+    # of luck: common random numbers.
+    ###########################################################################
+
+    # Seeds (from seed on) each get_dps_for_stat_deltas entry is averaged
+    # over.
+    ep_iterations = 1
+
+    def get_dps_for_stat_deltas(self, stat_deltas):
+        batch = self.get_seed_batches(self.ep_iterations, self.ep_iterations)[0]
+        rows = self.get_paired_dps(stat_deltas, batch)
+        return [math.fsum(column) / len(rows) for column in zip(*rows)]
+
+    def get_paired_dps(self, stat_deltas, seeds):
+        # Returns one row per seed, holding the dps with each of the
+        # stat_deltas (as in get_dps_for_stat_deltas) in the fight with that
+        # seed.
+        rows = [[] for seed in seeds]
+        for deltas in stat_deltas:
+            for stat, amount in deltas.items():
+                setattr(self.stats, stat, getattr(self.stats, stat) + amount)
+            try:
+                breakdowns = self.get_dps_breakdowns_for_seeds(seeds)
+            finally:
+                for stat, amount in deltas.items():
+                    setattr(self.stats, stat, getattr(self.stats, stat) - amount)
+            for row, breakdown in zip(rows, breakdowns):
+                row.append(math.fsum(breakdown.values()))
+        return rows
+
+    def get_scale_factors(self, ep_stats=None, normalize_ep_stat=None, delta=100., iterations=500, target_error=None,
+                          batch_size=20, processes=1):
+        # Ep values from paired fights: for every seed the baseline and each
+        # stat raised by delta are simulated with the same random numbers,
+        # and the values come from the mean paired differences. With
+        # target_error set, stops at the end of the first batch where the
+        # standard error of every stat's dps gain is at or below target_error
+        # times the gain. Returns a dict with the 'ep' values, their
+        # 'standard_error' (by the delta method, leaving out the covariance
+        # with the normalizing stat) and the number of 'iterations' run.
+        # With processes other than 1 each batch is split over a process pool
+        # (None uses one per cpu); the result doesn't depend on it.
+        if not normalize_ep_stat:
+            normalize_ep_stat = self.normalize_ep_stat
+        if not ep_stats:
+            ep_stats = self.default_ep_stats
+        gain_stats = list(ep_stats)
+        if normalize_ep_stat != 'dps' and normalize_ep_stat not in gain_stats:
+            gain_stats.append(normalize_ep_stat)
+        stat_deltas = [{}] + [{stat: delta} for stat in gain_stats]
+        gains = dict((stat, montecarlo.RunningStatistics()) for stat in gain_stats)
+
+        def add_rows(rows):
+            for row in rows:
+                for stat, dps in zip(gain_stats, row[1:]):
+                    gains[stat].add((dps - row[0]) / delta)
+
+        def precise_enough():
+            for statistics in gains.values():
+                if statistics.get_standard_error() > target_error * abs(statistics.mean):
+                    return False
+            return True
+
+        pool = None
+        if processes != 1:
+            pool = parallel.get_pool(self, processes)
+        try:
+            for batch in self.get_seed_batches(iterations, batch_size):
+                if pool is None:
+                    add_rows(self.get_paired_dps(stat_deltas, batch))
+                else:
+                    items = [(stat_deltas, seed) for seed in batch]
+                    add_rows(parallel.map_chunks(pool, parallel.paired_dps_for_seeds, items, processes or parallel.cpu_count()))
+                if target_error is not None and precise_enough():
+                    break
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        if normalize_ep_stat == 'dps':
+            normalize_gain, normalize_error = 1., 0.
+        else:
+            normalize_gain = gains[normalize_ep_stat].mean
+            normalize_error = gains[normalize_ep_stat].get_standard_error()
+        if normalize_gain == 0:
+            normalize_gain = 1
+        ep_values = {}
+        errors = {}
+        for stat in ep_stats:
+            gain = gains[stat].mean
+            error = gains[stat].get_standard_error()
+            ep_values[stat] = abs(gain / normalize_gain)
+            errors[stat] = ep_values[stat] * math.sqrt((error / gain) ** 2 + (normalize_error / normalize_gain) ** 2) if gain else abs(error / normalize_gain)
+        return {'ep': ep_values, 'standard_error': errors, 'iterations': gains[gain_stats[0]].count}
+
     def assassination_dps_estimate(self):
         return sum(self.assassination_dps_breakdown().values())
+
     def assassination_dps_breakdown(self):
-        #determine pre-fight sequence, establish baseline event_queue and auras
-        #read priority list, determine first action
-        #load event_state object with event_queue
-        return
-    
+        # The execute range is part of the fight, so there's no blending.
+        return self.get_fight_breakdown(self.get_fight_inputs(), self.seed)
+
+    def update_assassination_breakdown(self, fight, damage_breakdown):
+        vendetta_uptime = fight.auras.get_uptime('vendetta', fight.duration) / fight.duration
+        self.vendetta_mult = 1 + (.3 - .05 * self.glyphs.vendetta) * vendetta_uptime
+        self.update_damage_breakdown_for_vendetta(damage_breakdown)
+
     def combat_dps_estimate(self):
         return sum(self.combat_dps_breakdown().values())
+
     def combat_dps_breakdown(self):
-        #determine pre-fight sequence, establish baseline event_queue and auras
-        #read priority list, determine first action
-        #load event_state object with event_queue
-        return
-    
+        # Adrenaline rush is part of the fight, so there are no phases.
+        return self.get_fight_breakdown(self.get_fight_inputs(), self.seed)
+
+    def update_combat_breakdown(self, fight, damage_breakdown):
+        self.bandits_guile_multiplier = fight.get_bandits_guile_multiplier()
+        self.update_with_bandits_guile(damage_breakdown)
+        self.update_with_blade_flurry(damage_breakdown)
+
     def subtlety_dps_estimate(self):
         return sum(self.subtlety_dps_breakdown().values())
+
     def subtlety_dps_breakdown(self):
-        #determine pre-fight sequence, establish baseline event_queue and auras
-        #read priority list, determine first action
-        #load event_state object with event_queue
-        return
+        return self.get_fight_breakdown(self.get_fight_inputs(), self.seed)
+
+    def update_subtlety_breakdown(self, fight, damage_breakdown):
+        rates = fight.get_find_weakness_rates()
+        self.find_weakness_uptime, self.backstab_fw_rate, self.ambush_no_fw_rate, self.autoattack_fw_rate = rates
+        self.mos_multiplier = 1 + .1 * fight.auras.get_uptime('master_of_subtlety', fight.duration) / fight.duration
+        self.update_with_find_weakness(damage_breakdown)
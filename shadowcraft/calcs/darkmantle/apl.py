@@ -0,0 +1,222 @@
+import operator
+import re
+
+from shadowcraft.core.exceptions import InvalidInputException
+
+# Action priority lists for the Darkmantle simulator, written as text: one
+# action per line, tried in order at every decision point, with an optional
+# condition after ',if=':
+#
+#     # Comments and blank lines are skipped.
+#     slice_and_dice,if=!aura.slice_and_dice.up&combo_points>=1
+#     eviscerate,if=combo_points>=5
+#     sinister_strike
+#
+# Conditions combine numbers and fight state with + - * /, comparisons
+# (< <= > >= = !=), ! (not), & (and), | (or) and parentheses. The state that
+# can be read is:
+#
+#     aura.<name>.up, aura.<name>.remains, aura.<name>.stack
+#     cooldown.<name>.ready, cooldown.<name>.remains
+#     any name in the fight class's apl_expressions (energy, combo_points,
+#     time, and whatever the spec adds)
+#
+# A list is compiled once per fight class into the (action name, condition)
+# pairs Fight takes as its priority_list, each condition a closure of (fight,
+# time) built from the parsed expression, so a decision point runs no parsing
+# and no lookups by name.
+
+
+class InvalidPriorityListException(InvalidInputException):
+    pass
+
+
+token_pattern = re.compile(r'\s*(?:(\d+\.?\d*|\.\d+)|([A-Za-z_][A-Za-z0-9_.]*)|(<=|>=|!=|[<>=!&|+\-*/()]))')
+
+comparisons = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '=': operator.eq,
+    '!=': operator.ne,
+}
+
+arithmetic = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+# The most recently compiled lists, most recent last; a calculator compiles
+# its list for every fight, but the texts come from users, so only the last
+# max_compiled of them are kept.
+max_compiled = 8
+_compiled = []
+
+
+def compile_priority_list(text, fight_class):
+    key = (text, fight_class)
+    for index, (compiled_key, priority_list) in enumerate(_compiled):
+        if compiled_key == key:
+            if index != len(_compiled) - 1:
+                del _compiled[index]
+                _compiled.append((key, priority_list))
+            return list(priority_list)
+    priority_list = []
+    for line_number, line in enumerate(text.splitlines()):
+        line = line.split('#')[0].strip()
+        if not line:
+            continue
+        name, separator, condition = line.partition(',')
+        name = name.strip()
+        if not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', name):
+            raise InvalidPriorityListException(_('Line {line}: {name} is not an action name').format(line=line_number + 1, name=name))
+        if not separator:
+            priority_list.append((name, None))
+            continue
+        condition = condition.strip()
+        if not condition.startswith('if='):
+            raise InvalidPriorityListException(_('Line {line}: expected if= after the action name').format(line=line_number + 1))
+        try:
+            priority_list.append((name, Parser(condition[3:], fight_class.apl_expressions).parse()))
+        except InvalidPriorityListException as e:
+            raise InvalidPriorityListException(_('Line {line}: {error}').format(line=line_number + 1, error=e.error_msg))
+    _compiled.append((key, priority_list))
+    del _compiled[:-max_compiled]
+    return list(priority_list)
+
+
+class Parser(object):
+    # Recursive descent over the tokens of one condition. Every parse_*
+    # method returns a closure of (fight, time), along with whether it's a
+    # constant (and its value), so that constant operands can be folded into
+    # the closures that use them.
+
+    def __init__(self, text, expressions):
+        self.text = text
+        self.expressions = expressions
+        self.tokens = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = token_pattern.match(text, position)
+            if match is None:
+                raise InvalidPriorityListException(_('unexpected {text}').format(text=text[position:].strip()))
+            self.tokens.append(match.groups())
+            position = match.end()
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][2]
+        return None
+
+    def next(self):
+        if self.position >= len(self.tokens):
+            raise InvalidPriorityListException(_('unexpected end of {condition}').format(condition=self.text))
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self):
+        function, constant = self.parse_or()
+        if self.position < len(self.tokens):
+            raise InvalidPriorityListException(_('unexpected {token} in {condition}').format(token=''.join(t for t in self.tokens[self.position] if t), condition=self.text))
+        if constant is not None:
+            return lambda fight, time: constant[0]
+        return function
+
+    def parse_or(self):
+        function, constant = self.parse_and()
+        while self.peek() == '|':
+            self.next()
+            left = self.as_function(function, constant)
+            right = self.as_function(*self.parse_and())
+            function, constant = (lambda left, right: lambda fight, time: left(fight, time) or right(fight, time))(left, right), None
+        return function, constant
+
+    def parse_and(self):
+        function, constant = self.parse_not()
+        while self.peek() == '&':
+            self.next()
+            left = self.as_function(function, constant)
+            right = self.as_function(*self.parse_not())
+            function, constant = (lambda left, right: lambda fight, time: left(fight, time) and right(fight, time))(left, right), None
+        return function, constant
+
+    def parse_not(self):
+        if self.peek() == '!':
+            self.next()
+            operand = self.as_function(*self.parse_not())
+            return lambda fight, time: not operand(fight, time), None
+        return self.parse_comparison()
+
+    def parse_comparison(self):
+        function, constant = self.parse_sum()
+        if self.peek() in comparisons:
+            return self.binary(comparisons[self.next()[2]], function, constant, *self.parse_sum())
+        return function, constant
+
+    def parse_sum(self):
+        function, constant = self.parse_product()
+        while self.peek() in ('+', '-'):
+            function, constant = self.binary(arithmetic[self.next()[2]], function, constant, *self.parse_product())
+        return function, constant
+
+    def parse_product(self):
+        function, constant = self.parse_operand()
+        while self.peek() in ('*', '/'):
+            function, constant = self.binary(arithmetic[self.next()[2]], function, constant, *self.parse_operand())
+        return function, constant
+
+    def parse_operand(self):
+        number, name, symbol = self.next()
+        if number is not None:
+            return None, (float(number),)
+        if symbol == '(':
+            result = self.parse_or()
+            if self.peek() != ')':
+                raise InvalidPriorityListException(_('missing ) in {condition}').format(condition=self.text))
+            self.next()
+            return result
+        if name is not None:
+            return self.get_state(name), None
+        raise InvalidPriorityListException(_('unexpected {token} in {condition}').format(token=symbol, condition=self.text))
+
+    def as_function(self, function, constant):
+        if constant is not None:
+            return lambda fight, time: constant[0]
+        return function
+
+    def binary(self, op, left, left_constant, right, right_constant):
+        if left_constant is not None and right_constant is not None:
+            return None, (op(left_constant[0], right_constant[0]),)
+        if right_constant is not None:
+            value = right_constant[0]
+            return lambda fight, time: op(left(fight, time), value), None
+        if left_constant is not None:
+            value = left_constant[0]
+            return lambda fight, time: op(value, right(fight, time)), None
+        return lambda fight, time: op(left(fight, time), right(fight, time)), None
+
+    def get_state(self, name):
+        parts = name.split('.')
+        if len(parts) == 3 and parts[0] == 'aura':
+            aura, field = parts[1], parts[2]
+            if field == 'up':
+                return lambda fight, time: fight.auras.expires.get(aura, 0.) > time
+            if field == 'remains':
+                return lambda fight, time: max(fight.auras.expires.get(aura, 0.) - time, 0.)
+            if field == 'stack':
+                return lambda fight, time: fight.auras.get_stacks(aura, time)
+        elif len(parts) == 3 and parts[0] == 'cooldown':
+            cooldown, field = parts[1], parts[2]
+            if field == 'ready':
+                return lambda fight, time: fight.cooldowns.get(cooldown, 0.) <= time
+            if field == 'remains':
+                return lambda fight, time: max(fight.cooldowns.get(cooldown, 0.) - time, 0.)
+        elif name in self.expressions:
+            return self.expressions[name]
+        raise InvalidPriorityListException(_('unknown expression {name}').format(name=name))
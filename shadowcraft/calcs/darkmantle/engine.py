@@ -0,0 +1,415 @@
+import hashlib
+import heapq
+import random
+
+from shadowcraft.core.exceptions import InvalidInputException
+
+# The discrete-event core of the Darkmantle simulator. A fight is a heap of
+# timed events (swings, periodic ticks, decision points) processed in order;
+# everything else - energy, combo points, auras and cooldowns - is state that
+# the event handlers read and write. Energy is tracked lazily: it is only
+# brought up to date when something reads or changes it, so regeneration
+# doesn't need events of its own.
+
+
+class EventQueue(object):
+
+    def __init__(self):
+        self.heap = []
+        self.sequence = 0
+
+    def push(self, time, handler, data=None):
+        # The sequence number keeps events at the same time in the order they
+        # were pushed, and keeps the heap from ever comparing handlers.
+        heapq.heappush(self.heap, (time, self.sequence, handler, data))
+        self.sequence += 1
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class RandomStreams(dict):
+    # Independent random number generators by name, all derived from one
+    # seed: each kind of roll (a hand's swings, an ability's crits, a proc)
+    # draws from its own stream, streams[name]. Two fights with the same seed
+    # then make the n-th roll of each kind from the same number even when a
+    # change of inputs moves the rolls around in time or adds some of them,
+    # so their results stay paired (common random numbers). A seed of None
+    # picks one at random.
+
+    def __init__(self, seed=None):
+        dict.__init__(self)
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        self.seed = seed
+
+    def __missing__(self, name):
+        digest = hashlib.sha1('{seed}:{name}'.format(seed=self.seed, name=name)).hexdigest()
+        stream = random.Random(int(digest[:16], 16))
+        self[name] = stream
+        return stream
+
+
+class Auras(object):
+    # Buffs and debuffs by name, as the time they expire at. Uptime is
+    # accumulated for the auras listed in tracked, for the model's
+    # uptime-dependent multipliers.
+
+    def __init__(self, tracked=()):
+        self.expires = {}
+        self.stacks = {}
+        self.uptime = dict((name, 0.) for name in tracked)
+        self.applied_at = {}
+
+    def apply(self, name, time, duration, stacks=1):
+        if name in self.uptime:
+            # Count the time the last application was up for (until now, if
+            # it's being refreshed) before starting a new one.
+            if name in self.applied_at:
+                self.uptime[name] += min(self.expires[name], time) - self.applied_at[name]
+            self.applied_at[name] = time
+        self.expires[name] = time + duration
+        self.stacks[name] = stacks
+
+    def remove(self, name, time):
+        if self.is_up(name, time):
+            self.expires[name] = time
+        self.stacks[name] = 0
+
+    def is_up(self, name, time):
+        return self.expires.get(name, 0.) > time
+
+    def remaining(self, name, time):
+        return max(self.expires.get(name, 0.) - time, 0.)
+
+    def get_stacks(self, name, time):
+        if self.is_up(name, time):
+            return self.stacks.get(name, 0)
+        return 0
+
+    def get_uptime(self, name, end):
+        uptime = self.uptime[name]
+        if name in self.applied_at:
+            uptime += min(self.expires[name], end) - self.applied_at[name]
+        return uptime
+
+
+class Resources(object):
+    # Energy and combo points. Energy regenerates continuously at regen per
+    # second up to max_energy; anticipation keeps combo points past the
+    # fifth as charges that come back after the next finisher.
+
+    def __init__(self, max_energy, regen, anticipation=False):
+        self.max_energy = max_energy
+        self.energy = max_energy
+        self.regen = regen
+        self.last_update = 0.
+        self.combo_points = 0
+        self.anticipation = anticipation
+        self.anticipation_charges = 0
+        self.wasted_energy = 0.
+        self.wasted_combo_points = 0
+
+    def update(self, time):
+        energy = self.energy + (time - self.last_update) * self.regen
+        if energy > self.max_energy:
+            self.wasted_energy += energy - self.max_energy
+            energy = self.max_energy
+        self.energy = energy
+        self.last_update = time
+
+    def get_energy(self, time):
+        self.update(time)
+        return self.energy
+
+    def set_regen(self, time, regen):
+        self.update(time)
+        self.regen = regen
+
+    def gain_energy(self, time, amount):
+        self.update(time)
+        self.energy += amount
+        if self.energy > self.max_energy:
+            self.wasted_energy += self.energy - self.max_energy
+            self.energy = self.max_energy
+
+    def spend_energy(self, time, amount):
+        self.update(time)
+        self.energy -= amount
+
+    def time_until_energy(self, time, amount):
+        self.update(time)
+        if self.energy >= amount - 10 ** -9:
+            return 0.
+        return (amount - self.energy) / self.regen
+
+    def gain_combo_points(self, amount):
+        combo_points = self.combo_points + amount
+        if combo_points > 5:
+            if self.anticipation:
+                charges = self.anticipation_charges + combo_points - 5
+                self.wasted_combo_points += max(charges - 5, 0)
+                self.anticipation_charges = min(charges, 5)
+            else:
+                self.wasted_combo_points += combo_points - 5
+            combo_points = 5
+        self.combo_points = combo_points
+
+    def spend_combo_points(self):
+        combo_points = self.combo_points
+        self.combo_points = self.anticipation_charges
+        self.anticipation_charges = 0
+        return combo_points
+
+
+class Action(object):
+    # One entry of an action table: what it costs, which cooldown gates it,
+    # whether it triggers the global cooldown, and the method that carries
+    # it out. cost can be a number or a callable of (fight, time), for
+    # abilities whose cost depends on the state of the fight. pool is energy
+    # to wait for without spending it (pooling ahead of a cooldown), and
+    # ready an extra callable of (fight, time) the action needs to be usable
+    # at all. execute(time) returns how long the fight is busy afterwards,
+    # or None for the global cooldown (or nothing, if the action is off it).
+
+    def __init__(self, name, execute, cost=0, cooldown=None, on_gcd=True, ready=None, pool=0):
+        self.name = name
+        self.execute = execute
+        self.cost = cost
+        self.cooldown = cooldown
+        self.on_gcd = on_gcd
+        self.ready = ready
+        self.pool = pool
+
+
+class Fight(object):
+    # One simulated fight. Subclasses describe a spec: define_actions()
+    # returns the action table, get_priority_list() the (action name,
+    # condition) pairs tried in order at every decision point, with
+    # condition a callable of (fight, time) or None. counts collects the
+    # number of each attack over the fight; get_attacks_per_second() returns
+    # them in the form the damage model expects.
+    #
+    # At a decision point the first entry whose action is ready and whose
+    # condition holds is used. If there's not enough energy for it, the
+    # fight waits (pools) for it rather than moving down the list; energy
+    # gained in the meantime brings the decision forward.
+
+    tracked_auras = ()
+
+    # Fight state by name, for the conditions of priority lists written as
+    # text (see shadowcraft.calcs.darkmantle.apl).
+    apl_expressions = {
+        'energy': lambda fight, time: fight.resources.get_energy(time),
+        'energy_deficit': lambda fight, time: fight.resources.max_energy - fight.resources.get_energy(time),
+        'combo_points': lambda fight, time: fight.resources.combo_points,
+        'anticipation_charges': lambda fight, time: fight.resources.anticipation_charges,
+        'time': lambda fight, time: time,
+        'time_remaining': lambda fight, time: fight.duration - time,
+    }
+
+    def __init__(self, duration, seed, max_energy, energy_regen, gcd, mh_speed, oh_speed, mh_hit_chance,
+                 oh_hit_chance, response_time=.5, anticipation=False, priority_list=None):
+        self.duration = duration
+        self.streams = RandomStreams(seed)
+        self.mh_random = self.streams['mh_autoattacks']
+        self.oh_random = self.streams['oh_autoattacks']
+        self.gcd = gcd
+        self.mh_speed = mh_speed
+        self.oh_speed = oh_speed
+        self.mh_hit_chance = mh_hit_chance
+        self.oh_hit_chance = oh_hit_chance
+        self.response_time = response_time
+        self.resources = Resources(max_energy, energy_regen, anticipation)
+        self.auras = Auras(self.tracked_auras)
+        self.events = EventQueue()
+        self.cooldowns = {}
+        self.periodic_effects = {}
+        self.counts = {}
+        self.attack_speed = 1.
+        self.now = 0.
+        self.next_decision = None
+        self.busy_until = 0.
+        self.actions = self.define_actions()
+        if priority_list is None:
+            priority_list = self.get_priority_list()
+        for name, condition in priority_list:
+            if name not in self.actions:
+                raise InvalidInputException(_('There is no action named {name}').format(name=name))
+        # Flattened to what decide() looks at, in the order it looks.
+        self.priority_list = []
+        for name, condition in priority_list:
+            action = self.actions[name]
+            self.priority_list.append((action.cooldown, action.ready, condition, action))
+
+    def define_actions(self):
+        return {}
+
+    def get_priority_list(self):
+        return []
+
+    def count(self, attack, amount=1):
+        self.counts[attack] = self.counts.get(attack, 0) + amount
+
+    def count_finisher(self, attack, combo_points):
+        if attack not in self.counts:
+            self.counts[attack] = [0, 0, 0, 0, 0, 0]
+        self.counts[attack][combo_points] += 1
+
+    # State that conditions read.
+
+    def energy(self, time):
+        return self.resources.get_energy(time)
+
+    def combo_points(self):
+        return self.resources.combo_points
+
+    def cooldown_remaining(self, name, time):
+        return max(self.cooldowns.get(name, 0.) - time, 0.)
+
+    def cooldown_ready(self, name, time):
+        return self.cooldowns.get(name, 0.) <= time
+
+    def start_cooldown(self, name, time, length):
+        self.cooldowns[name] = time + length
+
+    def reduce_cooldown(self, name, amount):
+        if name in self.cooldowns:
+            self.cooldowns[name] -= amount
+
+    def apply_periodic(self, name, time, ticks, interval, handler):
+        # A damage over time effect: handler(time) runs every interval
+        # seconds, ticks times. Applying name again replaces the old effect
+        # (ticks it had left are lost); the aura of the same name is up while
+        # it lasts.
+        application = self.periodic_effects.get(name, 0) + 1
+        self.periodic_effects[name] = application
+        self.auras.apply(name, time, ticks * interval)
+        self.events.push(time + interval, self.periodic_tick, (name, application, ticks, interval, handler))
+
+    def periodic_tick(self, time, data):
+        name, application, ticks, interval, handler = data
+        if self.periodic_effects[name] != application:
+            return
+        handler(time)
+        if ticks > 1:
+            self.events.push(time + interval, self.periodic_tick, (name, application, ticks - 1, interval, handler))
+
+    # The event loop.
+
+    def run(self):
+        self.start()
+        heap = self.events.heap
+        pop = heapq.heappop
+        duration = self.duration
+        while heap:
+            time, sequence, handler, data = pop(heap)
+            if time >= duration:
+                break
+            self.now = time
+            handler(time, data)
+        self.resources.update(duration)
+        return self.counts
+
+    def start(self):
+        self.events.push(0., self.mh_swing)
+        self.events.push(0., self.oh_swing)
+        self.schedule_decision(0.)
+
+    def schedule_decision(self, time):
+        # Only the most recently scheduled decision counts; earlier ones are
+        # dropped when they come up.
+        self.next_decision = time
+        self.events.push(time, self.decide, time)
+
+    def gain_energy(self, time, amount):
+        self.resources.gain_energy(time, amount)
+        self.wake(time)
+
+    def set_energy_regen(self, time, regen):
+        self.resources.set_regen(time, regen)
+        self.wake(time)
+
+    def wake(self, time):
+        # Brings a pooling decision forward to now, so that it can look
+        # again at how long it has to wait.
+        if self.next_decision is not None and self.next_decision > time and self.busy_until <= time:
+            self.schedule_decision(time)
+
+    def decide(self, time, scheduled):
+        if scheduled != self.next_decision:
+            return
+        self.next_decision = None
+        cooldowns = self.cooldowns
+        resources = self.resources
+        for cooldown, ready, condition, action in self.priority_list:
+            if cooldown is not None and cooldowns.get(cooldown, 0.) > time:
+                continue
+            if ready is not None and not ready(self, time):
+                continue
+            if condition is not None and not condition(self, time):
+                continue
+            cost = action.cost
+            if callable(cost):
+                cost = cost(self, time)
+            wait = resources.time_until_energy(time, max(cost, action.pool))
+            if wait > 0:
+                self.schedule_decision(time + wait)
+                return
+            if cost:
+                resources.spend_energy(time, cost)
+            delay = action.execute(time)
+            if delay is None:
+                delay = self.get_gcd(time) if action.on_gcd else 0.
+            self.busy_until = time + delay
+            self.schedule_decision(time + delay)
+            return
+        # Nothing to do; look again in a moment.
+        self.schedule_decision(time + .1)
+
+    def get_gcd(self, time):
+        return self.gcd
+
+    # Autoattacks. Swing timers pick up attack speed changes at the next
+    # swing; attack_speed is kept up to date by whatever changes it.
+
+    def get_attack_speed(self, time):
+        return self.attack_speed
+
+    def is_autoattacking(self, time):
+        # Swings that come up while this is false are skipped.
+        return True
+
+    def mh_swing(self, time, data):
+        if self.is_autoattacking(time):
+            self.count('mh_autoattacks')
+            if self.mh_random.random() < self.mh_hit_chance:
+                self.count('mh_autoattack_hits')
+                self.on_mh_hit(time)
+        self.events.push(time + self.mh_speed / self.attack_speed, self.mh_swing)
+
+    def oh_swing(self, time, data):
+        if self.is_autoattacking(time):
+            self.count('oh_autoattacks')
+            if self.oh_random.random() < self.oh_hit_chance:
+                self.count('oh_autoattack_hits')
+                self.on_oh_hit(time)
+        self.events.push(time + self.oh_speed / self.attack_speed, self.oh_swing)
+
+    def on_mh_hit(self, time):
+        pass
+
+    def on_oh_hit(self, time):
+        pass
+
+    def get_attacks_per_second(self):
+        attacks_per_second = {}
+        for attack, count in self.counts.items():
+            if isinstance(count, list):
+                attacks_per_second[attack] = [float(i) / self.duration for i in count]
+            else:
+                attacks_per_second[attack] = float(count) / self.duration
+        return attacks_per_second
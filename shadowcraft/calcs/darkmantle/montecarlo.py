@@ -0,0 +1,85 @@
+import math
+
+# Summary statistics for batches of simulated fights: running means and
+# variances (Welford's method, so a long run doesn't lose precision), and
+# normal confidence intervals around them.
+
+# Coefficients of Acklam's rational approximation of the normal quantile
+# (relative error below 1.2e-9).
+quantile_a = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02, 1.383577518672690e+02,
+              -3.066479806614716e+01, 2.506628277459239e+00)
+quantile_b = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02, 6.680131188771972e+01,
+              -1.328068155288572e+01)
+quantile_c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00, -2.549732539343734e+00,
+              4.374664141464968e+00, 2.938163982698783e+00)
+quantile_d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00)
+
+def get_z_score(confidence):
+    # The two-sided normal quantile for a confidence level, from the upper
+    # tail's probability (math.erf isn't there before Python 2.7).
+    p = (1 + confidence) / 2.
+    a, b, c, d = quantile_a, quantile_b, quantile_c, quantile_d
+    if p <= .97575:
+        q = p - .5
+        r = q * q
+        return (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+            (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+    q = math.sqrt(-2 * math.log(1 - p))
+    return -(((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+        ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
+
+
+class RunningStatistics(object):
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.
+        self.sum_of_squares = 0.
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_of_squares += delta * (value - self.mean)
+
+    def get_standard_error(self):
+        if self.count < 2:
+            return float('inf')
+        return math.sqrt(self.sum_of_squares / (self.count - 1) / self.count)
+
+
+def summarize(batches, target_error=None, confidence=.95):
+    # batches yields lists of damage breakdowns, one per fight. Sources
+    # missing from a breakdown count as zero in it. Stops taking batches
+    # once the standard error of the mean dps, relative to the mean, is at
+    # or below target_error.
+    dps = RunningStatistics()
+    sources = {}
+    for breakdowns in batches:
+        for breakdown in breakdowns:
+            for source in breakdown:
+                if source not in sources:
+                    sources[source] = RunningStatistics()
+                    # Fights before this one didn't have it.
+                    for i in xrange(dps.count):
+                        sources[source].add(0.)
+            for source, statistics in sources.iteritems():
+                statistics.add(breakdown.get(source, 0.))
+            # fsum, so the total doesn't depend on the order of the sources.
+            dps.add(math.fsum(breakdown.values()))
+        if target_error is not None and dps.get_standard_error() <= target_error * abs(dps.mean):
+            break
+    z_score = get_z_score(confidence)
+    def interval(statistics):
+        error = z_score * statistics.get_standard_error()
+        return statistics.mean - error, statistics.mean + error
+    breakdown = {}
+    for source, statistics in sources.iteritems():
+        breakdown[source] = (statistics.mean,) + interval(statistics)
+    return {
+        'dps': dps.mean,
+        'standard_error': dps.get_standard_error(),
+        'interval': interval(dps),
+        'iterations': dps.count,
+        'breakdown': breakdown,
+    }
@@ -1,107 +1,630 @@
-import copy
-import gettext
-import __builtin__
-import math
-
-__builtin__._ = gettext.gettext
-
-from shadowcraft.calcs.rogue import RogueDamageCalculator
-from shadowcraft.core import exceptions
-from shadowcraft.objects import procs
-from shadowcraft.objects import proc_data
-
-
-class InputNotModeledException(exceptions.InvalidInputException):
-    # I'll return these when inputs don't make sense to the model.
-    pass
-
-class DarkmantleCalculator(object):
-    #
-
-    def __init__(self, stats, talents, glyphs, buffs, race, settings=None, level=85, target_level=None, char_class='rogue'):
-        self.tools = class_data.Util()
-        self.stats = stats
-        self.talents = talents
-        self.glyphs = glyphs
-        self.buffs = buffs
-        self.race = race
-        self.char_class = char_class
+from shadowcraft.calcs.darkmantle import engine
+
+# Rogue fights for the Darkmantle simulator. Each spec reads its constants off
+# an Aldriana calculator that has been initialized for the spec and whose
+# stats have been converged (determine_stats), so the simulation starts from
+# the same numbers as the closed-form model: ability costs and cooldowns, hit
+# and crit chances, energy regen and attack speed.
+
+
+class RogueFight(engine.Fight):
+    # What the three specs share: stealth and openers, vanish, marked for
+    # death, relentless strikes, rupture and slice and dice.
+
+    apl_expressions = dict(engine.Fight.apl_expressions, **{
+        'stealthed': lambda fight, time: fight.stealthed,
+    })
+
+    def __init__(self, calculator, current_stats, crit_rates, seed, priority_list=None):
+        settings = calculator.settings
+        self.calculator = calculator
         self.settings = settings
-        self.target_level = [target_level, level + 3][target_level is None]
-        if self.settings.is_pvp:
-            self.level_difference = 0
-        else:
-            self.level_difference = max(self.target_level - level, 0)
-        self.level = level
-        if self.stats.gear_buffs.mixology and (self.buffs.agi_flask or self.buffs.agi_flask_mop):
-            self.stats.agi += self.stats.gear_buffs.tradeskill_bonus()
-        if self.stats.gear_buffs.master_of_anatomy:
-            self.stats.crit += self.stats.gear_buffs.tradeskill_bonus('master_of_anatomy')
-        if self.race.race_name == 'undead':
-            self.stats.procs.set_proc('touch_of_the_grave')
-        self._set_constants_for_class()
-        
-        if self.settings.is_pvp:
-            self.base_one_hand_miss_rate = .03
-            self.base_parry_chance = .05
-            self.base_dodge_chance = .03
-            self.base_spell_miss_rate = .06
+        self.talents = calculator.talents
+        self.glyphs = calculator.glyphs
+        self.gear_buffs = calculator.stats.gear_buffs
+        self.current_stats = current_stats
+        self.crit_rates = crit_rates
+        self.haste_multiplier = calculator.stats.get_haste_multiplier_from_rating(current_stats['haste']) * calculator.true_haste_mod
+        self.base_attack_speed = calculator.base_speed_multiplier * self.haste_multiplier
+        self.relentless_strikes = calculator.relentless_strikes_energy_return_per_cp
+        self.bonus_finisher_cp = self.gear_buffs.rogue_t15_2pc_bonus_cp()
+        self.opener_name = settings.opener_name
+        self.opener_cost_modifier = calculator.get_shadow_focus_multiplier()
+        self.stealthed = settings.use_opener != 'never'
+        self.stealth_source = 'opener'
+        self.openers = 0
+        engine.Fight.__init__(self, settings.duration, seed, calculator.max_energy, 0., 1. + settings.latency,
+                              calculator.stats.mh.speed, calculator.stats.oh.speed, calculator.dw_mh_hit_chance,
+                              calculator.dw_oh_hit_chance, settings.response_time, bool(self.talents.anticipation),
+                              priority_list)
+        self.resources.regen = self.get_energy_regen(0.)
+        self.attack_speed = self.get_attack_speed(0.)
+
+    def get_energy_regen(self, time):
+        return self.calculator.base_energy_regen * self.haste_multiplier + self.calculator.bonus_energy_regen
+
+    def update_energy_regen(self, time):
+        self.set_energy_regen(time, self.get_energy_regen(time))
+
+    def get_spell_cost(self, ability, cost_modifier=1.):
+        return self.calculator.get_spell_stats(ability, cost_mod=cost_modifier)[0]
+
+    def use_cooldown(self, name, time, spell=None):
+        # Cooldowns come back response_time after they're ready: the time it
+        # takes to notice.
+        self.start_cooldown(name, time, self.calculator.get_spell_cd(spell or name) + self.response_time)
+
+    def roll(self, chance, stream):
+        return self.streams[stream].random() < chance
+
+    def is_crit(self, attack, stream=None):
+        # stream defaults to the attack's own; attacks that roll more than
+        # once name a stream for each roll.
+        return self.streams[stream or attack].random() < self.crit_rates[attack]
+
+    # Actions. Everything but the off-gcd cooldowns goes through ability(),
+    # which takes the rogue out of stealth once the ability is used.
+
+    def define_actions(self):
+        actions = {
+            'vanish': engine.Action('vanish', self.vanish, cooldown='vanish', on_gcd=False),
+            'marked_for_death': engine.Action('marked_for_death', self.marked_for_death, cooldown='marked_for_death', on_gcd=False),
+        }
+        for opener in ('ambush', 'garrote'):
+            actions[opener] = self.ability(opener, getattr(self, opener), self.get_opener_cost(opener))
+        return actions
+
+    def ability(self, name, execute, cost=0, cooldown=None, ready=None, pool=0):
+        def use(time):
+            delay = execute(time)
+            if self.stealthed:
+                self.leave_stealth(time)
+            return delay
+        return engine.Action(name, use, cost, cooldown, ready=ready, pool=pool)
+
+    def get_opener_cost(self, opener):
+        # Shadow focus makes abilities used from stealth cheaper.
+        cost = self.get_spell_cost(opener)
+        def get_cost(fight, time):
+            if fight.stealthed:
+                return cost * fight.opener_cost_modifier
+            return cost
+        return get_cost
+
+    def get_opener_priority_list(self):
+        # Vanish whenever it's up (if openers are used on cooldown) and open
+        # from stealth; finishers and builders used as openers are just the
+        # next ability in the rotation.
+        entries = []
+        if self.settings.use_opener == 'always':
+            entries.append(('vanish', lambda fight, time: not fight.stealthed))
+        if self.opener_name in ('ambush', 'garrote'):
+            entries.append((self.opener_name, lambda fight, time: fight.stealthed))
+        if self.talents.marked_for_death:
+            entries.append(('marked_for_death', lambda fight, time: fight.resources.combo_points == 0))
+        return entries
+
+    def is_autoattacking(self, time):
+        return not self.stealthed
+
+    def vanish(self, time):
+        self.use_cooldown('vanish', time)
+        self.stealthed = True
+        self.stealth_source = 'vanish'
+
+    def leave_stealth(self, time):
+        self.stealthed = False
+        self.openers += 1
+
+    def marked_for_death(self, time):
+        self.use_cooldown('marked_for_death', time)
+        self.resources.gain_combo_points(5)
+
+    def ambush(self, time):
+        self.count('ambush')
+        self.resources.gain_combo_points(2)
+        self.on_mh_strike(time)
+
+    def garrote(self, time):
+        self.count('garrote')
+        self.count('garrote_ticks', 6)
+        self.resources.gain_combo_points(1)
+
+    def on_mh_strike(self, time):
+        pass
+
+    # Finishers.
+
+    def finish(self, time, attack=None):
+        # Spends the combo points, counts the finisher by its size (if it's
+        # given an attack to count it under) and returns the size.
+        combo_points = self.resources.spend_combo_points()
+        if attack is not None:
+            self.count_finisher(attack, combo_points)
+        self.gain_energy(time, self.relentless_strikes * combo_points)
+        self.on_finisher(time, combo_points)
+        return combo_points
+
+    def on_finisher(self, time, combo_points):
+        pass
+
+    def rupture(self, time):
+        combo_points = self.finish(time)
+        self.count('rupture')
+        ticks = 2 * (1 + combo_points + self.bonus_finisher_cp)
+        self.apply_periodic('rupture', time, ticks, 2., lambda tick_time: self.rupture_tick(tick_time, combo_points))
+
+    def rupture_tick(self, time, combo_points):
+        if 'rupture_ticks' not in self.counts:
+            self.counts['rupture_ticks'] = [0, 0, 0, 0, 0, 0]
+        self.counts['rupture_ticks'][combo_points] += 1
+
+    def slice_and_dice(self, time):
+        combo_points = self.finish(time)
+        self.auras.apply('slice_and_dice', time, 6. * (1 + combo_points + self.bonus_finisher_cp))
+        self.update_attack_speed(time)
+        self.events.push(self.auras.expires['slice_and_dice'], self.end_slice_and_dice)
+
+    def end_slice_and_dice(self, time, data):
+        self.update_attack_speed(time)
+
+    def get_attack_speed(self, time):
+        return self.base_attack_speed
+
+    def update_attack_speed(self, time):
+        self.attack_speed = self.get_attack_speed(time)
+
+
+class AssassinationFight(RogueFight):
+    # Mutilate (or dispatch, in the execute range and on blindside procs)
+    # with seal fate; rupture kept up, envenom at the cycle's minimum size,
+    # vendetta on cooldown.
+    tracked_auras = ('vendetta',)
+
+    apl_expressions = dict(RogueFight.apl_expressions, **{
+        'execute_phase': lambda fight, time: fight.in_execute(time),
+        'min_envenom_size': lambda fight, time: fight.min_envenom_size[fight.in_execute(time)],
+        'prioritize_rupture_uptime': lambda fight, time: fight.rupture_for_uptime[fight.in_execute(time)],
+    })
+
+    def __init__(self, calculator, current_stats, crit_rates, seed, priority_list=None):
+        cycle = calculator.settings.cycle
+        settings = calculator.settings
+        self.execute_start = settings.duration * (1 - settings.time_in_execute_range)
+        self.min_envenom_size = (cycle.min_envenom_size_non_execute, cycle.min_envenom_size_execute)
+        self.rupture_for_uptime = (cycle.prioritize_rupture_uptime_non_execute, cycle.prioritize_rupture_uptime_execute)
+        self.cost_modifier = calculator.stats.gear_buffs.rogue_t15_4pc_reduced_cost()
+        if calculator.level == 100:
+            self.venomous_wounds_chance = 1.
         else:
-            self.base_one_hand_miss_rate = 0 #.03 + .015 * self.level_difference
-            self.base_parry_chance = .03 + .015 * self.level_difference
-            self.base_dodge_chance = 0 #.03 + .015 * self.level_difference
-            self.base_spell_miss_rate = 0 #.06 + .03 * self.level_difference
-        
-        self.base_dw_miss_rate = self.base_one_hand_miss_rate + .19
-        self.base_block_chance = .03 + .015 * self.level_difference
-        #load stats, class, procs, etc to main content
-        #load class modules
-        #load class global settings to global_settings
-        #load spell/mechanic data to global data
-        return
-    
-    def get_dps(self):
-        super(AldrianasRogueDamageCalculator, self).get_dps()
-        if self.settings.is_assassination_rogue():
-            #self.init_assassination()
-            return self.assassination_dps_estimate()
-        elif self.settings.is_combat_rogue():
-            return self.combat_dps_estimate()
-        elif self.settings.is_subtlety_rogue():
-            return self.subtlety_dps_estimate()
+            self.venomous_wounds_chance = .75
+        self.vendetta_duration = calculator.vendetta_duration
+        RogueFight.__init__(self, calculator, current_stats, crit_rates, seed, priority_list)
+
+    def in_execute(self, time):
+        return time >= self.execute_start
+
+    def define_actions(self):
+        actions = RogueFight.define_actions(self)
+        cost = self.get_spell_cost
+        actions.update({
+            'vendetta': engine.Action('vendetta', self.vendetta, cooldown='vendetta', on_gcd=False),
+            'mutilate': self.ability('mutilate', self.mutilate, cost('mutilate', self.cost_modifier)),
+            'dispatch': self.ability('dispatch', self.dispatch, self.get_dispatch_cost),
+            'rupture': self.ability('rupture', self.rupture, cost('rupture', self.cost_modifier)),
+            'envenom': self.ability('envenom', self.envenom, cost('envenom', self.cost_modifier)),
+        })
+        return actions
+
+    def get_priority_list(self):
+        def rupture(fight, time):
+            if fight.auras.is_up('rupture', time) or not fight.resources.combo_points:
+                return False
+            execute = fight.in_execute(time)
+            return fight.rupture_for_uptime[execute] or fight.resources.combo_points >= fight.min_envenom_size[execute]
+        def envenom(fight, time):
+            return fight.resources.combo_points >= fight.min_envenom_size[fight.in_execute(time)]
+        def dispatch(fight, time):
+            return fight.in_execute(time) or fight.auras.is_up('blindside', time)
+        return [('vendetta', None)] + self.get_opener_priority_list() + [
+            ('rupture', rupture),
+            ('envenom', envenom),
+            ('dispatch', dispatch),
+            ('mutilate', None),
+        ]
+
+    def get_dispatch_cost(self, fight, time):
+        if self.auras.is_up('blindside', time):
+            return 0
+        return self.get_spell_cost('dispatch', self.cost_modifier)
+
+    def seal_fate(self, time):
+        self.resources.gain_combo_points(1)
+        if self.gear_buffs.rogue_t16_2pc_bonus():
+            self.gain_energy(time, 6)
+
+    def mutilate(self, time):
+        self.count('mutilate')
+        self.resources.gain_combo_points(2)
+        # Both hands roll every time, so each stream is drawn from once per
+        # mutilate whatever the other one rolled.
+        mh_crit = self.is_crit('mutilate', 'mh_mutilate')
+        oh_crit = self.is_crit('mutilate', 'oh_mutilate')
+        if mh_crit or oh_crit:
+            self.seal_fate(time)
+        if self.roll(.3, 'blindside'):
+            self.auras.apply('blindside', time, 10.)
+
+    def dispatch(self, time):
+        self.count('dispatch')
+        self.auras.remove('blindside', time)
+        self.resources.gain_combo_points(1)
+        if self.is_crit('dispatch'):
+            self.seal_fate(time)
+
+    def envenom(self, time):
+        self.finish(time, 'envenom')
+
+    def rupture_tick(self, time, combo_points):
+        RogueFight.rupture_tick(self, time, combo_points)
+        if self.roll(self.venomous_wounds_chance, 'venomous_wounds'):
+            self.count('venomous_wounds')
+            self.gain_energy(time, 10)
+
+    def vendetta(self, time):
+        self.use_cooldown('vendetta', time)
+        self.auras.apply('vendetta', time, self.vendetta_duration)
+
+
+class CombatFight(RogueFight):
+    # Sinister strike into 5 point eviscerates, with revealing strike and
+    # slice and dice kept up; main gauche and combat potency off the
+    # autoattacks, bandit's guile off the strikes, and adrenaline rush and
+    # killing spree on cooldown (shortened by restless blades).
+
+    def __init__(self, calculator, current_stats, crit_rates, seed, priority_list=None):
+        self.cost_modifier = calculator.stats.gear_buffs.rogue_t15_4pc_modifier()
+        self.main_gauche_chance = calculator.combat_mastery_conversion * calculator.stats.get_mastery_from_rating(current_stats['mastery'])
+        self.combat_potency_chance = .2 * calculator.stats.oh.speed / 1.4
+        self.extra_cp_chance = calculator.extra_cp_chance
+        self.revealing_strike_duration = calculator.rvs_duration
+        if calculator.level == 100:
+            self.guile_levels = (0., .1, .2, .5)
         else:
-            raise InputNotModeledException(_('You must specify a spec.'))
-
-    def get_dps_breakdown(self):
-        if self.settings.is_assassination_rogue():
-            return self.assassination_dps_breakdown()
-        elif self.settings.is_combat_rogue():
-            return self.combat_dps_breakdown()
-        elif self.settings.is_subtlety_rogue():
-            return self.subtlety_dps_breakdown()
+            self.guile_levels = (0., .1, .2, .3)
+        self.guile_level = 0
+        self.guile_hits = 0
+        self.guile_changed = 0.
+        self.guile_total = 0.
+        self.guile_expiry = 0
+        RogueFight.__init__(self, calculator, current_stats, crit_rates, seed, priority_list)
+        if calculator.level == 100:
+            self.adrenaline_rush_gcd = self.gcd - .5
         else:
-            raise InputNotModeledException(_('You must specify a spec.'))
-    
-    def assassination_dps_estimate(self):
-        return sum(self.assassination_dps_breakdown().values())
-    def assassination_dps_breakdown(self):
-        #determine pre-fight sequence, establish baseline event_queue and auras
-        #read priority list, determine first action
-        #load event_state object with event_queue
-        return
-    
-    def combat_dps_estimate(self):
-        return sum(self.combat_dps_breakdown().values())
-    def combat_dps_breakdown(self):
-        #determine pre-fight sequence, establish baseline event_queue and auras
-        #read priority list, determine first action
-        #load event_state object with event_queue
-        return
-    
-    def subtlety_dps_estimate(self):
-        return sum(self.subtlety_dps_breakdown().values())
-    def subtlety_dps_breakdown(self):
-        #determine pre-fight sequence, establish baseline event_queue and auras
-        #read priority list, determine first action
-        #load event_state object with event_queue
-        return
+            self.adrenaline_rush_gcd = self.gcd - .2
+
+    def get_energy_regen(self, time):
+        regen = 12.
+        if self.settings.cycle.blade_flurry:
+            regen *= .8
+        if self.auras.is_up('adrenaline_rush', time):
+            regen *= 2
+        if self.talents.lemon_zest:
+            regen *= 1 + .05 * (1 + min(self.settings.num_boss_adds, 2))
+        return regen * self.haste_multiplier + self.calculator.bonus_energy_regen
+
+    def get_attack_speed(self, time):
+        speed = self.base_attack_speed / 1.4
+        if self.auras.is_up('slice_and_dice', time):
+            speed *= 1.4
+        if self.auras.is_up('adrenaline_rush', time):
+            speed *= 1.2
+        return speed
+
+    def get_gcd(self, time):
+        if self.auras.is_up('adrenaline_rush', time):
+            return self.adrenaline_rush_gcd
+        return self.gcd
+
+    def define_actions(self):
+        actions = RogueFight.define_actions(self)
+        cost = self.get_spell_cost
+        actions.update({
+            'adrenaline_rush': engine.Action('adrenaline_rush', self.adrenaline_rush, cooldown='adrenaline_rush', on_gcd=False),
+            'killing_spree': self.ability('killing_spree', self.killing_spree, cooldown='killing_spree'),
+            'slice_and_dice': self.ability('slice_and_dice', self.slice_and_dice, cost('slice_and_dice', self.cost_modifier)),
+            'revealing_strike': self.ability('revealing_strike', self.revealing_strike, cost('revealing_strike', self.cost_modifier)),
+            'eviscerate': self.ability('eviscerate', self.eviscerate, cost('eviscerate', self.cost_modifier)),
+            'sinister_strike': self.ability('sinister_strike', self.sinister_strike, cost('sinister_strike', self.cost_modifier)),
+        })
+        return actions
+
+    def get_priority_list(self):
+        def slice_and_dice(fight, time):
+            combo_points = fight.resources.combo_points
+            remaining = fight.auras.remaining('slice_and_dice', time)
+            return (remaining == 0 and combo_points) or (remaining < 3 and combo_points >= 4)
+        def revealing_strike(fight, time):
+            return fight.resources.combo_points < 5 and not fight.auras.is_up('revealing_strike', time)
+        def eviscerate(fight, time):
+            return fight.resources.combo_points >= 5
+        return [('adrenaline_rush', None)] + self.get_opener_priority_list() + [
+            ('slice_and_dice', slice_and_dice),
+            ('killing_spree', None),
+            ('revealing_strike', revealing_strike),
+            ('eviscerate', eviscerate),
+            ('sinister_strike', None),
+        ]
+
+    def main_gauche(self, time):
+        if self.roll(self.main_gauche_chance, 'main_gauche'):
+            self.count('main_gauche')
+            if self.roll(.2, 'main_gauche_combat_potency'):
+                self.gain_energy(time, 15)
+
+    def on_mh_hit(self, time):
+        self.main_gauche(time)
+
+    def on_oh_hit(self, time):
+        if self.roll(self.combat_potency_chance, 'combat_potency'):
+            self.gain_energy(time, 15)
+
+    def on_mh_strike(self, time):
+        self.main_gauche(time)
+
+    def on_finisher(self, time, combo_points):
+        # Ruthlessness, and restless blades.
+        if self.roll(.2 * combo_points, 'ruthlessness'):
+            self.resources.gain_combo_points(1)
+        for cooldown in ('adrenaline_rush', 'killing_spree'):
+            self.reduce_cooldown(cooldown, 2. * combo_points)
+
+    def bandits_guile(self, time):
+        self.guile_hits += 1
+        if self.guile_hits % 4 or self.guile_level == 3:
+            return
+        self.set_guile_level(time, self.guile_level + 1)
+        if self.guile_level == 3:
+            self.guile_expiry += 1
+            self.events.push(time + 15., self.end_deep_insight, self.guile_expiry)
+
+    def end_deep_insight(self, time, expiry):
+        if expiry == self.guile_expiry:
+            self.guile_hits = 0
+            self.set_guile_level(time, 0)
+
+    def set_guile_level(self, time, level):
+        self.guile_total += self.guile_levels[self.guile_level] * (time - self.guile_changed)
+        self.guile_changed = time
+        self.guile_level = level
+
+    def get_bandits_guile_multiplier(self):
+        total = self.guile_total + self.guile_levels[self.guile_level] * (self.duration - self.guile_changed)
+        return 1 + total / self.duration
+
+    def sinister_strike(self, time):
+        self.count('sinister_strike')
+        self.resources.gain_combo_points(1)
+        if self.auras.is_up('revealing_strike', time) and self.roll(self.extra_cp_chance, 'revealing_strike'):
+            self.resources.gain_combo_points(1)
+            if self.gear_buffs.rogue_t16_2pc_bonus():
+                self.gain_energy(time, 15)
+        self.on_mh_strike(time)
+        self.bandits_guile(time)
+
+    def revealing_strike(self, time):
+        self.count('revealing_strike')
+        self.resources.gain_combo_points(1)
+        self.auras.apply('revealing_strike', time, self.revealing_strike_duration)
+        self.on_mh_strike(time)
+        self.bandits_guile(time)
+
+    def eviscerate(self, time):
+        self.finish(time, 'eviscerate')
+        self.on_mh_strike(time)
+
+    def adrenaline_rush(self, time):
+        self.use_cooldown('adrenaline_rush', time)
+        self.auras.apply('adrenaline_rush', time, 15.)
+        self.update_energy_regen(time)
+        self.update_attack_speed(time)
+        self.events.push(time + 15., self.end_adrenaline_rush)
+
+    def end_adrenaline_rush(self, time, data):
+        self.update_energy_regen(time)
+        self.update_attack_speed(time)
+
+    def killing_spree(self, time):
+        # Seven hits with each weapon over a three second channel.
+        self.use_cooldown('killing_spree', time)
+        self.count('mh_killing_spree', 7)
+        self.count('oh_killing_spree', 7)
+        for hit in xrange(7):
+            self.main_gauche(time)
+        return 3.
+
+
+class SubtletyFight(RogueFight):
+    # Backstab (or hemorrhage) into rupture, slice and dice and 5 point
+    # eviscerates, with honor among thieves combo points from the raid,
+    # energetic recovery, and ambushes out of shadow dance, vanish (reset by
+    # preparation) and shadowmeld, opened with premeditation and applying
+    # find weakness.
+    tracked_auras = ('find_weakness', 'master_of_subtlety')
+
+    apl_expressions = dict(RogueFight.apl_expressions, **{
+        'can_ambush': lambda fight, time: fight.can_ambush(time),
+    })
+
+    def __init__(self, calculator, current_stats, crit_rates, seed, priority_list=None):
+        cycle = calculator.settings.cycle
+        self.cost_modifier = calculator.stats.gear_buffs.rogue_t15_4pc_reduced_cost()
+        self.hat_triggers_per_second = cycle.raid_crits_per_second
+        self.use_hemorrhage = cycle.use_hemorrhage
+        self.builder = ['backstab', 'hemorrhage'][cycle.use_hemorrhage == 'always']
+        self.snd_speed = 1 + .4 * (1 + calculator.subtlety_mastery_conversion * calculator.stats.get_mastery_from_rating(current_stats['mastery']))
+        self.shadow_dance_duration = calculator.shd_duration
+        self.subterfuge_duration = 3. * calculator.talents.subterfuge * [1, 2][calculator.glyphs.vanish]
+        self.ambush_pool = calculator.max_energy - calculator.get_adv_param('max_pool_reduct', 10, min_bound=0, max_bound=50)
+        self.backstabs_with_find_weakness = 0
+        self.ambushes_without_find_weakness = 0
+        self.autoattacks_with_find_weakness = 0
+        RogueFight.__init__(self, calculator, current_stats, crit_rates, seed, priority_list)
+
+    def get_attack_speed(self, time):
+        speed = self.base_attack_speed / 1.4
+        if self.auras.is_up('slice_and_dice', time):
+            speed *= self.snd_speed
+        return speed
+
+    def define_actions(self):
+        actions = RogueFight.define_actions(self)
+        cost = self.get_spell_cost
+        actions.update({
+            'shadow_dance': engine.Action('shadow_dance', self.shadow_dance, cooldown='shadow_dance', on_gcd=False, pool=self.ambush_pool),
+            'shadowmeld': engine.Action('shadowmeld', self.shadowmeld, cooldown='shadowmeld', on_gcd=False),
+            'preparation': engine.Action('preparation', self.preparation, cooldown='preparation', on_gcd=False),
+            'premeditation': engine.Action('premeditation', self.premeditation, cooldown='premeditation', on_gcd=False),
+            'ambush': self.ability('ambush', self.ambush, self.get_ambush_cost),
+            'slice_and_dice': self.ability('slice_and_dice', self.slice_and_dice, cost('slice_and_dice', self.cost_modifier)),
+            'rupture': self.ability('rupture', self.rupture, cost('rupture', self.cost_modifier)),
+            'eviscerate': self.ability('eviscerate', self.eviscerate, cost('eviscerate', self.cost_modifier)),
+            'backstab': self.ability('backstab', self.backstab, cost('backstab', self.cost_modifier)),
+            'hemorrhage': self.ability('hemorrhage', self.hemorrhage, cost('hemorrhage', self.cost_modifier)),
+        })
+        return actions
+
+    def can_ambush(self, time):
+        return self.stealthed or self.auras.is_up('shadow_dance', time) or self.auras.is_up('subterfuge', time)
+
+    def get_priority_list(self):
+        def can_ambush(fight, time):
+            return fight.can_ambush(time)
+        def not_stealthed(fight, time):
+            return not can_ambush(fight, time)
+        def premeditation(fight, time):
+            return can_ambush(fight, time) and fight.resources.combo_points <= 3
+        def preparation(fight, time):
+            return fight.cooldown_remaining('vanish', time) > 60
+        def slice_and_dice(fight, time):
+            combo_points = fight.resources.combo_points
+            remaining = fight.auras.remaining('slice_and_dice', time)
+            return (remaining == 0 and combo_points) or (remaining < 3 and combo_points == 5)
+        def rupture(fight, time):
+            return fight.resources.combo_points == 5 and not fight.auras.is_up('rupture', time)
+        def eviscerate(fight, time):
+            return fight.resources.combo_points == 5
+        def hemorrhage(fight, time):
+            return not fight.auras.is_up('hemorrhage', time)
+        priority_list = [('shadow_dance', not_stealthed)]
+        if self.settings.use_opener == 'always':
+            priority_list.append(('vanish', not_stealthed))
+            priority_list.append(('preparation', preparation))
+        if self.calculator.race.shadowmeld:
+            priority_list.append(('shadowmeld', not_stealthed))
+        if self.talents.marked_for_death:
+            priority_list.append(('marked_for_death', lambda fight, time: fight.resources.combo_points == 0))
+        priority_list += [
+            ('premeditation', premeditation),
+            ('slice_and_dice', slice_and_dice),
+            ('rupture', rupture),
+            ('eviscerate', eviscerate),
+            ('ambush', can_ambush),
+        ]
+        if self.use_hemorrhage not in ('always', 'never'):
+            priority_list.append(('hemorrhage', hemorrhage))
+        priority_list.append((self.builder, None))
+        return priority_list
+
+    def start(self):
+        RogueFight.start(self)
+        self.events.push(2., self.energetic_recovery)
+        if self.hat_triggers_per_second:
+            self.schedule_honor_among_thieves(0.)
+
+    def energetic_recovery(self, time, data):
+        if self.auras.is_up('slice_and_dice', time):
+            self.gain_energy(time, 8)
+        self.events.push(time + 2., self.energetic_recovery)
+
+    def schedule_honor_among_thieves(self, time):
+        self.events.push(time + 2. + self.streams['honor_among_thieves'].expovariate(self.hat_triggers_per_second), self.honor_among_thieves)
+
+    def honor_among_thieves(self, time, data):
+        self.resources.gain_combo_points(1)
+        if self.gear_buffs.rogue_t16_2pc_bonus():
+            self.gain_energy(time, 2)
+        self.wake(time)
+        self.schedule_honor_among_thieves(time)
+
+    def get_ambush_cost(self, fight, time):
+        if self.auras.is_up('shadow_dance', time):
+            return self.calculator.sd_ambush_cost
+        if self.stealthed:
+            return self.calculator.normal_ambush_cost * self.opener_cost_modifier
+        return self.calculator.normal_ambush_cost
+
+    def leave_stealth(self, time):
+        RogueFight.leave_stealth(self, time)
+        if self.stealth_source == 'shadowmeld':
+            return
+        if self.subterfuge_duration:
+            self.auras.apply('subterfuge', time, self.subterfuge_duration)
+        self.auras.apply('master_of_subtlety', time, 6. + self.subterfuge_duration)
+
+    def shadow_dance(self, time):
+        self.use_cooldown('shadow_dance', time)
+        self.auras.apply('shadow_dance', time, self.shadow_dance_duration)
+
+    def shadowmeld(self, time):
+        self.use_cooldown('shadowmeld', time)
+        self.stealthed = True
+        self.stealth_source = 'shadowmeld'
+
+    def preparation(self, time):
+        self.use_cooldown('preparation', time)
+        self.cooldowns['vanish'] = time
+
+    def premeditation(self, time):
+        self.start_cooldown('premeditation', time, 20.)
+        self.resources.gain_combo_points(2)
+
+    def on_mh_hit(self, time):
+        if self.auras.is_up('find_weakness', time):
+            self.autoattacks_with_find_weakness += 1
+
+    def ambush(self, time):
+        if not self.auras.is_up('find_weakness', time):
+            self.ambushes_without_find_weakness += 1
+        RogueFight.ambush(self, time)
+        self.auras.apply('find_weakness', time, 10.)
+
+    def backstab(self, time):
+        self.count('backstab')
+        if self.auras.is_up('find_weakness', time):
+            self.backstabs_with_find_weakness += 1
+        self.resources.gain_combo_points(1)
+
+    def hemorrhage(self, time):
+        self.count('hemorrhage')
+        self.resources.gain_combo_points(1)
+        self.apply_periodic('hemorrhage', time, 8, 3., self.hemorrhage_tick)
+
+    def hemorrhage_tick(self, time):
+        self.count('hemorrhage_ticks')
+
+    def eviscerate(self, time):
+        self.finish(time, 'eviscerate')
+
+    def get_find_weakness_rates(self):
+        # (find weakness uptime, share of backstabs with it, share of
+        # ambushes without it, share of autoattacks with it).
+        counts = self.counts
+        def share(part, whole):
+            if not counts.get(whole):
+                return 0.
+            return float(part) / counts[whole]
+        return (self.auras.get_uptime('find_weakness', self.duration) / self.duration,
+                share(self.backstabs_with_find_weakness, 'backstab'),
+                share(self.ambushes_without_find_weakness, 'ambush'),
+                share(self.autoattacks_with_find_weakness, 'mh_autoattack_hits'))
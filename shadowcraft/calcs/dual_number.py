@@ -0,0 +1,134 @@
+import math
+
+# Forward-mode automatic differentiation. A DualNumber carries a real value
+# along with its partial derivatives with respect to a fixed set of input
+# variables, so a single pass through the model yields the value and the
+# whole gradient. Comparisons, truth testing and float() only look at the
+# real part, which keeps the branching of the model code unchanged; anything
+# that goes through float() (math.floor, for instance) drops the derivatives,
+# which is right for step functions but wrong for smooth ones, so use the
+# operators (abs(), **) rather than the math module on values that carry
+# derivatives.
+
+class DualNumber(object):
+    __slots__ = ('real', 'dual')
+
+    def __init__(self, real, dual):
+        self.real = real
+        self.dual = dual
+
+    def __repr__(self):
+        return 'DualNumber({real!r}, {dual!r})'.format(real=self.real, dual=self.dual)
+
+    def __float__(self):
+        return float(self.real)
+
+    def __int__(self):
+        return int(self.real)
+
+    def __nonzero__(self):
+        return bool(self.real)
+
+    def __hash__(self):
+        return hash(self.real)
+
+    def __eq__(self, other):
+        return self.real == real_part(other)
+
+    def __ne__(self, other):
+        return self.real != real_part(other)
+
+    def __lt__(self, other):
+        return self.real < real_part(other)
+
+    def __le__(self, other):
+        return self.real <= real_part(other)
+
+    def __gt__(self, other):
+        return self.real > real_part(other)
+
+    def __ge__(self, other):
+        return self.real >= real_part(other)
+
+    def __neg__(self):
+        return DualNumber(-self.real, tuple([-d for d in self.dual]))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if self.real < 0:
+            return -self
+        return self
+
+    def __add__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.real + other.real, tuple([a + b for a, b in zip(self.dual, other.dual)]))
+        return DualNumber(self.real + other, self.dual)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.real - other.real, tuple([a - b for a, b in zip(self.dual, other.dual)]))
+        return DualNumber(self.real - other, self.dual)
+
+    def __rsub__(self, other):
+        return DualNumber(other - self.real, tuple([-d for d in self.dual]))
+
+    def __mul__(self, other):
+        if isinstance(other, DualNumber):
+            a, b = self.real, other.real
+            return DualNumber(a * b, tuple([a * db + b * da for da, db in zip(self.dual, other.dual)]))
+        return DualNumber(self.real * other, tuple([d * other for d in self.dual]))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, DualNumber):
+            a, b = self.real, other.real
+            b_squared = b * b
+            return DualNumber(a / b, tuple([(da * b - a * db) / b_squared for da, db in zip(self.dual, other.dual)]))
+        return DualNumber(self.real / other, tuple([d / other for d in self.dual]))
+
+    def __rtruediv__(self, other):
+        b = self.real
+        factor = -other / (b * b)
+        return DualNumber(other / b, tuple([d * factor for d in self.dual]))
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        if isinstance(other, DualNumber):
+            a, b = self.real, other.real
+            value = a ** b
+            log_a = math.log(a)
+            return DualNumber(value, tuple([value * (db * log_a + b * da / a) for da, db in zip(self.dual, other.dual)]))
+        if other == 0:
+            return DualNumber(1., tuple([0.] * len(self.dual)))
+        factor = other * self.real ** (other - 1)
+        return DualNumber(self.real ** other, tuple([d * factor for d in self.dual]))
+
+    def __rpow__(self, other):
+        value = other ** self.real
+        factor = value * math.log(other)
+        return DualNumber(value, tuple([d * factor for d in self.dual]))
+
+def variable(value, index, size):
+    # The index-th of size independent variables, at the given value.
+    dual = [0.] * size
+    dual[index] = 1.
+    return DualNumber(value, tuple(dual))
+
+def real_part(value):
+    if isinstance(value, DualNumber):
+        return value.real
+    return value
+
+def derivative(value, index):
+    # Partial derivative of value with respect to the index-th variable;
+    # anything that isn't a DualNumber didn't depend on the variables.
+    if isinstance(value, DualNumber):
+        return value.dual[index]
+    return 0.
@@ -0,0 +1,160 @@
+from shadowcraft.core import exceptions
+
+# Fixed-point iteration over attacks-per-second distributions: dicts whose
+# values are either rates or lists of rates (finishers, split by combo
+# points). The model converges them by feeding the rates back into proc
+# uptimes until they stop moving; this solver runs that loop with an
+# iteration cap and, optionally, an acceleration scheme.
+
+def flatten(distribution):
+    # Returns the layout of the distribution and its values as one list.
+    layout = []
+    values = []
+    for key in sorted(distribution):
+        value = distribution[key]
+        if hasattr(value, '__iter__'):
+            layout.append((key, len(value)))
+            values.extend(value)
+        else:
+            layout.append((key, None))
+            values.append(value)
+    return layout, values
+
+def unflatten(layout, values):
+    distribution = {}
+    index = 0
+    for key, length in layout:
+        if length is None:
+            distribution[key] = values[index]
+            index += 1
+        else:
+            distribution[key] = list(values[index:index + length])
+            index += length
+    return distribution
+
+def solve_linear_system(matrix, vector):
+    # Gaussian elimination with partial pivoting, for the few unknowns of
+    # an Anderson step. Returns None if the system is singular.
+    size = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in xrange(size)]
+    for column in xrange(size):
+        pivot = max(xrange(column, size), key=lambda row: abs(rows[row][column]))
+        if abs(rows[pivot][column]) < 10 ** -14:
+            return None
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for row in xrange(column + 1, size):
+            factor = rows[row][column] / rows[column][column]
+            for i in xrange(column, size + 1):
+                rows[row][i] -= factor * rows[column][i]
+    solution = [0.] * size
+    for row in xrange(size - 1, -1, -1):
+        total = rows[row][size] - sum(rows[row][i] * solution[i] for i in xrange(row + 1, size))
+        solution[row] = total / rows[row][row]
+    return solution
+
+
+class FixedPointSolver(object):
+    # method is one of
+    #   'none': plain iteration, x = g(x)
+    #   'aitken': every other step, componentwise Aitken delta-squared
+    #       extrapolation of the last three plain iterates
+    #   'anderson': Anderson mixing over the last `history` residuals
+    # Either way the loop stops once g(x) is within tolerance of x (as the
+    # model's are_close_enough judges it) or after max_iterations
+    # evaluations of g, whichever comes first. iterations and converged
+    # report how the last solve went.
+    allowed_methods = ('none', 'aitken', 'anderson')
+
+    def __init__(self, method='none', tolerance=10 ** -7, max_iterations=100, history=3):
+        if method not in self.allowed_methods:
+            raise exceptions.InvalidInputException(_('Unknown convergence method {method}').format(method=method))
+        self.method = method
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.history = history
+        self.iterations = 0
+        self.converged = False
+        self.plain_iterates = []
+        self.residuals = []
+
+    def solve(self, step, initial, are_close_enough):
+        # step maps a distribution to the next one; are_close_enough(old,
+        # new, precision) is the convergence test. Returns the last value of
+        # step, so whatever state step leaves behind matches the result.
+        self.iterations = 0
+        self.converged = False
+        self.plain_iterates = []
+        self.residuals = []
+        x = initial
+        while True:
+            gx = step(x)
+            self.iterations += 1
+            if are_close_enough(x, gx, self.tolerance):
+                self.converged = True
+                return gx
+            if self.iterations >= self.max_iterations:
+                return gx
+            x = self.next_iterate(x, gx)
+
+    def next_iterate(self, x, gx):
+        if self.method == 'none':
+            return gx
+        layout, x_values = flatten(x)
+        gx_layout, gx_values = flatten(gx)
+        if gx_layout != layout:
+            # The cycle changed shape between iterations; start over.
+            self.plain_iterates = []
+            self.residuals = []
+            return gx
+        if self.method == 'aitken':
+            values = self.aitken(x_values, gx_values)
+        else:
+            values = self.anderson(x_values, gx_values)
+        # Every entry is a rate, so extrapolations past zero are clamped.
+        return unflatten(layout, [max(value, 0.) for value in values])
+
+    def aitken(self, x_values, gx_values):
+        if not self.plain_iterates:
+            self.plain_iterates = [x_values]
+        self.plain_iterates.append(gx_values)
+        if len(self.plain_iterates) < 3:
+            return gx_values
+        x0, x1, x2 = self.plain_iterates
+        self.plain_iterates = []
+        values = []
+        for a, b, c in zip(x0, x1, x2):
+            denominator = c - 2 * b + a
+            if abs(denominator) < 10 ** -14:
+                values.append(c)
+            else:
+                values.append(c - (c - b) ** 2 / denominator)
+        return values
+
+    def anderson(self, x_values, gx_values):
+        residual = [g - x for g, x in zip(gx_values, x_values)]
+        self.residuals.append((gx_values, residual))
+        if len(self.residuals) > self.history + 1:
+            self.residuals.pop(0)
+        if len(self.residuals) < 2:
+            return gx_values
+        # Least squares on the residual differences, via the (lightly
+        # regularized) normal equations.
+        delta_g = []
+        delta_f = []
+        for (g0, f0), (g1, f1) in zip(self.residuals, self.residuals[1:]):
+            delta_g.append([b - a for a, b in zip(g0, g1)])
+            delta_f.append([b - a for a, b in zip(f0, f1)])
+        size = len(delta_f)
+        matrix = [[sum(a * b for a, b in zip(delta_f[i], delta_f[j])) for j in xrange(size)] for i in xrange(size)]
+        for i in xrange(size):
+            matrix[i][i] += 10 ** -12 * (1 + matrix[i][i])
+        vector = [sum(a * b for a, b in zip(delta_f[i], residual)) for i in xrange(size)]
+        gamma = solve_linear_system(matrix, vector)
+        if gamma is None:
+            self.residuals = self.residuals[-1:]
+            return gx_values
+        values = list(gx_values)
+        for weight, column in zip(gamma, delta_g):
+            for i in xrange(len(values)):
+                values[i] -= weight * column[i]
+        return values
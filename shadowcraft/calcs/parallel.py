@@ -0,0 +1,94 @@
+import cPickle
+
+# Process pool evaluation for the ranking and batch methods. Every worker receives a
+# pickled snapshot of the calculator once, at startup, and unpickles a fresh
+# copy of it for each task; the copy is thrown away afterwards, so nothing a
+# task toggles (or a model run caches on the calculator) can leak into the
+# next one. multiprocessing is imported when a pool is first asked for, so
+# importing the calculators doesn't pay for it.
+
+_snapshot = None
+
+def _init_worker(snapshot):
+    global _snapshot
+    _snapshot = snapshot
+
+def _toggled_dps(toggle):
+    calculator = cPickle.loads(_snapshot)
+    try:
+        calculator.toggle_input(toggle)
+        return calculator.get_dps()
+    except Exception as e:
+        return e
+
+def get_pool(calculator, processes=None):
+    # A pool whose workers hold a snapshot of calculator. processes is the
+    # number of worker processes; None uses one per cpu.
+    import multiprocessing
+    snapshot = cPickle.dumps(calculator, cPickle.HIGHEST_PROTOCOL)
+    return multiprocessing.Pool(processes, _init_worker, (snapshot,))
+
+def cpu_count():
+    import multiprocessing
+    return multiprocessing.cpu_count()
+
+def map_chunks(pool, function, items, workers):
+    # Applies function (which takes and returns a list) to items in chunks,
+    # so that each snapshot is unpickled once per chunk rather than once per
+    # item, and returns the results in order.
+    size = max(1, -(-len(items) // (4 * workers)))
+    chunks = [items[i:i + size] for i in xrange(0, len(items), size)]
+    results = []
+    for chunk_results in pool.map(function, chunks, chunksize=1):
+        results.extend(chunk_results)
+    return results
+
+def get_dps_for_toggles(calculator, toggles, processes=None):
+    # Same contract as DamageCalculator.get_dps_for_toggles.
+    pool = get_pool(calculator, processes)
+    try:
+        return pool.map(_toggled_dps, toggles, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+def _upgrades_dps(name):
+    calculator = cPickle.loads(_snapshot)
+    try:
+        return calculator.get_dps_for_upgrade_levels(name)
+    except Exception as e:
+        return e
+
+def get_dps_for_upgrades(calculator, names, processes=None):
+    # Same contract as DamageCalculator.get_dps_for_upgrades.
+    pool = get_pool(calculator, processes)
+    try:
+        return pool.map(_upgrades_dps, names, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+def _characters_dps(characters):
+    calculator = cPickle.loads(_snapshot)
+    return calculator.get_dps_for_characters(characters)
+
+def get_dps_for_characters(calculator, characters, processes=None):
+    # Same contract as DamageCalculator.get_dps_for_characters.
+    pool = get_pool(calculator, processes)
+    try:
+        return map_chunks(pool, _characters_dps, characters, processes or cpu_count())
+    finally:
+        pool.close()
+        pool.join()
+
+def breakdowns_for_seeds(seeds):
+    # For simulating calculators: the damage breakdowns of the fights with
+    # the given seeds.
+    calculator = cPickle.loads(_snapshot)
+    return calculator.get_dps_breakdowns_for_seeds(seeds)
+
+def paired_dps_for_seeds(items):
+    # items are (stat_deltas, seed) pairs, all with the same stat_deltas; see
+    # DarkmantleCalculator.get_paired_dps.
+    calculator = cPickle.loads(_snapshot)
+    return calculator.get_paired_dps(items[0][0], [seed for stat_deltas, seed in items])
@@ -0,0 +1,74 @@
+import math
+
+# Proc uptime formulas, evaluated for a list of procs against a list of
+# scenarios in one call; each function returns one row of uptimes per proc,
+# one column per scenario. The proc rate lookups happen once per row rather
+# than once per scenario, and the formulas stick to arithmetic (math.e ** x
+# rather than math.exp) so dual numbers pass through them.
+
+# Increase in the effective RPPM proc rate due to bad luck prevention. It
+# /should/ be constant among all rppm proc styles.
+RPPM_BAD_LUCK_MULTIPLIER = 1.1307
+
+def rppm_uptimes(procs, haste_multipliers):
+    # Uptimes for real ppm procs, with haste_multipliers the haste of each
+    # scenario; procs that don't scale with haste get the same uptime in
+    # every scenario.
+    # http://iam.yellingontheinternet.com/2013/04/12/theorycraft-201-advanced-rppm/
+    rows = []
+    for proc in procs:
+        rate = proc.get_rppm_proc_rate()
+        if proc.haste_scales:
+            scenarios = haste_multipliers
+        else:
+            scenarios = [1.]
+        if not proc.icd:
+            if proc.max_stacks <= 1:
+                row = [RPPM_BAD_LUCK_MULTIPLIER * (1 - math.e ** (-1 * haste * rate * proc.duration / 60)) for haste in scenarios]
+            else:
+                row = []
+                for haste in scenarios:
+                    lambd = haste * rate * proc.duration / 60
+                    e_lambda = math.e ** lambd
+                    e_minus_lambda = math.e ** (-1 * lambd)
+                    row.append(RPPM_BAD_LUCK_MULTIPLIER * (e_lambda - 1) * (1 - ((1 - e_minus_lambda) ** proc.max_stacks)))
+        else:
+            row = [RPPM_BAD_LUCK_MULTIPLIER * proc.duration / (60. / (haste * rate) + proc.icd - min(proc.icd, 10)) for haste in scenarios]
+        if len(row) != len(haste_multipliers):
+            row = row * len(haste_multipliers)
+        rows.append(row)
+    return rows
+
+def triggered_uptimes(procs, procs_per_second, fight_duration):
+    # Uptimes for procs triggered by attacks (ppm and flat chance procs),
+    # with procs_per_second[i][j] the trigger rate of procs[i] in scenario j.
+    rows = []
+    for proc, rates in zip(procs, procs_per_second):
+        row = []
+        for rate in rates:
+            if proc.icd:
+                row.append(proc.duration / (proc.icd + 1. / rate))
+            elif rate >= 1:
+                row.append(ramping_uptime(proc, rate, fight_duration))
+            else:
+                # See http://elitistjerks.com/f31/t20747-advanced_rogue_mechanics_discussion/#post621369
+                # for the derivation of this formula.
+                q = 1 - rate
+                Q = q ** proc.duration
+                if Q < .0001:
+                    row.append(ramping_uptime(proc, rate, fight_duration))
+                else:
+                    P = 1 - Q
+                    row.append(P * (1 - P ** proc.max_stacks) / Q)
+        rows.append(row)
+    return rows
+
+def ramping_uptime(proc, procs_per_second, fight_duration):
+    # Average stacks of a proc that keeps stacking without falling off.
+    time_for_one_stack = 1 / procs_per_second
+    if time_for_one_stack * proc.max_stacks > fight_duration:
+        max_stacks_reached = fight_duration * procs_per_second
+        return max_stacks_reached / 2
+    missing_stacks = proc.max_stacks * (proc.max_stacks + 1) / 2
+    stack_time_lost = missing_stacks * time_for_one_stack
+    return proc.max_stacks - stack_time_lost / fight_duration
@@ -0,0 +1,117 @@
+import json
+import os
+import timeit
+
+# Timing of the stages of a calculator run. Each calculator class lists the
+# methods that make up its stages in profiled_methods, by the name of the
+# span they're recorded under; attaching a Profiler to a calculator wraps
+# those methods on the instance, and detaching it removes the wrappers. A
+# calculator without a profiler attached runs its own methods untouched, so
+# the instrumentation costs nothing while it's off.
+#
+#     profiler = Profiler()
+#     with profiler.profile(calculator):
+#         calculator.get_dps()
+#     profiler.write_chrome_trace('get_dps.json')
+#
+# The trace opens in chrome://tracing (or any viewer of the Chrome trace
+# event format). A calculator with a profiler attached can't be pickled, so
+# detach it before handing the calculator to a process pool.
+
+
+class Span(object):
+    __slots__ = ('name', 'start', 'duration', 'depth', 'args')
+
+    def __init__(self, name, start, duration, depth, args):
+        # start and duration are in seconds, start from when the profiler
+        # was created; depth counts the spans this one is nested in.
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.depth = depth
+        self.args = args
+
+    def __repr__(self):
+        return 'Span({name!r}, {start!r}, {duration!r}, {depth!r}, {args!r})'.format(
+            name=self.name, start=self.start, duration=self.duration, depth=self.depth, args=self.args)
+
+
+class Profiler(object):
+
+    def __init__(self, callback=None, clock=timeit.default_timer):
+        # callback, if given, is called with every Span as it ends.
+        self.callback = callback
+        self.clock = clock
+        self.origin = clock()
+        self.depth = 0
+        self.spans = []
+
+    def attach(self, calculator):
+        self.detach(calculator)
+        for method, name in calculator.profiled_methods.items():
+            setattr(calculator, method, self.wrap(calculator, method, name, getattr(calculator, method)))
+
+    def detach(self, calculator):
+        for method in calculator.profiled_methods:
+            calculator.__dict__.pop(method, None)
+
+    def profile(self, calculator):
+        return AttachedProfiler(self, calculator)
+
+    def wrap(self, calculator, method, name, function):
+        clock = self.clock
+
+        def profiled(*args, **kwargs):
+            self.depth += 1
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                end = clock()
+                self.depth -= 1
+                self.record(name, start - self.origin, end - start, calculator.get_span_args(method, args))
+        return profiled
+
+    def record(self, name, start, duration, args=None):
+        span = Span(name, start, duration, self.depth, args or {})
+        self.spans.append(span)
+        if self.callback is not None:
+            self.callback(span)
+
+    def get_totals(self):
+        # {span name: (count, total seconds)}. Nested spans are counted in
+        # the totals of the spans around them too.
+        totals = {}
+        for span in self.spans:
+            count, duration = totals.get(span.name, (0, 0.))
+            totals[span.name] = (count + 1, duration + span.duration)
+        return totals
+
+    def get_chrome_trace(self):
+        pid = os.getpid()
+        events = []
+        for span in sorted(self.spans, key=lambda span: (span.start, span.depth)):
+            events.append({'name': span.name, 'ph': 'X', 'pid': pid, 'tid': 0, 'ts': span.start * 10 ** 6,
+                           'dur': span.duration * 10 ** 6, 'args': span.args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w') as trace_file:
+            json.dump(self.get_chrome_trace(), trace_file)
+
+
+class AttachedProfiler(object):
+    # What Profiler.profile returns: attaches the profiler for the length of
+    # a with block.
+
+    def __init__(self, profiler, calculator):
+        self.profiler = profiler
+        self.calculator = calculator
+
+    def __enter__(self):
+        self.profiler.attach(self.calculator)
+        return self.profiler
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.detach(self.calculator)
+        return False
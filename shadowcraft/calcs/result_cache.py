@@ -0,0 +1,125 @@
+import cPickle
+import hashlib
+import json
+import sqlite3
+import time
+
+from shadowcraft.objects.procs import Proc
+
+# A persistent cache of calculator results, keyed by a hash of everything the
+# calculator's results depend on (its get_inputs()). Results live in an
+# SQLite database, so they outlive the process and can be shared by every
+# process that opens the same file; entries expire ttl seconds after they
+# were stored, and past max_entries the least recently used ones go.
+
+# Written onto procs by the model itself; see session.snapshot.
+derived_proc_state = frozenset(['uptime', 'proc_rate_modifier', 'mh_only', 'oh_only'])
+
+
+def canonical(value):
+    # A json-able form of value that is the same for equal inputs however
+    # they were built: numbers are floats (so 1 and 1. agree), sets and dict
+    # keys are sorted, and objects become their class name and attributes.
+    # Dispatches on the exact type first, as this runs over every input on
+    # every lookup.
+    kind = type(value)
+    if kind is float or kind is int or kind is long:
+        return repr(float(value))
+    if value is None or kind is bool or kind is str or kind is unicode:
+        return value
+    if kind is dict:
+        return [[canonical(key), canonical(value[key])] for key in sorted(value)]
+    if kind is list or kind is tuple:
+        return [canonical(item) for item in value]
+    if kind is set or kind is frozenset:
+        return sorted(canonical(item) for item in value)
+    if kind is Proc:
+        state = dict((name, getattr(value, name)) for name in Proc.__slots__
+                     if name not in derived_proc_state and hasattr(value, name))
+    elif isinstance(value, (int, long, float)):
+        return repr(float(value))
+    else:
+        state = value.__dict__
+    return [kind.__module__ + '.' + kind.__name__, canonical(state)]
+
+
+def get_key(calculator, query):
+    # query tells apart the results asked for of the same calculator: the
+    # method name and its arguments.
+    serialized = json.dumps([canonical(calculator.get_inputs()), canonical(query)], separators=(',', ':'))
+    return hashlib.sha1(serialized).hexdigest()
+
+
+class ResultCache(object):
+
+    def __init__(self, path=':memory:', max_entries=10000, ttl=None):
+        self.connection = sqlite3.connect(path)
+        # A lost write only costs a recalculation, so there's no need to wait
+        # for the disk on every commit.
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS results '
+                                '(key TEXT PRIMARY KEY, value BLOB, stored REAL, used REAL)')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS results_used ON results (used)')
+        self.connection.commit()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.connection.close()
+
+    def get(self, key):
+        # The stored result, or None.
+        now = time.time()
+        row = self.connection.execute('SELECT value, stored FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        value, stored = row
+        if self.ttl is not None and stored + self.ttl < now:
+            self.connection.execute('DELETE FROM results WHERE key = ?', (key,))
+            self.connection.commit()
+            return None
+        self.connection.execute('UPDATE results SET used = ? WHERE key = ?', (now, key))
+        self.connection.commit()
+        return cPickle.loads(str(value))
+
+    def put(self, key, value):
+        now = time.time()
+        blob = sqlite3.Binary(cPickle.dumps(value, cPickle.HIGHEST_PROTOCOL))
+        self.connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)', (key, blob, now, now))
+        self.evict(now)
+        self.connection.commit()
+
+    def evict(self, now):
+        if self.ttl is not None:
+            self.connection.execute('DELETE FROM results WHERE stored < ?', (now - self.ttl,))
+        count = self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        if count > self.max_entries:
+            self.connection.execute('DELETE FROM results WHERE key IN '
+                                    '(SELECT key FROM results ORDER BY used LIMIT ?)', (count - self.max_entries,))
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def get_result(self, calculator, method, *args, **kwargs):
+        # calculator.<method>(*args, **kwargs), from the cache if it's there.
+        key = get_key(calculator, [method, args, kwargs])
+        result = self.get(key)
+        if result is None:
+            self.misses += 1
+            result = getattr(calculator, method)(*args, **kwargs)
+            self.put(key, result)
+        else:
+            self.hits += 1
+        return result
+
+    def get_dps(self, calculator):
+        return self.get_result(calculator, 'get_dps')
+
+    def get_dps_breakdown(self, calculator):
+        return self.get_result(calculator, 'get_dps_breakdown')
+
+    def get_ep(self, calculator, **kwargs):
+        return self.get_result(calculator, 'get_ep', **kwargs)
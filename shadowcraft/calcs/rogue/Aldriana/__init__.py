@@ -1,11 +1,9 @@
-#import copy
-import gettext
-import __builtin__
+import copy
 import math
 
-__builtin__._ = gettext.gettext
-
 from shadowcraft.calcs.rogue import RogueDamageCalculator
+from shadowcraft.calcs import dual_number
+from shadowcraft.calcs import fixed_point
 from shadowcraft.core import exceptions
 from shadowcraft.objects import procs
 from shadowcraft.objects import proc_data
@@ -17,6 +15,28 @@ class InputNotModeledException(exceptions.InvalidInputException):
 
 
 class AldrianasRogueDamageCalculator(RogueDamageCalculator):
+    profiled_methods = dict(RogueDamageCalculator.profiled_methods, **{
+        'init_assassination': 'init_spec',
+        'init_combat': 'init_spec',
+        'init_subtlety': 'init_spec',
+        'set_constants': 'set_constants',
+        'determine_stats': 'determine_stats',
+        'assassination_attack_counts_non_execute': 'attack_counts',
+        'assassination_attack_counts_execute': 'attack_counts',
+        'combat_attack_counts_ar': 'attack_counts',
+        'combat_attack_counts_none': 'attack_counts',
+        'subtlety_attack_counts': 'attack_counts',
+        'get_damage_breakdown': 'damage_breakdown',
+        'timeline_dps_breakdown': 'timeline',
+    })
+
+    def get_span_args(self, method, args):
+        if method == 'determine_stats':
+            return {'iterations': self.convergence_iterations}
+        if self.profiled_methods[method] == 'attack_counts':
+            return {'function': method}
+        return super(AldrianasRogueDamageCalculator, self).get_span_args(method, args)
+
     ###########################################################################
     # Main DPS comparison function.  Calls the appropriate sub-function based
     # on talent tree.
@@ -24,32 +44,178 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
 
     def get_dps(self):
         super(AldrianasRogueDamageCalculator, self).get_dps()
-        if self.settings.is_assassination_rogue():
-            self.init_assassination()
-            return self.assassination_dps_estimate()
-        elif self.settings.is_combat_rogue():
-            return self.combat_dps_estimate()
-        elif self.settings.is_subtlety_rogue():
-            return self.subtlety_dps_estimate()
-        else:
-            raise InputNotModeledException(_('You must specify a spec.'))
+        if self.settings.timeline is not None:
+            return sum(self.timeline_dps_breakdown().values())
+        init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+        init_spec()
+        return dps_estimate()
 
     def get_dps_breakdown(self):
+        if self.settings.timeline is not None:
+            return self.timeline_dps_breakdown()
+        init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+        init_spec()
+        return dps_breakdown()
+
+    def get_spec_functions(self):
+        # Returns the (initialization, dps estimate, dps breakdown) functions
+        # for the spec in settings. The initialization sets every constant
+        # that doesn't depend on the stats being converged, so the other two
+        # can be called repeatedly after a single initialization.
         if self.settings.is_assassination_rogue():
-            self.init_assassination()
-            return self.assassination_dps_breakdown()
+            return self.init_assassination, self.assassination_dps_estimate, self.assassination_dps_breakdown
         elif self.settings.is_combat_rogue():
-            return self.combat_dps_breakdown()
+            return self.init_combat, self.combat_dps_estimate, self.combat_dps_breakdown
         elif self.settings.is_subtlety_rogue():
-            return self.subtlety_dps_breakdown()
+            return self.init_subtlety, self.subtlety_dps_estimate, self.subtlety_dps_breakdown
         else:
             raise InputNotModeledException(_('You must specify a spec.'))
 
+    ###########################################################################
+    # Batched stat evaluation, used by the ep methods.
+    ###########################################################################
+
+    # Stats that only enter the model through self.base_stats once the spec
+    # is initialized. Deltas on these share a single initialization; anything
+    # else (readiness shortens cooldowns at initialization time, for instance)
+    # goes through a full get_dps() call.
+    base_stats_deltas = frozenset(['agi', 'ap', 'crit', 'haste', 'mastery', 'multistrike'])
+
+    def get_dps_for_stat_deltas(self, stat_deltas):
+        if self.settings.timeline is not None:
+            # Every phase initializes the spec again.
+            return super(AldrianasRogueDamageCalculator, self).get_dps_for_stat_deltas(stat_deltas)
+        dps_values = [None] * len(stat_deltas)
+        shared_setup = []
+        full_runs = []
+        for index, deltas in enumerate(stat_deltas):
+            if self.base_stats_deltas.issuperset(deltas):
+                shared_setup.append(index)
+            else:
+                full_runs.append(index)
+
+        if full_runs:
+            full_run_dps = super(AldrianasRogueDamageCalculator, self).get_dps_for_stat_deltas([stat_deltas[i] for i in full_runs])
+            for index, dps in zip(full_runs, full_run_dps):
+                dps_values[index] = dps
+
+        if shared_setup:
+            init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+            init_spec()
+            base_stats = self.base_stats
+            haste_ratings = [base_stats['haste'] + stat_deltas[index].get('haste', 0) for index in shared_setup]
+            self.rppm_uptime_table = self.build_rppm_uptime_table(self.get_active_procs()[0], haste_ratings)
+            try:
+                for index in shared_setup:
+                    self.base_stats = base_stats.copy()
+                    for stat, amount in stat_deltas[index].items():
+                        self.base_stats[stat] += amount
+                    dps_values[index] = dps_estimate()
+            finally:
+                self.base_stats = base_stats
+                self.rppm_uptime_table = None
+
+        return dps_values
+
+    def get_dps_for_stat_values(self, stat_values):
+        # Entries that only change base_stats_deltas stats share one spec
+        # initialization and only rebuild their base stats, like the
+        # shared setup of get_dps_for_stat_deltas. An entry that sets another
+        # stat to its current value doesn't count as changing it.
+        if self.settings.timeline is not None:
+            return super(AldrianasRogueDamageCalculator, self).get_dps_for_stat_values(stat_values)
+        dps_values = [None] * len(stat_values)
+        shared_setup = []
+        full_runs = []
+        for index, values in enumerate(stat_values):
+            if all(stat in self.base_stats_deltas or value == getattr(self.stats, stat) for stat, value in values.items()):
+                shared_setup.append(index)
+            else:
+                full_runs.append(index)
+
+        if full_runs:
+            full_run_dps = super(AldrianasRogueDamageCalculator, self).get_dps_for_stat_values([stat_values[i] for i in full_runs])
+            for index, dps in zip(full_runs, full_run_dps):
+                dps_values[index] = dps
+
+        if shared_setup:
+            old_values = dict((stat, getattr(self.stats, stat)) for stat in self.base_stats_deltas)
+            init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+            init_spec()
+            haste_ratings = [stat_values[index].get('haste', old_values['haste']) for index in shared_setup]
+            self.rppm_uptime_table = self.build_rppm_uptime_table(self.get_active_procs()[0], haste_ratings)
+            try:
+                for index in shared_setup:
+                    for stat in self.base_stats_deltas:
+                        setattr(self.stats, stat, stat_values[index].get(stat, old_values[stat]))
+                    self.set_base_stats()
+                    dps_values[index] = dps_estimate()
+            finally:
+                for stat, value in old_values.items():
+                    setattr(self.stats, stat, value)
+                self.set_base_stats()
+                self.rppm_uptime_table = None
+
+        return dps_values
+
+    def get_dps_for_proc_values(self, proc, values):
+        # Proc values are only read once the stats are being converged, so
+        # all of them share one spec initialization.
+        if self.settings.timeline is not None:
+            return super(AldrianasRogueDamageCalculator, self).get_dps_for_proc_values(proc, values)
+        init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+        init_spec()
+        old_value = proc.value
+        dps_values = []
+        try:
+            for value in values:
+                proc.value = dict(value)
+                dps_values.append(dps_estimate())
+        finally:
+            proc.value = old_value
+        return dps_values
+
+    def get_dps_gradient(self, stats):
+        # Stats in base_stats_deltas are seeded as dual numbers, so a single
+        # pass through the model returns the dps along with its derivative
+        # with respect to each of them. Any other stat falls back to finite
+        # differences.
+        dual_stats = [stat for stat in stats if stat in self.base_stats_deltas]
+        other_stats = [stat for stat in stats if stat not in self.base_stats_deltas]
+        if not dual_stats or self.settings.timeline is not None:
+            return super(AldrianasRogueDamageCalculator, self).get_dps_gradient(stats)
+        gradient = {}
+        if other_stats:
+            dps, gradient = super(AldrianasRogueDamageCalculator, self).get_dps_gradient(other_stats)
+
+        init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+        init_spec()
+        base_stats = self.base_stats
+        try:
+            self.base_stats = base_stats.copy()
+            for index, stat in enumerate(dual_stats):
+                self.base_stats[stat] = dual_number.variable(base_stats[stat], index, len(dual_stats))
+            dps = dps_estimate()
+        finally:
+            self.base_stats = base_stats
+
+        for index, stat in enumerate(dual_stats):
+            gradient[stat] = dual_number.derivative(dps, index)
+        return dual_number.real_part(dps), gradient
+
     ###########################################################################
     # General object manipulation functions that we'll use multiple places.
     ###########################################################################
 
     PRECISION_REQUIRED = 10 ** -7
+    # determine_stats convergence, see shadowcraft.calcs.fixed_point; the
+    # converge_method, converge_tolerance and converge_max_iterations
+    # advanced parameters override these.
+    default_convergence_method = 'anderson'
+    default_convergence_max_iterations = 100
+
+    def get_convergence_solver(self):
+        return fixed_point.FixedPointSolver(self.convergence_method, self.convergence_tolerance, self.convergence_max_iterations)
 
     def are_close_enough(self, old_dist, new_dist, precision=PRECISION_REQUIRED):
         for item in new_dist:
@@ -69,16 +235,16 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
     # setups that we are really modeling.
     ###########################################################################
 
-    def get_glyphs_ranking(self, list=None):
+    def get_glyphs_ranking(self, list=None, processes=1):
         if list is None:
             list = [
                 'vendetta',
                 'energy',
                 'disappearance',
             ]
-        return super(AldrianasRogueDamageCalculator, self).get_glyphs_ranking(list)
+        return super(AldrianasRogueDamageCalculator, self).get_glyphs_ranking(list, processes)
 
-    def get_talents_ranking(self, list=None):
+    def get_talents_ranking(self, list=None, processes=1):
         if list is None:
             list = [
                 'nightstalker',
@@ -91,7 +257,7 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
                 #'death_from_above',
                 #'shadow_reflection',
             ]
-        return super(AldrianasRogueDamageCalculator, self).get_talents_ranking(list)
+        return super(AldrianasRogueDamageCalculator, self).get_talents_ranking(list, processes)
 
     def get_oh_weapon_modifier(self, setups=None):
         if setups is None:
@@ -119,9 +285,115 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         return total_uptime * 1.0 / self.settings.duration
 
     def get_heroism_haste_multiplier(self):
-        # Just average-casing for now.  Should fix that at some point.
+        # Average-cased, unless there's a fight timeline to say when it's up.
+        if self.current_phase is not None:
+            return self.current_phase.haste_multiplier
         return 1 + .3 * self.heroism_uptime_per_fight()
 
+    ###########################################################################
+    # Fight timelines. Each distinct phase of settings.timeline gets one pass
+    # through the spec's model, and the phases are averaged by duration.
+    ###########################################################################
+
+    # The phase being evaluated, when there's a timeline.
+    current_phase = None
+
+    def get_phase_signature(self, phase):
+        # What the model sees of a phase; phases with the same signature share
+        # an evaluation. Only the assassination model has an execute range.
+        num_boss_adds = phase.num_boss_adds
+        if num_boss_adds is None:
+            num_boss_adds = self.settings.num_boss_adds
+        execute = phase.execute and self.settings.is_assassination_rogue()
+        return phase.haste_multiplier, num_boss_adds, execute
+
+    def timeline_dps_breakdown(self):
+        settings = self.settings
+        num_boss_adds = settings.num_boss_adds
+        phases = {}
+        try:
+            for index, (phase, duration) in enumerate(settings.timeline.group_phases(self.get_phase_signature)):
+                self.current_phase = phase
+                if phase.num_boss_adds is None:
+                    settings.num_boss_adds = num_boss_adds
+                else:
+                    settings.num_boss_adds = phase.num_boss_adds
+                phases[index] = (float(duration), self.phase_dps_breakdown(phase))
+        finally:
+            self.current_phase = None
+            settings.num_boss_adds = num_boss_adds
+        return self.average_damage_breakdowns(phases, denom=settings.timeline.get_duration())
+
+    def phase_dps_breakdown(self, phase):
+        init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+        init_spec()
+        if self.settings.is_assassination_rogue():
+            if phase.execute:
+                return self.assassination_dps_breakdown_execute()
+            return self.assassination_dps_breakdown_non_execute()
+        return dps_breakdown()
+
+    ###########################################################################
+    # Multi-target sweeps. The cycle only sees the number of adds through
+    # lemon zest energy (capped at two adds) and, with blade flurry, poison
+    # procs; target counts that agree on those share one pass through the
+    # model, and the damage that grows with the adds is scaled from it.
+    ###########################################################################
+
+    def get_init_target_signature(self, num_boss_adds):
+        # What spec initialization sees of the adds.
+        if self.talents.lemon_zest:
+            return min(num_boss_adds, 2)
+        return 0
+
+    def cycle_depends_on_targets(self):
+        # Blade flurry spreads poison procs over the adds.
+        return self.settings.cycle.blade_flurry
+
+    def scale_breakdown_for_targets(self, damage_breakdown, from_adds, to_adds):
+        # The breakdown for to_adds adds, from the one for from_adds with the
+        # same cycle.
+        damage_breakdown = damage_breakdown.copy()
+        fury_of_xuen = getattr(self.stats.procs, 'fury_of_xuen')
+        if fury_of_xuen and fury_of_xuen.proc_name in damage_breakdown:
+            damage_breakdown[fury_of_xuen.proc_name] *= (1. + min(4., to_adds)) / (1. + min(4., from_adds))
+        return damage_breakdown
+
+    def get_dps_breakdowns_for_target_counts(self, max_targets=None):
+        # Returns the dps breakdowns against 1 to max_targets targets (see
+        # get_dps_for_target_counts).
+        max_targets = self.check_max_targets(max_targets)
+        num_boss_adds = self.settings.num_boss_adds
+        damage_breakdowns = [None] * max_targets
+        try:
+            if self.settings.timeline is not None:
+                # Every phase initializes the spec again.
+                for adds in xrange(max_targets):
+                    self.settings.num_boss_adds = adds
+                    damage_breakdowns[adds] = self.get_dps_breakdown()
+                return damage_breakdowns
+            init_spec, dps_estimate, dps_breakdown = self.get_spec_functions()
+            groups = {}
+            for adds in xrange(max_targets):
+                groups.setdefault(self.get_init_target_signature(adds), []).append(adds)
+            for group in sorted(groups.values()):
+                self.settings.num_boss_adds = group[0]
+                init_spec()
+                evaluated_adds = None
+                for adds in group:
+                    if evaluated_adds is None or self.cycle_depends_on_targets():
+                        self.settings.num_boss_adds = adds
+                        damage_breakdowns[adds] = dps_breakdown()
+                        evaluated_adds = adds
+                    else:
+                        damage_breakdowns[adds] = self.scale_breakdown_for_targets(damage_breakdowns[evaluated_adds], evaluated_adds, adds)
+        finally:
+            self.settings.num_boss_adds = num_boss_adds
+        return damage_breakdowns
+
+    def get_dps_for_target_counts(self, max_targets=None):
+        return [sum(damage_breakdown.values()) for damage_breakdown in self.get_dps_breakdowns_for_target_counts(max_targets)]
+
     def get_cp_distribution_for_cycle(self, cp_distribution_per_move, target_cp_quantity):
         avg_cp_per_cpg = sum([key * cp_distribution_per_move[key] for key in cp_distribution_per_move])
         if self.talents.anticipation:
@@ -217,6 +489,15 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
 
         return crit_rates
 
+    def reset_spec_constants(self):
+        # The spec initializations adjust these for talents, glyphs and
+        # perks. Start every initialization from the defaults so that calling
+        # get_dps() repeatedly doesn't compound the adjustments (or leak them
+        # into other calculators through the class attributes).
+        self.damage_modifier_cache = 1
+        self.ability_cds = dict(RogueDamageCalculator.ability_cds)
+        self.ability_info = dict(RogueDamageCalculator.ability_info)
+
     def set_constants(self):
         # General setup that we'll use in all 3 cycles.
         self.load_from_advanced_parameters()
@@ -236,19 +517,7 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         
         #only include if general multiplier applies to spec calculations 
         self.true_haste_mod *= self.get_heroism_haste_multiplier()
-        self.base_stats = {
-            'agi': (self.stats.agi + self.buffs.buff_agi() + self.race.racial_agi),
-            'ap': (self.stats.ap + 2 * self.level - 30),
-            'crit': (self.stats.crit),
-            'haste': (self.stats.haste),
-            'mastery': (self.stats.mastery + self.buffs.buff_mast()),
-            'readiness': (self.stats.readiness),
-            'multistrike': (self.stats.multistrike),
-        }
-        
-        for boost in self.race.get_racial_stat_boosts():
-            if boost['stat'] in self.base_stats:
-                self.base_stats[boost['stat']] += boost['value'] * boost['duration'] * 1.0 / (boost['cooldown'] + self.settings.response_time)
+        self.set_base_stats()
 
         self.agi_multiplier = self.buffs.stat_multiplier() * self.stats.gear_buffs.leather_specialization_multiplier()
 
@@ -275,9 +544,30 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         self.dw_mh_hit_chance = self.dual_wield_mh_hit_chance()
         self.dw_oh_hit_chance = self.dual_wield_oh_hit_chance()
     
+    def set_base_stats(self):
+        # The only part of set_constants that reads the rating, agility and
+        # AP stats; see base_stats_deltas.
+        self.base_stats = {
+            'agi': (self.stats.agi + self.buffs.buff_agi() + self.race.racial_agi),
+            'ap': (self.stats.ap + 2 * self.level - 30),
+            'crit': (self.stats.crit),
+            'haste': (self.stats.haste),
+            'mastery': (self.stats.mastery + self.buffs.buff_mast()),
+            'readiness': (self.stats.readiness),
+            'multistrike': (self.stats.multistrike),
+        }
+        
+        for boost in self.race.get_racial_stat_boosts():
+            if boost['stat'] in self.base_stats:
+                self.base_stats[boost['stat']] += boost['value'] * boost['duration'] * 1.0 / (boost['cooldown'] + self.settings.response_time)
+
     def load_from_advanced_parameters(self):
         self.true_haste_mod = self.get_adv_param('haste_buff', 1., min_bound=.1, max_bound=3.)
         
+        self.convergence_method = self.get_adv_param('converge_method', self.default_convergence_method, ignore_bounds=True)
+        self.convergence_tolerance = self.get_adv_param('converge_tolerance', self.PRECISION_REQUIRED, min_bound=10 ** -12, max_bound=.01)
+        self.convergence_max_iterations = int(self.get_adv_param('converge_max_iterations', self.default_convergence_max_iterations, min_bound=1, max_bound=10000))
+        
         self.major_cd_delay = self.get_adv_param('major_cd_delay', 0, min_bound=0, max_bound=600)
         self.settings.feint_interval = self.get_adv_param('feint_interval', self.settings.feint_interval, min_bound=0, max_bound=600)
         
@@ -388,115 +678,120 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         if not args or 'poisons' in args:
             self.get_poison_counts(attacks_per_second)
 
-    def get_mh_procs_per_second(self, proc, attacks_per_second, crit_rates):
-        triggers_per_second = 0
-        if proc.procs_off_auto_attacks():
-            if proc.procs_off_crit_only():
-                if 'mh_autoattacks' in attacks_per_second:
-                    triggers_per_second += attacks_per_second['mh_autoattacks'] * crit_rates['mh_autoattacks']
-            else:
-                if 'mh_autoattack_hits' in attacks_per_second:
-                    triggers_per_second += attacks_per_second['mh_autoattack_hits']
-        if proc.procs_off_strikes():
-            for ability in ('mutilate', 'dispatch', 'backstab', 'revealing_strike', 'sinister_strike', 'ambush', 'hemorrhage', 'mh_killing_spree', 'main_gauche', 'shuriken_toss'):
-                if ability == 'main_gauche' and not proc.procs_off_procced_strikes():
-                    pass
-                elif ability in attacks_per_second:
-                    if proc.procs_off_crit_only():
-                        triggers_per_second += attacks_per_second[ability] * crit_rates[ability]
-                    else:
-                        triggers_per_second += attacks_per_second[ability]
-            for ability in ('envenom', 'eviscerate'):
-                if ability in attacks_per_second:
-                    if proc.procs_off_crit_only():
-                        triggers_per_second += sum(attacks_per_second[ability]) * crit_rates[ability]
-                    else:
-                        triggers_per_second += sum(attacks_per_second[ability])
-        if proc.procs_off_apply_debuff() and not proc.procs_off_crit_only():
-            if 'rupture' in attacks_per_second:
-                triggers_per_second += attacks_per_second['rupture']
-            if 'garrote' in attacks_per_second:
-                triggers_per_second += attacks_per_second['garrote']
-            if 'hemorrhage_ticks' in attacks_per_second:
-                triggers_per_second += attacks_per_second['hemorrhage']
-        return triggers_per_second * proc.get_proc_rate(self.stats.mh.speed)
-
-    def get_oh_procs_per_second(self, proc, attacks_per_second, crit_rates):
-        triggers_per_second = 0
-        if proc.procs_off_auto_attacks():
-            if proc.procs_off_crit_only():
-                if 'oh_autoattacks' in attacks_per_second:
-                    triggers_per_second += attacks_per_second['oh_autoattacks'] * crit_rates['oh_autoattacks']
-            else:
-                if 'oh_autoattack_hits' in attacks_per_second:
-                    triggers_per_second += attacks_per_second['oh_autoattack_hits']
-        if proc.procs_off_strikes():
-            for ability in ('mutilate', 'oh_killing_spree'):
-                if ability in attacks_per_second:
-                    if proc.procs_off_crit_only():
-                        triggers_per_second += attacks_per_second[ability] * crit_rates[ability]
-                    else:
-                        triggers_per_second += attacks_per_second[ability]
-        return triggers_per_second * proc.get_proc_rate(self.stats.oh.speed)
-
-    def get_other_procs_per_second(self, proc, attacks_per_second, crit_rates):
-        triggers_per_second = 0
-        if proc.procs_off_harmful_spells():
-            for ability in ('deadly_instant_poison', 'wound_poison', 'venomous_wounds'):
-                if ability in attacks_per_second:
-                    if proc.procs_off_crit_only():
-                        triggers_per_second += attacks_per_second[ability] * crit_rates[ability]
-                    else:
-                        triggers_per_second += attacks_per_second[ability]
-        if proc.procs_off_periodic_spell_damage():
-            if 'deadly_poison' in attacks_per_second:
-                if proc.procs_off_crit_only():
-                    triggers_per_second += attacks_per_second['deadly_poison'] * crit_rates['deadly_poison']
-                else:
-                    triggers_per_second += attacks_per_second['deadly_poison']
-        if proc.procs_off_bleeds():
-            if 'rupture_ticks' in attacks_per_second:
-                if proc.procs_off_crit_only():
-                    triggers_per_second += sum(attacks_per_second['rupture_ticks']) * crit_rates['rupture']
+    # The abilities a proc can trigger from, per hand. Each term is (guard,
+    # ability, crit_rate, summed): the term counts when guard is in
+    # attacks_per_second, summed abilities are per-combo-point lists, and
+    # crit_rate names the crit rate that applies when the proc needs a crit.
+    # The terms are listed in the order they are added up.
+    mh_strikes = ('mutilate', 'dispatch', 'backstab', 'revealing_strike', 'sinister_strike', 'ambush', 'hemorrhage', 'mh_killing_spree', 'main_gauche', 'shuriken_toss')
+    mh_finishers = ('envenom', 'eviscerate')
+    oh_strikes = ('mutilate', 'oh_killing_spree')
+    spell_hits = ('deadly_instant_poison', 'wound_poison', 'venomous_wounds')
+
+    def build_trigger_row(self, proc, hand):
+        crit_only = proc.procs_off_crit_only()
+        row = []
+        def add(guard, ability, crit_rate, summed=False):
+            row.append((guard, ability, crit_rate if crit_only else None, summed))
+        if hand in ('mh', 'oh'):
+            strikes = {'mh': self.mh_strikes, 'oh': self.oh_strikes}[hand]
+            if proc.procs_off_auto_attacks():
+                if crit_only:
+                    add(hand + '_autoattacks', hand + '_autoattacks', hand + '_autoattacks')
                 else:
-                    triggers_per_second += sum(attacks_per_second['rupture_ticks'])
-            if 'garrote_ticks' in attacks_per_second:
-                if proc.procs_off_crit_only():
-                    triggers_per_second += attacks_per_second['garrote_ticks'] * crit_rates['garrote']
+                    add(hand + '_autoattack_hits', hand + '_autoattack_hits', None)
+            if proc.procs_off_strikes():
+                for ability in strikes:
+                    if ability != 'main_gauche' or proc.procs_off_procced_strikes():
+                        add(ability, ability, ability)
+                if hand == 'mh':
+                    for ability in self.mh_finishers:
+                        add(ability, ability, ability, summed=True)
+            if hand == 'mh' and proc.procs_off_apply_debuff() and not crit_only:
+                add('rupture', 'rupture', None)
+                add('garrote', 'garrote', None)
+                add('hemorrhage_ticks', 'hemorrhage', None)
+        else:
+            if proc.procs_off_harmful_spells():
+                for ability in self.spell_hits:
+                    add(ability, ability, ability)
+            if proc.procs_off_periodic_spell_damage():
+                add('deadly_poison', 'deadly_poison', 'deadly_poison')
+            if proc.procs_off_bleeds():
+                add('rupture_ticks', 'rupture_ticks', 'rupture', summed=True)
+                add('garrote_ticks', 'garrote_ticks', 'garrote')
+                if not crit_only:
+                    add('hemorrhage_ticks', 'hemorrhage_ticks', None)
+        return tuple(row)
+
+    def get_trigger_row(self, proc, hand):
+        # Rows only depend on how the proc triggers, so procs that trigger
+        # the same way share one.
+        key = (hand, proc.trigger, bool(proc.on_crit), bool(proc.on_procced_strikes))
+        if key not in self.trigger_rows:
+            self.trigger_rows[key] = self.build_trigger_row(proc, hand)
+        return self.trigger_rows[key]
+
+    def get_triggers_per_second(self, row, attacks_per_second, crit_rates):
+        triggers_per_second = 0
+        for guard, ability, crit_rate, summed in row:
+            if guard in attacks_per_second:
+                if summed:
+                    triggers = sum(attacks_per_second[ability])
                 else:
-                    triggers_per_second += attacks_per_second['garrote_ticks']
-            if 'hemorrhage_ticks' in attacks_per_second and not proc.procs_off_crit_only():
-                triggers_per_second += attacks_per_second['hemorrhage_ticks']
+                    triggers = attacks_per_second[ability]
+                if crit_rate is not None:
+                    triggers = triggers * crit_rates[crit_rate]
+                triggers_per_second += triggers
+        return triggers_per_second
+
+    def get_mh_procs_per_second(self, proc, attacks_per_second, crit_rates, triggers=None):
+        if triggers is None:
+            triggers = self.get_triggers_per_second(self.get_trigger_row(proc, 'mh'), attacks_per_second, crit_rates)
+        return triggers * proc.get_proc_rate(self.stats.mh.speed)
+
+    def get_oh_procs_per_second(self, proc, attacks_per_second, crit_rates, triggers=None):
+        if triggers is None:
+            triggers = self.get_triggers_per_second(self.get_trigger_row(proc, 'oh'), attacks_per_second, crit_rates)
+        return triggers * proc.get_proc_rate(self.stats.oh.speed)
+
+    def get_other_procs_per_second(self, proc, attacks_per_second, crit_rates, triggers=None):
+        if triggers is None:
+            triggers = self.get_triggers_per_second(self.get_trigger_row(proc, 'other'), attacks_per_second, crit_rates)
         if proc.is_ppm():
-            if triggers_per_second == 0:
+            if triggers == 0:
                 return 0
             else:
                 raise InputNotModeledException(_('PPMs that also proc off spells are not yet modeled.'))
         else:
-            return triggers_per_second * proc.get_proc_rate()
+            return triggers * proc.get_proc_rate()
 
     def get_procs_per_second(self, proc, attacks_per_second, crit_rates):
+        return self.get_procs_per_second_for_procs([proc], attacks_per_second, crit_rates)[0]
+
+    def get_procs_per_second_for_procs(self, procs, attacks_per_second, crit_rates):
+        # Each distinct trigger row is added up once, however many procs
+        # share it; the procs then only scale it by their own proc rate.
         # TODO: Include damaging proc hits in figuring out how often everything else procs.
-        if getattr(proc, 'mh_only', False):
-            procs_per_second = self.get_mh_procs_per_second(proc, attacks_per_second, crit_rates)
-        elif getattr(proc, 'oh_only', False):
-            procs_per_second = self.get_oh_procs_per_second(proc, attacks_per_second, crit_rates)
-        else:
-            procs_per_second = self.get_mh_procs_per_second(proc, attacks_per_second, crit_rates)
-            procs_per_second += self.get_oh_procs_per_second(proc, attacks_per_second, crit_rates)
-            procs_per_second += self.get_other_procs_per_second(proc, attacks_per_second, crit_rates)
+        row_triggers = {}
+        def triggers(proc, hand):
+            row = self.get_trigger_row(proc, hand)
+            if row not in row_triggers:
+                row_triggers[row] = self.get_triggers_per_second(row, attacks_per_second, crit_rates)
+            return row_triggers[row]
+        procs_per_second = []
+        for proc in procs:
+            if getattr(proc, 'mh_only', False):
+                rate = self.get_mh_procs_per_second(proc, attacks_per_second, crit_rates, triggers(proc, 'mh'))
+            elif getattr(proc, 'oh_only', False):
+                rate = self.get_oh_procs_per_second(proc, attacks_per_second, crit_rates, triggers(proc, 'oh'))
+            else:
+                rate = self.get_mh_procs_per_second(proc, attacks_per_second, crit_rates, triggers(proc, 'mh'))
+                rate += self.get_oh_procs_per_second(proc, attacks_per_second, crit_rates, triggers(proc, 'oh'))
+                rate += self.get_other_procs_per_second(proc, attacks_per_second, crit_rates, triggers(proc, 'other'))
+            procs_per_second.append(rate)
         return procs_per_second
 
-    def set_uptime_for_ramping_proc(self, proc, procs_per_second):
-        time_for_one_stack = 1 / procs_per_second
-        if time_for_one_stack * proc.max_stacks > self.settings.duration:
-            max_stacks_reached = self.settings.duration * procs_per_second
-            proc.uptime = max_stacks_reached / 2
-        else:
-            missing_stacks = proc.max_stacks * (proc.max_stacks + 1) / 2
-            stack_time_lost = missing_stacks * time_for_one_stack
-            proc.uptime = proc.max_stacks - stack_time_lost / self.settings.duration
-
     def update_with_damaging_proc(self, proc, attacks_per_second, crit_rates):
         if proc.is_real_ppm():
             #http://us.battle.net/wow/en/forum/topic/8197741003?page=4#79
@@ -565,19 +860,26 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         elif self.settings.dmg_poison == 'wp':
             attacks_per_second['wound_poison'] = total_hits_per_second * avg_poison_proc_rate
 
-    def determine_stats(self, attack_counts_function):
-        current_stats = {
-            'str': self.base_strength,
-            'agi': self.base_stats['agi'] * self.agi_multiplier,
-            'ap': self.base_stats['ap'],
-            'crit': self.base_stats['crit'],
-            'haste': self.base_stats['haste'],
-            'mastery': self.base_stats['mastery'],
-            'readiness': self.base_stats['readiness'],
-            'multistrike': self.base_stats['multistrike'],
-        }
-        self.current_variables = {}
-        
+    def get_resolved_proc(self, proc):
+        # 'highest' procs give whichever of their stats is highest, which is
+        # always agi for a rogue. They're resolved into a copy with the other
+        # stats zeroed, so the inputs (and their result_cache key) stay as
+        # they were given. The copy is kept for as long as the proc doesn't
+        # change, so that uptime tables keyed by proc still find it.
+        state = proc.__getstate__()
+        cached = self.resolved_procs.get(proc)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        resolved = copy.copy(proc)
+        resolved.stat = 'stats'
+        resolved.value = dict((stat, [0, value][stat == 'agi']) for stat, value in proc.value.items())
+        self.resolved_procs[proc] = (state, resolved)
+        return resolved
+
+    def get_active_procs(self):
+        # Sorts the procs into the groups determine_stats handles separately:
+        # rppm, icd and no-icd stat procs, damage procs and weapon damage
+        # procs.
         #arrys to store different types of procs
         active_procs_rppm = []
         active_procs_icd = []
@@ -588,16 +890,10 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         #some procs need specific prep, think RoRO/VoS
         self.setup_unique_procs()
         
-        #set 'highest' procs to agi
-        for proc in self.stats.procs.get_all_procs_for_stat('highest'):
-            if 'agi' in proc.value:
-                proc.stat = 'stats'
-                for e in proc.value:
-                    if proc.value[e] is not 'agi':
-                        proc.value[e] = 0
-        
         #sort the procs into groups
         for proc in self.stats.procs.get_all_procs_for_stat():
+            if proc.stat == 'highest' and 'agi' in proc.value:
+                proc = self.get_resolved_proc(proc)
             if (proc.stat == 'stats') and not proc.is_ppm():
                 if proc.is_real_ppm():
                     active_procs_rppm.append(proc)
@@ -616,8 +912,10 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         for hand, enchant in [(x, y) for x in ('mh', 'oh') for y in ('dancing_steel', 'elemental_force')]:
             proc = getattr(getattr(self.stats, hand), enchant)
             if proc:
+                if proc.stat == 'highest' and 'agi' in proc.value:
+                    proc = self.get_resolved_proc(proc)
                 setattr(proc, '_'.join((hand, 'only')), True)
-                if (proc.stat in current_stats or proc.stat == 'stats'):
+                if (proc.stat in self.base_stats or proc.stat in ('str', 'stats')):
                     if proc.is_real_ppm():
                         active_procs_rppm.append(proc)
                     else:
@@ -627,19 +925,22 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
                             active_procs_no_icd.append(proc)
                 elif enchant in ('elemental_force',):
                     damage_procs.append(proc)
-                elif proc.stat == 'highest' and 'agi' in proc.value:
-                    proc.stat = 'stats'
-                    #need to make sure all 'highest' procs are restrained to a single stat
-                    for s in proc.value:
-                        if s != 'agi':
-                            proc.value[s] = 0
-                    if proc.is_real_ppm():
-                        active_procs_rppm.append(proc)
-                    else:
-                        if proc.icd:
-                            active_procs_icd.append(proc)
-                        else:
-                            active_procs_no_icd.append(proc)
+        
+        return active_procs_rppm, active_procs_icd, active_procs_no_icd, damage_procs, weapon_damage_procs
+
+    def determine_stats(self, attack_counts_function):
+        current_stats = {
+            'str': self.base_strength,
+            'agi': self.base_stats['agi'] * self.agi_multiplier,
+            'ap': self.base_stats['ap'],
+            'crit': self.base_stats['crit'],
+            'haste': self.base_stats['haste'],
+            'mastery': self.base_stats['mastery'],
+            'readiness': self.base_stats['readiness'],
+            'multistrike': self.base_stats['multistrike'],
+        }
+        self.current_variables = {}
+        active_procs_rppm, active_procs_icd, active_procs_no_icd, damage_procs, weapon_damage_procs = self.get_active_procs()
         
         static_proc_stats = {
             'str': 0,
@@ -657,8 +958,8 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         for e in self.human_racial_stats:
             static_proc_stats[e] += 30 #placeholder
         
+        self.set_rppm_uptimes(active_procs_rppm)
         for proc in active_procs_rppm:
-            self.set_rppm_uptime(proc)
             for e in proc.value:
                 static_proc_stats[ e ] += proc.uptime * proc.value[e] * self.get_stat_mod(e)
         
@@ -674,42 +975,50 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
             need_converge = True
         #only have to converge with specific procs, try to simplify later
         #check if... assassination:crit/haste, combat:mastery/haste, sub:haste/mastery
-        #while True:
-            #stuff()
-            #if not condition():
-                #break
-        while need_converge or self.spec_needs_converge:
-            current_stats = {
-                'str': self.base_strength,
-                'agi': self.base_stats['agi'] * self.agi_multiplier,
-                'ap': self.base_stats['ap'],
-                'crit': self.base_stats['crit'],
-                'haste': self.base_stats['haste'],
-                'mastery': self.base_stats['mastery'],
-                'readiness': self.base_stats['readiness'],
-                'multistrike': self.base_stats['multistrike'],
-            }
-            for k in static_proc_stats:
-                current_stats[k] +=  static_proc_stats[k]
-                
-            for proc in active_procs_no_icd:
-                self.set_uptime(proc, attacks_per_second, crit_rates)
-                for e in proc.value:
-                    if e == 'crit':
-                        recalculate_crit = True
-                    current_stats[ e ] += proc.uptime * proc.value[e] * self.get_stat_mod(e)
-                
-            old_attacks_per_second = attacks_per_second
-            if recalculate_crit:
-                crit_rates = None
+        self.convergence_iterations = 0
+        self.converged = True
+        if need_converge or self.spec_needs_converge:
+            # converge_step reports its stats and crit rates through here
+            state = {'crit_rates': crit_rates}
+
+            def converge_step(attacks_per_second):
+                current_stats = {
+                    'str': self.base_strength,
+                    'agi': self.base_stats['agi'] * self.agi_multiplier,
+                    'ap': self.base_stats['ap'],
+                    'crit': self.base_stats['crit'],
+                    'haste': self.base_stats['haste'],
+                    'mastery': self.base_stats['mastery'],
+                    'readiness': self.base_stats['readiness'],
+                    'multistrike': self.base_stats['multistrike'],
+                }
+                for k in static_proc_stats:
+                    current_stats[k] +=  static_proc_stats[k]
+
+                crit_rates = state['crit_rates']
                 recalculate_crit = False
-            attacks_per_second, crit_rates = attack_counts_function(current_stats, crit_rates=crit_rates)
-            
-            if self.are_close_enough(old_attacks_per_second, attacks_per_second):
-                break
+                self.set_uptimes(active_procs_no_icd, attacks_per_second, crit_rates)
+                for proc in active_procs_no_icd:
+                    for e in proc.value:
+                        if e == 'crit':
+                            recalculate_crit = True
+                        current_stats[ e ] += proc.uptime * proc.value[e] * self.get_stat_mod(e)
+
+                if recalculate_crit:
+                    crit_rates = None
+                attacks_per_second, state['crit_rates'] = attack_counts_function(current_stats, crit_rates=crit_rates)
+                state['current_stats'] = current_stats
+                return attacks_per_second
+
+            solver = self.get_convergence_solver()
+            attacks_per_second = solver.solve(converge_step, attacks_per_second, self.are_close_enough)
+            current_stats = state['current_stats']
+            crit_rates = state['crit_rates']
+            self.convergence_iterations = solver.iterations
+            self.converged = solver.converged
             
+        self.set_uptimes(active_procs_icd, attacks_per_second, crit_rates)
         for proc in active_procs_icd:
-            self.set_uptime(proc, attacks_per_second, crit_rates)
             for e in proc.value:
                 if e == 'crit':
                     recalculate_crit = True
@@ -759,8 +1068,7 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         for proc in damage_procs:
             self.update_with_damaging_proc(proc, attacks_per_second, crit_rates)
 
-        for proc in weapon_damage_procs:
-            self.set_uptime(proc, attacks_per_second, crit_rates)
+        self.set_uptimes(weapon_damage_procs, attacks_per_second, crit_rates)
                         
         return current_stats, attacks_per_second, crit_rates, damage_procs
     
@@ -791,12 +1099,14 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         if self.stats.mh.type != 'dagger' or self.stats.oh.type != 'dagger':
             raise InputNotModeledException(_('Assassination modeling requires daggers in both hands'))
         
+        self.reset_spec_constants()
+
         #set readiness coefficient
         self.readiness_spec_conversion = self.assassination_readiness_conversion
         self.human_racial_stats = ['mastery', 'crit']
         
         # Assassasins's Resolve
-        self.damage_modifier_cache *= 1.20
+        self.damage_modifier_cache = 1.20
         
         #update spec specific proc rates
         if getattr(self.stats.procs, 'legendary_capacitive_meta'):
@@ -1166,13 +1476,14 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
     # Combat DPS functions
     ###########################################################################
 
-    def combat_dps_estimate(self):
-        return sum(self.combat_dps_breakdown().values())
-
-    def combat_dps_breakdown(self):
+    def init_combat(self):
+        # Call this before calling any of the combat_dps functions directly;
+        # see init_assassination.
         if not self.settings.is_combat_rogue():
             raise InputNotModeledException(_('You must specify a combat cycle to match your combat spec.'))
         
+        self.reset_spec_constants()
+        
         #set readiness coefficient
         self.readiness_spec_conversion = self.combat_readiness_conversion
         self.human_racial_stats = ['haste', 'readiness']
@@ -1198,7 +1509,6 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
             self.max_energy += 15
         if self.glyphs.energy:
             self.max_energy += 20
-        ar_duration = 15
         self.ksp_buff = 0.5
         self.revealing_strike_multiplier = 1.35
         self.extra_cp_chance = .2 # Assume all casts during RvS
@@ -1207,7 +1517,12 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
             self.settings.dmg_poison = 'ip'
         
         self.set_constants()
-        
+
+    def combat_dps_estimate(self):
+        return sum(self.combat_dps_breakdown().values())
+
+    def combat_dps_breakdown(self):
+        ar_duration = 15
         cds = {'ar':self.get_spell_cd('adrenaline_rush')}
         
         # actual damage calculations here
@@ -1228,7 +1543,10 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         total_duration = phases['ar'][0] + phases['none'][0] 
         #average it together
         damage_breakdown = self.average_damage_breakdowns(phases, denom = total_duration)
-        
+        self.update_with_blade_flurry(damage_breakdown)
+        return damage_breakdown
+
+    def update_with_blade_flurry(self, damage_breakdown):
         bf_mod = .40
         bf_max_targets = 4
         if self.settings.cycle.blade_flurry:
@@ -1236,8 +1554,6 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
             for key in damage_breakdown:
                 if key in self.melee_attacks:
                     damage_breakdown['blade_flurry'] += bf_mod * damage_breakdown[key] * self.settings.num_boss_adds
-        
-        return damage_breakdown
     
     def update_with_bandits_guile(self, damage_breakdown):
         for key in damage_breakdown:
@@ -1463,10 +1779,9 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
     # Subtlety DPS functions
     ###########################################################################
 
-    def subtlety_dps_estimate(self):
-        return sum(self.subtlety_dps_breakdown().values())
-
-    def subtlety_dps_breakdown(self):
+    def init_subtlety(self):
+        # Call this before calling any of the subtlety_dps functions directly;
+        # see init_assassination.
         if not self.settings.is_subtlety_rogue():
             raise InputNotModeledException(_('You must specify a subtlety cycle to match your subtlety spec.'))
 
@@ -1478,7 +1793,9 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
                 raise InputNotModeledException(_('Hemorrhage usage must be set to always, never or a positive number'))
             if float(self.settings.cycle.use_hemorrhage) > self.settings.duration:
                 raise InputNotModeledException(_('Interval between Hemorrhages cannot be higher than the fight duration'))
-            
+        
+        self.reset_spec_constants()
+        
         #set readiness coefficient
         self.readiness_spec_conversion = self.subtlety_readiness_conversion
         self.human_racial_stats = ['haste', 'readiness']
@@ -1488,7 +1805,7 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         self.settings.opener_name = 'ambush'
         opener_cd = 30
         # Sanguinary Vein
-        self.damage_modifier_cache *= 1.35
+        self.damage_modifier_cache = 1.35
         
         #update spec specific proc rates
         if getattr(self.stats.procs, 'legendary_capacitive_meta'):
@@ -1526,10 +1843,19 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
             
         mos_value = .1
         self.vanish_rate = 1. / (self.get_spell_cd('vanish') + self.settings.response_time) + 1. / (self.get_spell_cd('preparation') + self.settings.response_time * 3) #vanish CD + Prep CD
-        mos_multiplier = 1. + mos_value * (6 + 3 * self.talents.subterfuge * [1, 2][self.glyphs.vanish]) * self.vanish_rate
+        self.mos_multiplier = 1. + mos_value * (6 + 3 * self.talents.subterfuge * [1, 2][self.glyphs.vanish]) * self.vanish_rate
+
+    def subtlety_dps_estimate(self):
+        return sum(self.subtlety_dps_breakdown().values())
 
+    def subtlety_dps_breakdown(self):
         damage_breakdown = self.compute_damage(self.subtlety_attack_counts)
+        self.update_with_find_weakness(damage_breakdown)
+        return damage_breakdown
 
+    def update_with_find_weakness(self, damage_breakdown):
+        # Find weakness, by the uptimes and rates subtlety_attack_counts
+        # leaves behind, along with the rupture bonus and master of subtlety.
         armor_value = self.target_armor()
         if self.settings.is_pvp:
             armor_reduction = .5
@@ -1549,9 +1875,7 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
                 damage_breakdown[key] *= 1 + self.backstab_fw_rate * (find_weakness_damage_boost - 1)
             if key == 'rupture':
                 damage_breakdown[key] *= 1.5
-            damage_breakdown[key] *= mos_multiplier
-        
-        return damage_breakdown
+            damage_breakdown[key] *= self.mos_multiplier
 
     def subtlety_attack_counts(self, current_stats, crit_rates=None):
         attacks_per_second = {}
@@ -1659,9 +1983,9 @@ class AldrianasRogueDamageCalculator(RogueDamageCalculator):
         #if we've consumed more CP's than we have for base functionality, lets generate some more CPs
         if base_cp_per_second < 0:
             if cpg_name == 'backstab':
-                cpg_per_second = math.fabs(base_cp_per_second) * self.base_backstab_energy_cost
+                cpg_per_second = abs(base_cp_per_second) * self.base_backstab_energy_cost
             elif cpg_name == 'hemorrhage':
-                cpg_per_second = math.fabs(base_cp_per_second) * self.base_hemo_cost
+                cpg_per_second = abs(base_cp_per_second) * self.base_hemo_cost
             base_cp_per_second += cpg_per_second
             attacks_per_second[cpg_name] += cpg_per_second
         attacks_per_second['eviscerate'][5] += base_cp_per_second / 5
@@ -5,7 +5,8 @@ class Settings(object):
 
     def __init__(self, cycle, time_in_execute_range=.35, response_time=.5, latency=.03, dmg_poison='dp', utl_poison=None,
                  duration=300, use_opener='always', opener_name='default', is_pvp=False, shiv_interval=0, adv_params=None,
-                 merge_damage=True, num_boss_adds=0, feint_interval=0, default_ep_stat='agi', potion=True, prepot=True, is_day=False):
+                 merge_damage=True, num_boss_adds=0, feint_interval=0, default_ep_stat='agi', potion=True, prepot=True, is_day=False,
+                 timeline=None):
         self.cycle = cycle
         self.time_in_execute_range = time_in_execute_range
         self.response_time = response_time
@@ -13,6 +14,7 @@ class Settings(object):
         self.dmg_poison = dmg_poison
         self.utl_poison = utl_poison
         self.duration = duration
+        self.timeline = timeline
         self.use_opener = use_opener # Allowed values are 'always' (vanish/shadowmeld on cooldown), 'opener' (once per fight) and 'never'
         self.opener_name = opener_name
         self.is_pvp = is_pvp
@@ -46,6 +48,15 @@ class Settings(object):
         if utl_poison not in (None, 'cp', 'mnp', 'lp', 'pp'):
             raise exceptions.InvalidInputException(_('You can only choose Crippling(cp), Mind-Numbing(mnp), Leeching(lp) or Paralytic(pp) as a non-lethal poison'))
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # A FightTimeline replaces the averaged heroism uptime and execute
+        # range with the phases it lists; duration and time_in_execute_range
+        # then come from it.
+        if name == 'timeline' and value is not None:
+            self.duration = value.get_duration()
+            self.time_in_execute_range = value.get_execute_fraction()
+
     def get_spec(self):
         return self.cycle._cycle_type
     
@@ -85,6 +96,9 @@ class Cycle(object):
     # you have an appropriate cycle object to go with your talent trees, etc.
     _cycle_type = ''
 
+    # Poison counts check this for every spec; only combat can enable it.
+    blade_flurry = False
+
 
 class AssassinationCycle(Cycle):
     _cycle_type = 'assassination'
@@ -128,4 +142,74 @@ class SubtletyCycle(Cycle):
         self.use_hemorrhage = use_hemorrhage # Allowed values are 'always' (main CP generator),
                                                                  #'never' (default to backstab),
                                                                  # or a number denoting the interval in seconds between applications
-        
\ No newline at end of file
+        
+
+class Phase(object):
+    # One stretch of a FightTimeline: duration seconds with haste_multiplier
+    # on top of the character's haste (1.3 under heroism, which isn't
+    # averaged in when there's a timeline), num_boss_adds extra targets (None
+    # for the settings' own) and the boss in the execute range or not.
+
+    def __init__(self, name, duration, haste_multiplier=1., num_boss_adds=None, execute=False):
+        if duration <= 0:
+            raise exceptions.InvalidInputException(_('Phase {name} must last longer than 0 seconds.').format(name=name))
+        if haste_multiplier <= 0:
+            raise exceptions.InvalidInputException(_('Phase {name} must have a positive haste multiplier.').format(name=name))
+        self.name = name
+        self.duration = duration
+        self.haste_multiplier = haste_multiplier
+        if num_boss_adds is not None:
+            num_boss_adds = max(num_boss_adds, 0)
+        self.num_boss_adds = num_boss_adds
+        self.execute = bool(execute)
+
+
+class FightTimeline(object):
+    # A fight as a list of phases, in the order they happen.
+
+    def __init__(self, phases):
+        if not phases:
+            raise exceptions.InvalidInputException(_('A fight timeline needs at least one phase.'))
+        self.phases = list(phases)
+
+    def get_duration(self):
+        return sum(phase.duration for phase in self.phases)
+
+    def get_execute_fraction(self):
+        return float(sum(phase.duration for phase in self.phases if phase.execute)) / self.get_duration()
+
+    def group_phases(self, signature):
+        # Phases with the same signature(phase) can't be told apart by the
+        # model; returns one (phase, total duration) pair for each distinct
+        # signature, in the order they first come up.
+        groups = []
+        indices = {}
+        for phase in self.phases:
+            key = signature(phase)
+            if key in indices:
+                first_phase, duration = groups[indices[key]]
+                groups[indices[key]] = (first_phase, duration + phase.duration)
+            else:
+                indices[key] = len(groups)
+                groups.append((phase, phase.duration))
+        return groups
+
+    @classmethod
+    def from_settings(cls, duration, time_in_execute_range=.35, heroism=True, num_boss_adds=None):
+        # The fight the averaged model describes: heroism for the first 40
+        # seconds of every 10 minutes, and the execute range at the end.
+        execute_start = duration * (1 - time_in_execute_range)
+        boundaries = set([0, duration, execute_start])
+        if heroism:
+            for start in xrange(0, int(duration), 600):
+                boundaries.update([start, min(start + 40, duration)])
+        boundaries = sorted(boundary for boundary in boundaries if 0 <= boundary <= duration)
+        phases = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            if end <= start:
+                continue
+            in_heroism = heroism and start % 600 < 40
+            in_execute = start >= execute_start
+            name = '_'.join([part for part, used in (('heroism', in_heroism), ('execute', in_execute)) if used]) or 'normal'
+            phases.append(Phase(name, end - start, [1., 1.3][in_heroism], num_boss_adds, in_execute))
+        return cls(phases)
@@ -1,8 +1,3 @@
-import gettext
-import __builtin__
-
-__builtin__._ = gettext.gettext
-
 from shadowcraft.calcs import DamageCalculator
 from shadowcraft.core import exceptions
 
@@ -37,11 +32,6 @@ class RogueDamageCalculator(DamageCalculator):
     combat_readiness_conversion = 0.8
     subtlety_readiness_conversion = 1.0
     
-    crit_damage_cache = None
-    raid_modifiers_cache = {'physical':None,
-                           'bleed':None,
-                           'spell':None}
-    
     ability_info = {
             'ambush':              (60, 'strike'),
             'backstab':            (35, 'strike'),
@@ -74,6 +64,31 @@ class RogueDamageCalculator(DamageCalculator):
             'marked_for_death':    60,
             'preparation':         300,
         }
+    # AP coefficients of the finishers, indexed by combo points.
+    rupture_tick_coefficients = (0, .025, .04, .05, .056, .062)
+    eviscerate_coefficients = tuple(.18 * cp for cp in xrange(6))
+    envenom_coefficients = tuple(.134 * cp for cp in xrange(6))
+    crimson_tempest_coefficients = tuple(.0275 * cp for cp in xrange(6))
+
+    # The damage methods get_formula looks attacks up in.
+    formula_methods = {
+            'backstab':              'backstab_damage',
+            'hemorrhage':            'hemorrhage_damage',
+            'sinister_strike':       'sinister_strike_damage',
+            'revealing_strike':      'revealing_strike_damage',
+            'main_gauche':           'main_gauche_damage',
+            'ambush':                'ambush_damage',
+            'eviscerate':            'eviscerate_damage',
+            'dispatch':              'dispatch_damage',
+            'mh_mutilate':           'mh_mutilate_damage',
+            'oh_mutilate':           'oh_mutilate_damage',
+            'venomous_wounds':       'venomous_wounds_damage',
+            'deadly_poison':         'deadly_poison_tick_damage',
+            'wound_poison':          'wound_poison_damage',
+            'deadly_instant_poison': 'deadly_instant_poison_damage',
+            'instant_poison':        'instant_poison_damage',
+            'shuriken_toss':         'shuriken_toss_damage',
+    }
     cd_reduction_table = {'assassination': ['vanish', 'vendetta'],
                           'combat': ['adrenaline_rush', 'killing_spree'],
                           'subtlety': ['vanish', 'shadow_dance']
@@ -90,6 +105,15 @@ class RogueDamageCalculator(DamageCalculator):
         super(RogueDamageCalculator, self)._set_constants_for_level()
         self.normalize_ep_stat = self.get_adv_param('norm_ep_stat', self.settings.default_ep_stat, ignore_bounds=True)
         self.damage_modifier_cache = 1
+        # Keyed on everything the modifiers read (see raid_settings_modifiers_key
+        # and crit_damage_modifiers_key), so changing the inputs can't hit a
+        # stale entry.
+        self.raid_modifiers_cache = {}
+        self.crit_damage_cache = {}
+        # Trigger rows for the procs per second, see get_trigger_row.
+        self.trigger_rows = {}
+        # 'highest' procs resolved to agi, see get_resolved_proc.
+        self.resolved_procs = {}
         # We only check race here (instead of calcs) because we can assume it's an agi food buff and it applies to every possible rogue calc
         # Otherwise we would be obligated to have a series of conditions to check for classes
         if self.race.epicurean:
@@ -117,23 +141,34 @@ class RogueDamageCalculator(DamageCalculator):
         base_modifier = self.damage_modifier_cache
         
         # Raid modifiers
-        if not self.raid_modifiers_cache[damage_type]:
-            self.raid_modifiers_cache[damage_type] = self.raid_settings_modifiers(attack_kind=damage_type, armor=armor)
-        base_modifier *= self.raid_modifiers_cache[damage_type]
+        raid_key = self.raid_settings_modifiers_key(damage_type, armor)
+        if raid_key not in self.raid_modifiers_cache:
+            self.raid_modifiers_cache[raid_key] = self.raid_settings_modifiers(attack_kind=damage_type, armor=armor)
+        base_modifier *= self.raid_modifiers_cache[raid_key]
         
         # potent poisons and executioner should be calculated outside, and passed in, no need to recalculate the % each time
         base_modifier *= executioner_modifier
         base_modifier *= potent_poisons_modifier
         
-        if not self.crit_damage_cache:
-            self.crit_damage_cache = self.crit_damage_modifiers()
+        crit_key = self.crit_damage_modifiers_key()
+        if crit_key not in self.crit_damage_cache:
+            self.crit_damage_cache[crit_key] = self.crit_damage_modifiers()
 
-        return (base_modifier, self.crit_damage_cache)
+        return (base_modifier, self.crit_damage_cache[crit_key])
     
     def get_dps_contribution(self, base_damage, crit_rate, frequency, crit_modifier):
         average_hit = base_damage * (1 - crit_rate) + base_damage * crit_rate * crit_modifier
         return average_hit * frequency
     
+    def get_finisher_dps(self, coefficients, ap, first_modifier, second_modifier, crit_rate, frequencies, crit_modifier):
+        # The dps of a finisher over its uses at 1 to 5 combo points, with
+        # frequencies indexed by combo points.
+        dps = 0
+        for cp in xrange(1, 6):
+            damage = coefficients[cp] * ap * first_modifier * second_modifier
+            dps += self.get_dps_contribution(damage, crit_rate, frequencies[cp], crit_modifier)
+        return dps
+
     def get_damage_breakdown(self, current_stats, attacks_per_second, crit_rates, damage_procs):
         average_ap = current_stats['ap'] + current_stats['agi'] + current_stats['str']
         average_ap *= self.buffs.attack_power_multiplier()
@@ -222,34 +257,22 @@ class RogueDamageCalculator(DamageCalculator):
         
         if 'hemorrhage_ticks' in attacks_per_second:
             hemo_hit = self.hemorrhage_tick_damage(average_ap) * bleed_modifier
-            hemo_crit = self.hemorrhage_tick_damage(average_ap) * bleed_modifier * bleed_crit_modifier
+            hemo_crit = hemo_hit * bleed_crit_modifier
             dps_from_hit_hemo = self.get_dps_contribution(hemo_hit, crit_rates['hemorrhage'], attacks_per_second['hemorrhage_ticks'] * (1 - crit_rates['hemorrhage']), bleed_crit_modifier)
             dps_from_crit_hemo = self.get_dps_contribution(hemo_crit, crit_rates['hemorrhage'], attacks_per_second['hemorrhage_ticks'] * crit_rates['hemorrhage'], bleed_crit_modifier)
             damage_breakdown['hemorrhage_dot'] = dps_from_hit_hemo + dps_from_crit_hemo
         
         if 'rupture_ticks' in attacks_per_second:
-            average_dps = 0
-            for i in xrange(1, 6):
-                dps_tuple = self.rupture_tick_damage(average_ap, i) * bleed_modifier * executioner_mod
-                dps_tuple = self.get_dps_contribution(dps_tuple, crit_rates['rupture_ticks'], attacks_per_second['rupture_ticks'][i], physical_crit_modifier)
-                average_dps += dps_tuple
-            damage_breakdown['rupture'] = average_dps
+            damage_breakdown['rupture'] = self.get_finisher_dps(self.rupture_tick_coefficients, average_ap, bleed_modifier, executioner_mod,
+                                                                crit_rates['rupture_ticks'], attacks_per_second['rupture_ticks'], physical_crit_modifier)
     
         if 'envenom' in attacks_per_second:
-            average_dps = 0
-            for i in xrange(1, 6):
-                dps_tuple = self.envenom_damage(average_ap, i) * potent_poisons_mod * spell_modifier
-                dps_tuple = self.get_dps_contribution(dps_tuple, crit_rates['envenom'], attacks_per_second['envenom'][i], spell_crit_modifier)
-                average_dps += dps_tuple
-            damage_breakdown['envenom'] = average_dps
+            damage_breakdown['envenom'] = self.get_finisher_dps(self.envenom_coefficients, average_ap, potent_poisons_mod, spell_modifier,
+                                                                crit_rates['envenom'], attacks_per_second['envenom'], spell_crit_modifier)
 
         if 'eviscerate' in attacks_per_second:
-            average_dps = 0
-            for i in xrange(1, 6):
-                dps_tuple = self.eviscerate_damage(average_ap, i) * physical_modifier * executioner_mod
-                dps_tuple = self.get_dps_contribution(dps_tuple, crit_rates['eviscerate'], attacks_per_second['eviscerate'][i], physical_crit_modifier)
-                average_dps += dps_tuple
-            damage_breakdown['eviscerate'] = average_dps
+            damage_breakdown['eviscerate'] = self.get_finisher_dps(self.eviscerate_coefficients, average_ap, physical_modifier, executioner_mod,
+                                                                   crit_rates['eviscerate'], attacks_per_second['eviscerate'], physical_crit_modifier)
                    
         for proc in damage_procs:
             if proc.proc_name not in damage_breakdown:
@@ -290,10 +313,10 @@ class RogueDamageCalculator(DamageCalculator):
         return damage
     
     def mh_shuriken(self, ap):
-        return .75 * mh_damage(ap, armor=armor)
+        return .75 * self.mh_damage(ap)
     
     def oh_shuriken(self, ap):
-        return .75 * oh_damage(ap, armor=armor)
+        return .75 * self.oh_damage(ap)
 
     def backstab_damage(self, ap):
         weapon_damage = self.get_weapon_damage('mh', ap)
@@ -326,8 +349,7 @@ class RogueDamageCalculator(DamageCalculator):
         return damage
 
     def hemorrhage_tick_damage(self, ap):
-        # Call this function twice to get all four crit/non-crit hemo values.
-        hemo_damage = self.hemorrhage_damage(ap, armor=armor)
+        hemo_damage = self.hemorrhage_damage(ap)
         tick_conversion_factor = .5 / 8
         tick_damage = hemo_damage * tick_conversion_factor
         return tick_damage
@@ -384,16 +406,15 @@ class RogueDamageCalculator(DamageCalculator):
         return tick_damage
 
     def rupture_tick_damage(self, ap, cp):
-        ap_multiplier_tuple = (0, .025, .04, .05, .056, .062)
-        tick_damage = (ap_multiplier_tuple[cp] * ap)
+        tick_damage = (self.rupture_tick_coefficients[cp] * ap)
         return tick_damage
 
     def eviscerate_damage(self, ap, cp):
-        damage = (0.18 * cp * ap)
+        damage = (self.eviscerate_coefficients[cp] * ap)
         return damage
 
     def envenom_damage(self, ap, cp):
-        damage = (0.134 * cp * ap)
+        damage = (self.envenom_coefficients[cp] * ap)
         return damage
 
     def fan_of_knives_damage(self, ap):
@@ -401,11 +422,11 @@ class RogueDamageCalculator(DamageCalculator):
         return damage
 
     def crimson_tempest_damage(self, ap, cp):
-        damage = (.0275 * cp * ap)
+        damage = (self.crimson_tempest_coefficients[cp] * ap)
         return damage
 
     def crimson_tempest_tick_damage(self, ap, cp):
-        ct_damage = self.crimson_tempest_damage(ap, cp, armor=armor)
+        ct_damage = self.crimson_tempest_damage(ap, cp)
         tick_conversion_factor = 2.4 / 6
         tick_damage = ct_damage * tick_conversion_factor
         return tick_damage
@@ -424,25 +445,7 @@ class RogueDamageCalculator(DamageCalculator):
         return damage
     
     def get_formula(self, name):
-        formulas = {
-            'backstab':              self.backstab_damage,
-            'hemorrhage':            self.hemorrhage_damage,
-            'sinister_strike':       self.sinister_strike_damage,
-            'revealing_strike':      self.revealing_strike_damage,
-            'main_gauche':           self.main_gauche_damage,
-            'ambush':                self.ambush_damage,
-            'eviscerate':            self.eviscerate_damage,
-            'dispatch':              self.dispatch_damage,
-            'mh_mutilate':           self.mh_mutilate_damage,
-            'oh_mutilate':           self.oh_mutilate_damage,
-            'venomous_wounds':       self.venomous_wounds_damage,
-            'deadly_poison':         self.deadly_poison_tick_damage,
-            'wound_poison':          self.wound_poison_damage,
-            'deadly_instant_poison': self.deadly_instant_poison_damage,
-            'instant_poison':        self.instant_poison_damage,
-            'shuriken_toss':         self.shuriken_toss_damage
-        }
-        return formulas[name]
+        return getattr(self, self.formula_methods[name])
 
     def get_spell_stats(self, ability, cost_mod=1.0):
         cost = self.ability_info[ability][0] * cost_mod
@@ -0,0 +1,115 @@
+import copy
+
+# A session wraps a calculator for repeated what-if queries against one
+# character. Instead of running the whole model on every request it keeps
+# a small dependency graph of derived values, each tagged with the state of
+# the inputs it was built from:
+#
+#   spec constants (init_<spec>: set_constants, openers, hit chances, energy)
+#       <- talents, glyphs, buffs, race, settings, level, and every stat
+#          not in the calculator's base_stats_deltas
+#   base stats (set_base_stats)
+#       <- spec constants, and the stats in base_stats_deltas
+#   results (dps, breakdown)
+#       <- base stats
+#
+# Each query compares the inputs against the ones the nodes were built from
+# and only rebuilds the nodes whose inputs changed, along with everything
+# downstream of them. The calculator needs get_spec_functions(),
+# set_base_stats() and base_stats_deltas, as AldrianasRogueDamageCalculator
+# provides.
+
+def snapshot(obj, exclude=()):
+    # A copy of the attributes of an input object that compares equal to
+    # snapshot(obj, exclude) until one of them changes. Containers are copied
+    # deep so that changes made in place show up as well; objects held in an
+    # attribute compare by identity, so nested inputs need a snapshot of
+    # their own. Procs in particular only compare by identity: the model
+    # writes its own derived state (uptimes, proc rate modifiers) onto them,
+    # and that shouldn't count as a change of inputs.
+    state = {}
+    for name, value in obj.__dict__.iteritems():
+        if name in exclude:
+            continue
+        if isinstance(value, (dict, list, set)):
+            value = copy.deepcopy(value)
+        state[name] = value
+    return state
+
+
+class Session(object):
+
+    def __init__(self, calculator):
+        self.calculator = calculator
+        self.invalidate()
+
+    def invalidate(self):
+        # Forget every node; the next query rebuilds from scratch.
+        self.spec_state = None
+        self.base_stats_state = None
+        self.results = {}
+        self.rebuilds = {'spec': 0, 'base_stats': 0, 'results': 0}
+
+    def input_objects(self):
+        calculator = self.calculator
+        return [calculator.stats, calculator.stats.mh, calculator.stats.oh, calculator.stats.procs,
+                calculator.stats.gear_buffs, calculator.talents, calculator.glyphs, calculator.buffs, calculator.race,
+                calculator.settings, calculator.settings.cycle]
+
+    def spec_inputs_changed(self):
+        if self.spec_state is None:
+            return True
+        calculator = self.calculator
+        levels, objects, states = self.spec_state
+        if levels != (calculator.level, calculator.target_level):
+            return True
+        current_objects = self.input_objects()
+        if current_objects != objects:
+            return True
+        # The stats snapshot leaves out base_stats_deltas, which belong to
+        # the base stats node.
+        if snapshot(current_objects[0], calculator.base_stats_deltas) != states[0]:
+            return True
+        for obj, state in zip(current_objects[1:], states[1:]):
+            if obj.__dict__ != state:
+                return True
+        return False
+
+    def spec_inputs(self):
+        calculator = self.calculator
+        objects = self.input_objects()
+        states = [snapshot(objects[0], calculator.base_stats_deltas)] + [snapshot(obj) for obj in objects[1:]]
+        return (calculator.level, calculator.target_level), objects, states
+
+    def base_stats_inputs(self):
+        return tuple([getattr(self.calculator.stats, stat) for stat in sorted(self.calculator.base_stats_deltas)])
+
+    def update(self):
+        # Brings every node up to date with the calculator inputs.
+        if self.spec_inputs_changed():
+            init_spec, dps_estimate, dps_breakdown = self.calculator.get_spec_functions()
+            init_spec()
+            self.rebuilds['spec'] += 1
+            self.spec_state = self.spec_inputs()
+            self.base_stats_state = self.base_stats_inputs()
+            self.results = {}
+        base_stats_state = self.base_stats_inputs()
+        if base_stats_state != self.base_stats_state:
+            self.calculator.set_base_stats()
+            self.rebuilds['base_stats'] += 1
+            self.base_stats_state = base_stats_state
+            self.results = {}
+
+    def get_result(self, name):
+        self.update()
+        if name not in self.results:
+            init_spec, dps_estimate, dps_breakdown = self.calculator.get_spec_functions()
+            self.results[name] = {'dps': dps_estimate, 'breakdown': dps_breakdown}[name]()
+            self.rebuilds['results'] += 1
+        return self.results[name]
+
+    def get_dps(self):
+        return self.get_result('dps')
+
+    def get_dps_breakdown(self):
+        return dict(self.get_result('breakdown'))
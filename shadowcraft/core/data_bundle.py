@@ -0,0 +1,99 @@
+import mmap
+import struct
+
+from shadowcraft.core import exceptions
+
+# Read-only numeric tables packed into one binary file, for data that would
+# otherwise be built from Python literals on every import. The file is
+# mapped rather than read, so tables cost nothing until they're indexed and
+# processes forked from one that mapped it share its pages.
+#
+# Layout, little-endian: a header (magic, format version, table count and
+# the sha1 of the source the tables were built from), then one directory
+# entry per table (name, struct type code, offset and length in items),
+# then the tables, each starting on an 8 byte boundary.
+
+MAGIC = 'SCDB'
+FORMAT_VERSION = 1
+
+header = struct.Struct('<4sII20s')
+entry = struct.Struct('<32sc7xQQ')
+type_codes = frozenset('id')
+
+
+class InvalidBundleException(exceptions.InvalidInputException):
+    pass
+
+
+def write_bundle(path, tables, digest):
+    # tables is a list of (name, type code, sequence of numbers); digest the
+    # 20 byte sha1 of whatever they were built from.
+    offset = header.size + entry.size * len(tables)
+    directory = []
+    payload = []
+    for name, type_code, values in tables:
+        if type_code not in type_codes:
+            raise InvalidBundleException(_('Unsupported type code {type_code}').format(type_code=type_code))
+        padding = -offset % 8
+        payload.append('\0' * padding)
+        offset += padding
+        data = struct.pack('<{count}{type_code}'.format(count=len(values), type_code=type_code), *values)
+        directory.append(entry.pack(name, type_code, offset, len(values)))
+        payload.append(data)
+        offset += len(data)
+    with open(path, 'wb') as bundle_file:
+        bundle_file.write(header.pack(MAGIC, FORMAT_VERSION, len(tables), digest))
+        bundle_file.write(''.join(directory))
+        bundle_file.write(''.join(payload))
+
+
+class Bundle(object):
+
+    def __init__(self, path):
+        with open(path, 'rb') as bundle_file:
+            self.buffer = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.buffer) < header.size:
+            raise InvalidBundleException(_('{path} is not a data bundle').format(path=path))
+        magic, version, count, self.digest = header.unpack_from(self.buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise InvalidBundleException(_('{path} is not a version {version} data bundle').format(path=path, version=FORMAT_VERSION))
+        self.entries = {}
+        for index in xrange(count):
+            name, type_code, offset, length = entry.unpack_from(self.buffer, header.size + entry.size * index)
+            self.entries[name.rstrip('\0')] = (type_code, offset, length)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def get_table(self, name):
+        try:
+            type_code, offset, length = self.entries[name]
+        except KeyError:
+            raise InvalidBundleException(_('No table {name} in the data bundle').format(name=name))
+        return MappedTable(self.buffer, type_code, offset, length)
+
+
+class MappedTable(object):
+    # A table of a bundle, indexed like the list it was built from (negative
+    # indices included); each lookup reads straight from the mapping.
+    __slots__ = ('buffer', 'item', 'offset', 'length')
+
+    def __init__(self, buffer, type_code, offset, length):
+        self.buffer = buffer
+        self.item = struct.Struct('<' + type_code)
+        self.offset = offset
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('table index out of range')
+        return self.item.unpack_from(self.buffer, self.offset + self.item.size * index)[0]
+
+    def __iter__(self):
+        for index in xrange(self.length):
+            yield self[index]
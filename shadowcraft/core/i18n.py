@@ -1,9 +1,6 @@
 import gettext
 import os.path
 import locale
-import __builtin__
-
-__builtin__._ = gettext.gettext
 
 # Domain: this needs to be the name of our .mo files
 TRANSLATION_DOMAIN = 'SCE'
@@ -1,4 +0,0 @@
-import gettext
-import __builtin__
-
-__builtin__._ = gettext.gettext
@@ -72,6 +72,11 @@ class Buffs(object):
         except KeyError as e:
             raise exceptions.InvalidLevelException(_('No conversion factor available for level {level}').format(level=self.level))
     
+    def get_active_buffs(self):
+        # Buffs are only ever set as instance attributes, so this doesn't
+        # need to go through __getattr__ for the ones we don't have.
+        return frozenset([buff for buff, active in self.__dict__.iteritems() if active and buff in self.allowed_buffs])
+
     def get_max_buffs(self):
         return frozenset(buffs_debuffs + ['food_300_agi', 'agi_flask_mop'])
 
@@ -0,0 +1,1096 @@
+# The numeric tables behind class_data.Util, as datamined. Edit them here,
+# then rebuild class_data.bundle with scripts/build_data_bundle.py; Util only
+# imports this module when the bundle is missing or out of date.
+
+SPELL_SCALING_VALUES = [
+    [],
+    [],
+    [],
+    [],
+    [
+          37.297119140625000,   38.664085388183594,   39.575397491455078,   40.182941436767578,   40.587966918945312,
+          41.398025512695312,   43.448474884033203,   45.498928070068359,   47.549381256103516,   49.599834442138672,
+          51.650287628173828,   53.700740814208984,   55.751190185546875,   59.506370544433594,   63.464359283447266,
+          67.625152587890625,   71.988761901855469,   76.555175781250000,   81.324394226074219,   86.296417236328125,
+          90.327865600585938,   94.427680969238281,   98.588249206542969,  102.801979064941406,  107.061256408691406,
+         111.358489990234375,  115.686058044433594,  120.036361694335938,  124.401786804199219,  128.774749755859375,
+         133.147628784179688,  137.512817382812500,  141.862716674804688,  146.189712524414062,  150.486206054687500,
+         154.744598388671875,  158.957290649414062,  163.116653442382812,  167.215087890625000,  171.244995117187500,
+         182.127532958984375,  193.476638793945312,  205.302459716796875,  217.615112304687500,  230.424774169921875,
+         243.741546630859375,  257.575592041015625,  271.937042236328125,  286.836029052734375,  302.282745361328125,
+         318.287261962890625,  334.859741210937500,  352.010345458984375,  369.749206542968750,  388.086425781250000,
+         407.032226562500000,  426.596649169921875,  446.789916992187500,  510.141021728515625,  532.945800781250000,
+         552.214721679687500,  571.938354492187500,  592.121704101562500,  612.769897460937500,  633.887939453125000,
+         655.481018066406250,  677.554077148437500,  700.112243652343750,  723.160583496093750,  746.704162597656250,
+         770.748107910156250,  795.297363281250000,  820.357116699218750,  845.932373046875000,  872.028198242187500,
+         898.649719238281250,  925.802001953125000,  953.490051269531250,  981.718994140625000, 1010.493896484375000,
+        1032.933593750000000, 1055.626708984375000, 1078.573486328125000, 1101.773681640625000, 1125.227416992187500,
+        1148.934570312500000, 1172.895385742187500, 1197.109619140625000, 1221.577270507812500, 1246.298583984375000,
+    ],
+    [],
+    [],
+    [],
+    [],
+    [],
+    [],
+    [],
+]
+
+AGI_PER_CRIT_VALUES = [
+    [],
+    [],
+    [],
+    [],
+    [
+           2.234094142913818,    2.331228971481323,    2.428363323211670,    2.622632265090942,    2.719766616821289,
+           2.816901445388794,    3.011170148849487,    3.108304500579834,    3.205439567565918,    3.399708032608032,
+           3.788246154785156,    4.176784992218018,    4.662456989288330,    5.050994873046875,    5.633802890777588,
+           6.022340297698975,    6.410876750946045,    6.896551609039307,    7.382225990295410,    7.867895126342773,
+           8.353569984436035,    8.742107391357422,    9.227782249450684,    9.616318702697754,   10.199128150939941,
+          10.684799194335938,   11.073339462280273,   11.559009552001953,   12.044680595397949,   12.627490043640137,
+          13.016019821166992,   13.501690864562988,   13.987363815307617,   14.473036766052246,   15.055842399597168,
+          15.541511535644531,   15.930060386657715,   16.415725708007812,   16.901399612426758,   17.484230041503906,
+          17.969871520996094,   18.455564498901367,   18.941223144531250,   19.524042129516602,   20.106847763061523,
+          20.592529296875000,   21.078191757202148,   21.563854217529297,   22.049549102783203,   22.729494094848633,
+          23.215160369873047,   23.700838088989258,   24.283632278442383,   24.769273757934570,   25.352140426635742,
+          25.934886932373047,   26.420568466186523,   27.003381729125977,   27.489067077636719,   28.169013977050781,
+          29.917457580566406,   31.083024978637695,   32.637184143066406,   33.802856445312500,   34.968460083007812,
+          36.134086608886719,   37.299655914306641,   38.173912048339844,   39.048007965087891,   40.019371032714844,
+          43.030555725097656,   46.333190917968750,   49.830078125000000,   53.618152618408203,   57.697746276855469,
+          62.069007873535156,   66.828392028808594,   71.879356384277344,   77.319190979003906,   83.146942138671875,
+         108.695663452148438,  142.857147216796875,  188.679244995117188,  250.000000000000000,  322.580657958984375,
+         422.838226318359375,  555.987243652343750,  730.520507812500000,  959.033020019531250, 1259.518066406250000,
+    ],
+    [],
+    [],
+    [],
+    [],
+    [],
+    [],
+    [],
+]
+
+RANDOM_PROP_POINTS = [
+      [   0, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   1, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   2, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   3, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   4, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   5, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   6, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   7, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   8, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [   9, [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ], [    0,    0,    0,    0,    0 ] ],
+      [  10, [    9,    7,    5,    4,    3 ], [    5,    4,    3,    2,    2 ], [    1,    1,    1,    1,    1 ] ],
+      [  11, [   10,    8,    6,    4,    3 ], [    5,    4,    3,    2,    2 ], [    2,    1,    1,    1,    1 ] ],
+      [  12, [   11,    8,    6,    5,    4 ], [    6,    4,    3,    3,    2 ], [    2,    2,    1,    1,    1 ] ],
+      [  13, [   12,    9,    7,    5,    4 ], [    7,    5,    4,    3,    2 ], [    3,    2,    1,    1,    1 ] ],
+      [  14, [   12,    9,    7,    5,    4 ], [    7,    5,    4,    3,    2 ], [    3,    2,    2,    1,    1 ] ],
+      [  15, [   13,   10,    7,    5,    4 ], [    8,    6,    4,    3,    2 ], [    4,    3,    2,    1,    1 ] ],
+      [  16, [   14,   10,    8,    6,    4 ], [    8,    6,    5,    4,    3 ], [    4,    3,    2,    2,    1 ] ],
+      [  17, [   14,   11,    8,    6,    5 ], [    9,    7,    5,    4,    3 ], [    5,    3,    3,    2,    1 ] ],
+      [  18, [   15,   11,    9,    7,    5 ], [    9,    7,    5,    4,    3 ], [    5,    4,    3,    2,    2 ] ],
+      [  19, [   16,   12,    9,    7,    5 ], [   10,    8,    6,    4,    3 ], [    6,    4,    3,    2,    2 ] ],
+      [  20, [   16,   12,    9,    7,    5 ], [   11,    8,    6,    5,    3 ], [    6,    5,    3,    3,    2 ] ],
+      [  21, [   17,   13,    9,    7,    5 ], [   11,    8,    6,    5,    4 ], [    7,    5,    4,    3,    2 ] ],
+      [  22, [   18,   13,   10,    7,    6 ], [   12,    9,    7,    5,    4 ], [    7,    5,    4,    3,    2 ] ],
+      [  23, [   18,   14,   11,    8,    6 ], [   12,    9,    7,    5,    4 ], [    8,    6,    4,    3,    2 ] ],
+      [  24, [   19,   14,   11,    8,    6 ], [   13,   10,    7,    6,    4 ], [    8,    6,    5,    3,    3 ] ],
+      [  25, [   20,   15,   11,    9,    7 ], [   14,   10,    8,    6,    4 ], [    9,    6,    5,    4,    3 ] ],
+      [  26, [   20,   16,   11,    9,    7 ], [   14,   11,    8,    6,    5 ], [    9,    7,    5,    4,    3 ] ],
+      [  27, [   21,   16,   12,    9,    7 ], [   15,   11,    8,    6,    5 ], [   10,    7,    5,    4,    3 ] ],
+      [  28, [   22,   16,   12,    9,    7 ], [   15,   12,    9,    7,    5 ], [   10,    8,    6,    4,    3 ] ],
+      [  29, [   23,   17,   13,    9,    7 ], [   16,   12,    9,    7,    5 ], [   11,    8,    6,    4,    3 ] ],
+      [  30, [   23,   18,   13,   10,    7 ], [   17,   12,    9,    7,    5 ], [   11,    8,    6,    5,    3 ] ],
+      [  31, [   24,   18,   14,   10,    7 ], [   17,   13,   10,    7,    5 ], [   12,    9,    6,    5,    4 ] ],
+      [  32, [   25,   18,   14,   11,    8 ], [   18,   13,   10,    8,    6 ], [   12,    9,    7,    5,    4 ] ],
+      [  33, [   25,   19,   14,   11,    8 ], [   18,   14,   10,    8,    6 ], [   13,    9,    7,    5,    4 ] ],
+      [  34, [   26,   20,   15,   11,    8 ], [   19,   14,   11,    8,    6 ], [   13,   10,    7,    5,    4 ] ],
+      [  35, [   27,   20,   15,   11,    9 ], [   20,   15,   11,    8,    6 ], [   14,   10,    8,    6,    4 ] ],
+      [  36, [   27,   20,   16,   11,    9 ], [   20,   15,   11,    9,    6 ], [   14,   11,    8,    6,    4 ] ],
+      [  37, [   28,   21,   16,   12,    9 ], [   21,   16,   12,    9,    7 ], [   15,   11,    8,    6,    5 ] ],
+      [  38, [   29,   22,   16,   12,    9 ], [   21,   16,   12,    9,    7 ], [   15,   11,    8,    6,    5 ] ],
+      [  39, [   29,   22,   16,   12,    9 ], [   22,   16,   12,    9,    7 ], [   16,   12,    9,    7,    5 ] ],
+      [  40, [   30,   23,   17,   13,    9 ], [   23,   17,   13,   10,    7 ], [   16,   12,    9,    7,    5 ] ],
+      [  41, [   31,   23,   18,   13,   10 ], [   23,   17,   13,   10,    7 ], [   17,   12,    9,    7,    5 ] ],
+      [  42, [   32,   24,   18,   13,   10 ], [   24,   18,   13,   10,    8 ], [   17,   13,   10,    7,    5 ] ],
+      [  43, [   32,   24,   18,   14,   10 ], [   24,   18,   14,   10,    8 ], [   18,   13,   10,    7,    6 ] ],
+      [  44, [   33,   25,   18,   14,   11 ], [   25,   19,   14,   11,    8 ], [   18,   14,   10,    8,    6 ] ],
+      [  45, [   34,   25,   19,   14,   11 ], [   26,   19,   14,   11,    8 ], [   19,   14,   10,    8,    6 ] ],
+      [  46, [   34,   25,   19,   14,   11 ], [   26,   20,   15,   11,    8 ], [   19,   14,   11,    8,    6 ] ],
+      [  47, [   35,   26,   20,   15,   11 ], [   27,   20,   15,   11,    8 ], [   20,   15,   11,    8,    6 ] ],
+      [  48, [   36,   27,   20,   15,   11 ], [   27,   20,   15,   12,    9 ], [   20,   15,   11,    8,    6 ] ],
+      [  49, [   36,   27,   20,   16,   11 ], [   28,   21,   16,   12,    9 ], [   21,   15,   12,    9,    6 ] ],
+      [  50, [   37,   28,   21,   16,   12 ], [   28,   21,   16,   12,    9 ], [   21,   16,   12,    9,    7 ] ],
+      [  51, [   38,   28,   21,   16,   12 ], [   29,   22,   16,   12,    9 ], [   22,   16,   12,    9,    7 ] ],
+      [  52, [   38,   29,   22,   16,   12 ], [   30,   22,   17,   13,    9 ], [   22,   17,   12,    9,    7 ] ],
+      [  53, [   39,   29,   22,   16,   12 ], [   30,   23,   17,   13,   10 ], [   23,   17,   13,    9,    7 ] ],
+      [  54, [   40,   30,   22,   17,   13 ], [   31,   23,   17,   13,   10 ], [   23,   17,   13,   10,    7 ] ],
+      [  55, [   41,   30,   23,   17,   13 ], [   31,   24,   18,   13,   10 ], [   24,   18,   13,   10,    7 ] ],
+      [  56, [   41,   31,   23,   18,   13 ], [   32,   24,   18,   14,   10 ], [   24,   18,   14,   10,    8 ] ],
+      [  57, [   42,   32,   23,   18,   13 ], [   33,   24,   18,   14,   10 ], [   25,   18,   14,   10,    8 ] ],
+      [  58, [   43,   32,   24,   18,   14 ], [   33,   25,   19,   14,   11 ], [   25,   19,   14,   11,    8 ] ],
+      [  59, [   43,   32,   25,   18,   14 ], [   34,   25,   19,   14,   11 ], [   26,   19,   14,   11,    8 ] ],
+      [  60, [   44,   33,   25,   18,   14 ], [   34,   26,   19,   15,   11 ], [   26,   20,   15,   11,    8 ] ],
+      [  61, [   45,   34,   25,   19,   14 ], [   35,   26,   20,   15,   11 ], [   27,   20,   15,   11,    8 ] ],
+      [  62, [   45,   34,   25,   19,   14 ], [   36,   27,   20,   15,   11 ], [   27,   20,   15,   11,    9 ] ],
+      [  63, [   46,   34,   26,   19,   14 ], [   36,   27,   20,   15,   11 ], [   28,   21,   15,   12,    9 ] ],
+      [  64, [   47,   35,   26,   20,   15 ], [   37,   28,   21,   16,   12 ], [   28,   21,   16,   12,    9 ] ],
+      [  65, [   47,   36,   27,   20,   15 ], [   37,   28,   21,   16,   12 ], [   29,   21,   16,   12,    9 ] ],
+      [  66, [   48,   36,   27,   20,   15 ], [   38,   28,   21,   16,   12 ], [   29,   22,   16,   12,    9 ] ],
+      [  67, [   49,   36,   27,   20,   16 ], [   39,   29,   22,   16,   12 ], [   30,   22,   17,   12,    9 ] ],
+      [  68, [   50,   37,   28,   21,   16 ], [   39,   29,   22,   17,   12 ], [   30,   23,   17,   13,    9 ] ],
+      [  69, [   50,   38,   28,   21,   16 ], [   40,   30,   22,   17,   13 ], [   31,   23,   17,   13,   10 ] ],
+      [  70, [   50,   38,   29,   21,   16 ], [   40,   30,   23,   17,   13 ], [   31,   23,   17,   13,   10 ] ],
+      [  71, [   52,   39,   29,   22,   16 ], [   41,   31,   23,   17,   13 ], [   32,   24,   18,   13,   10 ] ],
+      [  72, [   52,   39,   29,   22,   16 ], [   42,   31,   23,   18,   13 ], [   32,   24,   18,   14,   10 ] ],
+      [  73, [   52,   39,   30,   22,   17 ], [   42,   32,   24,   18,   13 ], [   33,   24,   18,   14,   10 ] ],
+      [  74, [   53,   40,   30,   23,   17 ], [   43,   32,   24,   18,   14 ], [   33,   25,   19,   14,   10 ] ],
+      [  75, [   54,   41,   30,   23,   17 ], [   43,   32,   24,   18,   14 ], [   34,   25,   19,   14,   11 ] ],
+      [  76, [   55,   41,   31,   23,   18 ], [   44,   33,   25,   19,   14 ], [   34,   26,   19,   14,   11 ] ],
+      [  77, [   55,   41,   31,   23,   18 ], [   45,   33,   25,   19,   14 ], [   35,   26,   19,   15,   11 ] ],
+      [  78, [   56,   42,   32,   24,   18 ], [   45,   34,   25,   19,   14 ], [   35,   26,   20,   15,   11 ] ],
+      [  79, [   57,   43,   32,   24,   18 ], [   46,   34,   26,   19,   14 ], [   36,   27,   20,   15,   11 ] ],
+      [  80, [   57,   43,   32,   25,   18 ], [   46,   35,   26,   20,   15 ], [   36,   27,   20,   15,   11 ] ],
+      [  81, [   58,   43,   33,   25,   18 ], [   47,   35,   26,   20,   15 ], [   37,   27,   21,   15,   12 ] ],
+      [  82, [   59,   44,   33,   25,   18 ], [   47,   36,   27,   20,   15 ], [   37,   28,   21,   16,   12 ] ],
+      [  83, [   59,   45,   34,   25,   19 ], [   48,   36,   27,   20,   15 ], [   38,   28,   21,   16,   12 ] ],
+      [  84, [   60,   45,   34,   25,   19 ], [   49,   37,   27,   21,   15 ], [   38,   29,   21,   16,   12 ] ],
+      [  85, [   61,   46,   34,   26,   19 ], [   49,   37,   28,   21,   16 ], [   39,   29,   22,   16,   12 ] ],
+      [  86, [   61,   46,   34,   26,   20 ], [   50,   37,   28,   21,   16 ], [   39,   29,   22,   16,   12 ] ],
+      [  87, [   62,   47,   35,   26,   20 ], [   50,   38,   28,   21,   16 ], [   40,   30,   22,   17,   12 ] ],
+      [  88, [   63,   47,   36,   27,   20 ], [   51,   38,   29,   22,   16 ], [   40,   30,   23,   17,   13 ] ],
+      [  89, [   64,   48,   36,   27,   20 ], [   52,   39,   29,   22,   16 ], [   41,   30,   23,   17,   13 ] ],
+      [  90, [   64,   48,   36,   27,   20 ], [   52,   39,   29,   22,   17 ], [   41,   31,   23,   17,   13 ] ],
+      [  91, [   65,   49,   36,   27,   21 ], [   53,   40,   30,   22,   17 ], [   42,   31,   23,   18,   13 ] ],
+      [  92, [   66,   50,   37,   28,   21 ], [   53,   40,   30,   23,   17 ], [   42,   32,   24,   18,   13 ] ],
+      [  93, [   66,   50,   37,   28,   21 ], [   54,   41,   30,   23,   17 ], [   43,   32,   24,   18,   13 ] ],
+      [  94, [   66,   50,   37,   28,   21 ], [   54,   41,   30,   23,   17 ], [   43,   32,   24,   18,   14 ] ],
+      [  95, [   67,   50,   37,   28,   21 ], [   54,   41,   31,   23,   17 ], [   44,   33,   24,   18,   14 ] ],
+      [  96, [   67,   50,   37,   28,   21 ], [   55,   41,   31,   23,   17 ], [   44,   33,   25,   19,   14 ] ],
+      [  97, [   67,   51,   38,   28,   21 ], [   55,   42,   31,   24,   18 ], [   45,   33,   25,   19,   14 ] ],
+      [  98, [   68,   51,   38,   29,   21 ], [   56,   42,   31,   24,   18 ], [   45,   34,   25,   19,   14 ] ],
+      [  99, [   68,   51,   38,   29,   22 ], [   56,   42,   32,   24,   18 ], [   46,   34,   26,   19,   14 ] ],
+      [ 100, [   68,   51,   38,   29,   22 ], [   57,   43,   32,   24,   18 ], [   46,   35,   26,   19,   15 ] ],
+      [ 101, [   69,   52,   38,   29,   22 ], [   57,   43,   32,   24,   18 ], [   47,   35,   26,   20,   15 ] ],
+      [ 102, [   69,   52,   39,   29,   22 ], [   57,   43,   32,   25,   18 ], [   47,   35,   26,   20,   15 ] ],
+      [ 103, [   69,   52,   39,   29,   22 ], [   58,   44,   33,   25,   18 ], [   48,   36,   27,   20,   15 ] ],
+      [ 104, [   70,   52,   39,   30,   22 ], [   58,   44,   33,   25,   19 ], [   48,   36,   27,   20,   15 ] ],
+      [ 105, [   70,   52,   39,   30,   22 ], [   59,   44,   33,   25,   19 ], [   49,   36,   27,   20,   15 ] ],
+      [ 106, [   71,   52,   39,   30,   22 ], [   59,   45,   33,   25,   19 ], [   49,   37,   28,   21,   16 ] ],
+      [ 107, [   71,   53,   40,   31,   22 ], [   60,   45,   34,   26,   19 ], [   50,   37,   28,   21,   16 ] ],
+      [ 108, [   72,   53,   40,   31,   23 ], [   60,   45,   34,   26,   19 ], [   50,   38,   28,   21,   16 ] ],
+      [ 109, [   73,   54,   40,   31,   23 ], [   60,   46,   34,   26,   19 ], [   51,   38,   28,   21,   16 ] ],
+      [ 110, [   73,   54,   41,   31,   23 ], [   61,   46,   34,   26,   19 ], [   51,   38,   29,   22,   16 ] ],
+      [ 111, [   74,   55,   41,   32,   23 ], [   61,   46,   34,   26,   20 ], [   52,   39,   29,   22,   16 ] ],
+      [ 112, [   75,   56,   42,   32,   23 ], [   62,   47,   35,   26,   20 ], [   52,   39,   29,   22,   16 ] ],
+      [ 113, [   75,   56,   42,   32,   24 ], [   62,   47,   35,   27,   20 ], [   53,   39,   30,   22,   17 ] ],
+      [ 114, [   76,   57,   42,   33,   24 ], [   63,   47,   35,   27,   20 ], [   53,   40,   30,   22,   17 ] ],
+      [ 115, [   77,   57,   43,   33,   24 ], [   63,   48,   35,   27,   20 ], [   54,   40,   30,   23,   17 ] ],
+      [ 116, [   78,   58,   43,   33,   24 ], [   67,   50,   38,   29,   21 ], [   54,   41,   30,   23,   17 ] ],
+      [ 117, [   78,   58,   44,   34,   25 ], [   68,   51,   38,   29,   21 ], [   55,   41,   31,   23,   17 ] ],
+      [ 118, [   79,   59,   44,   34,   25 ], [   69,   51,   38,   29,   22 ], [   55,   41,   31,   23,   17 ] ],
+      [ 119, [   80,   59,   44,   34,   25 ], [   69,   52,   39,   30,   22 ], [   56,   42,   31,   23,   18 ] ],
+      [ 120, [   80,   60,   45,   35,   25 ], [   70,   52,   39,   30,   22 ], [   56,   42,   32,   24,   18 ] ],
+      [ 121, [   81,   60,   45,   35,   26 ], [   71,   52,   39,   30,   22 ], [   61,   46,   34,   26,   19 ] ],
+      [ 122, [   82,   61,   46,   35,   26 ], [   71,   53,   40,   31,   22 ], [   62,   46,   35,   27,   19 ] ],
+      [ 123, [   83,   61,   46,   35,   26 ], [   72,   53,   40,   31,   23 ], [   63,   46,   35,   27,   20 ] ],
+      [ 124, [   84,   62,   47,   36,   26 ], [   73,   54,   40,   31,   23 ], [   63,   47,   35,   27,   20 ] ],
+      [ 125, [   84,   63,   47,   36,   27 ], [   73,   54,   41,   31,   23 ], [   64,   47,   36,   27,   20 ] ],
+      [ 126, [   85,   63,   47,   36,   27 ], [   74,   55,   41,   32,   23 ], [   64,   48,   36,   28,   20 ] ],
+      [ 127, [   86,   64,   48,   37,   27 ], [   75,   56,   42,   32,   23 ], [   65,   48,   36,   28,   20 ] ],
+      [ 128, [   87,   64,   48,   37,   27 ], [   75,   56,   42,   32,   24 ], [   66,   49,   37,   28,   21 ] ],
+      [ 129, [   88,   65,   49,   38,   28 ], [   76,   57,   42,   33,   24 ], [   66,   49,   37,   28,   21 ] ],
+      [ 130, [   88,   66,   49,   38,   28 ], [   77,   57,   43,   33,   24 ], [   67,   50,   37,   29,   21 ] ],
+      [ 131, [   89,   66,   50,   38,   28 ], [   78,   58,   43,   33,   24 ], [   67,   50,   38,   29,   21 ] ],
+      [ 132, [   90,   67,   50,   39,   28 ], [   78,   58,   44,   34,   25 ], [   68,   51,   38,   29,   21 ] ],
+      [ 133, [   91,   68,   51,   39,   29 ], [   79,   59,   44,   34,   25 ], [   69,   51,   38,   29,   22 ] ],
+      [ 134, [   92,   68,   51,   39,   29 ], [   80,   59,   44,   34,   25 ], [   69,   52,   39,   30,   22 ] ],
+      [ 135, [   93,   69,   52,   40,   29 ], [   80,   60,   45,   35,   25 ], [   70,   52,   39,   30,   22 ] ],
+      [ 136, [   93,   69,   52,   40,   29 ], [   81,   60,   45,   35,   26 ], [   71,   52,   39,   30,   22 ] ],
+      [ 137, [   94,   70,   53,   40,   30 ], [   82,   61,   46,   35,   26 ], [   71,   53,   40,   31,   22 ] ],
+      [ 138, [   95,   71,   53,   41,   30 ], [   83,   61,   46,   35,   26 ], [   72,   53,   40,   31,   23 ] ],
+      [ 139, [   96,   71,   54,   41,   30 ], [   84,   62,   47,   36,   26 ], [   73,   54,   40,   31,   23 ] ],
+      [ 140, [   97,   72,   54,   42,   30 ], [   84,   63,   47,   36,   27 ], [   73,   54,   41,   31,   23 ] ],
+      [ 141, [   98,   73,   55,   42,   31 ], [   85,   63,   47,   36,   27 ], [   74,   55,   41,   32,   23 ] ],
+      [ 142, [   99,   73,   55,   42,   31 ], [   86,   64,   48,   37,   27 ], [   75,   56,   42,   32,   23 ] ],
+      [ 143, [  100,   74,   56,   43,   31 ], [   87,   64,   48,   37,   27 ], [   75,   56,   42,   32,   24 ] ],
+      [ 144, [  101,   75,   56,   43,   32 ], [   88,   65,   49,   38,   28 ], [   76,   57,   42,   33,   24 ] ],
+      [ 145, [  102,   75,   57,   44,   32 ], [   88,   66,   49,   38,   28 ], [   77,   57,   43,   33,   24 ] ],
+      [ 146, [  103,   76,   57,   44,   32 ], [   89,   66,   50,   38,   28 ], [   78,   58,   43,   33,   24 ] ],
+      [ 147, [  104,   77,   58,   44,   33 ], [   90,   67,   50,   39,   28 ], [   78,   58,   44,   34,   25 ] ],
+      [ 148, [  104,   78,   58,   45,   33 ], [   91,   68,   51,   39,   29 ], [   79,   59,   44,   34,   25 ] ],
+      [ 149, [  105,   78,   59,   45,   33 ], [   92,   68,   51,   39,   29 ], [   80,   59,   44,   34,   25 ] ],
+      [ 150, [  106,   79,   59,   46,   33 ], [   93,   69,   52,   40,   29 ], [   80,   60,   45,   35,   25 ] ],
+      [ 151, [  107,   80,   60,   46,   34 ], [   93,   69,   52,   40,   29 ], [   81,   60,   45,   35,   26 ] ],
+      [ 152, [  108,   81,   60,   46,   34 ], [   94,   70,   53,   40,   30 ], [   82,   61,   46,   35,   26 ] ],
+      [ 153, [  109,   81,   61,   47,   34 ], [   95,   71,   53,   41,   30 ], [   83,   61,   46,   35,   26 ] ],
+      [ 154, [  111,   82,   62,   47,   35 ], [   96,   71,   54,   41,   30 ], [   84,   62,   47,   36,   26 ] ],
+      [ 155, [  112,   83,   62,   48,   35 ], [   97,   72,   54,   42,   30 ], [   84,   63,   47,   36,   27 ] ],
+      [ 156, [  113,   84,   63,   48,   35 ], [   98,   73,   55,   42,   31 ], [   85,   63,   47,   36,   27 ] ],
+      [ 157, [  114,   84,   63,   49,   36 ], [   99,   73,   55,   42,   31 ], [   86,   64,   48,   37,   27 ] ],
+      [ 158, [  115,   85,   64,   49,   36 ], [  100,   74,   56,   43,   31 ], [   87,   64,   48,   37,   27 ] ],
+      [ 159, [  116,   86,   65,   50,   36 ], [  101,   75,   56,   43,   32 ], [   88,   65,   49,   38,   28 ] ],
+      [ 160, [  117,   87,   65,   50,   37 ], [  102,   75,   57,   44,   32 ], [   88,   66,   49,   38,   28 ] ],
+      [ 161, [  118,   88,   66,   51,   37 ], [  103,   76,   57,   44,   32 ], [   89,   66,   50,   38,   28 ] ],
+      [ 162, [  119,   88,   66,   51,   37 ], [  104,   77,   58,   44,   33 ], [   90,   67,   50,   39,   28 ] ],
+      [ 163, [  120,   89,   67,   52,   38 ], [  104,   78,   58,   45,   33 ], [   91,   68,   51,   39,   29 ] ],
+      [ 164, [  121,   90,   68,   52,   38 ], [  105,   78,   59,   45,   33 ], [   92,   68,   51,   39,   29 ] ],
+      [ 165, [  122,   91,   68,   52,   38 ], [  106,   79,   59,   46,   33 ], [   93,   69,   52,   40,   29 ] ],
+      [ 166, [  124,   92,   69,   53,   39 ], [  107,   80,   60,   46,   34 ], [   93,   69,   52,   40,   29 ] ],
+      [ 167, [  125,   93,   69,   53,   39 ], [  108,   81,   60,   46,   34 ], [   94,   70,   53,   40,   30 ] ],
+      [ 168, [  126,   94,   70,   54,   40 ], [  109,   81,   61,   47,   34 ], [   95,   71,   53,   41,   30 ] ],
+      [ 169, [  127,   94,   71,   54,   40 ], [  111,   82,   62,   47,   35 ], [   96,   71,   54,   41,   30 ] ],
+      [ 170, [  128,   95,   71,   55,   40 ], [  112,   83,   62,   48,   35 ], [   97,   72,   54,   42,   30 ] ],
+      [ 171, [  129,   96,   72,   55,   41 ], [  113,   84,   63,   48,   35 ], [   98,   73,   55,   42,   31 ] ],
+      [ 172, [  131,   97,   73,   56,   41 ], [  114,   84,   63,   49,   36 ], [   99,   73,   55,   42,   31 ] ],
+      [ 173, [  132,   98,   73,   57,   41 ], [  115,   85,   64,   49,   36 ], [  100,   74,   56,   43,   31 ] ],
+      [ 174, [  133,   99,   74,   57,   42 ], [  116,   86,   65,   50,   36 ], [  101,   75,   56,   43,   32 ] ],
+      [ 175, [  134,  100,   75,   58,   42 ], [  117,   87,   65,   50,   37 ], [  102,   75,   57,   44,   32 ] ],
+      [ 176, [  136,  101,   76,   58,   43 ], [  118,   88,   66,   51,   37 ], [  103,   76,   57,   44,   32 ] ],
+      [ 177, [  137,  102,   76,   59,   43 ], [  119,   88,   66,   51,   37 ], [  104,   77,   58,   44,   33 ] ],
+      [ 178, [  138,  103,   77,   59,   43 ], [  120,   89,   67,   52,   38 ], [  104,   78,   58,   45,   33 ] ],
+      [ 179, [  139,  104,   78,   60,   44 ], [  121,   90,   68,   52,   38 ], [  105,   78,   59,   45,   33 ] ],
+      [ 180, [  141,  105,   78,   60,   44 ], [  122,   91,   68,   52,   38 ], [  106,   79,   59,   46,   33 ] ],
+      [ 181, [  142,  106,   79,   61,   45 ], [  124,   92,   69,   53,   39 ], [  107,   80,   60,   46,   34 ] ],
+      [ 182, [  143,  107,   80,   61,   45 ], [  125,   93,   69,   53,   39 ], [  108,   81,   60,   46,   34 ] ],
+      [ 183, [  145,  108,   81,   62,   46 ], [  126,   94,   70,   54,   40 ], [  109,   81,   61,   47,   34 ] ],
+      [ 184, [  146,  109,   81,   63,   46 ], [  127,   94,   71,   54,   40 ], [  111,   82,   62,   47,   35 ] ],
+      [ 185, [  148,  110,   82,   63,   46 ], [  128,   95,   71,   55,   40 ], [  112,   83,   62,   48,   35 ] ],
+      [ 186, [  149,  111,   83,   64,   47 ], [  129,   96,   72,   55,   41 ], [  113,   84,   63,   48,   35 ] ],
+      [ 187, [  150,  112,   84,   64,   47 ], [  131,   97,   73,   56,   41 ], [  114,   84,   63,   49,   36 ] ],
+      [ 188, [  152,  113,   85,   65,   48 ], [  132,   98,   73,   57,   41 ], [  115,   85,   64,   49,   36 ] ],
+      [ 189, [  153,  114,   85,   66,   48 ], [  133,   99,   74,   57,   42 ], [  116,   86,   65,   50,   36 ] ],
+      [ 190, [  155,  115,   86,   66,   49 ], [  134,  100,   75,   58,   42 ], [  117,   87,   65,   50,   37 ] ],
+      [ 191, [  156,  116,   87,   67,   49 ], [  136,  101,   76,   58,   43 ], [  118,   88,   66,   51,   37 ] ],
+      [ 192, [  157,  117,   88,   67,   49 ], [  137,  102,   76,   59,   43 ], [  119,   88,   66,   51,   37 ] ],
+      [ 193, [  159,  118,   89,   68,   50 ], [  138,  103,   77,   59,   43 ], [  120,   89,   67,   52,   38 ] ],
+      [ 194, [  160,  119,   89,   69,   50 ], [  139,  104,   78,   60,   44 ], [  121,   90,   68,   52,   38 ] ],
+      [ 195, [  162,  120,   90,   69,   51 ], [  141,  105,   78,   60,   44 ], [  122,   91,   68,   52,   38 ] ],
+      [ 196, [  163,  121,   91,   70,   51 ], [  142,  106,   79,   61,   45 ], [  124,   92,   69,   53,   39 ] ],
+      [ 197, [  165,  123,   92,   71,   52 ], [  143,  107,   80,   61,   45 ], [  125,   93,   69,   53,   39 ] ],
+      [ 198, [  167,  124,   93,   71,   52 ], [  145,  108,   81,   62,   46 ], [  126,   94,   70,   54,   40 ] ],
+      [ 199, [  168,  125,   94,   72,   53 ], [  146,  109,   81,   63,   46 ], [  127,   94,   71,   54,   40 ] ],
+      [ 200, [  170,  126,   95,   73,   53 ], [  148,  110,   82,   63,   46 ], [  128,   95,   71,   55,   40 ] ],
+      [ 201, [  171,  127,   95,   73,   54 ], [  149,  111,   83,   64,   47 ], [  129,   96,   72,   55,   41 ] ],
+      [ 202, [  173,  128,   96,   74,   54 ], [  150,  112,   84,   64,   47 ], [  131,   97,   73,   56,   41 ] ],
+      [ 203, [  174,  130,   97,   75,   55 ], [  152,  113,   85,   65,   48 ], [  132,   98,   73,   57,   41 ] ],
+      [ 204, [  176,  131,   98,   75,   55 ], [  153,  114,   85,   66,   48 ], [  133,   99,   74,   57,   42 ] ],
+      [ 205, [  178,  132,   99,   76,   56 ], [  155,  115,   86,   66,   49 ], [  134,  100,   75,   58,   42 ] ],
+      [ 206, [  179,  133,  100,   77,   56 ], [  156,  116,   87,   67,   49 ], [  136,  101,   76,   58,   43 ] ],
+      [ 207, [  181,  135,  101,   78,   57 ], [  157,  117,   88,   67,   49 ], [  137,  102,   76,   59,   43 ] ],
+      [ 208, [  183,  136,  102,   78,   57 ], [  159,  118,   89,   68,   50 ], [  138,  103,   77,   59,   43 ] ],
+      [ 209, [  184,  137,  103,   79,   58 ], [  160,  119,   89,   69,   50 ], [  139,  104,   78,   60,   44 ] ],
+      [ 210, [  186,  138,  104,   80,   59 ], [  162,  120,   90,   69,   51 ], [  141,  105,   78,   60,   44 ] ],
+      [ 211, [  188,  140,  105,   81,   59 ], [  163,  121,   91,   70,   51 ], [  142,  106,   79,   61,   45 ] ],
+      [ 212, [  190,  141,  106,   81,   60 ], [  165,  123,   92,   71,   52 ], [  143,  107,   80,   61,   45 ] ],
+      [ 213, [  191,  142,  107,   82,   60 ], [  167,  124,   93,   71,   52 ], [  145,  108,   81,   62,   46 ] ],
+      [ 214, [  193,  144,  108,   83,   61 ], [  168,  125,   94,   72,   53 ], [  146,  109,   81,   63,   46 ] ],
+      [ 215, [  195,  145,  109,   84,   61 ], [  170,  126,   95,   73,   53 ], [  148,  110,   82,   63,   46 ] ],
+      [ 216, [  197,  146,  110,   84,   62 ], [  171,  127,   95,   73,   54 ], [  149,  111,   83,   64,   47 ] ],
+      [ 217, [  199,  148,  111,   85,   62 ], [  173,  128,   96,   74,   54 ], [  150,  112,   84,   64,   47 ] ],
+      [ 218, [  201,  149,  112,   86,   63 ], [  174,  130,   97,   75,   55 ], [  152,  113,   85,   65,   48 ] ],
+      [ 219, [  202,  150,  113,   87,   64 ], [  176,  131,   98,   75,   55 ], [  153,  114,   85,   66,   48 ] ],
+      [ 220, [  204,  152,  114,   88,   64 ], [  178,  132,   99,   76,   56 ], [  155,  115,   86,   66,   49 ] ],
+      [ 221, [  206,  153,  115,   88,   65 ], [  179,  133,  100,   77,   56 ], [  156,  116,   87,   67,   49 ] ],
+      [ 222, [  208,  155,  116,   89,   65 ], [  181,  135,  101,   78,   57 ], [  157,  117,   88,   67,   49 ] ],
+      [ 223, [  210,  156,  117,   90,   66 ], [  183,  136,  102,   78,   57 ], [  159,  118,   89,   68,   50 ] ],
+      [ 224, [  212,  158,  118,   91,   67 ], [  184,  137,  103,   79,   58 ], [  160,  119,   89,   69,   50 ] ],
+      [ 225, [  214,  159,  119,   92,   67 ], [  186,  138,  104,   80,   59 ], [  162,  120,   90,   69,   51 ] ],
+      [ 226, [  216,  161,  120,   93,   68 ], [  188,  140,  105,   81,   59 ], [  163,  121,   91,   70,   51 ] ],
+      [ 227, [  218,  162,  122,   93,   69 ], [  190,  141,  106,   81,   60 ], [  165,  123,   92,   71,   52 ] ],
+      [ 228, [  220,  164,  123,   94,   69 ], [  191,  142,  107,   82,   60 ], [  167,  124,   93,   71,   52 ] ],
+      [ 229, [  222,  165,  124,   95,   70 ], [  193,  144,  108,   83,   61 ], [  168,  125,   94,   72,   53 ] ],
+      [ 230, [  224,  167,  125,   96,   71 ], [  195,  145,  109,   84,   61 ], [  170,  126,   95,   73,   53 ] ],
+      [ 231, [  226,  168,  126,   97,   71 ], [  197,  146,  110,   84,   62 ], [  171,  127,   95,   73,   54 ] ],
+      [ 232, [  229,  170,  127,   98,   72 ], [  199,  148,  111,   85,   62 ], [  173,  128,   96,   74,   54 ] ],
+      [ 233, [  231,  171,  129,   99,   73 ], [  201,  149,  112,   86,   63 ], [  174,  130,   97,   75,   55 ] ],
+      [ 234, [  233,  173,  130,  100,   73 ], [  202,  150,  113,   87,   64 ], [  176,  131,   98,   75,   55 ] ],
+      [ 235, [  235,  175,  131,  101,   74 ], [  204,  152,  114,   88,   64 ], [  178,  132,   99,   76,   56 ] ],
+      [ 236, [  237,  176,  132,  102,   75 ], [  206,  153,  115,   88,   65 ], [  179,  133,  100,   77,   56 ] ],
+      [ 237, [  239,  178,  133,  103,   75 ], [  208,  155,  116,   89,   65 ], [  181,  135,  101,   78,   57 ] ],
+      [ 238, [  242,  180,  135,  104,   76 ], [  210,  156,  117,   90,   66 ], [  183,  136,  102,   78,   57 ] ],
+      [ 239, [  244,  181,  136,  105,   77 ], [  212,  158,  118,   91,   67 ], [  184,  137,  103,   79,   58 ] ],
+      [ 240, [  246,  183,  137,  106,   77 ], [  214,  159,  119,   92,   67 ], [  186,  138,  104,   80,   59 ] ],
+      [ 241, [  249,  185,  138,  107,   78 ], [  216,  161,  120,   93,   68 ], [  188,  140,  105,   81,   59 ] ],
+      [ 242, [  251,  186,  140,  108,   79 ], [  218,  162,  122,   93,   69 ], [  190,  141,  106,   81,   60 ] ],
+      [ 243, [  253,  188,  141,  109,   80 ], [  220,  164,  123,   94,   69 ], [  191,  142,  107,   82,   60 ] ],
+      [ 244, [  256,  190,  142,  110,   80 ], [  222,  165,  124,   95,   70 ], [  193,  144,  108,   83,   61 ] ],
+      [ 245, [  258,  192,  144,  111,   81 ], [  224,  167,  125,   96,   71 ], [  195,  145,  109,   84,   61 ] ],
+      [ 246, [  260,  193,  145,  112,   82 ], [  226,  168,  126,   97,   71 ], [  197,  146,  110,   84,   62 ] ],
+      [ 247, [  263,  195,  146,  113,   83 ], [  229,  170,  127,   98,   72 ], [  199,  148,  111,   85,   62 ] ],
+      [ 248, [  265,  197,  148,  114,   83 ], [  231,  171,  129,   99,   73 ], [  201,  149,  112,   86,   63 ] ],
+      [ 249, [  268,  199,  149,  115,   84 ], [  233,  173,  130,  100,   73 ], [  202,  150,  113,   87,   64 ] ],
+      [ 250, [  270,  201,  151,  116,   85 ], [  235,  175,  131,  101,   74 ], [  204,  152,  114,   88,   64 ] ],
+      [ 251, [  273,  203,  152,  117,   86 ], [  237,  176,  132,  102,   75 ], [  206,  153,  115,   88,   65 ] ],
+      [ 252, [  275,  205,  153,  118,   87 ], [  239,  178,  133,  103,   75 ], [  208,  155,  116,   89,   65 ] ],
+      [ 253, [  278,  206,  155,  119,   87 ], [  242,  180,  135,  104,   76 ], [  210,  156,  117,   90,   66 ] ],
+      [ 254, [  281,  208,  156,  120,   88 ], [  244,  181,  136,  105,   77 ], [  212,  158,  118,   91,   67 ] ],
+      [ 255, [  283,  210,  158,  121,   89 ], [  246,  183,  137,  106,   77 ], [  214,  159,  119,   92,   67 ] ],
+      [ 256, [  286,  212,  159,  123,   90 ], [  249,  185,  138,  107,   78 ], [  216,  161,  120,   93,   68 ] ],
+      [ 257, [  289,  214,  161,  124,   91 ], [  251,  186,  140,  108,   79 ], [  218,  162,  122,   93,   69 ] ],
+      [ 258, [  291,  216,  162,  125,   92 ], [  253,  188,  141,  109,   80 ], [  220,  164,  123,   94,   69 ] ],
+      [ 259, [  294,  218,  164,  126,   92 ], [  256,  190,  142,  110,   80 ], [  222,  165,  124,   95,   70 ] ],
+      [ 260, [  297,  220,  165,  127,   93 ], [  258,  192,  144,  111,   81 ], [  224,  167,  125,   96,   71 ] ],
+      [ 261, [  299,  222,  167,  128,   94 ], [  260,  193,  145,  112,   82 ], [  226,  168,  126,   97,   71 ] ],
+      [ 262, [  302,  225,  168,  130,   95 ], [  263,  195,  146,  113,   83 ], [  229,  170,  127,   98,   72 ] ],
+      [ 263, [  305,  227,  170,  131,   96 ], [  265,  197,  148,  114,   83 ], [  231,  171,  129,   99,   73 ] ],
+      [ 264, [  308,  229,  172,  132,   97 ], [  268,  199,  149,  115,   84 ], [  233,  173,  130,  100,   73 ] ],
+      [ 265, [  311,  231,  173,  133,   98 ], [  270,  201,  151,  116,   85 ], [  235,  175,  131,  101,   74 ] ],
+      [ 266, [  314,  233,  175,  134,   99 ], [  273,  203,  152,  117,   86 ], [  237,  176,  132,  102,   75 ] ],
+      [ 267, [  317,  235,  176,  136,  100 ], [  275,  205,  153,  118,   87 ], [  239,  178,  133,  103,   75 ] ],
+      [ 268, [  320,  237,  178,  137,  100 ], [  278,  206,  155,  119,   87 ], [  242,  180,  135,  104,   76 ] ],
+      [ 269, [  323,  240,  180,  138,  101 ], [  281,  208,  156,  120,   88 ], [  244,  181,  136,  105,   77 ] ],
+      [ 270, [  326,  242,  181,  140,  102 ], [  283,  210,  158,  121,   89 ], [  246,  183,  137,  106,   77 ] ],
+      [ 271, [  329,  244,  183,  141,  103 ], [  286,  212,  159,  123,   90 ], [  249,  185,  138,  107,   78 ] ],
+      [ 272, [  332,  246,  185,  142,  104 ], [  289,  214,  161,  124,   91 ], [  289,  214,  161,  124,   91 ] ],
+      [ 273, [  335,  249,  187,  144,  105 ], [  291,  216,  162,  125,   92 ], [  291,  216,  162,  125,   92 ] ],
+      [ 274, [  338,  251,  188,  145,  106 ], [  294,  218,  164,  126,   92 ], [  294,  218,  164,  126,   92 ] ],
+      [ 275, [  341,  253,  190,  146,  107 ], [  297,  220,  165,  127,   93 ], [  297,  220,  165,  127,   93 ] ],
+      [ 276, [  344,  256,  192,  148,  108 ], [  299,  222,  167,  128,   94 ], [  299,  222,  167,  128,   94 ] ],
+      [ 277, [  348,  258,  194,  149,  109 ], [  302,  225,  168,  130,   95 ], [  302,  225,  168,  130,   95 ] ],
+      [ 278, [  351,  261,  195,  150,  110 ], [  305,  227,  170,  131,   96 ], [  305,  227,  170,  131,   96 ] ],
+      [ 279, [  354,  263,  197,  152,  111 ], [  308,  229,  172,  132,   97 ], [  308,  229,  172,  132,   97 ] ],
+      [ 280, [  357,  266,  199,  153,  112 ], [  311,  231,  173,  133,   98 ], [  311,  231,  173,  133,   98 ] ],
+      [ 281, [  361,  268,  201,  155,  113 ], [  314,  233,  175,  134,   99 ], [  314,  233,  175,  134,   99 ] ],
+      [ 282, [  364,  271,  203,  156,  114 ], [  317,  235,  176,  136,  100 ], [  317,  235,  176,  136,  100 ] ],
+      [ 283, [  368,  273,  205,  158,  116 ], [  320,  237,  178,  137,  100 ], [  320,  237,  178,  137,  100 ] ],
+      [ 284, [  371,  276,  207,  159,  117 ], [  323,  240,  180,  138,  101 ], [  323,  240,  180,  138,  101 ] ],
+      [ 285, [  326,  242,  181,  140,  102 ], [  326,  242,  181,  140,  102 ], [  326,  242,  181,  140,  102 ] ],
+      [ 286, [  329,  244,  183,  141,  103 ], [  329,  244,  183,  141,  103 ], [  329,  244,  183,  141,  103 ] ],
+      [ 287, [  332,  246,  185,  142,  104 ], [  332,  246,  185,  142,  104 ], [  332,  246,  185,  142,  104 ] ],
+      [ 288, [  335,  249,  187,  144,  105 ], [  335,  249,  187,  144,  105 ], [  335,  249,  187,  144,  105 ] ],
+      [ 289, [  338,  251,  188,  145,  106 ], [  338,  251,  188,  145,  106 ], [  338,  251,  188,  145,  106 ] ],
+      [ 290, [  341,  253,  190,  146,  107 ], [  341,  253,  190,  146,  107 ], [  341,  253,  190,  146,  107 ] ],
+      [ 291, [  344,  256,  192,  148,  108 ], [  344,  256,  192,  148,  108 ], [  344,  256,  192,  148,  108 ] ],
+      [ 292, [  348,  258,  194,  149,  109 ], [  348,  258,  194,  149,  109 ], [  348,  258,  194,  149,  109 ] ],
+      [ 293, [  351,  261,  195,  150,  110 ], [  351,  261,  195,  150,  110 ], [  351,  261,  195,  150,  110 ] ],
+      [ 294, [  354,  263,  197,  152,  111 ], [  354,  263,  197,  152,  111 ], [  354,  263,  197,  152,  111 ] ],
+      [ 295, [  357,  266,  199,  153,  112 ], [  357,  266,  199,  153,  112 ], [  357,  266,  199,  153,  112 ] ],
+      [ 296, [  361,  268,  201,  155,  113 ], [  361,  268,  201,  155,  113 ], [  361,  268,  201,  155,  113 ] ],
+      [ 297, [  364,  271,  203,  156,  114 ], [  364,  271,  203,  156,  114 ], [  364,  271,  203,  156,  114 ] ],
+      [ 298, [  368,  273,  205,  158,  116 ], [  368,  273,  205,  158,  116 ], [  368,  273,  205,  158,  116 ] ],
+      [ 299, [  371,  276,  207,  159,  117 ], [  371,  276,  207,  159,  117 ], [  371,  276,  207,  159,  117 ] ],
+      [ 300, [  375,  278,  209,  161,  118 ], [  375,  278,  209,  161,  118 ], [  375,  278,  209,  161,  118 ] ],
+      [ 301, [  378,  281,  211,  162,  119 ], [  378,  281,  211,  162,  119 ], [  378,  281,  211,  162,  119 ] ],
+      [ 302, [  382,  283,  213,  164,  120 ], [  382,  283,  213,  164,  120 ], [  382,  283,  213,  164,  120 ] ],
+      [ 303, [  385,  286,  215,  165,  121 ], [  385,  286,  215,  165,  121 ], [  385,  286,  215,  165,  121 ] ],
+      [ 304, [  389,  289,  217,  167,  122 ], [  389,  289,  217,  167,  122 ], [  389,  289,  217,  167,  122 ] ],
+      [ 305, [  392,  291,  219,  168,  123 ], [  392,  291,  219,  168,  123 ], [  392,  291,  219,  168,  123 ] ],
+      [ 306, [  396,  294,  221,  170,  124 ], [  396,  294,  221,  170,  124 ], [  396,  294,  221,  170,  124 ] ],
+      [ 307, [  400,  297,  223,  171,  126 ], [  400,  297,  223,  171,  126 ], [  400,  297,  223,  171,  126 ] ],
+      [ 308, [  404,  300,  225,  173,  127 ], [  404,  300,  225,  173,  127 ], [  404,  300,  225,  173,  127 ] ],
+      [ 309, [  407,  303,  227,  175,  128 ], [  407,  303,  227,  175,  128 ], [  407,  303,  227,  175,  128 ] ],
+      [ 310, [  411,  305,  229,  176,  129 ], [  411,  305,  229,  176,  129 ], [  411,  305,  229,  176,  129 ] ],
+      [ 311, [  415,  308,  231,  178,  130 ], [  415,  308,  231,  178,  130 ], [  415,  308,  231,  178,  130 ] ],
+      [ 312, [  419,  311,  233,  179,  132 ], [  419,  311,  233,  179,  132 ], [  419,  311,  233,  179,  132 ] ],
+      [ 313, [  423,  314,  236,  181,  133 ], [  423,  314,  236,  181,  133 ], [  423,  314,  236,  181,  133 ] ],
+      [ 314, [  427,  317,  238,  183,  134 ], [  427,  317,  238,  183,  134 ], [  427,  317,  238,  183,  134 ] ],
+      [ 315, [  431,  320,  240,  185,  135 ], [  431,  320,  240,  185,  135 ], [  431,  320,  240,  185,  135 ] ],
+      [ 316, [  435,  323,  242,  186,  137 ], [  435,  323,  242,  186,  137 ], [  435,  323,  242,  186,  137 ] ],
+      [ 317, [  439,  326,  244,  188,  138 ], [  439,  326,  244,  188,  138 ], [  439,  326,  244,  188,  138 ] ],
+      [ 318, [  443,  329,  247,  190,  139 ], [  443,  329,  247,  190,  139 ], [  443,  329,  247,  190,  139 ] ],
+      [ 319, [  447,  332,  249,  192,  141 ], [  447,  332,  249,  192,  141 ], [  447,  332,  249,  192,  141 ] ],
+      [ 320, [  451,  335,  251,  193,  142 ], [  451,  335,  251,  193,  142 ], [  451,  335,  251,  193,  142 ] ],
+      [ 321, [  455,  338,  254,  195,  143 ], [  455,  338,  254,  195,  143 ], [  455,  338,  254,  195,  143 ] ],
+      [ 322, [  460,  342,  256,  197,  144 ], [  460,  342,  256,  197,  144 ], [  460,  342,  256,  197,  144 ] ],
+      [ 323, [  464,  345,  259,  199,  146 ], [  464,  345,  259,  199,  146 ], [  464,  345,  259,  199,  146 ] ],
+      [ 324, [  468,  348,  261,  201,  147 ], [  468,  348,  261,  201,  147 ], [  468,  348,  261,  201,  147 ] ],
+      [ 325, [  473,  351,  263,  203,  149 ], [  473,  351,  263,  203,  149 ], [  473,  351,  263,  203,  149 ] ],
+      [ 326, [  477,  354,  266,  205,  150 ], [  477,  354,  266,  205,  150 ], [  477,  354,  266,  205,  150 ] ],
+      [ 327, [  482,  358,  268,  206,  151 ], [  482,  358,  268,  206,  151 ], [  482,  358,  268,  206,  151 ] ],
+      [ 328, [  486,  361,  271,  208,  153 ], [  486,  361,  271,  208,  153 ], [  486,  361,  271,  208,  153 ] ],
+      [ 329, [  491,  365,  273,  210,  154 ], [  491,  365,  273,  210,  154 ], [  491,  365,  273,  210,  154 ] ],
+      [ 330, [  495,  368,  276,  212,  156 ], [  495,  368,  276,  212,  156 ], [  495,  368,  276,  212,  156 ] ],
+      [ 331, [  500,  371,  279,  214,  157 ], [  500,  371,  279,  214,  157 ], [  500,  371,  279,  214,  157 ] ],
+      [ 332, [  505,  375,  281,  216,  159 ], [  505,  375,  281,  216,  159 ], [  505,  375,  281,  216,  159 ] ],
+      [ 333, [  509,  378,  284,  218,  160 ], [  509,  378,  284,  218,  160 ], [  509,  378,  284,  218,  160 ] ],
+      [ 334, [  514,  382,  286,  220,  162 ], [  514,  382,  286,  220,  162 ], [  514,  382,  286,  220,  162 ] ],
+      [ 335, [  519,  385,  289,  222,  163 ], [  519,  385,  289,  222,  163 ], [  519,  385,  289,  222,  163 ] ],
+      [ 336, [  524,  389,  292,  224,  165 ], [  524,  389,  292,  224,  165 ], [  524,  389,  292,  224,  165 ] ],
+      [ 337, [  529,  393,  295,  227,  166 ], [  529,  393,  295,  227,  166 ], [  529,  393,  295,  227,  166 ] ],
+      [ 338, [  534,  396,  297,  229,  168 ], [  534,  396,  297,  229,  168 ], [  534,  396,  297,  229,  168 ] ],
+      [ 339, [  539,  400,  300,  231,  169 ], [  539,  400,  300,  231,  169 ], [  539,  400,  300,  231,  169 ] ],
+      [ 340, [  544,  404,  303,  233,  171 ], [  544,  404,  303,  233,  171 ], [  544,  404,  303,  233,  171 ] ],
+      [ 341, [  549,  408,  306,  235,  172 ], [  549,  408,  306,  235,  172 ], [  549,  408,  306,  235,  172 ] ],
+      [ 342, [  554,  411,  309,  237,  174 ], [  554,  411,  309,  237,  174 ], [  554,  411,  309,  237,  174 ] ],
+      [ 343, [  559,  415,  311,  240,  176 ], [  559,  415,  311,  240,  176 ], [  559,  415,  311,  240,  176 ] ],
+      [ 344, [  564,  419,  314,  242,  177 ], [  564,  419,  314,  242,  177 ], [  564,  419,  314,  242,  177 ] ],
+      [ 345, [  570,  423,  317,  244,  179 ], [  570,  423,  317,  244,  179 ], [  570,  423,  317,  244,  179 ] ],
+      [ 346, [  575,  427,  320,  246,  181 ], [  575,  427,  320,  246,  181 ], [  575,  427,  320,  246,  181 ] ],
+      [ 347, [  580,  431,  323,  249,  182 ], [  580,  431,  323,  249,  182 ], [  580,  431,  323,  249,  182 ] ],
+      [ 348, [  586,  435,  326,  251,  184 ], [  586,  435,  326,  251,  184 ], [  586,  435,  326,  251,  184 ] ],
+      [ 349, [  591,  439,  329,  253,  186 ], [  591,  439,  329,  253,  186 ], [  591,  439,  329,  253,  186 ] ],
+      [ 350, [  597,  443,  332,  256,  188 ], [  597,  443,  332,  256,  188 ], [  597,  443,  332,  256,  188 ] ],
+      [ 351, [  602,  447,  336,  258,  189 ], [  602,  447,  336,  258,  189 ], [  602,  447,  336,  258,  189 ] ],
+      [ 352, [  608,  452,  339,  261,  191 ], [  608,  452,  339,  261,  191 ], [  608,  452,  339,  261,  191 ] ],
+      [ 353, [  614,  456,  342,  263,  193 ], [  614,  456,  342,  263,  193 ], [  614,  456,  342,  263,  193 ] ],
+      [ 354, [  619,  460,  345,  265,  195 ], [  619,  460,  345,  265,  195 ], [  619,  460,  345,  265,  195 ] ],
+      [ 355, [  625,  464,  348,  268,  196 ], [  625,  464,  348,  268,  196 ], [  625,  464,  348,  268,  196 ] ],
+      [ 356, [  631,  469,  352,  270,  198 ], [  631,  469,  352,  270,  198 ], [  631,  469,  352,  270,  198 ] ],
+      [ 357, [  637,  473,  355,  273,  200 ], [  637,  473,  355,  273,  200 ], [  637,  473,  355,  273,  200 ] ],
+      [ 358, [  643,  478,  358,  276,  202 ], [  643,  478,  358,  276,  202 ], [  643,  478,  358,  276,  202 ] ],
+      [ 359, [  649,  482,  362,  278,  204 ], [  649,  482,  362,  278,  204 ], [  649,  482,  362,  278,  204 ] ],
+      [ 360, [  655,  487,  365,  281,  206 ], [  655,  487,  365,  281,  206 ], [  655,  487,  365,  281,  206 ] ],
+      [ 361, [  661,  491,  368,  283,  208 ], [  661,  491,  368,  283,  208 ], [  661,  491,  368,  283,  208 ] ],
+      [ 362, [  667,  496,  372,  286,  210 ], [  667,  496,  372,  286,  210 ], [  667,  496,  372,  286,  210 ] ],
+      [ 363, [  674,  500,  375,  289,  212 ], [  674,  500,  375,  289,  212 ], [  674,  500,  375,  289,  212 ] ],
+      [ 364, [  680,  505,  379,  291,  214 ], [  680,  505,  379,  291,  214 ], [  680,  505,  379,  291,  214 ] ],
+      [ 365, [  686,  510,  382,  294,  216 ], [  686,  510,  382,  294,  216 ], [  686,  510,  382,  294,  216 ] ],
+      [ 366, [  693,  515,  386,  297,  218 ], [  693,  515,  386,  297,  218 ], [  693,  515,  386,  297,  218 ] ],
+      [ 367, [  699,  519,  390,  300,  220 ], [  699,  519,  390,  300,  220 ], [  699,  519,  390,  300,  220 ] ],
+      [ 368, [  706,  524,  393,  302,  222 ], [  706,  524,  393,  302,  222 ], [  706,  524,  393,  302,  222 ] ],
+      [ 369, [  712,  529,  397,  305,  224 ], [  712,  529,  397,  305,  224 ], [  712,  529,  397,  305,  224 ] ],
+      [ 370, [  719,  534,  401,  308,  226 ], [  719,  534,  401,  308,  226 ], [  719,  534,  401,  308,  226 ] ],
+      [ 371, [  726,  539,  404,  311,  228 ], [  726,  539,  404,  311,  228 ], [  726,  539,  404,  311,  228 ] ],
+      [ 372, [  733,  544,  408,  314,  230 ], [  733,  544,  408,  314,  230 ], [  733,  544,  408,  314,  230 ] ],
+      [ 373, [  739,  549,  412,  317,  232 ], [  739,  549,  412,  317,  232 ], [  739,  549,  412,  317,  232 ] ],
+      [ 374, [  746,  554,  416,  320,  235 ], [  746,  554,  416,  320,  235 ], [  746,  554,  416,  320,  235 ] ],
+      [ 375, [  753,  560,  420,  323,  237 ], [  753,  560,  420,  323,  237 ], [  753,  560,  420,  323,  237 ] ],
+      [ 376, [  760,  565,  424,  326,  239 ], [  760,  565,  424,  326,  239 ], [  760,  565,  424,  326,  239 ] ],
+      [ 377, [  767,  570,  428,  329,  241 ], [  767,  570,  428,  329,  241 ], [  767,  570,  428,  329,  241 ] ],
+      [ 378, [  775,  575,  432,  332,  243 ], [  775,  575,  432,  332,  243 ], [  775,  575,  432,  332,  243 ] ],
+      [ 379, [  782,  581,  436,  335,  246 ], [  782,  581,  436,  335,  246 ], [  782,  581,  436,  335,  246 ] ],
+      [ 380, [  789,  586,  440,  338,  248 ], [  789,  586,  440,  338,  248 ], [  789,  586,  440,  338,  248 ] ],
+      [ 381, [  797,  592,  444,  341,  250 ], [  797,  592,  444,  341,  250 ], [  797,  592,  444,  341,  250 ] ],
+      [ 382, [  804,  597,  448,  345,  253 ], [  804,  597,  448,  345,  253 ], [  804,  597,  448,  345,  253 ] ],
+      [ 383, [  812,  603,  452,  348,  255 ], [  812,  603,  452,  348,  255 ], [  812,  603,  452,  348,  255 ] ],
+      [ 384, [  819,  609,  456,  351,  257 ], [  819,  609,  456,  351,  257 ], [  819,  609,  456,  351,  257 ] ],
+      [ 385, [  827,  614,  461,  354,  260 ], [  827,  614,  461,  354,  260 ], [  827,  614,  461,  354,  260 ] ],
+      [ 386, [  835,  620,  465,  358,  262 ], [  835,  620,  465,  358,  262 ], [  835,  620,  465,  358,  262 ] ],
+      [ 387, [  842,  626,  469,  361,  265 ], [  842,  626,  469,  361,  265 ], [  842,  626,  469,  361,  265 ] ],
+      [ 388, [  850,  632,  474,  364,  267 ], [  850,  632,  474,  364,  267 ], [  850,  632,  474,  364,  267 ] ],
+      [ 389, [  858,  638,  478,  368,  270 ], [  858,  638,  478,  368,  270 ], [  858,  638,  478,  368,  270 ] ],
+      [ 390, [  866,  644,  483,  371,  272 ], [  866,  644,  483,  371,  272 ], [  866,  644,  483,  371,  272 ] ],
+      [ 391, [  874,  650,  487,  375,  275 ], [  874,  650,  487,  375,  275 ], [  874,  650,  487,  375,  275 ] ],
+      [ 392, [  883,  656,  492,  378,  277 ], [  883,  656,  492,  378,  277 ], [  883,  656,  492,  378,  277 ] ],
+      [ 393, [  891,  662,  496,  382,  280 ], [  891,  662,  496,  382,  280 ], [  891,  662,  496,  382,  280 ] ],
+      [ 394, [  899,  668,  501,  385,  283 ], [  899,  668,  501,  385,  283 ], [  899,  668,  501,  385,  283 ] ],
+      [ 395, [  908,  674,  506,  389,  285 ], [  908,  674,  506,  389,  285 ], [  908,  674,  506,  389,  285 ] ],
+      [ 396, [  916,  681,  510,  393,  288 ], [  916,  681,  510,  393,  288 ], [  916,  681,  510,  393,  288 ] ],
+      [ 397, [  925,  687,  515,  396,  291 ], [  925,  687,  515,  396,  291 ], [  925,  687,  515,  396,  291 ] ],
+      [ 398, [  933,  693,  520,  400,  293 ], [  933,  693,  520,  400,  293 ], [  933,  693,  520,  400,  293 ] ],
+      [ 399, [  942,  700,  525,  404,  296 ], [  942,  700,  525,  404,  296 ], [  942,  700,  525,  404,  296 ] ],
+      [ 400, [  951,  706,  530,  408,  299 ], [  951,  706,  530,  408,  299 ], [  951,  706,  530,  408,  299 ] ],
+      [ 401, [  960,  713,  535,  411,  302 ], [  960,  713,  535,  411,  302 ], [  960,  713,  535,  411,  302 ] ],
+      [ 402, [  969,  720,  540,  415,  304 ], [  969,  720,  540,  415,  304 ], [  969,  720,  540,  415,  304 ] ],
+      [ 403, [  978,  726,  545,  419,  307 ], [  978,  726,  545,  419,  307 ], [  978,  726,  545,  419,  307 ] ],
+      [ 404, [  987,  733,  550,  423,  310 ], [  987,  733,  550,  423,  310 ], [  987,  733,  550,  423,  310 ] ],
+      [ 405, [  996,  740,  555,  427,  313 ], [  996,  740,  555,  427,  313 ], [  996,  740,  555,  427,  313 ] ],
+      [ 406, [ 1006,  747,  560,  431,  316 ], [ 1006,  747,  560,  431,  316 ], [ 1006,  747,  560,  431,  316 ] ],
+      [ 407, [ 1015,  754,  565,  435,  319 ], [ 1015,  754,  565,  435,  319 ], [ 1015,  754,  565,  435,  319 ] ],
+      [ 408, [ 1024,  761,  571,  439,  322 ], [ 1024,  761,  571,  439,  322 ], [ 1024,  761,  571,  439,  322 ] ],
+      [ 409, [ 1034,  768,  576,  443,  325 ], [ 1034,  768,  576,  443,  325 ], [ 1034,  768,  576,  443,  325 ] ],
+      [ 410, [ 1044,  775,  582,  447,  328 ], [ 1044,  775,  582,  447,  328 ], [ 1044,  775,  582,  447,  328 ] ],
+      [ 411, [ 1054,  783,  587,  452,  331 ], [ 1054,  783,  587,  452,  331 ], [ 1054,  783,  587,  452,  331 ] ],
+      [ 412, [ 1063,  790,  592,  456,  334 ], [ 1063,  790,  592,  456,  334 ], [ 1063,  790,  592,  456,  334 ] ],
+      [ 413, [ 1073,  797,  598,  460,  337 ], [ 1073,  797,  598,  460,  337 ], [ 1073,  797,  598,  460,  337 ] ],
+      [ 414, [ 1083,  805,  604,  464,  340 ], [ 1083,  805,  604,  464,  340 ], [ 1083,  805,  604,  464,  340 ] ],
+      [ 415, [ 1094,  812,  609,  469,  344 ], [ 1094,  812,  609,  469,  344 ], [ 1094,  812,  609,  469,  344 ] ],
+      [ 416, [ 1104,  820,  615,  473,  347 ], [ 1104,  820,  615,  473,  347 ], [ 1104,  820,  615,  473,  347 ] ],
+      [ 417, [ 1114,  828,  621,  477,  350 ], [ 1114,  828,  621,  477,  350 ], [ 1114,  828,  621,  477,  350 ] ],
+      [ 418, [ 1125,  835,  627,  482,  353 ], [ 1125,  835,  627,  482,  353 ], [ 1125,  835,  627,  482,  353 ] ],
+      [ 419, [ 1135,  843,  632,  486,  357 ], [ 1135,  843,  632,  486,  357 ], [ 1135,  843,  632,  486,  357 ] ],
+      [ 420, [ 1146,  851,  638,  491,  360 ], [ 1146,  851,  638,  491,  360 ], [ 1146,  851,  638,  491,  360 ] ],
+      [ 421, [ 1156,  859,  644,  496,  363 ], [ 1156,  859,  644,  496,  363 ], [ 1156,  859,  644,  496,  363 ] ],
+      [ 422, [ 1167,  867,  650,  500,  367 ], [ 1167,  867,  650,  500,  367 ], [ 1167,  867,  650,  500,  367 ] ],
+      [ 423, [ 1178,  875,  656,  505,  370 ], [ 1178,  875,  656,  505,  370 ], [ 1178,  875,  656,  505,  370 ] ],
+      [ 424, [ 1189,  883,  663,  510,  374 ], [ 1189,  883,  663,  510,  374 ], [ 1189,  883,  663,  510,  374 ] ],
+      [ 425, [ 1200,  892,  669,  514,  377 ], [ 1200,  892,  669,  514,  377 ], [ 1200,  892,  669,  514,  377 ] ],
+      [ 426, [ 1212,  900,  675,  519,  381 ], [ 1212,  900,  675,  519,  381 ], [ 1212,  900,  675,  519,  381 ] ],
+      [ 427, [ 1223,  908,  681,  524,  384 ], [ 1223,  908,  681,  524,  384 ], [ 1223,  908,  681,  524,  384 ] ],
+      [ 428, [ 1234,  917,  688,  529,  388 ], [ 1234,  917,  688,  529,  388 ], [ 1234,  917,  688,  529,  388 ] ],
+      [ 429, [ 1246,  926,  694,  534,  392 ], [ 1246,  926,  694,  534,  392 ], [ 1246,  926,  694,  534,  392 ] ],
+      [ 430, [ 1258,  934,  701,  539,  395 ], [ 1258,  934,  701,  539,  395 ], [ 1258,  934,  701,  539,  395 ] ],
+      [ 431, [ 1269,  943,  707,  544,  399 ], [ 1269,  943,  707,  544,  399 ], [ 1269,  943,  707,  544,  399 ] ],
+      [ 432, [ 1281,  952,  714,  549,  403 ], [ 1281,  952,  714,  549,  403 ], [ 1281,  952,  714,  549,  403 ] ],
+      [ 433, [ 1293,  961,  720,  554,  406 ], [ 1293,  961,  720,  554,  406 ], [ 1293,  961,  720,  554,  406 ] ],
+      [ 434, [ 1305,  970,  727,  559,  410 ], [ 1305,  970,  727,  559,  410 ], [ 1305,  970,  727,  559,  410 ] ],
+      [ 435, [ 1318,  979,  734,  565,  414 ], [ 1318,  979,  734,  565,  414 ], [ 1318,  979,  734,  565,  414 ] ],
+      [ 436, [ 1330,  988,  741,  570,  418 ], [ 1330,  988,  741,  570,  418 ], [ 1330,  988,  741,  570,  418 ] ],
+      [ 437, [ 1342,  997,  748,  575,  422 ], [ 1342,  997,  748,  575,  422 ], [ 1342,  997,  748,  575,  422 ] ],
+      [ 438, [ 1355, 1006,  755,  581,  426 ], [ 1355, 1006,  755,  581,  426 ], [ 1355, 1006,  755,  581,  426 ] ],
+      [ 439, [ 1368, 1016,  762,  586,  430 ], [ 1368, 1016,  762,  586,  430 ], [ 1368, 1016,  762,  586,  430 ] ],
+      [ 440, [ 1380, 1025,  769,  592,  434 ], [ 1380, 1025,  769,  592,  434 ], [ 1380, 1025,  769,  592,  434 ] ],
+      [ 441, [ 1393, 1035,  776,  597,  438 ], [ 1393, 1035,  776,  597,  438 ], [ 1393, 1035,  776,  597,  438 ] ],
+      [ 442, [ 1406, 1045,  784,  603,  442 ], [ 1406, 1045,  784,  603,  442 ], [ 1406, 1045,  784,  603,  442 ] ],
+      [ 443, [ 1419, 1054,  791,  608,  446 ], [ 1419, 1054,  791,  608,  446 ], [ 1419, 1054,  791,  608,  446 ] ],
+      [ 444, [ 1433, 1064,  798,  614,  450 ], [ 1433, 1064,  798,  614,  450 ], [ 1433, 1064,  798,  614,  450 ] ],
+      [ 445, [ 1446, 1074,  806,  620,  455 ], [ 1446, 1074,  806,  620,  455 ], [ 1446, 1074,  806,  620,  455 ] ],
+      [ 446, [ 1460, 1084,  813,  626,  459 ], [ 1460, 1084,  813,  626,  459 ], [ 1460, 1084,  813,  626,  459 ] ],
+      [ 447, [ 1473, 1095,  821,  631,  463 ], [ 1473, 1095,  821,  631,  463 ], [ 1473, 1095,  821,  631,  463 ] ],
+      [ 448, [ 1487, 1105,  829,  637,  467 ], [ 1487, 1105,  829,  637,  467 ], [ 1487, 1105,  829,  637,  467 ] ],
+      [ 449, [ 1501, 1115,  836,  643,  472 ], [ 1501, 1115,  836,  643,  472 ], [ 1501, 1115,  836,  643,  472 ] ],
+      [ 450, [ 1515, 1126,  844,  649,  476 ], [ 1515, 1126,  844,  649,  476 ], [ 1515, 1126,  844,  649,  476 ] ],
+      [ 451, [ 1529, 1136,  852,  655,  481 ], [ 1529, 1136,  852,  655,  481 ], [ 1529, 1136,  852,  655,  481 ] ],
+      [ 452, [ 1544, 1147,  860,  662,  485 ], [ 1544, 1147,  860,  662,  485 ], [ 1544, 1147,  860,  662,  485 ] ],
+      [ 453, [ 1558, 1157,  868,  668,  490 ], [ 1558, 1157,  868,  668,  490 ], [ 1558, 1157,  868,  668,  490 ] ],
+      [ 454, [ 1573, 1168,  876,  674,  494 ], [ 1573, 1168,  876,  674,  494 ], [ 1573, 1168,  876,  674,  494 ] ],
+      [ 455, [ 1587, 1179,  884,  680,  499 ], [ 1587, 1179,  884,  680,  499 ], [ 1587, 1179,  884,  680,  499 ] ],
+      [ 456, [ 1602, 1190,  893,  687,  504 ], [ 1602, 1190,  893,  687,  504 ], [ 1602, 1190,  893,  687,  504 ] ],
+      [ 457, [ 1617, 1201,  901,  693,  508 ], [ 1617, 1201,  901,  693,  508 ], [ 1617, 1201,  901,  693,  508 ] ],
+      [ 458, [ 1632, 1213,  909,  700,  513 ], [ 1632, 1213,  909,  700,  513 ], [ 1632, 1213,  909,  700,  513 ] ],
+      [ 459, [ 1648, 1224,  918,  706,  518 ], [ 1648, 1224,  918,  706,  518 ], [ 1648, 1224,  918,  706,  518 ] ],
+      [ 460, [ 1663, 1235,  927,  713,  523 ], [ 1663, 1235,  927,  713,  523 ], [ 1663, 1235,  927,  713,  523 ] ],
+      [ 461, [ 1679, 1247,  935,  719,  528 ], [ 1679, 1247,  935,  719,  528 ], [ 1679, 1247,  935,  719,  528 ] ],
+      [ 462, [ 1694, 1259,  944,  726,  533 ], [ 1694, 1259,  944,  726,  533 ], [ 1694, 1259,  944,  726,  533 ] ],
+      [ 463, [ 1710, 1270,  953,  733,  538 ], [ 1710, 1270,  953,  733,  538 ], [ 1710, 1270,  953,  733,  538 ] ],
+      [ 464, [ 1726, 1282,  962,  740,  543 ], [ 1726, 1282,  962,  740,  543 ], [ 1726, 1282,  962,  740,  543 ] ],
+      [ 465, [ 1742, 1294,  971,  747,  548 ], [ 1742, 1294,  971,  747,  548 ], [ 1742, 1294,  971,  747,  548 ] ],
+      [ 466, [ 1759, 1306,  980,  754,  553 ], [ 1759, 1306,  980,  754,  553 ], [ 1759, 1306,  980,  754,  553 ] ],
+      [ 467, [ 1775, 1319,  989,  761,  558 ], [ 1775, 1319,  989,  761,  558 ], [ 1775, 1319,  989,  761,  558 ] ],
+      [ 468, [ 1792, 1331,  998,  768,  563 ], [ 1792, 1331,  998,  768,  563 ], [ 1792, 1331,  998,  768,  563 ] ],
+      [ 469, [ 1809, 1344, 1008,  775,  568 ], [ 1809, 1344, 1008,  775,  568 ], [ 1809, 1344, 1008,  775,  568 ] ],
+      [ 470, [ 1825, 1356, 1017,  782,  574 ], [ 1825, 1356, 1017,  782,  574 ], [ 1825, 1356, 1017,  782,  574 ] ],
+      [ 471, [ 1843, 1369, 1027,  790,  579 ], [ 1843, 1369, 1027,  790,  579 ], [ 1843, 1369, 1027,  790,  579 ] ],
+      [ 472, [ 1860, 1382, 1036,  797,  585 ], [ 1860, 1382, 1036,  797,  585 ], [ 1860, 1382, 1036,  797,  585 ] ],
+      [ 473, [ 1877, 1395, 1046,  805,  590 ], [ 1877, 1395, 1046,  805,  590 ], [ 1877, 1395, 1046,  805,  590 ] ],
+      [ 474, [ 1895, 1408, 1056,  812,  596 ], [ 1895, 1408, 1056,  812,  596 ], [ 1895, 1408, 1056,  812,  596 ] ],
+      [ 475, [ 1913, 1421, 1066,  820,  601 ], [ 1913, 1421, 1066,  820,  601 ], [ 1913, 1421, 1066,  820,  601 ] ],
+      [ 476, [ 1930, 1434, 1076,  827,  607 ], [ 1930, 1434, 1076,  827,  607 ], [ 1930, 1434, 1076,  827,  607 ] ],
+      [ 477, [ 1949, 1447, 1086,  835,  612 ], [ 1949, 1447, 1086,  835,  612 ], [ 1949, 1447, 1086,  835,  612 ] ],
+      [ 478, [ 1967, 1461, 1096,  843,  618 ], [ 1967, 1461, 1096,  843,  618 ], [ 1967, 1461, 1096,  843,  618 ] ],
+      [ 479, [ 1985, 1475, 1106,  851,  624 ], [ 1985, 1475, 1106,  851,  624 ], [ 1985, 1475, 1106,  851,  624 ] ],
+      [ 480, [ 2004, 1489, 1116,  859,  630 ], [ 2004, 1489, 1116,  859,  630 ], [ 2004, 1489, 1116,  859,  630 ] ],
+      [ 481, [ 2023, 1502, 1127,  867,  636 ], [ 2023, 1502, 1127,  867,  636 ], [ 2023, 1502, 1127,  867,  636 ] ],
+      [ 482, [ 2041, 1517, 1137,  875,  642 ], [ 2041, 1517, 1137,  875,  642 ], [ 2041, 1517, 1137,  875,  642 ] ],
+      [ 483, [ 2061, 1531, 1148,  883,  648 ], [ 2061, 1531, 1148,  883,  648 ], [ 2061, 1531, 1148,  883,  648 ] ],
+      [ 484, [ 2080, 1545, 1159,  891,  654 ], [ 2080, 1545, 1159,  891,  654 ], [ 2080, 1545, 1159,  891,  654 ] ],
+      [ 485, [ 2099, 1559, 1170,  900,  660 ], [ 2099, 1559, 1170,  900,  660 ], [ 2099, 1559, 1170,  900,  660 ] ],
+      [ 486, [ 2119, 1574, 1181,  908,  666 ], [ 2119, 1574, 1181,  908,  666 ], [ 2119, 1574, 1181,  908,  666 ] ],
+      [ 487, [ 2139, 1589, 1192,  917,  672 ], [ 2139, 1589, 1192,  917,  672 ], [ 2139, 1589, 1192,  917,  672 ] ],
+      [ 488, [ 2159, 1604, 1203,  925,  678 ], [ 2159, 1604, 1203,  925,  678 ], [ 2159, 1604, 1203,  925,  678 ] ],
+      [ 489, [ 2179, 1619, 1214,  934,  685 ], [ 2179, 1619, 1214,  934,  685 ], [ 2179, 1619, 1214,  934,  685 ] ],
+      [ 490, [ 2199, 1634, 1225,  943,  691 ], [ 2199, 1634, 1225,  943,  691 ], [ 2199, 1634, 1225,  943,  691 ] ],
+      [ 491, [ 2220, 1649, 1237,  951,  698 ], [ 2220, 1649, 1237,  951,  698 ], [ 2220, 1649, 1237,  951,  698 ] ],
+      [ 492, [ 2241, 1665, 1248,  960,  704 ], [ 2241, 1665, 1248,  960,  704 ], [ 2241, 1665, 1248,  960,  704 ] ],
+      [ 493, [ 2262, 1680, 1260,  969,  711 ], [ 2262, 1680, 1260,  969,  711 ], [ 2262, 1680, 1260,  969,  711 ] ],
+      [ 494, [ 2283, 1696, 1272,  978,  718 ], [ 2283, 1696, 1272,  978,  718 ], [ 2283, 1696, 1272,  978,  718 ] ],
+      [ 495, [ 2304, 1712, 1284,  988,  724 ], [ 2304, 1712, 1284,  988,  724 ], [ 2304, 1712, 1284,  988,  724 ] ],
+      [ 496, [ 2326, 1728, 1296,  997,  731 ], [ 2326, 1728, 1296,  997,  731 ], [ 2326, 1728, 1296,  997,  731 ] ],
+      [ 497, [ 2348, 1744, 1308, 1006,  738 ], [ 2348, 1744, 1308, 1006,  738 ], [ 2348, 1744, 1308, 1006,  738 ] ],
+      [ 498, [ 2370, 1760, 1320, 1016,  745 ], [ 2370, 1760, 1320, 1016,  745 ], [ 2370, 1760, 1320, 1016,  745 ] ],
+      [ 499, [ 2392, 1777, 1333, 1025,  752 ], [ 2392, 1777, 1333, 1025,  752 ], [ 2392, 1777, 1333, 1025,  752 ] ],
+      [ 500, [ 2414, 1793, 1345, 1035,  759 ], [ 2414, 1793, 1345, 1035,  759 ], [ 2414, 1793, 1345, 1035,  759 ] ],
+      [ 501, [ 2437, 1810, 1358, 1044,  766 ], [ 2437, 1810, 1358, 1044,  766 ], [ 2437, 1810, 1358, 1044,  766 ] ],
+      [ 502, [ 2460, 1827, 1370, 1054,  773 ], [ 2460, 1827, 1370, 1054,  773 ], [ 2460, 1827, 1370, 1054,  773 ] ],
+      [ 503, [ 2483, 1844, 1383, 1064,  780 ], [ 2483, 1844, 1383, 1064,  780 ], [ 2483, 1844, 1383, 1064,  780 ] ],
+      [ 504, [ 2506, 1862, 1396, 1074,  788 ], [ 2506, 1862, 1396, 1074,  788 ], [ 2506, 1862, 1396, 1074,  788 ] ],
+      [ 505, [ 2529, 1879, 1409, 1084,  795 ], [ 2529, 1879, 1409, 1084,  795 ], [ 2529, 1879, 1409, 1084,  795 ] ],
+      [ 506, [ 2553, 1897, 1422, 1094,  802 ], [ 2553, 1897, 1422, 1094,  802 ], [ 2553, 1897, 1422, 1094,  802 ] ],
+      [ 507, [ 2577, 1914, 1436, 1104,  810 ], [ 2577, 1914, 1436, 1104,  810 ], [ 2577, 1914, 1436, 1104,  810 ] ],
+      [ 508, [ 2601, 1932, 1449, 1115,  817 ], [ 2601, 1932, 1449, 1115,  817 ], [ 2601, 1932, 1449, 1115,  817 ] ],
+      [ 509, [ 2625, 1950, 1463, 1125,  825 ], [ 2625, 1950, 1463, 1125,  825 ], [ 2625, 1950, 1463, 1125,  825 ] ],
+      [ 510, [ 2650, 1969, 1476, 1136,  833 ], [ 2650, 1969, 1476, 1136,  833 ], [ 2650, 1969, 1476, 1136,  833 ] ],
+      [ 511, [ 2675, 1987, 1490, 1146,  841 ], [ 2675, 1987, 1490, 1146,  841 ], [ 2675, 1987, 1490, 1146,  841 ] ],
+      [ 512, [ 2700, 2006, 1504, 1157,  849 ], [ 2700, 2006, 1504, 1157,  849 ], [ 2700, 2006, 1504, 1157,  849 ] ],
+      [ 513, [ 2725, 2024, 1518, 1168,  856 ], [ 2725, 2024, 1518, 1168,  856 ], [ 2725, 2024, 1518, 1168,  856 ] ],
+      [ 514, [ 2751, 2043, 1532, 1179,  864 ], [ 2751, 2043, 1532, 1179,  864 ], [ 2751, 2043, 1532, 1179,  864 ] ],
+      [ 515, [ 2776, 2062, 1547, 1190,  873 ], [ 2776, 2062, 1547, 1190,  873 ], [ 2776, 2062, 1547, 1190,  873 ] ],
+      [ 516, [ 2802, 2082, 1561, 1201,  881 ], [ 2802, 2082, 1561, 1201,  881 ], [ 2802, 2082, 1561, 1201,  881 ] ],
+      [ 517, [ 2829, 2101, 1576, 1212,  889 ], [ 2829, 2101, 1576, 1212,  889 ], [ 2829, 2101, 1576, 1212,  889 ] ],
+      [ 518, [ 2855, 2121, 1591, 1224,  897 ], [ 2855, 2121, 1591, 1224,  897 ], [ 2855, 2121, 1591, 1224,  897 ] ],
+      [ 519, [ 2882, 2141, 1606, 1235,  906 ], [ 2882, 2141, 1606, 1235,  906 ], [ 2882, 2141, 1606, 1235,  906 ] ],
+      [ 520, [ 2909, 2161, 1621, 1247,  914 ], [ 2909, 2161, 1621, 1247,  914 ], [ 2909, 2161, 1621, 1247,  914 ] ],
+      [ 521, [ 2936, 2181, 1636, 1258,  923 ], [ 2936, 2181, 1636, 1258,  923 ], [ 2936, 2181, 1636, 1258,  923 ] ],
+      [ 522, [ 2963, 2201, 1651, 1270,  931 ], [ 2963, 2201, 1651, 1270,  931 ], [ 2963, 2201, 1651, 1270,  931 ] ],
+      [ 523, [ 2991, 2222, 1667, 1282,  940 ], [ 2991, 2222, 1667, 1282,  940 ], [ 2991, 2222, 1667, 1282,  940 ] ],
+      [ 524, [ 3019, 2243, 1682, 1294,  949 ], [ 3019, 2243, 1682, 1294,  949 ], [ 3019, 2243, 1682, 1294,  949 ] ],
+      [ 525, [ 3047, 2264, 1698, 1306,  958 ], [ 3047, 2264, 1698, 1306,  958 ], [ 3047, 2264, 1698, 1306,  958 ] ],
+      [ 526, [ 3076, 2285, 1714, 1318,  967 ], [ 3076, 2285, 1714, 1318,  967 ], [ 3076, 2285, 1714, 1318,  967 ] ],
+      [ 527, [ 3105, 2306, 1730, 1331,  976 ], [ 3105, 2306, 1730, 1331,  976 ], [ 3105, 2306, 1730, 1331,  976 ] ],
+      [ 528, [ 3134, 2328, 1746, 1343,  985 ], [ 3134, 2328, 1746, 1343,  985 ], [ 3134, 2328, 1746, 1343,  985 ] ],
+      [ 529, [ 3163, 2350, 1762, 1356,  994 ], [ 3163, 2350, 1762, 1356,  994 ], [ 3163, 2350, 1762, 1356,  994 ] ],
+      [ 530, [ 3193, 2372, 1779, 1368, 1003 ], [ 3193, 2372, 1779, 1368, 1003 ], [ 3193, 2372, 1779, 1368, 1003 ] ],
+      [ 531, [ 3223, 2394, 1796, 1381, 1013 ], [ 3223, 2394, 1796, 1381, 1013 ], [ 3223, 2394, 1796, 1381, 1013 ] ],
+      [ 532, [ 3253, 2416, 1812, 1394, 1022 ], [ 3253, 2416, 1812, 1394, 1022 ], [ 3253, 2416, 1812, 1394, 1022 ] ],
+      [ 533, [ 3283, 2439, 1829, 1407, 1032 ], [ 3283, 2439, 1829, 1407, 1032 ], [ 3283, 2439, 1829, 1407, 1032 ] ],
+      [ 534, [ 3314, 2462, 1846, 1420, 1042 ], [ 3314, 2462, 1846, 1420, 1042 ], [ 3314, 2462, 1846, 1420, 1042 ] ],
+      [ 535, [ 3345, 2485, 1864, 1434, 1051 ], [ 3345, 2485, 1864, 1434, 1051 ], [ 3345, 2485, 1864, 1434, 1051 ] ],
+      [ 536, [ 3376, 2508, 1881, 1447, 1061 ], [ 3376, 2508, 1881, 1447, 1061 ], [ 3376, 2508, 1881, 1447, 1061 ] ],
+      [ 537, [ 3408, 2532, 1899, 1461, 1071 ], [ 3408, 2532, 1899, 1461, 1071 ], [ 3408, 2532, 1899, 1461, 1071 ] ],
+      [ 538, [ 3440, 2555, 1917, 1474, 1081 ], [ 3440, 2555, 1917, 1474, 1081 ], [ 3440, 2555, 1917, 1474, 1081 ] ],
+      [ 539, [ 3472, 2579, 1934, 1488, 1091 ], [ 3472, 2579, 1934, 1488, 1091 ], [ 3472, 2579, 1934, 1488, 1091 ] ],
+      [ 540, [ 3505, 2603, 1953, 1502, 1101 ], [ 3505, 2603, 1953, 1502, 1101 ], [ 3505, 2603, 1953, 1502, 1101 ] ],
+      [ 541, [ 3537, 2628, 1971, 1516, 1112 ], [ 3537, 2628, 1971, 1516, 1112 ], [ 3537, 2628, 1971, 1516, 1112 ] ],
+      [ 542, [ 3571, 2652, 1989, 1530, 1122 ], [ 3571, 2652, 1989, 1530, 1122 ], [ 3571, 2652, 1989, 1530, 1122 ] ],
+      [ 543, [ 3604, 2677, 2008, 1545, 1133 ], [ 3604, 2677, 2008, 1545, 1133 ], [ 3604, 2677, 2008, 1545, 1133 ] ],
+      [ 544, [ 3638, 2702, 2027, 1559, 1143 ], [ 3638, 2702, 2027, 1559, 1143 ], [ 3638, 2702, 2027, 1559, 1143 ] ],
+      [ 545, [ 3672, 2728, 2046, 1574, 1154 ], [ 3672, 2728, 2046, 1574, 1154 ], [ 3672, 2728, 2046, 1574, 1154 ] ],
+      [ 546, [ 3706, 2753, 2065, 1588, 1165 ], [ 3706, 2753, 2065, 1588, 1165 ], [ 3706, 2753, 2065, 1588, 1165 ] ],
+      [ 547, [ 3741, 2779, 2084, 1603, 1176 ], [ 3741, 2779, 2084, 1603, 1176 ], [ 3741, 2779, 2084, 1603, 1176 ] ],
+      [ 548, [ 3776, 2805, 2104, 1618, 1187 ], [ 3776, 2805, 2104, 1618, 1187 ], [ 3776, 2805, 2104, 1618, 1187 ] ],
+      [ 549, [ 3811, 2831, 2123, 1633, 1198 ], [ 3811, 2831, 2123, 1633, 1198 ], [ 3811, 2831, 2123, 1633, 1198 ] ],
+      [ 550, [ 3847, 2858, 2143, 1649, 1209 ], [ 3847, 2858, 2143, 1649, 1209 ], [ 3847, 2858, 2143, 1649, 1209 ] ],
+      [ 551, [ 3883, 2884, 2163, 1664, 1220 ], [ 3883, 2884, 2163, 1664, 1220 ], [ 3883, 2884, 2163, 1664, 1220 ] ],
+      [ 552, [ 3919, 2911, 2184, 1680, 1232 ], [ 3919, 2911, 2184, 1680, 1232 ], [ 3919, 2911, 2184, 1680, 1232 ] ],
+      [ 553, [ 3956, 2939, 2204, 1695, 1243 ], [ 3956, 2939, 2204, 1695, 1243 ], [ 3956, 2939, 2204, 1695, 1243 ] ],
+      [ 554, [ 3993, 2966, 2225, 1711, 1255 ], [ 3993, 2966, 2225, 1711, 1255 ], [ 3993, 2966, 2225, 1711, 1255 ] ],
+      [ 555, [ 4030, 2994, 2245, 1727, 1267 ], [ 4030, 2994, 2245, 1727, 1267 ], [ 4030, 2994, 2245, 1727, 1267 ] ],
+      [ 556, [ 4068, 3022, 2266, 1743, 1279 ], [ 4068, 3022, 2266, 1743, 1279 ], [ 4068, 3022, 2266, 1743, 1279 ] ],
+      [ 557, [ 4106, 3050, 2288, 1760, 1290 ], [ 4106, 3050, 2288, 1760, 1290 ], [ 4106, 3050, 2288, 1760, 1290 ] ],
+      [ 558, [ 4145, 3079, 2309, 1776, 1303 ], [ 4145, 3079, 2309, 1776, 1303 ], [ 4145, 3079, 2309, 1776, 1303 ] ],
+      [ 559, [ 4183, 3108, 2331, 1793, 1315 ], [ 4183, 3108, 2331, 1793, 1315 ], [ 4183, 3108, 2331, 1793, 1315 ] ],
+      [ 560, [ 4222, 3137, 2353, 1810, 1327 ], [ 4222, 3137, 2353, 1810, 1327 ], [ 4222, 3137, 2353, 1810, 1327 ] ],
+      [ 561, [ 4262, 3166, 2375, 1827, 1339 ], [ 4262, 3166, 2375, 1827, 1339 ], [ 4262, 3166, 2375, 1827, 1339 ] ],
+      [ 562, [ 4302, 3196, 2397, 1844, 1352 ], [ 4302, 3196, 2397, 1844, 1352 ], [ 4302, 3196, 2397, 1844, 1352 ] ],
+      [ 563, [ 4342, 3226, 2419, 1861, 1365 ], [ 4342, 3226, 2419, 1861, 1365 ], [ 4342, 3226, 2419, 1861, 1365 ] ],
+      [ 564, [ 4383, 3256, 2442, 1878, 1377 ], [ 4383, 3256, 2442, 1878, 1377 ], [ 4383, 3256, 2442, 1878, 1377 ] ],
+      [ 565, [ 4424, 3286, 2465, 1896, 1390 ], [ 4424, 3286, 2465, 1896, 1390 ], [ 4424, 3286, 2465, 1896, 1390 ] ],
+      [ 566, [ 4465, 3317, 2488, 1914, 1403 ], [ 4465, 3317, 2488, 1914, 1403 ], [ 4465, 3317, 2488, 1914, 1403 ] ],
+      [ 567, [ 4507, 3348, 2511, 1932, 1417 ], [ 4507, 3348, 2511, 1932, 1417 ], [ 4507, 3348, 2511, 1932, 1417 ] ],
+      [ 568, [ 4549, 3379, 2535, 1950, 1430 ], [ 4549, 3379, 2535, 1950, 1430 ], [ 4549, 3379, 2535, 1950, 1430 ] ],
+      [ 569, [ 4592, 3411, 2558, 1968, 1443 ], [ 4592, 3411, 2558, 1968, 1443 ], [ 4592, 3411, 2558, 1968, 1443 ] ],
+      [ 570, [ 4635, 3443, 2582, 1986, 1457 ], [ 4635, 3443, 2582, 1986, 1457 ], [ 4635, 3443, 2582, 1986, 1457 ] ],
+      [ 571, [ 4678, 3475, 2606, 2005, 1470 ], [ 4678, 3475, 2606, 2005, 1470 ], [ 4678, 3475, 2606, 2005, 1470 ] ],
+      [ 572, [ 4722, 3508, 2631, 2024, 1484 ], [ 4722, 3508, 2631, 2024, 1484 ], [ 4722, 3508, 2631, 2024, 1484 ] ],
+      [ 573, [ 4766, 3541, 2655, 2043, 1498 ], [ 4766, 3541, 2655, 2043, 1498 ], [ 4766, 3541, 2655, 2043, 1498 ] ],
+      [ 574, [ 4811, 3574, 2680, 2062, 1512 ], [ 4811, 3574, 2680, 2062, 1512 ], [ 4811, 3574, 2680, 2062, 1512 ] ],
+      [ 575, [ 4856, 3607, 2705, 2081, 1526 ], [ 4856, 3607, 2705, 2081, 1526 ], [ 4856, 3607, 2705, 2081, 1526 ] ],
+      [ 576, [ 4901, 3641, 2731, 2101, 1540 ], [ 4901, 3641, 2731, 2101, 1540 ], [ 4901, 3641, 2731, 2101, 1540 ] ],
+      [ 577, [ 4947, 3675, 2756, 2120, 1555 ], [ 4947, 3675, 2756, 2120, 1555 ], [ 4947, 3675, 2756, 2120, 1555 ] ],
+      [ 578, [ 4994, 3709, 2782, 2140, 1569 ], [ 4994, 3709, 2782, 2140, 1569 ], [ 4994, 3709, 2782, 2140, 1569 ] ],
+      [ 579, [ 5040, 3744, 2808, 2160, 1584 ], [ 5040, 3744, 2808, 2160, 1584 ], [ 5040, 3744, 2808, 2160, 1584 ] ],
+      [ 580, [ 5087, 3779, 2834, 2180, 1599 ], [ 5087, 3779, 2834, 2180, 1599 ], [ 5087, 3779, 2834, 2180, 1599 ] ],
+      [ 581, [ 5135, 3815, 2861, 2201, 1614 ], [ 5135, 3815, 2861, 2201, 1614 ], [ 5135, 3815, 2861, 2201, 1614 ] ],
+      [ 582, [ 5183, 3850, 2888, 2221, 1629 ], [ 5183, 3850, 2888, 2221, 1629 ], [ 5183, 3850, 2888, 2221, 1629 ] ],
+      [ 583, [ 5232, 3886, 2915, 2242, 1644 ], [ 5232, 3886, 2915, 2242, 1644 ], [ 5232, 3886, 2915, 2242, 1644 ] ],
+      [ 584, [ 5281, 3923, 2942, 2263, 1660 ], [ 5281, 3923, 2942, 2263, 1660 ], [ 5281, 3923, 2942, 2263, 1660 ] ],
+      [ 585, [ 5330, 3959, 2970, 2284, 1675 ], [ 5330, 3959, 2970, 2284, 1675 ], [ 5330, 3959, 2970, 2284, 1675 ] ],
+      [ 586, [ 5380, 3997, 2997, 2306, 1691 ], [ 5380, 3997, 2997, 2306, 1691 ], [ 5380, 3997, 2997, 2306, 1691 ] ],
+      [ 587, [ 5430, 4034, 3025, 2327, 1707 ], [ 5430, 4034, 3025, 2327, 1707 ], [ 5430, 4034, 3025, 2327, 1707 ] ],
+      [ 588, [ 5481, 4072, 3054, 2349, 1723 ], [ 5481, 4072, 3054, 2349, 1723 ], [ 5481, 4072, 3054, 2349, 1723 ] ],
+      [ 589, [ 5532, 4110, 3082, 2371, 1739 ], [ 5532, 4110, 3082, 2371, 1739 ], [ 5532, 4110, 3082, 2371, 1739 ] ],
+      [ 590, [ 5584, 4148, 3111, 2393, 1755 ], [ 5584, 4148, 3111, 2393, 1755 ], [ 5584, 4148, 3111, 2393, 1755 ] ],
+      [ 591, [ 5637, 4187, 3140, 2416, 1771 ], [ 5637, 4187, 3140, 2416, 1771 ], [ 5637, 4187, 3140, 2416, 1771 ] ],
+      [ 592, [ 5689, 4226, 3170, 2438, 1788 ], [ 5689, 4226, 3170, 2438, 1788 ], [ 5689, 4226, 3170, 2438, 1788 ] ],
+      [ 593, [ 5743, 4266, 3199, 2461, 1805 ], [ 5743, 4266, 3199, 2461, 1805 ], [ 5743, 4266, 3199, 2461, 1805 ] ],
+      [ 594, [ 5796, 4306, 3229, 2484, 1822 ], [ 5796, 4306, 3229, 2484, 1822 ], [ 5796, 4306, 3229, 2484, 1822 ] ],
+      [ 595, [ 5851, 4346, 3260, 2507, 1839 ], [ 5851, 4346, 3260, 2507, 1839 ], [ 5851, 4346, 3260, 2507, 1839 ] ],
+      [ 596, [ 5905, 4387, 3290, 2531, 1856 ], [ 5905, 4387, 3290, 2531, 1856 ], [ 5905, 4387, 3290, 2531, 1856 ] ],
+      [ 597, [ 5961, 4428, 3321, 2555, 1873 ], [ 5961, 4428, 3321, 2555, 1873 ], [ 5961, 4428, 3321, 2555, 1873 ] ],
+      [ 598, [ 6016, 4469, 3352, 2578, 1891 ], [ 6016, 4469, 3352, 2578, 1891 ], [ 6016, 4469, 3352, 2578, 1891 ] ],
+      [ 599, [ 6073, 4511, 3383, 2603, 1909 ], [ 6073, 4511, 3383, 2603, 1909 ], [ 6073, 4511, 3383, 2603, 1909 ] ],
+      [ 600, [ 6130, 4553, 3415, 2627, 1926 ], [ 6130, 4553, 3415, 2627, 1926 ], [ 6130, 4553, 3415, 2627, 1926 ] ],
+      [ 601, [ 6187, 4596, 3447, 2652, 1944 ], [ 6187, 4596, 3447, 2652, 1944 ], [ 6187, 4596, 3447, 2652, 1944 ] ],
+      [ 602, [ 6245, 4639, 3479, 2676, 1963 ], [ 6245, 4639, 3479, 2676, 1963 ], [ 6245, 4639, 3479, 2676, 1963 ] ],
+      [ 603, [ 6303, 4682, 3512, 2701, 1981 ], [ 6303, 4682, 3512, 2701, 1981 ], [ 6303, 4682, 3512, 2701, 1981 ] ],
+      [ 604, [ 6362, 4726, 3545, 2727, 2000 ], [ 6362, 4726, 3545, 2727, 2000 ], [ 6362, 4726, 3545, 2727, 2000 ] ],
+      [ 605, [ 6422, 4771, 3578, 2752, 2018 ], [ 6422, 4771, 3578, 2752, 2018 ], [ 6422, 4771, 3578, 2752, 2018 ] ],
+      [ 606, [ 6482, 4815, 3611, 2778, 2037 ], [ 6482, 4815, 3611, 2778, 2037 ], [ 6482, 4815, 3611, 2778, 2037 ] ],
+      [ 607, [ 6543, 4860, 3645, 2804, 2056 ], [ 6543, 4860, 3645, 2804, 2056 ], [ 6543, 4860, 3645, 2804, 2056 ] ],
+      [ 608, [ 6604, 4906, 3679, 2830, 2076 ], [ 6604, 4906, 3679, 2830, 2076 ], [ 6604, 4906, 3679, 2830, 2076 ] ],
+      [ 609, [ 6666, 4952, 3714, 2857, 2095 ], [ 6666, 4952, 3714, 2857, 2095 ], [ 6666, 4952, 3714, 2857, 2095 ] ],
+      [ 610, [ 6728, 4998, 3749, 2883, 2115 ], [ 6728, 4998, 3749, 2883, 2115 ], [ 6728, 4998, 3749, 2883, 2115 ] ],
+      [ 611, [ 6791, 5045, 3784, 2910, 2134 ], [ 6791, 5045, 3784, 2910, 2134 ], [ 6791, 5045, 3784, 2910, 2134 ] ],
+      [ 612, [ 6855, 5092, 3819, 2938, 2154 ], [ 6855, 5092, 3819, 2938, 2154 ], [ 6855, 5092, 3819, 2938, 2154 ] ],
+      [ 613, [ 6919, 5140, 3855, 2965, 2174 ], [ 6919, 5140, 3855, 2965, 2174 ], [ 6919, 5140, 3855, 2965, 2174 ] ],
+      [ 614, [ 6984, 5188, 3891, 2993, 2195 ], [ 6984, 5188, 3891, 2993, 2195 ], [ 6984, 5188, 3891, 2993, 2195 ] ],
+      [ 615, [ 7049, 5236, 3927, 3021, 2215 ], [ 7049, 5236, 3927, 3021, 2215 ], [ 7049, 5236, 3927, 3021, 2215 ] ],
+      [ 616, [ 7115, 5285, 3964, 3049, 2236 ], [ 7115, 5285, 3964, 3049, 2236 ], [ 7115, 5285, 3964, 3049, 2236 ] ],
+      [ 617, [ 7182, 5335, 4001, 3078, 2257 ], [ 7182, 5335, 4001, 3078, 2257 ], [ 7182, 5335, 4001, 3078, 2257 ] ],
+      [ 618, [ 7249, 5385, 4039, 3107, 2278 ], [ 7249, 5385, 4039, 3107, 2278 ], [ 7249, 5385, 4039, 3107, 2278 ] ],
+      [ 619, [ 7317, 5435, 4076, 3136, 2300 ], [ 7317, 5435, 4076, 3136, 2300 ], [ 7317, 5435, 4076, 3136, 2300 ] ],
+      [ 620, [ 7385, 5486, 4115, 3165, 2321 ], [ 7385, 5486, 4115, 3165, 2321 ], [ 7385, 5486, 4115, 3165, 2321 ] ],
+      [ 621, [ 7454, 5537, 4153, 3195, 2343 ], [ 7454, 5537, 4153, 3195, 2343 ], [ 7454, 5537, 4153, 3195, 2343 ] ],
+      [ 622, [ 7524, 5589, 4192, 3225, 2365 ], [ 7524, 5589, 4192, 3225, 2365 ], [ 7524, 5589, 4192, 3225, 2365 ] ],
+      [ 623, [ 7594, 5642, 4231, 3255, 2387 ], [ 7594, 5642, 4231, 3255, 2387 ], [ 7594, 5642, 4231, 3255, 2387 ] ],
+      [ 624, [ 7666, 5694, 4271, 3285, 2409 ], [ 7666, 5694, 4271, 3285, 2409 ], [ 7666, 5694, 4271, 3285, 2409 ] ],
+      [ 625, [ 7737, 5748, 4311, 3316, 2432 ], [ 7737, 5748, 4311, 3316, 2432 ], [ 7737, 5748, 4311, 3316, 2432 ] ],
+      [ 626, [ 7810, 5802, 4351, 3347, 2455 ], [ 7810, 5802, 4351, 3347, 2455 ], [ 7810, 5802, 4351, 3347, 2455 ] ],
+      [ 627, [ 7883, 5856, 4392, 3378, 2477 ], [ 7883, 5856, 4392, 3378, 2477 ], [ 7883, 5856, 4392, 3378, 2477 ] ],
+      [ 628, [ 7957, 5911, 4433, 3410, 2501 ], [ 7957, 5911, 4433, 3410, 2501 ], [ 7957, 5911, 4433, 3410, 2501 ] ],
+      [ 629, [ 8031, 5966, 4475, 3442, 2524 ], [ 8031, 5966, 4475, 3442, 2524 ], [ 8031, 5966, 4475, 3442, 2524 ] ],
+      [ 630, [ 8106, 6022, 4516, 3474, 2548 ], [ 8106, 6022, 4516, 3474, 2548 ], [ 8106, 6022, 4516, 3474, 2548 ] ],
+      [ 631, [ 8182, 6078, 4559, 3507, 2572 ], [ 8182, 6078, 4559, 3507, 2572 ], [ 8182, 6078, 4559, 3507, 2572 ] ],
+      [ 632, [ 8259, 6135, 4601, 3539, 2596 ], [ 8259, 6135, 4601, 3539, 2596 ], [ 8259, 6135, 4601, 3539, 2596 ] ],
+      [ 633, [ 8336, 6193, 4644, 3573, 2620 ], [ 8336, 6193, 4644, 3573, 2620 ], [ 8336, 6193, 4644, 3573, 2620 ] ],
+      [ 634, [ 8414, 6251, 4688, 3606, 2644 ], [ 8414, 6251, 4688, 3606, 2644 ], [ 8414, 6251, 4688, 3606, 2644 ] ],
+      [ 635, [ 8493, 6309, 4732, 3640, 2669 ], [ 8493, 6309, 4732, 3640, 2669 ], [ 8493, 6309, 4732, 3640, 2669 ] ],
+      [ 636, [ 8572, 6368, 4776, 3674, 2694 ], [ 8572, 6368, 4776, 3674, 2694 ], [ 8572, 6368, 4776, 3674, 2694 ] ],
+      [ 637, [ 8653, 6428, 4821, 3708, 2719 ], [ 8653, 6428, 4821, 3708, 2719 ], [ 8653, 6428, 4821, 3708, 2719 ] ],
+      [ 638, [ 8734, 6488, 4866, 3743, 2745 ], [ 8734, 6488, 4866, 3743, 2745 ], [ 8734, 6488, 4866, 3743, 2745 ] ],
+      [ 639, [ 8815, 6549, 4911, 3778, 2771 ], [ 8815, 6549, 4911, 3778, 2771 ], [ 8815, 6549, 4911, 3778, 2771 ] ],
+      [ 640, [ 8898, 6610, 4957, 3813, 2796 ], [ 8898, 6610, 4957, 3813, 2796 ], [ 8898, 6610, 4957, 3813, 2796 ] ],
+      [ 641, [ 8981, 6672, 5004, 3849, 2823 ], [ 8981, 6672, 5004, 3849, 2823 ], [ 8981, 6672, 5004, 3849, 2823 ] ],
+      [ 642, [ 9065, 6734, 5051, 3885, 2849 ], [ 9065, 6734, 5051, 3885, 2849 ], [ 9065, 6734, 5051, 3885, 2849 ] ],
+      [ 643, [ 9150, 6797, 5098, 3922, 2876 ], [ 9150, 6797, 5098, 3922, 2876 ], [ 9150, 6797, 5098, 3922, 2876 ] ],
+      [ 644, [ 9236, 6861, 5146, 3958, 2903 ], [ 9236, 6861, 5146, 3958, 2903 ], [ 9236, 6861, 5146, 3958, 2903 ] ],
+      [ 645, [ 9322, 6925, 5194, 3995, 2930 ], [ 9322, 6925, 5194, 3995, 2930 ], [ 9322, 6925, 5194, 3995, 2930 ] ],
+      [ 646, [ 9410, 6990, 5242, 4033, 2957 ], [ 9410, 6990, 5242, 4033, 2957 ], [ 9410, 6990, 5242, 4033, 2957 ] ],
+      [ 647, [ 9498, 7055, 5292, 4070, 2985 ], [ 9498, 7055, 5292, 4070, 2985 ], [ 9498, 7055, 5292, 4070, 2985 ] ],
+      [ 648, [ 9587, 7121, 5341, 4109, 3013 ], [ 9587, 7121, 5341, 4109, 3013 ], [ 9587, 7121, 5341, 4109, 3013 ] ],
+      [ 649, [ 9676, 7188, 5391, 4147, 3041 ], [ 9676, 7188, 5391, 4147, 3041 ], [ 9676, 7188, 5391, 4147, 3041 ] ],
+      [ 650, [ 9767, 7255, 5442, 4186, 3070 ], [ 9767, 7255, 5442, 4186, 3070 ], [ 9767, 7255, 5442, 4186, 3070 ] ],
+      [ 651, [ 9858, 7323, 5492, 4225, 3098 ], [ 9858, 7323, 5492, 4225, 3098 ], [ 9858, 7323, 5492, 4225, 3098 ] ],
+      [ 652, [ 9951, 7392, 5544, 4265, 3127 ], [ 9951, 7392, 5544, 4265, 3127 ], [ 9951, 7392, 5544, 4265, 3127 ] ],
+      [ 653, [ 10044, 7461, 5596, 4304, 3157 ], [ 10044, 7461, 5596, 4304, 3157 ], [ 10044, 7461, 5596, 4304, 3157 ] ],
+      [ 654, [ 10138, 7531, 5648, 4345, 3186 ], [ 10138, 7531, 5648, 4345, 3186 ], [ 10138, 7531, 5648, 4345, 3186 ] ],
+      [ 655, [ 10233, 7601, 5701, 4385, 3216 ], [ 10233, 7601, 5701, 4385, 3216 ], [ 10233, 7601, 5701, 4385, 3216 ] ],
+      [ 656, [ 10328, 7673, 5754, 4426, 3246 ], [ 10328, 7673, 5754, 4426, 3246 ], [ 10328, 7673, 5754, 4426, 3246 ] ],
+      [ 657, [ 10425, 7744, 5808, 4468, 3276 ], [ 10425, 7744, 5808, 4468, 3276 ], [ 10425, 7744, 5808, 4468, 3276 ] ],
+      [ 658, [ 10523, 7817, 5863, 4510, 3307 ], [ 10523, 7817, 5863, 4510, 3307 ], [ 10523, 7817, 5863, 4510, 3307 ] ],
+      [ 659, [ 10621, 7890, 5918, 4552, 3338 ], [ 10621, 7890, 5918, 4552, 3338 ], [ 10621, 7890, 5918, 4552, 3338 ] ],
+      [ 660, [ 10721, 7964, 5973, 4595, 3369 ], [ 10721, 7964, 5973, 4595, 3369 ], [ 10721, 7964, 5973, 4595, 3369 ] ],
+      [ 661, [ 10821, 8038, 6029, 4638, 3401 ], [ 10821, 8038, 6029, 4638, 3401 ], [ 10821, 8038, 6029, 4638, 3401 ] ],
+      [ 662, [ 10922, 8114, 6085, 4681, 3433 ], [ 10922, 8114, 6085, 4681, 3433 ], [ 10922, 8114, 6085, 4681, 3433 ] ],
+      [ 663, [ 11025, 8190, 6142, 4725, 3465 ], [ 11025, 8190, 6142, 4725, 3465 ], [ 11025, 8190, 6142, 4725, 3465 ] ],
+      [ 664, [ 11128, 8266, 6200, 4769, 3497 ], [ 11128, 8266, 6200, 4769, 3497 ], [ 11128, 8266, 6200, 4769, 3497 ] ],
+      [ 665, [ 11232, 8344, 6258, 4814, 3530 ], [ 11232, 8344, 6258, 4814, 3530 ], [ 11232, 8344, 6258, 4814, 3530 ] ],
+      [ 666, [ 11337, 8422, 6316, 4859, 3563 ], [ 11337, 8422, 6316, 4859, 3563 ], [ 11337, 8422, 6316, 4859, 3563 ] ],
+      [ 667, [ 11443, 8501, 6375, 4904, 3596 ], [ 11443, 8501, 6375, 4904, 3596 ], [ 11443, 8501, 6375, 4904, 3596 ] ],
+      [ 668, [ 11550, 8580, 6435, 4950, 3630 ], [ 11550, 8580, 6435, 4950, 3630 ], [ 11550, 8580, 6435, 4950, 3630 ] ],
+      [ 669, [ 11658, 8661, 6495, 4996, 3664 ], [ 11658, 8661, 6495, 4996, 3664 ], [ 11658, 8661, 6495, 4996, 3664 ] ],
+      [ 670, [ 11768, 8742, 6556, 5043, 3698 ], [ 11768, 8742, 6556, 5043, 3698 ], [ 11768, 8742, 6556, 5043, 3698 ] ],
+      [ 671, [ 11878, 8823, 6618, 5090, 3733 ], [ 11878, 8823, 6618, 5090, 3733 ], [ 11878, 8823, 6618, 5090, 3733 ] ],
+      [ 672, [ 11989, 8906, 6680, 5138, 3768 ], [ 11989, 8906, 6680, 5138, 3768 ], [ 11989, 8906, 6680, 5138, 3768 ] ],
+      [ 673, [ 12101, 8989, 6742, 5186, 3803 ], [ 12101, 8989, 6742, 5186, 3803 ], [ 12101, 8989, 6742, 5186, 3803 ] ],
+      [ 674, [ 12214, 9074, 6805, 5235, 3839 ], [ 12214, 9074, 6805, 5235, 3839 ], [ 12214, 9074, 6805, 5235, 3839 ] ],
+      [ 675, [ 12329, 9158, 6869, 5284, 3875 ], [ 12329, 9158, 6869, 5284, 3875 ], [ 12329, 9158, 6869, 5284, 3875 ] ],
+      [ 676, [ 12444, 9244, 6933, 5333, 3911 ], [ 12444, 9244, 6933, 5333, 3911 ], [ 12444, 9244, 6933, 5333, 3911 ] ],
+      [ 677, [ 12561, 9331, 6998, 5383, 3948 ], [ 12561, 9331, 6998, 5383, 3948 ], [ 12561, 9331, 6998, 5383, 3948 ] ],
+      [ 678, [ 12678, 9418, 7064, 5434, 3985 ], [ 12678, 9418, 7064, 5434, 3985 ], [ 12678, 9418, 7064, 5434, 3985 ] ],
+      [ 679, [ 12797, 9506, 7130, 5484, 4022 ], [ 12797, 9506, 7130, 5484, 4022 ], [ 12797, 9506, 7130, 5484, 4022 ] ],
+      [ 680, [ 12917, 9595, 7196, 5536, 4060 ], [ 12917, 9595, 7196, 5536, 4060 ], [ 12917, 9595, 7196, 5536, 4060 ] ],
+      [ 681, [ 13038, 9685, 7264, 5588, 4098 ], [ 13038, 9685, 7264, 5588, 4098 ], [ 13038, 9685, 7264, 5588, 4098 ] ],
+      [ 682, [ 13160, 9776, 7332, 5640, 4136 ], [ 13160, 9776, 7332, 5640, 4136 ], [ 13160, 9776, 7332, 5640, 4136 ] ],
+      [ 683, [ 13283, 9867, 7400, 5693, 4175 ], [ 13283, 9867, 7400, 5693, 4175 ], [ 13283, 9867, 7400, 5693, 4175 ] ],
+      [ 684, [ 13407, 9960, 7470, 5746, 4214 ], [ 13407, 9960, 7470, 5746, 4214 ], [ 13407, 9960, 7470, 5746, 4214 ] ],
+      [ 685, [ 13533, 10053, 7540, 5800, 4253 ], [ 13533, 10053, 7540, 5800, 4253 ], [ 13533, 10053, 7540, 5800, 4253 ] ],
+      [ 686, [ 13659, 10147, 7610, 5854, 4293 ], [ 13659, 10147, 7610, 5854, 4293 ], [ 13659, 10147, 7610, 5854, 4293 ] ],
+      [ 687, [ 13787, 10242, 7681, 5909, 4333 ], [ 13787, 10242, 7681, 5909, 4333 ], [ 13787, 10242, 7681, 5909, 4333 ] ],
+      [ 688, [ 13916, 10338, 7753, 5964, 4374 ], [ 13916, 10338, 7753, 5964, 4374 ], [ 13916, 10338, 7753, 5964, 4374 ] ],
+      [ 689, [ 14047, 10435, 7826, 6020, 4415 ], [ 14047, 10435, 7826, 6020, 4415 ], [ 14047, 10435, 7826, 6020, 4415 ] ],
+      [ 690, [ 14178, 10532, 7899, 6076, 4456 ], [ 14178, 10532, 7899, 6076, 4456 ], [ 14178, 10532, 7899, 6076, 4456 ] ],
+      [ 691, [ 14311, 10631, 7973, 6133, 4498 ], [ 14311, 10631, 7973, 6133, 4498 ], [ 14311, 10631, 7973, 6133, 4498 ] ],
+      [ 692, [ 14445, 10730, 8048, 6191, 4540 ], [ 14445, 10730, 8048, 6191, 4540 ], [ 14445, 10730, 8048, 6191, 4540 ] ],
+      [ 693, [ 14580, 10831, 8123, 6249, 4582 ], [ 14580, 10831, 8123, 6249, 4582 ], [ 14580, 10831, 8123, 6249, 4582 ] ],
+      [ 694, [ 14716, 10932, 8199, 6307, 4625 ], [ 14716, 10932, 8199, 6307, 4625 ], [ 14716, 10932, 8199, 6307, 4625 ] ],
+      [ 695, [ 14854, 11035, 8276, 6366, 4668 ], [ 14854, 11035, 8276, 6366, 4668 ], [ 14854, 11035, 8276, 6366, 4668 ] ],
+      [ 696, [ 14993, 11138, 8353, 6426, 4712 ], [ 14993, 11138, 8353, 6426, 4712 ], [ 14993, 11138, 8353, 6426, 4712 ] ],
+      [ 697, [ 15134, 11242, 8432, 6486, 4756 ], [ 15134, 11242, 8432, 6486, 4756 ], [ 15134, 11242, 8432, 6486, 4756 ] ],
+      [ 698, [ 15275, 11347, 8510, 6547, 4801 ], [ 15275, 11347, 8510, 6547, 4801 ], [ 15275, 11347, 8510, 6547, 4801 ] ],
+      [ 699, [ 15418, 11454, 8590, 6608, 4846 ], [ 15418, 11454, 8590, 6608, 4846 ], [ 15418, 11454, 8590, 6608, 4846 ] ],
+      [ 700, [ 15563, 11561, 8671, 6670, 4891 ], [ 15563, 11561, 8671, 6670, 4891 ], [ 15563, 11561, 8671, 6670, 4891 ] ],
+      [ 701, [ 15708, 11669, 8752, 6732, 4937 ], [ 15708, 11669, 8752, 6732, 4937 ], [ 15708, 11669, 8752, 6732, 4937 ] ],
+      [ 702, [ 15855, 11778, 8834, 6795, 4983 ], [ 15855, 11778, 8834, 6795, 4983 ], [ 15855, 11778, 8834, 6795, 4983 ] ],
+      [ 703, [ 16004, 11888, 8916, 6859, 5030 ], [ 16004, 11888, 8916, 6859, 5030 ], [ 16004, 11888, 8916, 6859, 5030 ] ],
+      [ 704, [ 16154, 12000, 9000, 6923, 5077 ], [ 16154, 12000, 9000, 6923, 5077 ], [ 16154, 12000, 9000, 6923, 5077 ] ],
+      [ 705, [ 16305, 12112, 9084, 6988, 5124 ], [ 16305, 12112, 9084, 6988, 5124 ], [ 16305, 12112, 9084, 6988, 5124 ] ],
+      [ 706, [ 16457, 12225, 9169, 7053, 5172 ], [ 16457, 12225, 9169, 7053, 5172 ], [ 16457, 12225, 9169, 7053, 5172 ] ],
+      [ 707, [ 16611, 12340, 9255, 7119, 5221 ], [ 16611, 12340, 9255, 7119, 5221 ], [ 16611, 12340, 9255, 7119, 5221 ] ],
+      [ 708, [ 16767, 12455, 9342, 7186, 5270 ], [ 16767, 12455, 9342, 7186, 5270 ], [ 16767, 12455, 9342, 7186, 5270 ] ],
+      [ 709, [ 16924, 12572, 9429, 7253, 5319 ], [ 16924, 12572, 9429, 7253, 5319 ], [ 16924, 12572, 9429, 7253, 5319 ] ],
+      [ 710, [ 17082, 12690, 9517, 7321, 5369 ], [ 17082, 12690, 9517, 7321, 5369 ], [ 17082, 12690, 9517, 7321, 5369 ] ],
+      [ 711, [ 17242, 12808, 9606, 7390, 5419 ], [ 17242, 12808, 9606, 7390, 5419 ], [ 17242, 12808, 9606, 7390, 5419 ] ],
+      [ 712, [ 17404, 12928, 9696, 7459, 5470 ], [ 17404, 12928, 9696, 7459, 5470 ], [ 17404, 12928, 9696, 7459, 5470 ] ],
+      [ 713, [ 17567, 13049, 9787, 7529, 5521 ], [ 17567, 13049, 9787, 7529, 5521 ], [ 17567, 13049, 9787, 7529, 5521 ] ],
+      [ 714, [ 17731, 13172, 9879, 7599, 5573 ], [ 17731, 13172, 9879, 7599, 5573 ], [ 17731, 13172, 9879, 7599, 5573 ] ],
+      [ 715, [ 17897, 13295, 9971, 7670, 5625 ], [ 17897, 13295, 9971, 7670, 5625 ], [ 17897, 13295, 9971, 7670, 5625 ] ],
+      [ 716, [ 18064, 13419, 10064, 7742, 5677 ], [ 18064, 13419, 10064, 7742, 5677 ], [ 18064, 13419, 10064, 7742, 5677 ] ],
+      [ 717, [ 18234, 13545, 10159, 7814, 5731 ], [ 18234, 13545, 10159, 7814, 5731 ], [ 18234, 13545, 10159, 7814, 5731 ] ],
+      [ 718, [ 18404, 13672, 10254, 7888, 5784 ], [ 18404, 13672, 10254, 7888, 5784 ], [ 18404, 13672, 10254, 7888, 5784 ] ],
+      [ 719, [ 18577, 13800, 10350, 7961, 5838 ], [ 18577, 13800, 10350, 7961, 5838 ], [ 18577, 13800, 10350, 7961, 5838 ] ],
+      [ 720, [ 18750, 13929, 10447, 8036, 5893 ], [ 18750, 13929, 10447, 8036, 5893 ], [ 18750, 13929, 10447, 8036, 5893 ] ],
+      [ 721, [ 18926, 14059, 10544, 8111, 5948 ], [ 18926, 14059, 10544, 8111, 5948 ], [ 18926, 14059, 10544, 8111, 5948 ] ],
+      [ 722, [ 19103, 14191, 10643, 8187, 6004 ], [ 19103, 14191, 10643, 8187, 6004 ], [ 19103, 14191, 10643, 8187, 6004 ] ],
+      [ 723, [ 19282, 14324, 10743, 8264, 6060 ], [ 19282, 14324, 10743, 8264, 6060 ], [ 19282, 14324, 10743, 8264, 6060 ] ],
+      [ 724, [ 19462, 14458, 10843, 8341, 6117 ], [ 19462, 14458, 10843, 8341, 6117 ], [ 19462, 14458, 10843, 8341, 6117 ] ],
+      [ 725, [ 19645, 14593, 10945, 8419, 6174 ], [ 19645, 14593, 10945, 8419, 6174 ], [ 19645, 14593, 10945, 8419, 6174 ] ],
+      [ 726, [ 19829, 14730, 11047, 8498, 6232 ], [ 19829, 14730, 11047, 8498, 6232 ], [ 19829, 14730, 11047, 8498, 6232 ] ],
+      [ 727, [ 20014, 14868, 11151, 8577, 6290 ], [ 20014, 14868, 11151, 8577, 6290 ], [ 20014, 14868, 11151, 8577, 6290 ] ],
+      [ 728, [ 20202, 15007, 11255, 8658, 6349 ], [ 20202, 15007, 11255, 8658, 6349 ], [ 20202, 15007, 11255, 8658, 6349 ] ],
+      [ 729, [ 20391, 15147, 11360, 8739, 6408 ], [ 20391, 15147, 11360, 8739, 6408 ], [ 20391, 15147, 11360, 8739, 6408 ] ],
+      [ 730, [ 20581, 15289, 11467, 8821, 6468 ], [ 20581, 15289, 11467, 8821, 6468 ], [ 20581, 15289, 11467, 8821, 6468 ] ],
+      [ 731, [ 20774, 15432, 11574, 8903, 6529 ], [ 20774, 15432, 11574, 8903, 6529 ], [ 20774, 15432, 11574, 8903, 6529 ] ],
+      [ 732, [ 20969, 15577, 11683, 8987, 6590 ], [ 20969, 15577, 11683, 8987, 6590 ], [ 20969, 15577, 11683, 8987, 6590 ] ],
+      [ 733, [ 21165, 15723, 11792, 9071, 6652 ], [ 21165, 15723, 11792, 9071, 6652 ], [ 21165, 15723, 11792, 9071, 6652 ] ],
+      [ 734, [ 21363, 15870, 11902, 9156, 6714 ], [ 21363, 15870, 11902, 9156, 6714 ], [ 21363, 15870, 11902, 9156, 6714 ] ],
+      [ 735, [ 21563, 16018, 12014, 9241, 6777 ], [ 21563, 16018, 12014, 9241, 6777 ], [ 21563, 16018, 12014, 9241, 6777 ] ],
+      [ 736, [ 21765, 16168, 12126, 9328, 6840 ], [ 21765, 16168, 12126, 9328, 6840 ], [ 21765, 16168, 12126, 9328, 6840 ] ],
+      [ 737, [ 21969, 16320, 12240, 9415, 6904 ], [ 21969, 16320, 12240, 9415, 6904 ], [ 21969, 16320, 12240, 9415, 6904 ] ],
+      [ 738, [ 22174, 16472, 12354, 9503, 6969 ], [ 22174, 16472, 12354, 9503, 6969 ], [ 22174, 16472, 12354, 9503, 6969 ] ],
+      [ 739, [ 22382, 16627, 12470, 9592, 7034 ], [ 22382, 16627, 12470, 9592, 7034 ], [ 22382, 16627, 12470, 9592, 7034 ] ],
+      [ 740, [ 22591, 16782, 12587, 9682, 7100 ], [ 22591, 16782, 12587, 9682, 7100 ], [ 22591, 16782, 12587, 9682, 7100 ] ],
+      [ 741, [ 22803, 16939, 12704, 9773, 7167 ], [ 22803, 16939, 12704, 9773, 7167 ], [ 22803, 16939, 12704, 9773, 7167 ] ],
+      [ 742, [ 23016, 17098, 12823, 9864, 7234 ], [ 23016, 17098, 12823, 9864, 7234 ], [ 23016, 17098, 12823, 9864, 7234 ] ],
+      [ 743, [ 23232, 17258, 12943, 9956, 7301 ], [ 23232, 17258, 12943, 9956, 7301 ], [ 23232, 17258, 12943, 9956, 7301 ] ],
+      [ 744, [ 23449, 17419, 13065, 10050, 7370 ], [ 23449, 17419, 13065, 10050, 7370 ], [ 23449, 17419, 13065, 10050, 7370 ] ],
+      [ 745, [ 23669, 17582, 13187, 10144, 7439 ], [ 23669, 17582, 13187, 10144, 7439 ], [ 23669, 17582, 13187, 10144, 7439 ] ],
+      [ 746, [ 23890, 17747, 13310, 10239, 7508 ], [ 23890, 17747, 13310, 10239, 7508 ], [ 23890, 17747, 13310, 10239, 7508 ] ],
+      [ 747, [ 24114, 17913, 13435, 10335, 7579 ], [ 24114, 17913, 13435, 10335, 7579 ], [ 24114, 17913, 13435, 10335, 7579 ] ],
+      [ 748, [ 24340, 18081, 13561, 10431, 7650 ], [ 24340, 18081, 13561, 10431, 7650 ], [ 24340, 18081, 13561, 10431, 7650 ] ],
+      [ 749, [ 24567, 18250, 13688, 10529, 7721 ], [ 24567, 18250, 13688, 10529, 7721 ], [ 24567, 18250, 13688, 10529, 7721 ] ],
+      [ 750, [ 24797, 18421, 13816, 10627, 7793 ], [ 24797, 18421, 13816, 10627, 7793 ], [ 24797, 18421, 13816, 10627, 7793 ] ],
+      [ 751, [ 25030, 18593, 13945, 10727, 7866 ], [ 25030, 18593, 13945, 10727, 7866 ], [ 25030, 18593, 13945, 10727, 7866 ] ],
+      [ 752, [ 25264, 18767, 14076, 10827, 7940 ], [ 25264, 18767, 14076, 10827, 7940 ], [ 25264, 18767, 14076, 10827, 7940 ] ],
+      [ 753, [ 25500, 18943, 14207, 10929, 8014 ], [ 25500, 18943, 14207, 10929, 8014 ], [ 25500, 18943, 14207, 10929, 8014 ] ],
+      [ 754, [ 25739, 19120, 14340, 11031, 8089 ], [ 25739, 19120, 14340, 11031, 8089 ], [ 25739, 19120, 14340, 11031, 8089 ] ],
+      [ 755, [ 25980, 19299, 14475, 11134, 8165 ], [ 25980, 19299, 14475, 11134, 8165 ], [ 25980, 19299, 14475, 11134, 8165 ] ],
+      [ 756, [ 26223, 19480, 14610, 11239, 8242 ], [ 26223, 19480, 14610, 11239, 8242 ], [ 26223, 19480, 14610, 11239, 8242 ] ],
+      [ 757, [ 26469, 19662, 14747, 11344, 8319 ], [ 26469, 19662, 14747, 11344, 8319 ], [ 26469, 19662, 14747, 11344, 8319 ] ],
+      [ 758, [ 26716, 19847, 14885, 11450, 8397 ], [ 26716, 19847, 14885, 11450, 8397 ], [ 26716, 19847, 14885, 11450, 8397 ] ],
+      [ 759, [ 26967, 20032, 15024, 11557, 8475 ], [ 26967, 20032, 15024, 11557, 8475 ], [ 26967, 20032, 15024, 11557, 8475 ] ],
+      [ 760, [ 27219, 20220, 15165, 11665, 8555 ], [ 27219, 20220, 15165, 11665, 8555 ], [ 27219, 20220, 15165, 11665, 8555 ] ],
+      [ 761, [ 27474, 20409, 15307, 11774, 8635 ], [ 27474, 20409, 15307, 11774, 8635 ], [ 27474, 20409, 15307, 11774, 8635 ] ],
+      [ 762, [ 27731, 20600, 15450, 11885, 8715 ], [ 27731, 20600, 15450, 11885, 8715 ], [ 27731, 20600, 15450, 11885, 8715 ] ],
+      [ 763, [ 27991, 20793, 15595, 11996, 8797 ], [ 27991, 20793, 15595, 11996, 8797 ], [ 27991, 20793, 15595, 11996, 8797 ] ],
+      [ 764, [ 28253, 20988, 15741, 12108, 8879 ], [ 28253, 20988, 15741, 12108, 8879 ], [ 28253, 20988, 15741, 12108, 8879 ] ],
+      [ 765, [ 28517, 21184, 15888, 12222, 8963 ], [ 28517, 21184, 15888, 12222, 8963 ], [ 28517, 21184, 15888, 12222, 8963 ] ],
+      [ 766, [ 28784, 21382, 16037, 12336, 9046 ], [ 28784, 21382, 16037, 12336, 9046 ], [ 28784, 21382, 16037, 12336, 9046 ] ],
+      [ 767, [ 29053, 21583, 16187, 12451, 9131 ], [ 29053, 21583, 16187, 12451, 9131 ], [ 29053, 21583, 16187, 12451, 9131 ] ],
+      [ 768, [ 29325, 21785, 16338, 12568, 9217 ], [ 29325, 21785, 16338, 12568, 9217 ], [ 29325, 21785, 16338, 12568, 9217 ] ],
+      [ 769, [ 29600, 21989, 16491, 12686, 9303 ], [ 29600, 21989, 16491, 12686, 9303 ], [ 29600, 21989, 16491, 12686, 9303 ] ],
+      [ 770, [ 29877, 22194, 16646, 12804, 9390 ], [ 29877, 22194, 16646, 12804, 9390 ], [ 29877, 22194, 16646, 12804, 9390 ] ],
+      [ 771, [ 30157, 22402, 16802, 12924, 9478 ], [ 30157, 22402, 16802, 12924, 9478 ], [ 30157, 22402, 16802, 12924, 9478 ] ],
+      [ 772, [ 30439, 22612, 16959, 13045, 9567 ], [ 30439, 22612, 16959, 13045, 9567 ], [ 30439, 22612, 16959, 13045, 9567 ] ],
+      [ 773, [ 30724, 22824, 17118, 13167, 9656 ], [ 30724, 22824, 17118, 13167, 9656 ], [ 30724, 22824, 17118, 13167, 9656 ] ],
+      [ 774, [ 31012, 23037, 17278, 13291, 9746 ], [ 31012, 23037, 17278, 13291, 9746 ], [ 31012, 23037, 17278, 13291, 9746 ] ],
+      [ 775, [ 31302, 23253, 17440, 13415, 9838 ], [ 31302, 23253, 17440, 13415, 9838 ], [ 31302, 23253, 17440, 13415, 9838 ] ],
+      [ 776, [ 31595, 23470, 17603, 13541, 9930 ], [ 31595, 23470, 17603, 13541, 9930 ], [ 31595, 23470, 17603, 13541, 9930 ] ],
+      [ 777, [ 31891, 23690, 17768, 13667, 10023 ], [ 31891, 23690, 17768, 13667, 10023 ], [ 31891, 23690, 17768, 13667, 10023 ] ],
+      [ 778, [ 32189, 23912, 17934, 13795, 10117 ], [ 32189, 23912, 17934, 13795, 10117 ], [ 32189, 23912, 17934, 13795, 10117 ] ],
+      [ 779, [ 32491, 24136, 18102, 13925, 10211 ], [ 32491, 24136, 18102, 13925, 10211 ], [ 32491, 24136, 18102, 13925, 10211 ] ],
+      [ 780, [ 32795, 24362, 18271, 14055, 10307 ], [ 32795, 24362, 18271, 14055, 10307 ], [ 32795, 24362, 18271, 14055, 10307 ] ],
+      [ 781, [ 33102, 24590, 18442, 14186, 10403 ], [ 33102, 24590, 18442, 14186, 10403 ], [ 33102, 24590, 18442, 14186, 10403 ] ],
+      [ 782, [ 33412, 24820, 18615, 14319, 10501 ], [ 33412, 24820, 18615, 14319, 10501 ], [ 33412, 24820, 18615, 14319, 10501 ] ],
+      [ 783, [ 33724, 25052, 18789, 14453, 10599 ], [ 33724, 25052, 18789, 14453, 10599 ], [ 33724, 25052, 18789, 14453, 10599 ] ],
+      [ 784, [ 34040, 25287, 18965, 14589, 10698 ], [ 34040, 25287, 18965, 14589, 10698 ], [ 34040, 25287, 18965, 14589, 10698 ] ],
+      [ 785, [ 34359, 25524, 19143, 14725, 10798 ], [ 34359, 25524, 19143, 14725, 10798 ], [ 34359, 25524, 19143, 14725, 10798 ] ],
+      [ 786, [ 34680, 25762, 19322, 14863, 10900 ], [ 34680, 25762, 19322, 14863, 10900 ], [ 34680, 25762, 19322, 14863, 10900 ] ],
+      [ 787, [ 35005, 26004, 19503, 15002, 11002 ], [ 35005, 26004, 19503, 15002, 11002 ], [ 35005, 26004, 19503, 15002, 11002 ] ],
+      [ 788, [ 35333, 26247, 19685, 15143, 11105 ], [ 35333, 26247, 19685, 15143, 11105 ], [ 35333, 26247, 19685, 15143, 11105 ] ],
+      [ 789, [ 35663, 26493, 19870, 15284, 11208 ], [ 35663, 26493, 19870, 15284, 11208 ], [ 35663, 26493, 19870, 15284, 11208 ] ],
+      [ 790, [ 35997, 26741, 20056, 15427, 11313 ], [ 35997, 26741, 20056, 15427, 11313 ], [ 35997, 26741, 20056, 15427, 11313 ] ],
+      [ 791, [ 36334, 26991, 20243, 15572, 11419 ], [ 36334, 26991, 20243, 15572, 11419 ], [ 36334, 26991, 20243, 15572, 11419 ] ],
+      [ 792, [ 36674, 27244, 20433, 15718, 11526 ], [ 36674, 27244, 20433, 15718, 11526 ], [ 36674, 27244, 20433, 15718, 11526 ] ],
+      [ 793, [ 37018, 27499, 20624, 15865, 11634 ], [ 37018, 27499, 20624, 15865, 11634 ], [ 37018, 27499, 20624, 15865, 11634 ] ],
+      [ 794, [ 37364, 27756, 20817, 16013, 11743 ], [ 37364, 27756, 20817, 16013, 11743 ], [ 37364, 27756, 20817, 16013, 11743 ] ],
+      [ 795, [ 37714, 28016, 21012, 16163, 11853 ], [ 37714, 28016, 21012, 16163, 11853 ], [ 37714, 28016, 21012, 16163, 11853 ] ],
+      [ 796, [ 38067, 28278, 21209, 16314, 11964 ], [ 38067, 28278, 21209, 16314, 11964 ], [ 38067, 28278, 21209, 16314, 11964 ] ],
+      [ 797, [ 38423, 28543, 21407, 16467, 12076 ], [ 38423, 28543, 21407, 16467, 12076 ], [ 38423, 28543, 21407, 16467, 12076 ] ],
+      [ 798, [ 38783, 28810, 21608, 16621, 12189 ], [ 38783, 28810, 21608, 16621, 12189 ], [ 38783, 28810, 21608, 16621, 12189 ] ],
+      [ 799, [ 39146, 29080, 21810, 16777, 12303 ], [ 39146, 29080, 21810, 16777, 12303 ], [ 39146, 29080, 21810, 16777, 12303 ] ],
+      [ 800, [ 39512, 29352, 22014, 16934, 12418 ], [ 39512, 29352, 22014, 16934, 12418 ], [ 39512, 29352, 22014, 16934, 12418 ] ],
+      [ 801, [ 39882, 29627, 22220, 17092, 12534 ], [ 39882, 29627, 22220, 17092, 12534 ], [ 39882, 29627, 22220, 17092, 12534 ] ],
+      [ 802, [ 40256, 29904, 22428, 17252, 12652 ], [ 40256, 29904, 22428, 17252, 12652 ], [ 40256, 29904, 22428, 17252, 12652 ] ],
+      [ 803, [ 40632, 30184, 22638, 17414, 12770 ], [ 40632, 30184, 22638, 17414, 12770 ], [ 40632, 30184, 22638, 17414, 12770 ] ],
+      [ 804, [ 41013, 30467, 22850, 17577, 12890 ], [ 41013, 30467, 22850, 17577, 12890 ], [ 41013, 30467, 22850, 17577, 12890 ] ],
+      [ 805, [ 41397, 30752, 23064, 17741, 13010 ], [ 41397, 30752, 23064, 17741, 13010 ], [ 41397, 30752, 23064, 17741, 13010 ] ],
+      [ 806, [ 41784, 31040, 23280, 17908, 13132 ], [ 41784, 31040, 23280, 17908, 13132 ], [ 41784, 31040, 23280, 17908, 13132 ] ],
+      [ 807, [ 42175, 31330, 23498, 18075, 13255 ], [ 42175, 31330, 23498, 18075, 13255 ], [ 42175, 31330, 23498, 18075, 13255 ] ],
+      [ 808, [ 42570, 31624, 23718, 18244, 13379 ], [ 42570, 31624, 23718, 18244, 13379 ], [ 42570, 31624, 23718, 18244, 13379 ] ],
+      [ 809, [ 42969, 31920, 23940, 18415, 13504 ], [ 42969, 31920, 23940, 18415, 13504 ], [ 42969, 31920, 23940, 18415, 13504 ] ],
+      [ 810, [ 43371, 32218, 24164, 18588, 13631 ], [ 43371, 32218, 24164, 18588, 13631 ], [ 43371, 32218, 24164, 18588, 13631 ] ],
+      [ 811, [ 43777, 32520, 24390, 18762, 13758 ], [ 43777, 32520, 24390, 18762, 13758 ], [ 43777, 32520, 24390, 18762, 13758 ] ],
+      [ 812, [ 44187, 32824, 24618, 18937, 13887 ], [ 44187, 32824, 24618, 18937, 13887 ], [ 44187, 32824, 24618, 18937, 13887 ] ],
+      [ 813, [ 44600, 33132, 24849, 19114, 14017 ], [ 44600, 33132, 24849, 19114, 14017 ], [ 44600, 33132, 24849, 19114, 14017 ] ],
+      [ 814, [ 45018, 33442, 25081, 19293, 14148 ], [ 45018, 33442, 25081, 19293, 14148 ], [ 45018, 33442, 25081, 19293, 14148 ] ],
+      [ 815, [ 45439, 33755, 25316, 19474, 14281 ], [ 45439, 33755, 25316, 19474, 14281 ], [ 45439, 33755, 25316, 19474, 14281 ] ],
+      [ 816, [ 45865, 34071, 25553, 19656, 14415 ], [ 45865, 34071, 25553, 19656, 14415 ], [ 45865, 34071, 25553, 19656, 14415 ] ],
+      [ 817, [ 46294, 34390, 25792, 19840, 14550 ], [ 46294, 34390, 25792, 19840, 14550 ], [ 46294, 34390, 25792, 19840, 14550 ] ],
+      [ 818, [ 46727, 34712, 26034, 20026, 14686 ], [ 46727, 34712, 26034, 20026, 14686 ], [ 46727, 34712, 26034, 20026, 14686 ] ],
+      [ 819, [ 47165, 35037, 26277, 20213, 14823 ], [ 47165, 35037, 26277, 20213, 14823 ], [ 47165, 35037, 26277, 20213, 14823 ] ],
+      [ 820, [ 47606, 35365, 26523, 20403, 14962 ], [ 47606, 35365, 26523, 20403, 14962 ], [ 47606, 35365, 26523, 20403, 14962 ] ],
+      [ 821, [ 48052, 35696, 26772, 20594, 15102 ], [ 48052, 35696, 26772, 20594, 15102 ], [ 48052, 35696, 26772, 20594, 15102 ] ],
+      [ 822, [ 48502, 36030, 27022, 20786, 15243 ], [ 48502, 36030, 27022, 20786, 15243 ], [ 48502, 36030, 27022, 20786, 15243 ] ],
+      [ 823, [ 48956, 36367, 27275, 20981, 15386 ], [ 48956, 36367, 27275, 20981, 15386 ], [ 48956, 36367, 27275, 20981, 15386 ] ],
+      [ 824, [ 49414, 36708, 27531, 21177, 15530 ], [ 49414, 36708, 27531, 21177, 15530 ], [ 49414, 36708, 27531, 21177, 15530 ] ],
+      [ 825, [ 49877, 37051, 27788, 21376, 15675 ], [ 49877, 37051, 27788, 21376, 15675 ], [ 49877, 37051, 27788, 21376, 15675 ] ],
+      [ 826, [ 50343, 37398, 28048, 21576, 15822 ], [ 50343, 37398, 28048, 21576, 15822 ], [ 50343, 37398, 28048, 21576, 15822 ] ],
+      [ 827, [ 50815, 37748, 28311, 21778, 15970 ], [ 50815, 37748, 28311, 21778, 15970 ], [ 50815, 37748, 28311, 21778, 15970 ] ],
+      [ 828, [ 51290, 38101, 28576, 21982, 16120 ], [ 51290, 38101, 28576, 21982, 16120 ], [ 51290, 38101, 28576, 21982, 16120 ] ],
+      [ 829, [ 51771, 38458, 28844, 22187, 16271 ], [ 51771, 38458, 28844, 22187, 16271 ], [ 51771, 38458, 28844, 22187, 16271 ] ],
+      [ 830, [ 52255, 38818, 29114, 22395, 16423 ], [ 52255, 38818, 29114, 22395, 16423 ], [ 52255, 38818, 29114, 22395, 16423 ] ],
+      [ 831, [ 52744, 39181, 29386, 22605, 16577 ], [ 52744, 39181, 29386, 22605, 16577 ], [ 52744, 39181, 29386, 22605, 16577 ] ],
+      [ 832, [ 53238, 39548, 29661, 22816, 16732 ], [ 53238, 39548, 29661, 22816, 16732 ], [ 53238, 39548, 29661, 22816, 16732 ] ],
+      [ 833, [ 53736, 39918, 29939, 23030, 16889 ], [ 53736, 39918, 29939, 23030, 16889 ], [ 53736, 39918, 29939, 23030, 16889 ] ],
+      [ 834, [ 54239, 40292, 30219, 23245, 17047 ], [ 54239, 40292, 30219, 23245, 17047 ], [ 54239, 40292, 30219, 23245, 17047 ] ],
+      [ 835, [ 54747, 40669, 30502, 23463, 17206 ], [ 54747, 40669, 30502, 23463, 17206 ], [ 54747, 40669, 30502, 23463, 17206 ] ],
+      [ 836, [ 55260, 41050, 30788, 23683, 17367 ], [ 55260, 41050, 30788, 23683, 17367 ], [ 55260, 41050, 30788, 23683, 17367 ] ],
+      [ 837, [ 55777, 41434, 31076, 23904, 17530 ], [ 55777, 41434, 31076, 23904, 17530 ], [ 55777, 41434, 31076, 23904, 17530 ] ],
+      [ 838, [ 56299, 41822, 31367, 24128, 17694 ], [ 56299, 41822, 31367, 24128, 17694 ], [ 56299, 41822, 31367, 24128, 17694 ] ],
+      [ 839, [ 56826, 42214, 31660, 24354, 17860 ], [ 56826, 42214, 31660, 24354, 17860 ], [ 56826, 42214, 31660, 24354, 17860 ] ],
+      [ 840, [ 57358, 42609, 31957, 24582, 18027 ], [ 57358, 42609, 31957, 24582, 18027 ], [ 57358, 42609, 31957, 24582, 18027 ] ],
+      [ 841, [ 57895, 43008, 32256, 24812, 18196 ], [ 57895, 43008, 32256, 24812, 18196 ], [ 57895, 43008, 32256, 24812, 18196 ] ],
+      [ 842, [ 58437, 43410, 32558, 25044, 18366 ], [ 58437, 43410, 32558, 25044, 18366 ], [ 58437, 43410, 32558, 25044, 18366 ] ],
+      [ 843, [ 58984, 43817, 32862, 25279, 18538 ], [ 58984, 43817, 32862, 25279, 18538 ], [ 58984, 43817, 32862, 25279, 18538 ] ],
+      [ 844, [ 59536, 44227, 33170, 25515, 18711 ], [ 59536, 44227, 33170, 25515, 18711 ], [ 59536, 44227, 33170, 25515, 18711 ] ],
+      [ 845, [ 60093, 44641, 33481, 25754, 18887 ], [ 60093, 44641, 33481, 25754, 18887 ], [ 60093, 44641, 33481, 25754, 18887 ] ],
+      [ 846, [ 60656, 45059, 33794, 25995, 19063 ], [ 60656, 45059, 33794, 25995, 19063 ], [ 60656, 45059, 33794, 25995, 19063 ] ],
+      [ 847, [ 61224, 45481, 34110, 26239, 19242 ], [ 61224, 45481, 34110, 26239, 19242 ], [ 61224, 45481, 34110, 26239, 19242 ] ],
+      [ 848, [ 61797, 45906, 34430, 26484, 19422 ], [ 61797, 45906, 34430, 26484, 19422 ], [ 61797, 45906, 34430, 26484, 19422 ] ],
+      [ 849, [ 62375, 46336, 34752, 26732, 19604 ], [ 62375, 46336, 34752, 26732, 19604 ], [ 62375, 46336, 34752, 26732, 19604 ] ],
+      [ 850, [ 62959, 46770, 35077, 26983, 19787 ], [ 62959, 46770, 35077, 26983, 19787 ], [ 62959, 46770, 35077, 26983, 19787 ] ],
+      [ 851, [ 63549, 47208, 35406, 27235, 19972 ], [ 63549, 47208, 35406, 27235, 19972 ], [ 63549, 47208, 35406, 27235, 19972 ] ],
+      [ 852, [ 64143, 47649, 35737, 27490, 20159 ], [ 64143, 47649, 35737, 27490, 20159 ], [ 64143, 47649, 35737, 27490, 20159 ] ],
+      [ 853, [ 64744, 48096, 36072, 27747, 20348 ], [ 64744, 48096, 36072, 27747, 20348 ], [ 64744, 48096, 36072, 27747, 20348 ] ],
+      [ 854, [ 65350, 48546, 36409, 28007, 20539 ], [ 65350, 48546, 36409, 28007, 20539 ], [ 65350, 48546, 36409, 28007, 20539 ] ],
+      [ 855, [ 65962, 49000, 36750, 28269, 20731 ], [ 65962, 49000, 36750, 28269, 20731 ], [ 65962, 49000, 36750, 28269, 20731 ] ],
+      [ 856, [ 66579, 49459, 37094, 28534, 20925 ], [ 66579, 49459, 37094, 28534, 20925 ], [ 66579, 49459, 37094, 28534, 20925 ] ],
+      [ 857, [ 67202, 49922, 37441, 28801, 21121 ], [ 67202, 49922, 37441, 28801, 21121 ], [ 67202, 49922, 37441, 28801, 21121 ] ],
+      [ 858, [ 67832, 50389, 37792, 29071, 21318 ], [ 67832, 50389, 37792, 29071, 21318 ], [ 67832, 50389, 37792, 29071, 21318 ] ],
+      [ 859, [ 68467, 50861, 38146, 29343, 21518 ], [ 68467, 50861, 38146, 29343, 21518 ], [ 68467, 50861, 38146, 29343, 21518 ] ],
+      [ 860, [ 69107, 51337, 38503, 29617, 21719 ], [ 69107, 51337, 38503, 29617, 21719 ], [ 69107, 51337, 38503, 29617, 21719 ] ],
+      [ 861, [ 69754, 51818, 38863, 29895, 21923 ], [ 69754, 51818, 38863, 29895, 21923 ], [ 69754, 51818, 38863, 29895, 21923 ] ],
+      [ 862, [ 70407, 52303, 39227, 30175, 22128 ], [ 70407, 52303, 39227, 30175, 22128 ], [ 70407, 52303, 39227, 30175, 22128 ] ],
+      [ 863, [ 71066, 52792, 39594, 30457, 22335 ], [ 71066, 52792, 39594, 30457, 22335 ], [ 71066, 52792, 39594, 30457, 22335 ] ],
+      [ 864, [ 71732, 53286, 39965, 30742, 22544 ], [ 71732, 53286, 39965, 30742, 22544 ], [ 71732, 53286, 39965, 30742, 22544 ] ],
+      [ 865, [ 72403, 53785, 40339, 31030, 22755 ], [ 72403, 53785, 40339, 31030, 22755 ], [ 72403, 53785, 40339, 31030, 22755 ] ],
+      [ 866, [ 73081, 54289, 40717, 31320, 22968 ], [ 73081, 54289, 40717, 31320, 22968 ], [ 73081, 54289, 40717, 31320, 22968 ] ],
+      [ 867, [ 73765, 54797, 41098, 31614, 23183 ], [ 73765, 54797, 41098, 31614, 23183 ], [ 73765, 54797, 41098, 31614, 23183 ] ],
+      [ 868, [ 74456, 55310, 41482, 31910, 23400 ], [ 74456, 55310, 41482, 31910, 23400 ], [ 74456, 55310, 41482, 31910, 23400 ] ],
+      [ 869, [ 75153, 55828, 41871, 32208, 23619 ], [ 75153, 55828, 41871, 32208, 23619 ], [ 75153, 55828, 41871, 32208, 23619 ] ],
+      [ 870, [ 75856, 56350, 42263, 32510, 23840 ], [ 75856, 56350, 42263, 32510, 23840 ], [ 75856, 56350, 42263, 32510, 23840 ] ],
+      [ 871, [ 76566, 56878, 42658, 32814, 24064 ], [ 76566, 56878, 42658, 32814, 24064 ], [ 76566, 56878, 42658, 32814, 24064 ] ],
+      [ 872, [ 77283, 57410, 43058, 33121, 24289 ], [ 77283, 57410, 43058, 33121, 24289 ], [ 77283, 57410, 43058, 33121, 24289 ] ],
+      [ 873, [ 78006, 57948, 43461, 33431, 24516 ], [ 78006, 57948, 43461, 33431, 24516 ], [ 78006, 57948, 43461, 33431, 24516 ] ],
+      [ 874, [ 78737, 58490, 43867, 33744, 24746 ], [ 78737, 58490, 43867, 33744, 24746 ], [ 78737, 58490, 43867, 33744, 24746 ] ],
+      [ 875, [ 79474, 59038, 44278, 34060, 24977 ], [ 79474, 59038, 44278, 34060, 24977 ], [ 79474, 59038, 44278, 34060, 24977 ] ],
+      [ 876, [ 80218, 59590, 44693, 34379, 25211 ], [ 80218, 59590, 44693, 34379, 25211 ], [ 80218, 59590, 44693, 34379, 25211 ] ],
+      [ 877, [ 80968, 60148, 45111, 34701, 25447 ], [ 80968, 60148, 45111, 34701, 25447 ], [ 80968, 60148, 45111, 34701, 25447 ] ],
+      [ 878, [ 81726, 60711, 45533, 35026, 25685 ], [ 81726, 60711, 45533, 35026, 25685 ], [ 81726, 60711, 45533, 35026, 25685 ] ],
+      [ 879, [ 82491, 61279, 45960, 35353, 25926 ], [ 82491, 61279, 45960, 35353, 25926 ], [ 82491, 61279, 45960, 35353, 25926 ] ],
+      [ 880, [ 83264, 61853, 46390, 35684, 26169 ], [ 83264, 61853, 46390, 35684, 26169 ], [ 83264, 61853, 46390, 35684, 26169 ] ],
+      [ 881, [ 84043, 62432, 46824, 36018, 26414 ], [ 84043, 62432, 46824, 36018, 26414 ], [ 84043, 62432, 46824, 36018, 26414 ] ],
+      [ 882, [ 84830, 63016, 47262, 36356, 26661 ], [ 84830, 63016, 47262, 36356, 26661 ], [ 84830, 63016, 47262, 36356, 26661 ] ],
+      [ 883, [ 85624, 63606, 47705, 36696, 26910 ], [ 85624, 63606, 47705, 36696, 26910 ], [ 85624, 63606, 47705, 36696, 26910 ] ],
+      [ 884, [ 86425, 64202, 48151, 37039, 27162 ], [ 86425, 64202, 48151, 37039, 27162 ], [ 86425, 64202, 48151, 37039, 27162 ] ],
+      [ 885, [ 87234, 64803, 48602, 37386, 27417 ], [ 87234, 64803, 48602, 37386, 27417 ], [ 87234, 64803, 48602, 37386, 27417 ] ],
+      [ 886, [ 88051, 65409, 49057, 37736, 27673 ], [ 88051, 65409, 49057, 37736, 27673 ], [ 88051, 65409, 49057, 37736, 27673 ] ],
+      [ 887, [ 88875, 66022, 49516, 38089, 27932 ], [ 88875, 66022, 49516, 38089, 27932 ], [ 88875, 66022, 49516, 38089, 27932 ] ],
+      [ 888, [ 89707, 66640, 49980, 38446, 28194 ], [ 89707, 66640, 49980, 38446, 28194 ], [ 89707, 66640, 49980, 38446, 28194 ] ],
+      [ 889, [ 90547, 67263, 50448, 38806, 28458 ], [ 90547, 67263, 50448, 38806, 28458 ], [ 90547, 67263, 50448, 38806, 28458 ] ],
+      [ 890, [ 91395, 67893, 50920, 39169, 28724 ], [ 91395, 67893, 50920, 39169, 28724 ], [ 91395, 67893, 50920, 39169, 28724 ] ],
+      [ 891, [ 92250, 68529, 51397, 39536, 28993 ], [ 92250, 68529, 51397, 39536, 28993 ], [ 92250, 68529, 51397, 39536, 28993 ] ],
+      [ 892, [ 93114, 69170, 51878, 39906, 29264 ], [ 93114, 69170, 51878, 39906, 29264 ], [ 93114, 69170, 51878, 39906, 29264 ] ],
+      [ 893, [ 93985, 69818, 52363, 40279, 29538 ], [ 93985, 69818, 52363, 40279, 29538 ], [ 93985, 69818, 52363, 40279, 29538 ] ],
+      [ 894, [ 94865, 70471, 52853, 40656, 29815 ], [ 94865, 70471, 52853, 40656, 29815 ], [ 94865, 70471, 52853, 40656, 29815 ] ],
+      [ 895, [ 95753, 71131, 53348, 41037, 30094 ], [ 95753, 71131, 53348, 41037, 30094 ], [ 95753, 71131, 53348, 41037, 30094 ] ],
+      [ 896, [ 96650, 71797, 53848, 41421, 30376 ], [ 96650, 71797, 53848, 41421, 30376 ], [ 96650, 71797, 53848, 41421, 30376 ] ],
+      [ 897, [ 97554, 72469, 54352, 41809, 30660 ], [ 97554, 72469, 54352, 41809, 30660 ], [ 97554, 72469, 54352, 41809, 30660 ] ],
+      [ 898, [ 98467, 73147, 54860, 42200, 30947 ], [ 98467, 73147, 54860, 42200, 30947 ], [ 98467, 73147, 54860, 42200, 30947 ] ],
+      [ 899, [ 99389, 73832, 55374, 42595, 31237 ], [ 99389, 73832, 55374, 42595, 31237 ], [ 99389, 73832, 55374, 42595, 31237 ] ],
+      [ 900, [ 100320, 74523, 55892, 42994, 31529 ], [ 100320, 74523, 55892, 42994, 31529 ], [ 100320, 74523, 55892, 42994, 31529 ] ],
+      [ 901, [ 101259, 75221, 56416, 43397, 31824 ], [ 101259, 75221, 56416, 43397, 31824 ], [ 101259, 75221, 56416, 43397, 31824 ] ],
+      [ 902, [ 102207, 75925, 56944, 43803, 32122 ], [ 102207, 75925, 56944, 43803, 32122 ], [ 102207, 75925, 56944, 43803, 32122 ] ],
+      [ 903, [ 103163, 76636, 57477, 44213, 32423 ], [ 103163, 76636, 57477, 44213, 32423 ], [ 103163, 76636, 57477, 44213, 32423 ] ],
+      [ 904, [ 104129, 77353, 58015, 44627, 32726 ], [ 104129, 77353, 58015, 44627, 32726 ], [ 104129, 77353, 58015, 44627, 32726 ] ],
+      [ 905, [ 105104, 78077, 58558, 45044, 33033 ], [ 105104, 78077, 58558, 45044, 33033 ], [ 105104, 78077, 58558, 45044, 33033 ] ],
+      [ 906, [ 106088, 78808, 59106, 45466, 33342 ], [ 106088, 78808, 59106, 45466, 33342 ], [ 106088, 78808, 59106, 45466, 33342 ] ],
+      [ 907, [ 107081, 79546, 59659, 45892, 33654 ], [ 107081, 79546, 59659, 45892, 33654 ], [ 107081, 79546, 59659, 45892, 33654 ] ],
+      [ 908, [ 108083, 80290, 60218, 46321, 33969 ], [ 108083, 80290, 60218, 46321, 33969 ], [ 108083, 80290, 60218, 46321, 33969 ] ],
+      [ 909, [ 109095, 81042, 60781, 46755, 34287 ], [ 109095, 81042, 60781, 46755, 34287 ], [ 109095, 81042, 60781, 46755, 34287 ] ],
+      [ 910, [ 110116, 81801, 61350, 47193, 34608 ], [ 110116, 81801, 61350, 47193, 34608 ], [ 110116, 81801, 61350, 47193, 34608 ] ],
+      [ 911, [ 111147, 82566, 61925, 47634, 34932 ], [ 111147, 82566, 61925, 47634, 34932 ], [ 111147, 82566, 61925, 47634, 34932 ] ],
+      [ 912, [ 112187, 83339, 62504, 48080, 35259 ], [ 112187, 83339, 62504, 48080, 35259 ], [ 112187, 83339, 62504, 48080, 35259 ] ],
+      [ 913, [ 113238, 84119, 63090, 48530, 35589 ], [ 113238, 84119, 63090, 48530, 35589 ], [ 113238, 84119, 63090, 48530, 35589 ] ],
+      [ 914, [ 114298, 84907, 63680, 48985, 35922 ], [ 114298, 84907, 63680, 48985, 35922 ], [ 114298, 84907, 63680, 48985, 35922 ] ],
+      [ 915, [ 115368, 85702, 64276, 49443, 36258 ], [ 115368, 85702, 64276, 49443, 36258 ], [ 115368, 85702, 64276, 49443, 36258 ] ],
+      [ 916, [ 116447, 86504, 64878, 49906, 36598 ], [ 116447, 86504, 64878, 49906, 36598 ], [ 116447, 86504, 64878, 49906, 36598 ] ],
+      [ 917, [ 117538, 87314, 65485, 50373, 36940 ], [ 117538, 87314, 65485, 50373, 36940 ], [ 117538, 87314, 65485, 50373, 36940 ] ],
+      [ 918, [ 118638, 88131, 66098, 50845, 37286 ], [ 118638, 88131, 66098, 50845, 37286 ], [ 118638, 88131, 66098, 50845, 37286 ] ],
+      [ 919, [ 119748, 88956, 66717, 51321, 37635 ], [ 119748, 88956, 66717, 51321, 37635 ], [ 119748, 88956, 66717, 51321, 37635 ] ],
+      [ 920, [ 120869, 89789, 67341, 51801, 37988 ], [ 120869, 89789, 67341, 51801, 37988 ], [ 120869, 89789, 67341, 51801, 37988 ] ],
+      [ 921, [ 122001, 90629, 67972, 52286, 38343 ], [ 122001, 90629, 67972, 52286, 38343 ], [ 122001, 90629, 67972, 52286, 38343 ] ],
+      [ 922, [ 123143, 91478, 68608, 52776, 38702 ], [ 123143, 91478, 68608, 52776, 38702 ], [ 123143, 91478, 68608, 52776, 38702 ] ],
+      [ 923, [ 124296, 92334, 69250, 53270, 39064 ], [ 124296, 92334, 69250, 53270, 39064 ], [ 124296, 92334, 69250, 53270, 39064 ] ],
+      [ 924, [ 125459, 93198, 69899, 53768, 39430 ], [ 125459, 93198, 69899, 53768, 39430 ], [ 125459, 93198, 69899, 53768, 39430 ] ],
+      [ 925, [ 126634, 94071, 70553, 54272, 39799 ], [ 126634, 94071, 70553, 54272, 39799 ], [ 126634, 94071, 70553, 54272, 39799 ] ],
+      [ 926, [ 127819, 94951, 71213, 54780, 40172 ], [ 127819, 94951, 71213, 54780, 40172 ], [ 127819, 94951, 71213, 54780, 40172 ] ],
+      [ 927, [ 129015, 95840, 71880, 55292, 40548 ], [ 129015, 95840, 71880, 55292, 40548 ], [ 129015, 95840, 71880, 55292, 40548 ] ],
+      [ 928, [ 130223, 96737, 72553, 55810, 40927 ], [ 130223, 96737, 72553, 55810, 40927 ], [ 130223, 96737, 72553, 55810, 40927 ] ],
+      [ 929, [ 131442, 97643, 73232, 56332, 41310 ], [ 131442, 97643, 73232, 56332, 41310 ], [ 131442, 97643, 73232, 56332, 41310 ] ],
+      [ 930, [ 132673, 98557, 73918, 56860, 41697 ], [ 132673, 98557, 73918, 56860, 41697 ], [ 132673, 98557, 73918, 56860, 41697 ] ],
+      [ 931, [ 133915, 99479, 74610, 57392, 42087 ], [ 133915, 99479, 74610, 57392, 42087 ], [ 133915, 99479, 74610, 57392, 42087 ] ],
+      [ 932, [ 135168, 100411, 75308, 57929, 42481 ], [ 135168, 100411, 75308, 57929, 42481 ], [ 135168, 100411, 75308, 57929, 42481 ] ],
+      [ 933, [ 136433, 101351, 76013, 58471, 42879 ], [ 136433, 101351, 76013, 58471, 42879 ], [ 136433, 101351, 76013, 58471, 42879 ] ],
+      [ 934, [ 137711, 102299, 76725, 59019, 43280 ], [ 137711, 102299, 76725, 59019, 43280 ], [ 137711, 102299, 76725, 59019, 43280 ] ],
+      [ 935, [ 139000, 103257, 77443, 59571, 43686 ], [ 139000, 103257, 77443, 59571, 43686 ], [ 139000, 103257, 77443, 59571, 43686 ] ],
+      [ 936, [ 140301, 104224, 78168, 60129, 44095 ], [ 140301, 104224, 78168, 60129, 44095 ], [ 140301, 104224, 78168, 60129, 44095 ] ],
+      [ 937, [ 141614, 105199, 78899, 60692, 44507 ], [ 141614, 105199, 78899, 60692, 44507 ], [ 141614, 105199, 78899, 60692, 44507 ] ],
+      [ 938, [ 142940, 106184, 79638, 61260, 44924 ], [ 142940, 106184, 79638, 61260, 44924 ], [ 142940, 106184, 79638, 61260, 44924 ] ],
+      [ 939, [ 144278, 107178, 80383, 61833, 45345 ], [ 144278, 107178, 80383, 61833, 45345 ], [ 144278, 107178, 80383, 61833, 45345 ] ],
+      [ 940, [ 145629, 108181, 81136, 62412, 45769 ], [ 145629, 108181, 81136, 62412, 45769 ], [ 145629, 108181, 81136, 62412, 45769 ] ],
+      [ 941, [ 146992, 109194, 81895, 62996, 46197 ], [ 146992, 109194, 81895, 62996, 46197 ], [ 146992, 109194, 81895, 62996, 46197 ] ],
+      [ 942, [ 148368, 110216, 82662, 63586, 46630 ], [ 148368, 110216, 82662, 63586, 46630 ], [ 148368, 110216, 82662, 63586, 46630 ] ],
+      [ 943, [ 149757, 111248, 83436, 64181, 47066 ], [ 149757, 111248, 83436, 64181, 47066 ], [ 149757, 111248, 83436, 64181, 47066 ] ],
+      [ 944, [ 151159, 112289, 84217, 64782, 47507 ], [ 151159, 112289, 84217, 64782, 47507 ], [ 151159, 112289, 84217, 64782, 47507 ] ],
+      [ 945, [ 152574, 113340, 85005, 65389, 47952 ], [ 152574, 113340, 85005, 65389, 47952 ], [ 152574, 113340, 85005, 65389, 47952 ] ],
+      [ 946, [ 154002, 114401, 85801, 66001, 48401 ], [ 154002, 114401, 85801, 66001, 48401 ], [ 154002, 114401, 85801, 66001, 48401 ] ],
+      [ 947, [ 155443, 115472, 86604, 66619, 48854 ], [ 155443, 115472, 86604, 66619, 48854 ], [ 155443, 115472, 86604, 66619, 48854 ] ],
+      [ 948, [ 156899, 116553, 87415, 67242, 49311 ], [ 156899, 116553, 87415, 67242, 49311 ], [ 156899, 116553, 87415, 67242, 49311 ] ],
+      [ 949, [ 158367, 117644, 88233, 67872, 49773 ], [ 158367, 117644, 88233, 67872, 49773 ], [ 158367, 117644, 88233, 67872, 49773 ] ],
+      [ 950, [ 159850, 118746, 89059, 68507, 50238 ], [ 159850, 118746, 89059, 68507, 50238 ], [ 159850, 118746, 89059, 68507, 50238 ] ],
+      [ 951, [ 161346, 119857, 89893, 69148, 50709 ], [ 161346, 119857, 89893, 69148, 50709 ], [ 161346, 119857, 89893, 69148, 50709 ] ],
+      [ 952, [ 162856, 120979, 90734, 69796, 51183 ], [ 162856, 120979, 90734, 69796, 51183 ], [ 162856, 120979, 90734, 69796, 51183 ] ],
+      [ 953, [ 164381, 122112, 91584, 70449, 51663 ], [ 164381, 122112, 91584, 70449, 51663 ], [ 164381, 122112, 91584, 70449, 51663 ] ],
+      [ 954, [ 165920, 123255, 92441, 71108, 52146 ], [ 165920, 123255, 92441, 71108, 52146 ], [ 165920, 123255, 92441, 71108, 52146 ] ],
+      [ 955, [ 167473, 124408, 93306, 71774, 52634 ], [ 167473, 124408, 93306, 71774, 52634 ], [ 167473, 124408, 93306, 71774, 52634 ] ],
+      [ 956, [ 169041, 125573, 94180, 72446, 53127 ], [ 169041, 125573, 94180, 72446, 53127 ], [ 169041, 125573, 94180, 72446, 53127 ] ],
+      [ 957, [ 170623, 126749, 95061, 73124, 53624 ], [ 170623, 126749, 95061, 73124, 53624 ], [ 170623, 126749, 95061, 73124, 53624 ] ],
+      [ 958, [ 172220, 127935, 95951, 73809, 54126 ], [ 172220, 127935, 95951, 73809, 54126 ], [ 172220, 127935, 95951, 73809, 54126 ] ],
+      [ 959, [ 173832, 129133, 96849, 74500, 54633 ], [ 173832, 129133, 96849, 74500, 54633 ], [ 173832, 129133, 96849, 74500, 54633 ] ],
+      [ 960, [ 175460, 130341, 97756, 75197, 55144 ], [ 175460, 130341, 97756, 75197, 55144 ], [ 175460, 130341, 97756, 75197, 55144 ] ],
+      [ 961, [ 177102, 131562, 98671, 75901, 55661 ], [ 177102, 131562, 98671, 75901, 55661 ], [ 177102, 131562, 98671, 75901, 55661 ] ],
+      [ 962, [ 178760, 132793, 99595, 76611, 56182 ], [ 178760, 132793, 99595, 76611, 56182 ], [ 178760, 132793, 99595, 76611, 56182 ] ],
+      [ 963, [ 180433, 134036, 100527, 77329, 56708 ], [ 180433, 134036, 100527, 77329, 56708 ], [ 180433, 134036, 100527, 77329, 56708 ] ],
+      [ 964, [ 182122, 135291, 101468, 78052, 57238 ], [ 182122, 135291, 101468, 78052, 57238 ], [ 182122, 135291, 101468, 78052, 57238 ] ],
+      [ 965, [ 183827, 136557, 102418, 78783, 57774 ], [ 183827, 136557, 102418, 78783, 57774 ], [ 183827, 136557, 102418, 78783, 57774 ] ],
+      [ 966, [ 185548, 137836, 103377, 79521, 58315 ], [ 185548, 137836, 103377, 79521, 58315 ], [ 185548, 137836, 103377, 79521, 58315 ] ],
+      [ 967, [ 187285, 139126, 104344, 80265, 58861 ], [ 187285, 139126, 104344, 80265, 58861 ], [ 187285, 139126, 104344, 80265, 58861 ] ],
+      [ 968, [ 189038, 140428, 105321, 81016, 59412 ], [ 189038, 140428, 105321, 81016, 59412 ], [ 189038, 140428, 105321, 81016, 59412 ] ],
+      [ 969, [ 190808, 141743, 106307, 81775, 59968 ], [ 190808, 141743, 106307, 81775, 59968 ], [ 190808, 141743, 106307, 81775, 59968 ] ],
+      [ 970, [ 192594, 143070, 107302, 82540, 60529 ], [ 192594, 143070, 107302, 82540, 60529 ], [ 192594, 143070, 107302, 82540, 60529 ] ],
+      [ 971, [ 194397, 144409, 108307, 83313, 61096 ], [ 194397, 144409, 108307, 83313, 61096 ], [ 194397, 144409, 108307, 83313, 61096 ] ],
+      [ 972, [ 196216, 145761, 109321, 84093, 61668 ], [ 196216, 145761, 109321, 84093, 61668 ], [ 196216, 145761, 109321, 84093, 61668 ] ],
+      [ 973, [ 198053, 147125, 110344, 84880, 62245 ], [ 198053, 147125, 110344, 84880, 62245 ], [ 198053, 147125, 110344, 84880, 62245 ] ],
+      [ 974, [ 199907, 148502, 111377, 85675, 62828 ], [ 199907, 148502, 111377, 85675, 62828 ], [ 199907, 148502, 111377, 85675, 62828 ] ],
+      [ 975, [ 201779, 149893, 112419, 86477, 63416 ], [ 201779, 149893, 112419, 86477, 63416 ], [ 201779, 149893, 112419, 86477, 63416 ] ],
+      [ 976, [ 203667, 151296, 113472, 87286, 64010 ], [ 203667, 151296, 113472, 87286, 64010 ], [ 203667, 151296, 113472, 87286, 64010 ] ],
+      [ 977, [ 205574, 152712, 114534, 88103, 64609 ], [ 205574, 152712, 114534, 88103, 64609 ], [ 205574, 152712, 114534, 88103, 64609 ] ],
+      [ 978, [ 207498, 154142, 115606, 88928, 65214 ], [ 207498, 154142, 115606, 88928, 65214 ], [ 207498, 154142, 115606, 88928, 65214 ] ],
+      [ 979, [ 209441, 155585, 116688, 89760, 65824 ], [ 209441, 155585, 116688, 89760, 65824 ], [ 209441, 155585, 116688, 89760, 65824 ] ],
+      [ 980, [ 211401, 157041, 117781, 90601, 66440 ], [ 211401, 157041, 117781, 90601, 66440 ], [ 211401, 157041, 117781, 90601, 66440 ] ],
+      [ 981, [ 213380, 158511, 118883, 91449, 67062 ], [ 213380, 158511, 118883, 91449, 67062 ], [ 213380, 158511, 118883, 91449, 67062 ] ],
+      [ 982, [ 215378, 159995, 119996, 92305, 67690 ], [ 215378, 159995, 119996, 92305, 67690 ], [ 215378, 159995, 119996, 92305, 67690 ] ],
+      [ 983, [ 217394, 161493, 121119, 93169, 68324 ], [ 217394, 161493, 121119, 93169, 68324 ], [ 217394, 161493, 121119, 93169, 68324 ] ],
+      [ 984, [ 219429, 163004, 122253, 94041, 68963 ], [ 219429, 163004, 122253, 94041, 68963 ], [ 219429, 163004, 122253, 94041, 68963 ] ],
+      [ 985, [ 221483, 164530, 123398, 94921, 69609 ], [ 221483, 164530, 123398, 94921, 69609 ], [ 221483, 164530, 123398, 94921, 69609 ] ],
+      [ 986, [ 223556, 166070, 124553, 95810, 70261 ], [ 223556, 166070, 124553, 95810, 70261 ], [ 223556, 166070, 124553, 95810, 70261 ] ],
+      [ 987, [ 225649, 167625, 125719, 96707, 70918 ], [ 225649, 167625, 125719, 96707, 70918 ], [ 225649, 167625, 125719, 96707, 70918 ] ],
+      [ 988, [ 227761, 169194, 126896, 97612, 71582 ], [ 227761, 169194, 126896, 97612, 71582 ], [ 227761, 169194, 126896, 97612, 71582 ] ],
+      [ 989, [ 229893, 170778, 128083, 98526, 72252 ], [ 229893, 170778, 128083, 98526, 72252 ], [ 229893, 170778, 128083, 98526, 72252 ] ],
+      [ 990, [ 232045, 172377, 129282, 99448, 72929 ], [ 232045, 172377, 129282, 99448, 72929 ], [ 232045, 172377, 129282, 99448, 72929 ] ],
+      [ 991, [ 234217, 173990, 130493, 100379, 73611 ], [ 234217, 173990, 130493, 100379, 73611 ], [ 234217, 173990, 130493, 100379, 73611 ] ],
+      [ 992, [ 236410, 175619, 131714, 101319, 74300 ], [ 236410, 175619, 131714, 101319, 74300 ], [ 236410, 175619, 131714, 101319, 74300 ] ],
+      [ 993, [ 238623, 177263, 132947, 102267, 74996 ], [ 238623, 177263, 132947, 102267, 74996 ], [ 238623, 177263, 132947, 102267, 74996 ] ],
+      [ 994, [ 240857, 178922, 134192, 103224, 75698 ], [ 240857, 178922, 134192, 103224, 75698 ], [ 240857, 178922, 134192, 103224, 75698 ] ],
+      [ 995, [ 243111, 180597, 135448, 104191, 76406 ], [ 243111, 180597, 135448, 104191, 76406 ], [ 243111, 180597, 135448, 104191, 76406 ] ],
+      [ 996, [ 245387, 182288, 136716, 105166, 77122 ], [ 245387, 182288, 136716, 105166, 77122 ], [ 245387, 182288, 136716, 105166, 77122 ] ],
+      [ 997, [ 247684, 183994, 137996, 106150, 77844 ], [ 247684, 183994, 137996, 106150, 77844 ], [ 247684, 183994, 137996, 106150, 77844 ] ],
+      [ 998, [ 250003, 185716, 139287, 107144, 78572 ], [ 250003, 185716, 139287, 107144, 78572 ], [ 250003, 185716, 139287, 107144, 78572 ] ],
+      [ 999, [ 252343, 187455, 140591, 108147, 79308 ], [ 252343, 187455, 140591, 108147, 79308 ], [ 252343, 187455, 140591, 108147, 79308 ] ],
+]
+
+#SimC keeps their's here: https://code.google.com/p/simulationcraft/source/browse/engine/dbc/sc_scale_data.inc#342
+WEAPON_PROC_SCALE_POINTS = [
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #1-5
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #6-10
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #11-15
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #16-20
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #21-25
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #26-30
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #31-35
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #36-40
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #41-45
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #46-50
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #51-55
+    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000,    6.000000000000000, #56-60
+    8.000000000000000,    8.000000000000000,    8.000000000000000,    8.000000000000000,    8.000000000000000, #61-65
+    8.000000000000000,    8.000000000000000,    8.000000000000000,    8.000000000000000,    8.000000000000000, #66-70
+   16.000000000000000,   16.000000000000000,   16.000000000000000,   16.000000000000000,   16.000000000000000, #71-75
+   16.000000000000000,   16.000000000000000,   16.000000000000000,   16.000000000000000,   16.000000000000000, #76-80
+   40.000000000000000,   40.000000000000000,   40.000000000000000,   40.000000000000000,   40.000000000000000, #81-85
+  160.000000000000000,  160.000000000000000,  160.000000000000000,  160.000000000000000,  160.000000000000000, #86-90
+]
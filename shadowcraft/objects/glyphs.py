@@ -11,6 +11,9 @@ class Glyphs(object):
 
     def __getattr__(self, name):
         # Any glyph we haven't assigned a value to, we don't have.
+        if name.startswith('__'):
+            # pickle and copy look these up before allowed_glyphs is restored
+            raise AttributeError(name)
         if name in self.allowed_glyphs:
             return False
         object.__getattribute__(self, name)
@@ -2,13 +2,23 @@ from shadowcraft.core import exceptions
 from shadowcraft.objects import proc_data
 from shadowcraft.objects import class_data
 
-import sys, traceback
+# Util only holds lookup tables, so every proc shares one.
+_tools = class_data.Util()
 
 class InvalidProcException(exceptions.InvalidInputException):
     pass
 
 
 class Proc(object):
+    # Procs are created for every proc and enchant of every character the
+    # model looks at, so they use slots rather than a __dict__. The last four
+    # are written by the model itself (or by callers) and stay unset until
+    # then.
+    __slots__ = ('stat', 'stats', 'value', 'base_value', 'buffs', 'can_crit', 'duration', 'max_stacks', 'upgradable',
+                 'scaling', 'proc_name', 'proc_type', 'icd', 'type', 'source', 'proc_rate', 'trigger', 'haste_scales',
+                 'item_level', 'on_crit', 'on_procced_strikes', 'proc_rate_modifier',
+                 'uptime', 'upgrade_level', 'mh_only', 'oh_only')
+
     def __init__(self, stat, value, duration, proc_name, max_stacks=1, can_crit=True, stats=None, upgradable=False, scaling=None,
                  buffs=None, base_value=0, type='rppm', icd=0, proc_rate=1.0, trigger='all_attacks', haste_scales=False, item_level=1,
                  on_crit=False, on_procced_strikes=True, proc_rate_modifier=1., source='generic',):
@@ -39,13 +49,26 @@ class Proc(object):
         #separate method just to keep the constructor clean
         self.update_proc_value()
     
+    def __getstate__(self):
+        # Slots have no __dict__ for the older pickle protocols to fall back on.
+        return dict((name, getattr(self, name)) for name in self.__slots__ if hasattr(self, name))
+
+    def __setstate__(self, state):
+        for name, value in state.iteritems():
+            setattr(self, name, value)
+
     def update_proc_value(self):
-        tools = class_data.Util()
         #http://forums.elitistjerks.com/topic/130561-shadowcraft-for-mists-of-pandaria/page-3
         #see above for stat value initialization
         if self.source in ('trinket',):
-            for e in self.value:
-                self.value[e] = round(self.scaling * tools.get_random_prop_point(self.item_level))
+            self.value.update(self.get_values_for_item_levels([self.item_level])[0])
+
+    def get_values_for_item_levels(self, item_levels):
+        # The values the proc would have at each of the item levels, scaled
+        # in one go; only trinket values depend on the item level.
+        if self.source not in ('trinket',):
+            return [self.value for item_level in item_levels]
+        return [dict((e, round(self.scaling * point)) for e in self.value) for point in _tools.get_random_prop_points(item_levels)]
 
     def procs_off_auto_attacks(self):
         if self.trigger in ('all_attacks', 'auto_attacks', 'all_spells_and_attacks', 'all_melee_attacks'):
@@ -143,45 +166,65 @@ class Proc(object):
 
 class ProcsList(object):
     allowed_procs = proc_data.allowed_procs
+    # The order procs are returned in; sums over procs depend on it.
+    proc_order = dict((name, index) for index, name in enumerate(allowed_procs))
 
     def __init__(self, *args):
+        # The procs we have live as attributes, as before, and active_procs
+        # keeps them in allowed_procs order so lookups only go through procs
+        # we actually have. item_levels remembers the item level each proc
+        # was given, for set_proc.
+        self.active_procs = ()
+        self.item_levels = {}
         for arg in args:
             if not isinstance(arg, (list,tuple)):
                 arg = (arg,90)
             if arg[0] in self.allowed_procs:
-                proc_data = self.allowed_procs[arg[0]]
-                proc_data['item_level'] = arg[1]
-                setattr(self, arg[0], Proc(**proc_data))
+                self.set_proc(arg[0], arg[1])
             else:
                 raise InvalidProcException(_('No data for proc {proc}').format(proc=arg[0]))
 
-    def set_proc(self, proc):
-        setattr(self, proc, Proc(**self.allowed_procs[proc]))
+    def set_proc(self, proc, item_level=None):
+        # The shared proc data is copied rather than written to, so procs of
+        # one list never change with another.
+        data = dict(self.allowed_procs[proc])
+        if item_level is not None:
+            self.item_levels[proc] = item_level
+        if proc in self.item_levels:
+            data['item_level'] = self.item_levels[proc]
+        for key in ('value', 'scaling'):
+            if isinstance(data.get(key), dict):
+                data[key] = dict(data[key])
+        setattr(self, proc, Proc(**data))
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in self.allowed_procs:
+            self.update_active_procs()
+
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        if name in self.allowed_procs:
+            self.update_active_procs()
+
+    def update_active_procs(self):
+        names = [name for name in self.__dict__ if name in self.allowed_procs and self.__dict__[name]]
+        names.sort(key=self.proc_order.__getitem__)
+        # A tuple, so that snapshots of the list compare the procs by identity.
+        object.__setattr__(self, 'active_procs', tuple(self.__dict__[name] for name in names))
 
     def __getattr__(self, proc):
         # Any proc we haven't assigned a value to, we don't have.
+        if proc.startswith('__'):
+            raise AttributeError(proc)
         if proc in self.allowed_procs:
             return False
         object.__getattribute__(self, proc)
-    
-    def get_all_procs_for_stat(self, stat=None):
-        procs = []
-        for proc_name in self.allowed_procs:
-            proc = getattr(self, proc_name)
-            if proc:
-                if stat is None:
-                    procs.append(proc)
-                elif proc.stat in ('stats', 'highest', 'random') and stat in proc.value:
-                    procs.append(proc)
 
-        return procs
+    def get_all_procs_for_stat(self, stat=None):
+        if stat is None:
+            return list(self.active_procs)
+        return [proc for proc in self.active_procs if proc.stat in ('stats', 'highest', 'random') and stat in proc.value]
 
     def get_all_damage_procs(self):
-        procs = []
-        for proc_name in self.allowed_procs:
-            proc = getattr(self, proc_name)
-            if proc:
-                if proc.stat in ('spell_damage', 'physical_damage'):
-                    procs.append(proc)
-
-        return procs
+        return [proc for proc in self.active_procs if proc.stat in ('spell_damage', 'physical_damage')]
@@ -17,6 +17,11 @@ class Stats(object):
     pvp_power_rating_conversion_values = {60:7.96, 70:12.55, 80:26.11, 85:79.12, 90:400.0, 100:800}
     pvp_resil_rating_conversion_values = {60:9.29, 70:14.65, 80:30.46, 85:92.31, 90:310.0, 100:600}
 
+    # The stats that are plain numbers; batches of characters (see
+    # DamageCalculator.get_dps_for_characters) set them directly.
+    stat_names = ('str', 'agi', 'int', 'spirit', 'stam', 'ap', 'crit', 'haste', 'mastery', 'readiness', 'multistrike',
+                  'pvp_power', 'pvp_resil')
+
     def __init__(self, mh, oh, procs, gear_buffs, str=0, agi=0, int=0, spirit=0, stam=0, ap=0, crit=0, haste=0, mastery=0, 
                  readiness=0, multistrike=0, level=None, pvp_power=0, pvp_resil=0, pvp_target_armor=None):
         # This will need to be adjusted if at any point we want to support
@@ -127,7 +132,13 @@ class Weapon(object):
             if self.is_melee():
                 if enchant in self.allowed_melee_enchants:
                     self.del_enchant()
-                    proc = procs.Proc(**self.allowed_melee_enchants[enchant])
+                    # Copied, like ProcsList.set_proc, so that weapons
+                    # never share an enchant proc.
+                    data = dict(self.allowed_melee_enchants[enchant])
+                    for key in ('value', 'scaling'):
+                        if isinstance(data.get(key), dict):
+                            data[key] = dict(data[key])
+                    proc = procs.Proc(**data)
                     setattr(self, enchant, proc)
                 else:
                     raise exceptions.InvalidInputException(_('Enchant {enchant} is not allowed.').format(enchant=enchant))
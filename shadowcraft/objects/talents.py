@@ -22,6 +22,9 @@ class Talents(object):
     def __getattr__(self, name):
         # If someone tries to access a talent not initialized (the talent
         # string was shorter than 6) we return False
+        if name.startswith('__'):
+            # pickle and copy look these up before allowed_talents is restored
+            raise AttributeError(name)
         if name in self.allowed_talents:
             return False
         object.__getattribute__(self, name)
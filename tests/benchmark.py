@@ -0,0 +1,158 @@
+# Timings of the rogue models' public methods on the reference characters of
+# the tests, for catching performance regressions before they ship.
+#
+#     python benchmark.py --output results.json
+#     python benchmark.py --baseline results.json --threshold .2
+#
+# Every benchmark is warmed up, then timed repeat times over enough calls to
+# take at least min_time seconds; the median time per call is what's
+# compared. With a baseline, benchmarks that got slower by more than the
+# threshold are listed and the exit status is 1. Run it from this directory.
+import json
+import optparse
+import platform
+import sys
+import time
+import timeit
+from os import path
+
+sys.path.append(path.abspath(path.join(path.dirname(__file__), '..')))
+
+from shadowcraft.calcs.darkmantle import DarkmantleCalculator
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+specs = ('assassination', 'combat', 'subtlety')
+
+upgrade_procs = ['assurance_of_consequence', 'haromms_talisman']
+
+
+def run_darkmantle_fight(calculator):
+    # Simulates one 300 s fight. The spec setup is only done on the first
+    # call, which is a warmup call, so the timings are of the fight alone.
+    if calculator.settings.duration != 300:
+        calculator.settings.duration = 300
+        init_spec, dps_estimate, dps_breakdown = calculator.get_spec_functions()
+        init_spec()
+    calculator.get_fight(calculator.base_stats, calculator.get_crit_rates(calculator.base_stats), 0).run()
+
+benchmarks = [
+    ('get_dps', lambda calculator: calculator.get_dps()),
+    ('get_dps_breakdown', lambda calculator: calculator.get_dps_breakdown()),
+    ('get_ep', lambda calculator: calculator.get_ep()),
+    ('get_weapon_ep', lambda calculator: calculator.get_weapon_ep(dps=True, enchants=True)),
+    ('get_upgrades_ep', lambda calculator: calculator.get_upgrades_ep(upgrade_procs)),
+    ('get_upgrades_ep_fast', lambda calculator: calculator.get_upgrades_ep_fast(upgrade_procs)),
+    ('get_other_ep', lambda calculator: calculator.get_other_ep(['rogue_t16_2pc', 'rogue_t16_4pc'])),
+    ('get_glyphs_ranking', lambda calculator: calculator.get_glyphs_ranking()),
+    ('get_talents_ranking', lambda calculator: calculator.get_talents_ranking()),
+    ('darkmantle_fight', run_darkmantle_fight),
+]
+
+# Benchmarks that need a calculator other than the Aldriana one.
+calculator_classes = {'darkmantle_fight': DarkmantleCalculator}
+
+
+def time_benchmark(function, calculator, warmup=2, repeat=5, min_time=.05):
+    # Returns {'calls', 'min', 'median', 'max'}, the times in seconds per
+    # call.
+    for i in xrange(warmup):
+        function(calculator)
+    timer = timeit.Timer(lambda: function(calculator))
+    calls = 1
+    while True:
+        elapsed = timer.timeit(calls)
+        if elapsed >= min_time:
+            break
+        calls *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    timings = sorted([elapsed] + timer.repeat(repeat - 1, calls))
+    timings = [timing / calls for timing in timings]
+    return {'calls': calls, 'min': timings[0], 'median': timings[len(timings) // 2], 'max': timings[-1]}
+
+
+def run(warmup=2, repeat=5, min_time=.05, selected=None):
+    # {spec: {benchmark: timings}}, with {'error': message} for benchmarks the
+    # model raised on. selected, if given, is a list of benchmark names.
+    results = {}
+    for spec in specs:
+        results[spec] = {}
+        for name, function in benchmarks:
+            if selected and name not in selected:
+                continue
+            if name in calculator_classes:
+                calculator = build_calculator(spec, calculator_classes[name])
+            else:
+                calculator = build_calculator(spec)
+            try:
+                results[spec][name] = time_benchmark(function, calculator, warmup, repeat, min_time)
+            except Exception as e:
+                results[spec][name] = {'error': '{kind}: {message}'.format(kind=type(e).__name__, message=e)}
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold=.2):
+    # Returns (spec, benchmark, baseline median, median) for the benchmarks
+    # more than threshold slower than in the baseline, and those that raise
+    # now but didn't then.
+    regressions = []
+    for spec, timings in sorted(report['results'].items()):
+        for name, timing in sorted(timings.items()):
+            old_timing = baseline['results'].get(spec, {}).get(name)
+            if old_timing is None or 'error' in old_timing:
+                continue
+            if 'error' in timing:
+                regressions.append((spec, name, old_timing['median'], None))
+            elif timing['median'] > old_timing['median'] * (1 + threshold):
+                regressions.append((spec, name, old_timing['median'], timing['median']))
+    return regressions
+
+
+def main(argv=None):
+    parser = optparse.OptionParser(description='Time the rogue models.')
+    parser.add_option('--output', help='write the results to this JSON file')
+    parser.add_option('--baseline', help='compare against the results in this JSON file')
+    parser.add_option('--threshold', type='float', default=.2, help='slowdown that counts as a regression (default .2)')
+    parser.add_option('--warmup', type='int', default=2)
+    parser.add_option('--repeat', type='int', default=5)
+    parser.add_option('--min-time', type='float', default=.05, help='seconds each timing runs for at least')
+    parser.add_option('--benchmark', action='append', help='only run this benchmark (can be repeated)')
+    args, positional = parser.parse_args(argv)
+    if positional:
+        parser.error('unexpected arguments: {arguments}'.format(arguments=' '.join(positional)))
+
+    report = run(args.warmup, args.repeat, args.min_time, args.benchmark)
+    for spec in specs:
+        for name, function in benchmarks:
+            timing = report['results'][spec].get(name)
+            if timing is None:
+                continue
+            if 'error' in timing:
+                print '{spec:14} {name:22} {error}'.format(spec=spec, name=name, error=timing['error'])
+            else:
+                print '{spec:14} {name:22} {median:10.3f} ms'.format(spec=spec, name=name, median=timing['median'] * 1000)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.threshold)
+        for spec, name, old_median, median in regressions:
+            if median is None:
+                print 'REGRESSION {spec} {name}: now raises'.format(spec=spec, name=name)
+            else:
+                print 'REGRESSION {spec} {name}: {old:.3f} ms -> {new:.3f} ms'.format(
+                    spec=spec, name=name, old=old_median * 1000, new=median * 1000)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import unittest
+from shadowcraft.calcs.rogue.Aldriana import AldrianasRogueDamageCalculator
+from shadowcraft.calcs.rogue.Aldriana import settings
+from shadowcraft.objects import buffs
+from shadowcraft.objects import race
+from shadowcraft.objects import stats
+from shadowcraft.objects import procs
+from shadowcraft.objects import talents
+from shadowcraft.objects import glyphs
+
+test_buffs = ('short_term_haste_buff', 'stat_multiplier_buff', 'crit_chance_buff', 'mastery_buff', 'haste_buff',
+              'attack_power_buff', 'armor_debuff', 'physical_vulnerability_debuff', 'spell_damage_debuff',
+              'agi_flask_mop', 'food_300_agi')
+
+def build_calculator(spec, calculator_class=AldrianasRogueDamageCalculator):
+    if spec == 'combat':
+        mh = stats.Weapon(18846.0, 2.6, 'axe', 'dancing_steel')
+        oh = stats.Weapon(18846.0, 2.6, 'axe', 'dancing_steel')
+        cycle = settings.CombatCycle(revealing_strike_pooling=True, blade_flurry=False)
+        talent_string = '3322131'
+        opener = 'ambush'
+    elif spec == 'subtlety':
+        mh = stats.Weapon(13047.0, 1.8, 'dagger', 'dancing_steel')
+        oh = stats.Weapon(13047.0, 1.8, 'dagger', 'dancing_steel')
+        cycle = settings.SubtletyCycle(5, use_hemorrhage='never')
+        talent_string = '3222121'
+        opener = 'default'
+    else:
+        mh = stats.Weapon(13047.0, 1.8, 'dagger', 'dancing_steel')
+        oh = stats.Weapon(13047.0, 1.8, 'dagger', 'dancing_steel')
+        cycle = settings.AssassinationCycle()
+        talent_string = '122213'
+        opener = 'envenom'
+    test_procs = procs.ProcsList(('assurance_of_consequence', 580), ('haromms_talisman', 580), 'legendary_capacitive_meta', 'fury_of_xuen')
+    test_gear_buffs = stats.GearBuffs('rogue_t16_2pc', 'rogue_t16_4pc', 'leather_specialization')
+    test_stats = stats.Stats(mh, oh, test_procs, test_gear_buffs, str=80, agi=27882, stam=35869, crit=3851,
+                             haste=18871, mastery=8574, readiness=6000, multistrike=6000)
+    test_settings = settings.Settings(cycle, response_time=.5, duration=360, dmg_poison='dp', utl_poison='lp',
+                                      opener_name=opener)
+    return calculator_class(test_stats, talents.Talents(talent_string, 'rogue', 90),
+                            glyphs.Glyphs('rogue', 'energy', 'disappearance'), buffs.Buffs(*test_buffs),
+                            race.Race('troll'), test_settings, 90)
+
+class TestAldrianasBatchedEP(unittest.TestCase):
+    deltas = [{}, {'agi': 1.}, {'haste': 1.}, {'mastery': 1.}, {'readiness': 1.}, {'ap': 1., 'crit': 1.}]
+
+    def assertBatchMatches(self, spec):
+        calculator = build_calculator(spec)
+        batched = calculator.get_dps_for_stat_deltas(self.deltas)
+        generic = super(AldrianasRogueDamageCalculator, calculator).get_dps_for_stat_deltas(self.deltas)
+        for batched_dps, generic_dps in zip(batched, generic):
+            self.assertAlmostEqual(batched_dps, generic_dps, places=6)
+
+    def test_combat(self):
+        self.assertBatchMatches('combat')
+
+    def test_subtlety(self):
+        self.assertBatchMatches('subtlety')
+
+    def test_assassination(self):
+        self.assertBatchMatches('assassination')
+
+    def test_repeated_dps_is_stable(self):
+        for spec in ('combat', 'subtlety', 'assassination'):
+            calculator = build_calculator(spec)
+            self.assertAlmostEqual(calculator.get_dps(), calculator.get_dps(), places=6)
+
+    def test_stats_restored(self):
+        calculator = build_calculator('combat')
+        agi = calculator.stats.agi
+        calculator.get_ep()
+        self.assertEqual(calculator.stats.agi, agi)
+
+class TestAldrianasGradientEP(unittest.TestCase):
+    def test_matches_finite_differences(self):
+        for spec in ('combat', 'subtlety', 'assassination'):
+            calculator = build_calculator(spec)
+            finite_differences = calculator.get_ep()
+            gradient = calculator.get_ep(gradient=True)
+            self.assertEqual(set(finite_differences), set(gradient))
+            for stat in gradient:
+                self.assertAlmostEqual(finite_differences[stat], gradient[stat], places=3)
+
+    def test_dps_is_real(self):
+        calculator = build_calculator('combat')
+        dps, gradient = calculator.get_dps_gradient(['agi', 'haste'])
+        self.assertTrue(isinstance(dps, float))
+        self.assertAlmostEqual(dps, calculator.get_dps(), places=6)
+        self.assertTrue(isinstance(calculator.base_stats['agi'], (int, float)))
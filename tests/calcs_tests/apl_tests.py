@@ -0,0 +1,84 @@
+import unittest
+from shadowcraft.calcs.darkmantle import DarkmantleCalculator
+from shadowcraft.calcs.darkmantle import apl
+from shadowcraft.calcs.darkmantle import engine
+from shadowcraft.calcs.darkmantle import rogue
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestFight(engine.Fight):
+    apl_expressions = dict(engine.Fight.apl_expressions, **{'five': lambda fight, time: 5})
+
+class TestParser(unittest.TestCase):
+    def evaluate(self, condition, time=0.):
+        fight = TestFight(10., 0, 100., 10., 1., 2., 2., 1., 1.)
+        fight.resources.combo_points = 3
+        fight.auras.apply('slice_and_dice', 0., 4.)
+        fight.cooldowns['vanish'] = 20.
+        return apl.Parser(condition, fight.apl_expressions).parse()(fight, time)
+
+    def test_arithmetic(self):
+        self.assertEqual(self.evaluate('1+2*3'), 7)
+        self.assertEqual(self.evaluate('(1+2)*3'), 9)
+        self.assertEqual(self.evaluate('five-combo_points/3'), 4)
+        self.assertEqual(self.evaluate('energy_deficit'), 0)
+
+    def test_logic(self):
+        self.assertTrue(self.evaluate('combo_points>=3&energy=100'))
+        self.assertFalse(self.evaluate('combo_points>3|!energy'))
+        self.assertTrue(self.evaluate('!(combo_points<2|five!=5)'))
+
+    def test_state(self):
+        self.assertTrue(self.evaluate('aura.slice_and_dice.up'))
+        self.assertEqual(self.evaluate('aura.slice_and_dice.remains', 1.), 3.)
+        self.assertFalse(self.evaluate('aura.rupture.up'))
+        self.assertEqual(self.evaluate('aura.slice_and_dice.stack'), 1)
+        self.assertEqual(self.evaluate('cooldown.vanish.remains', 5.), 15.)
+        self.assertFalse(self.evaluate('cooldown.vanish.ready', 5.))
+        self.assertTrue(self.evaluate('cooldown.shadowmeld.ready'))
+
+    def test_errors(self):
+        for condition in ('combo_points>', 'aura.rupture', '(energy', 'energy$', 'speed>1', 'energy energy'):
+            self.assertRaises(apl.InvalidPriorityListException, lambda: apl.Parser(condition, TestFight.apl_expressions).parse())
+
+class TestPriorityList(unittest.TestCase):
+    combat = '''
+        # The combat rotation, as CombatFight.get_priority_list builds it.
+        adrenaline_rush
+        vanish,if=!stealthed
+        ambush,if=stealthed
+        slice_and_dice,if=!aura.slice_and_dice.up&combo_points>0|aura.slice_and_dice.remains<3&combo_points>=4
+        killing_spree
+        revealing_strike,if=combo_points<5&!aura.revealing_strike.up
+        eviscerate,if=combo_points>=5
+        sinister_strike
+    '''
+
+    def test_compile(self):
+        priority_list = apl.compile_priority_list(self.combat, rogue.CombatFight)
+        self.assertEqual([name for name, condition in priority_list][:3], ['adrenaline_rush', 'vanish', 'ambush'])
+        self.assertEqual(priority_list[0][1], None)
+        self.assertEqual(priority_list, apl.compile_priority_list(self.combat, rogue.CombatFight))
+        self.assertRaises(apl.InvalidPriorityListException, apl.compile_priority_list, 'eviscerate,when=combo_points>4', rogue.CombatFight)
+        self.assertRaises(apl.InvalidPriorityListException, apl.compile_priority_list, 'eviscerate,if=execute_phase', rogue.CombatFight)
+
+    def test_cache_is_bounded(self):
+        priority_list = apl.compile_priority_list(self.combat, rogue.CombatFight)
+        for i in xrange(2 * apl.max_compiled):
+            apl.compile_priority_list('eviscerate,if=combo_points>={0}'.format(i), rogue.CombatFight)
+            # The recently used list stays compiled.
+            self.assertTrue(apl.compile_priority_list(self.combat, rogue.CombatFight)[1][1] is priority_list[1][1])
+        self.assertEqual(len(apl._compiled), apl.max_compiled)
+
+    def test_matches_default_rotation(self):
+        calculator = build_calculator('combat', DarkmantleCalculator)
+        dps = calculator.get_dps()
+        calculator.priority_list = self.combat
+        self.assertEqual(calculator.get_dps(), dps)
+
+    def test_variant(self):
+        calculator = build_calculator('combat', DarkmantleCalculator)
+        dps = calculator.get_dps()
+        calculator.priority_list = self.combat.replace('killing_spree\n', '')
+        self.assertTrue(calculator.get_dps() < dps)
+        calculator.priority_list = 'adrenaline_rush\nshadow_dance'
+        self.assertRaises(engine.InvalidInputException, calculator.get_dps)
@@ -0,0 +1,22 @@
+import unittest
+import benchmark
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestBenchmark(unittest.TestCase):
+    def report(self, **timings):
+        return {'results': {'combat': dict((name, {'error': timing} if isinstance(timing, str) else {'median': timing})
+                                           for name, timing in timings.items())}}
+
+    def test_compare(self):
+        baseline = self.report(get_dps=1., get_ep=1., get_weapon_ep=1., get_upgrades_ep='AttributeError')
+        report = self.report(get_dps=1.1, get_ep=1.3, get_weapon_ep='ValueError', get_upgrades_ep=2., get_other_ep=5.)
+        self.assertEqual(benchmark.compare(report, baseline, .2), [('combat', 'get_ep', 1., 1.3), ('combat', 'get_weapon_ep', 1., None)])
+        self.assertEqual(benchmark.compare(report, baseline, .5), [('combat', 'get_weapon_ep', 1., None)])
+
+    def test_time_benchmark(self):
+        calls = []
+        timing = benchmark.time_benchmark(lambda calculator: calls.append(calculator.get_dps()), build_calculator('subtlety'),
+                                          warmup=1, repeat=3, min_time=.001)
+        self.assertTrue(timing['min'] <= timing['median'] <= timing['max'])
+        self.assertTrue(len(calls) >= 1 + 3 * timing['calls'])
+        self.assertEqual(len(set(calls)), 1)
@@ -0,0 +1,90 @@
+import unittest
+from shadowcraft.core import exceptions
+from shadowcraft.objects import buffs
+from shadowcraft.objects import race
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestCharacterBatch(unittest.TestCase):
+    characters = [{}, {'haste': 15000., 'mastery': 9000.}, {'agi': 30000., 'crit': 2000.}, {'readiness': 4000., 'haste': 20000.}]
+
+    def assertBatchMatches(self, spec):
+        calculator = build_calculator(spec)
+        dps = calculator.get_dps()
+        batched = calculator.get_dps_for_characters(self.characters)
+        for character, batched_dps in zip(self.characters, batched):
+            single = build_calculator(spec)
+            for stat, value in character.items():
+                setattr(single.stats, stat, value)
+            self.assertAlmostEqual(batched_dps, single.get_dps(), places=6)
+        self.assertAlmostEqual(calculator.get_dps(), dps)
+
+    def test_combat(self):
+        self.assertBatchMatches('combat')
+
+    def test_subtlety(self):
+        self.assertBatchMatches('subtlety')
+
+    def test_assassination(self):
+        self.assertBatchMatches('assassination')
+
+    def test_processes(self):
+        calculator = build_calculator('combat')
+        self.assertEqual(calculator.get_dps_for_characters(self.characters), calculator.get_dps_for_characters(self.characters, processes=2))
+
+    def test_unknown_stat(self):
+        calculator = build_calculator('combat')
+        self.assertRaises(exceptions.InvalidInputException, calculator.get_dps_for_characters, [{'not_a_stat': 1.}])
+
+class TestCharacterInputs(unittest.TestCase):
+    def get_character(self, spec, **changes):
+        # The inputs build_calculator gives spec, with changes to them or to
+        # the values of the stats.
+        test_stats, test_talents, test_glyphs, test_buffs, test_race, test_settings, level = build_calculator(spec, calculator_class=lambda *args: args)
+        character = {'stats': test_stats, 'talents': test_talents, 'glyphs': test_glyphs, 'buffs': test_buffs, 'race': test_race}
+        for name, value in changes.items():
+            if name in character:
+                character[name] = value
+            else:
+                setattr(test_stats, name, value)
+        return character
+
+    def get_single_dps(self, spec, character):
+        calculator = build_calculator(spec)
+        return calculator.__class__(character['stats'], character['talents'], character['glyphs'], character['buffs'],
+                                    character['race'], calculator.settings, 90).get_dps()
+
+    def get_characters(self, spec):
+        # Three groups: the base inputs, pandaren (whose food is added when
+        # their calculator is built) and other buffs.
+        return [self.get_character(spec), self.get_character(spec, haste=15000.),
+                dict(self.get_character(spec), mastery=9000.),
+                self.get_character(spec, race=race.Race('pandaren')),
+                self.get_character(spec, race=race.Race('pandaren'), agi=30000.),
+                self.get_character(spec, buffs=buffs.Buffs('agi_flask_mop', 'food_300_agi'))]
+
+    def test_matches_single_characters(self):
+        for spec in ('combat', 'assassination'):
+            calculator = build_calculator(spec)
+            dps = calculator.get_dps()
+            batched = calculator.get_dps_for_characters(self.get_characters(spec))
+            for character, batched_dps in zip(self.get_characters(spec), batched):
+                if 'mastery' in character:
+                    character['stats'].mastery = character.pop('mastery')
+                self.assertAlmostEqual(batched_dps, self.get_single_dps(spec, character), places=6)
+            self.assertAlmostEqual(calculator.get_dps(), dps)
+
+    def test_processes(self):
+        calculator = build_calculator('combat')
+        self.assertEqual(calculator.get_dps_for_characters(self.get_characters('combat')),
+                         calculator.get_dps_for_characters(self.get_characters('combat'), processes=2))
+
+    def test_groups(self):
+        calculator = build_calculator('combat')
+        characters = [{}, self.get_character('combat'), self.get_character('combat', haste=15000.),
+                      self.get_character('combat', race=race.Race('pandaren')), {'agi': 30000.}]
+        groups = calculator.group_characters(characters)
+        self.assertEqual([indices for inputs, indices in groups], [[0, 4], [1, 2], [3]])
+
+    def test_inputs_need_stats(self):
+        calculator = build_calculator('combat')
+        self.assertRaises(exceptions.InvalidInputException, calculator.get_dps_for_characters, [{'race': race.Race('pandaren')}])
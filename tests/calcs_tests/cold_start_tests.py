@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Run in a fresh interpreter: imports the calculator, builds a combat rogue
+# and calls get_dps once, then prints the time that took and the modules it
+# left loaded.
+cold_start_script = '''
+import sys
+import time
+start = time.time()
+from shadowcraft.calcs.rogue.Aldriana import AldrianasRogueDamageCalculator
+from shadowcraft.calcs.rogue.Aldriana import settings
+from shadowcraft.objects import buffs, glyphs, procs, race, stats, talents
+imported = time.time() - start
+mh = stats.Weapon(18846.0, 2.6, 'axe', 'dancing_steel')
+oh = stats.Weapon(18846.0, 2.6, 'axe', 'dancing_steel')
+test_stats = stats.Stats(mh, oh, procs.ProcsList('fury_of_xuen'), stats.GearBuffs('leather_specialization'),
+                         agi=27882, crit=3851, haste=18871, mastery=8574, readiness=6000, multistrike=6000)
+test_settings = settings.Settings(settings.CombatCycle(), response_time=.5, duration=360)
+calculator = AldrianasRogueDamageCalculator(test_stats, talents.Talents('3322131', 'rogue', 90),
+                                            glyphs.Glyphs('rogue'), buffs.Buffs('agi_flask_mop'),
+                                            race.Race('troll'), test_settings, 90)
+calculator.get_dps()
+print imported, time.time() - start
+print ' '.join(sorted(name for name, module in sys.modules.items() if module is not None))
+'''
+
+class TestColdStart(unittest.TestCase):
+    # Seconds, generous enough for a slow machine compiling the package
+    # without cached bytecode; a cold start takes a few tens of ms.
+    import_budget = .5
+    first_dps_budget = 1.
+    # Only needed for process pools, translations, or rebuilding stale
+    # tables, so a plain get_dps mustn't load them.
+    deferred_modules = ['multiprocessing', 'gettext', 'locale', 'hashlib', 'sqlite3',
+                        'shadowcraft.objects.class_data_tables', 'shadowcraft.calcs.darkmantle']
+
+    def run_cold_start(self):
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        environment = dict(os.environ, PYTHONPATH=root)
+        process = subprocess.Popen([sys.executable, '-c', cold_start_script], cwd=root, env=environment,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        output, errors = process.communicate()
+        self.assertEqual(process.returncode, 0, errors)
+        timings, modules = output.splitlines()
+        imported, first_dps = [float(timing) for timing in timings.split()]
+        return imported, first_dps, set(modules.split())
+
+    def test_budget(self):
+        imported, first_dps, modules = self.run_cold_start()
+        self.assertTrue(imported < self.import_budget, imported)
+        self.assertTrue(first_dps < self.first_dps_budget, first_dps)
+
+    def test_deferred_modules(self):
+        imported, first_dps, modules = self.run_cold_start()
+        for name in self.deferred_modules:
+            self.assertFalse(name in modules, name)
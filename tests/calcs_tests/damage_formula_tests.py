@@ -0,0 +1,38 @@
+import unittest
+from shadowcraft.calcs.rogue.Aldriana import settings
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestDamageFormulas(unittest.TestCase):
+    def setUp(self):
+        self.calculator = build_calculator('subtlety')
+
+    def test_finisher_coefficients(self):
+        for cp in xrange(1, 6):
+            self.assertEqual(self.calculator.eviscerate_damage(1000., cp), .18 * cp * 1000.)
+            self.assertEqual(self.calculator.envenom_damage(1000., cp), .134 * cp * 1000.)
+            self.assertEqual(self.calculator.crimson_tempest_damage(1000., cp), .0275 * cp * 1000.)
+        self.assertEqual(self.calculator.rupture_tick_damage(1000., 5), 62.)
+        self.assertRaises(IndexError, self.calculator.rupture_tick_damage, 1000., 6)
+
+    def test_get_formula(self):
+        self.assertEqual(self.calculator.get_formula('backstab')(1000.), self.calculator.backstab_damage(1000.))
+        self.assertEqual(self.calculator.get_formula('deadly_poison')(1000.), self.calculator.deadly_poison_tick_damage(1000.))
+        self.assertRaises(KeyError, self.calculator.get_formula, 'rupture')
+
+    def test_tick_damage(self):
+        self.assertEqual(self.calculator.hemorrhage_tick_damage(1000.), self.calculator.hemorrhage_damage(1000.) * .5 / 8)
+        self.assertAlmostEqual(self.calculator.crimson_tempest_tick_damage(1000., 5), .0275 * 5 * 1000. * .4)
+        self.assertEqual(self.calculator.mh_shuriken(1000.), .75 * self.calculator.mh_damage(1000.))
+        self.assertEqual(self.calculator.oh_shuriken(1000.), .75 * self.calculator.oh_damage(1000.))
+
+    def test_finisher_dps(self):
+        frequencies = [0, .01, 0, .02, 0, .1]
+        dps = self.calculator.get_finisher_dps(self.calculator.eviscerate_coefficients, 1000., 1.1, 1.2, .3, frequencies, 2.)
+        expected = sum(self.calculator.get_dps_contribution(self.calculator.eviscerate_damage(1000., cp) * 1.1 * 1.2, .3, frequencies[cp], 2.)
+                       for cp in xrange(1, 6))
+        self.assertAlmostEqual(dps, expected)
+
+    def test_hemorrhage_dot(self):
+        self.calculator.settings.cycle = settings.SubtletyCycle(5, use_hemorrhage='always')
+        breakdown = self.calculator.get_dps_breakdown()
+        self.assertTrue(breakdown['hemorrhage_dot'] > 0)
@@ -0,0 +1,155 @@
+import unittest
+from shadowcraft.calcs.darkmantle import DarkmantleCalculator
+from shadowcraft.calcs.darkmantle import engine
+from shadowcraft.calcs.darkmantle import montecarlo
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestEngine(unittest.TestCase):
+    def test_event_order(self):
+        events = engine.EventQueue()
+        order = []
+        events.push(2., lambda time, data: order.append(data), 'c')
+        events.push(1., lambda time, data: order.append(data), 'a')
+        events.push(1., lambda time, data: order.append(data), 'b')
+        while events:
+            time, sequence, handler, data = events.pop()
+            handler(time, data)
+        self.assertEqual(order, ['a', 'b', 'c'])
+
+    def test_energy(self):
+        resources = engine.Resources(100., 10.)
+        resources.spend_energy(0., 60.)
+        self.assertAlmostEqual(resources.time_until_energy(1., 70.), 2.)
+        self.assertAlmostEqual(resources.get_energy(10.), 100.)
+        self.assertAlmostEqual(resources.wasted_energy, 40.)
+
+    def test_combo_points(self):
+        resources = engine.Resources(100., 10., anticipation=True)
+        resources.gain_combo_points(4)
+        resources.gain_combo_points(3)
+        self.assertEqual(resources.spend_combo_points(), 5)
+        self.assertEqual(resources.combo_points, 2)
+        resources = engine.Resources(100., 10.)
+        resources.gain_combo_points(7)
+        self.assertEqual(resources.spend_combo_points(), 5)
+        self.assertEqual(resources.combo_points, 0)
+        self.assertEqual(resources.wasted_combo_points, 2)
+
+    def test_aura_uptime(self):
+        auras = engine.Auras(('buff',))
+        auras.apply('buff', 0., 10.)
+        auras.apply('buff', 5., 10.)
+        self.assertTrue(auras.is_up('buff', 14.))
+        self.assertFalse(auras.is_up('buff', 17.))
+        auras.apply('buff', 20., 10.)
+        self.assertAlmostEqual(auras.remaining('buff', 25.), 5.)
+        self.assertAlmostEqual(auras.get_uptime('buff', 28.), 23.)
+
+class TestDarkmantleCalculator(unittest.TestCase):
+    # Over seeds 0 to 7 the simulated dps of the test characters comes out
+    # 4-8% above the closed-form model for combat, within 1% for subtlety
+    # and 1-4% below for assassination; the bounds leave a couple of points
+    # over that.
+    def assertCloseToAldriana(self, spec, low, high):
+        simulated = build_calculator(spec, DarkmantleCalculator).get_dps()
+        closed_form = build_calculator(spec).get_dps()
+        self.assertTrue(low < simulated / closed_form - 1 < high, simulated / closed_form - 1)
+
+    def test_combat(self):
+        self.assertCloseToAldriana('combat', .02, .1)
+
+    def test_subtlety(self):
+        self.assertCloseToAldriana('subtlety', -.03, .03)
+
+    def test_assassination(self):
+        self.assertCloseToAldriana('assassination', -.06, .01)
+
+    def test_seeded(self):
+        calculator = build_calculator('combat', DarkmantleCalculator)
+        self.assertEqual(calculator.get_dps_breakdown(), calculator.get_dps_breakdown())
+        dps = calculator.get_dps()
+        calculator.seed = 1
+        self.assertNotEqual(calculator.get_dps(), dps)
+
+    def test_mutilate_draws(self):
+        # Mutilate draws once per hand whatever the rolls, so the streams of
+        # fights with the same seed stay paired.
+        calculator = build_calculator('assassination', DarkmantleCalculator)
+        init_spec, dps_estimate, dps_breakdown = calculator.get_spec_functions()
+        init_spec()
+        crit_rates = calculator.get_crit_rates(calculator.base_stats)
+        fights = []
+        for crit_rate in (0., 1.):
+            fight = calculator.get_fight(calculator.base_stats, dict(crit_rates, mutilate=crit_rate), 0)
+            fight.mutilate(0.)
+            fights.append(fight)
+        fresh = calculator.get_fight(calculator.base_stats, crit_rates, 0)
+        for stream in ('mh_mutilate', 'oh_mutilate'):
+            fresh.streams[stream].random()
+            expected = fresh.streams[stream].random()
+            self.assertEqual([fight.streams[stream].random() for fight in fights], [expected, expected])
+
+class TestDarkmantleMonteCarlo(unittest.TestCase):
+    def test_matches_single_fights(self):
+        calculator = build_calculator('subtlety', DarkmantleCalculator)
+        result = calculator.get_dps_distribution(iterations=4, batch_size=2)
+        dps_values = []
+        for seed in xrange(4):
+            calculator.seed = seed
+            dps_values.append(calculator.get_dps())
+        self.assertEqual(result['iterations'], 4)
+        self.assertAlmostEqual(result['dps'], sum(dps_values) / 4, places=6)
+        low, high = result['interval']
+        self.assertTrue(low < result['dps'] < high)
+        for source, (mean, low, high) in result['breakdown'].items():
+            self.assertTrue(low <= mean <= high)
+        self.assertAlmostEqual(sum(mean for mean, low, high in result['breakdown'].values()), result['dps'], places=6)
+
+    def test_z_scores(self):
+        self.assertAlmostEqual(montecarlo.get_z_score(.95), 1.959964, places=6)
+        self.assertAlmostEqual(montecarlo.get_z_score(.99), 2.575829, places=6)
+        self.assertAlmostEqual(montecarlo.get_z_score(.5), .674490, places=6)
+        self.assertEqual(montecarlo.get_z_score(0.), 0.)
+
+    def test_early_stopping(self):
+        calculator = build_calculator('combat', DarkmantleCalculator)
+        result = calculator.get_dps_distribution(iterations=400, target_error=.01, batch_size=10)
+        self.assertEqual(result['iterations'], 10)
+        self.assertTrue(result['standard_error'] <= .01 * result['dps'])
+
+    def test_processes(self):
+        calculator = build_calculator('assassination', DarkmantleCalculator)
+        self.assertEqual(calculator.get_dps_distribution(iterations=6, batch_size=3),
+                         calculator.get_dps_distribution(iterations=6, batch_size=3, processes=2))
+
+class TestDarkmantleScaleFactors(unittest.TestCase):
+    def test_random_streams(self):
+        streams = engine.RandomStreams(3)
+        self.assertEqual(streams['a'].random(), engine.RandomStreams(3)['a'].random())
+        self.assertNotEqual(streams['a'].random(), streams['b'].random())
+
+    def test_paired_differences(self):
+        # The same seeds with and without the extra agility should differ by
+        # much less than fights with different seeds.
+        calculator = build_calculator('combat', DarkmantleCalculator)
+        rows = calculator.get_paired_dps([{}, {'agi': 100.}], range(4))
+        paired = [agi - base for base, agi in rows]
+        unpaired = [rows[i][1] - rows[i - 1][0] for i in xrange(4)]
+        self.assertTrue(max(paired) - min(paired) < .05 * (max(unpaired) - min(unpaired)))
+        self.assertEqual(calculator.stats.agi, build_calculator('combat', DarkmantleCalculator).stats.agi)
+
+    def test_scale_factors(self):
+        calculator = build_calculator('assassination', DarkmantleCalculator)
+        result = calculator.get_scale_factors(ep_stats=['agi', 'ap', 'multistrike'], iterations=20, batch_size=2,
+                                              target_error=.01)
+        self.assertEqual(result['iterations'], 2)
+        self.assertEqual(result['ep']['agi'], 1.)
+        aldriana_ep = build_calculator('assassination').get_ep(ep_stats=['ap', 'multistrike'])
+        for stat in ('ap', 'multistrike'):
+            self.assertTrue(abs(result['ep'][stat] - aldriana_ep[stat]) < .05)
+            self.assertTrue(result['standard_error'][stat] < .02)
+
+    def test_processes(self):
+        calculator = build_calculator('subtlety', DarkmantleCalculator)
+        self.assertEqual(calculator.get_scale_factors(ep_stats=['ap'], iterations=2, batch_size=2),
+                         calculator.get_scale_factors(ep_stats=['ap'], iterations=2, batch_size=2, processes=2))
@@ -0,0 +1,44 @@
+import math
+import unittest
+from shadowcraft.calcs import dual_number
+
+class TestDualNumber(unittest.TestCase):
+    def setUp(self):
+        self.x = dual_number.variable(3., 0, 2)
+        self.y = dual_number.variable(2., 1, 2)
+
+    def assertDual(self, value, real, dual):
+        self.assertAlmostEqual(value.real, real)
+        for computed, expected in zip(value.dual, dual):
+            self.assertAlmostEqual(computed, expected)
+
+    def test_arithmetic(self):
+        self.assertDual(self.x + self.y, 5., (1., 1.))
+        self.assertDual(1 - self.x, -2., (-1., 0.))
+        self.assertDual(self.x * self.y, 6., (2., 3.))
+        self.assertDual(self.x / self.y, 1.5, (.5, -.75))
+        self.assertDual(1. / self.y, .5, (0., -.25))
+        self.assertDual(-self.x * 2, -6., (-2., 0.))
+
+    def test_powers(self):
+        self.assertDual(self.x ** 2, 9., (6., 0.))
+        self.assertDual(math.e ** self.y, math.e ** 2, (0., math.e ** 2))
+        self.assertDual(self.x ** self.y, 9., (6., 9 * math.log(3)))
+
+    def test_comparisons(self):
+        self.assertTrue(self.x > self.y)
+        self.assertTrue(self.y < 2.5)
+        self.assertEqual(min(self.x, 5), self.x)
+        self.assertEqual(max(self.x, 5), 5)
+        self.assertTrue(self.x == 3)
+        self.assertDual(abs(self.y - self.x), 1., (1., -1.))
+        self.assertFalse(self.x - 3)
+
+    def test_sum(self):
+        self.assertDual(sum([self.x, self.y, 1.]), 6., (1., 1.))
+
+    def test_derivative(self):
+        self.assertEqual(dual_number.derivative(self.x * self.y, 1), 3.)
+        self.assertEqual(dual_number.derivative(4., 0), 0.)
+        self.assertEqual(dual_number.real_part(self.x), 3.)
+        self.assertEqual(dual_number.real_part(4.), 4.)
@@ -0,0 +1,88 @@
+import math
+import unittest
+from shadowcraft.calcs import fixed_point
+from shadowcraft.core import exceptions
+from shadowcraft.objects import procs
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+def are_close_enough(old_dist, new_dist, precision):
+    for key in new_dist:
+        old_values = old_dist[key] if hasattr(old_dist[key], '__iter__') else [old_dist[key]]
+        new_values = new_dist[key] if hasattr(new_dist[key], '__iter__') else [new_dist[key]]
+        for old, new in zip(old_values, new_values):
+            if abs(new - old) > precision:
+                return False
+    return True
+
+def cosine_step(distribution):
+    return {'a': math.cos(distribution['a']), 'b': [.5 * distribution['b'][0] + .25, math.cos(distribution['b'][1])]}
+
+class TestFixedPointSolver(unittest.TestCase):
+    initial = {'a': 1., 'b': [0., 1.]}
+
+    def test_flatten(self):
+        layout, values = fixed_point.flatten(self.initial)
+        self.assertEqual(values, [1., 0., 1.])
+        self.assertEqual(fixed_point.unflatten(layout, values), self.initial)
+
+    def test_methods_agree(self):
+        iterations = {}
+        for method in fixed_point.FixedPointSolver.allowed_methods:
+            solver = fixed_point.FixedPointSolver(method, tolerance=10 ** -10)
+            result = solver.solve(cosine_step, self.initial, are_close_enough)
+            self.assertTrue(solver.converged)
+            self.assertAlmostEqual(result['a'], 0.7390851332, places=8)
+            self.assertAlmostEqual(result['b'][0], .5, places=8)
+            iterations[method] = solver.iterations
+        self.assertTrue(iterations['aitken'] < iterations['none'])
+        self.assertTrue(iterations['anderson'] < iterations['none'])
+
+    def test_max_iterations(self):
+        solver = fixed_point.FixedPointSolver('none', tolerance=10 ** -10, max_iterations=5)
+        solver.solve(cosine_step, self.initial, are_close_enough)
+        self.assertEqual(solver.iterations, 5)
+        self.assertFalse(solver.converged)
+
+    def test_unknown_method(self):
+        self.assertRaises(exceptions.InvalidInputException, fixed_point.FixedPointSolver, 'newton')
+
+class TestDetermineStatsConvergence(unittest.TestCase):
+    def build(self, method):
+        calculator = build_calculator('combat')
+        calculator.stats.procs.haromms_talisman = procs.Proc(stat='stats', value={'haste': 20000, 'crit': 10000}, duration=15,
+                                                             proc_name='test', type='perc', icd=0, proc_rate=.2)
+        calculator.settings.adv_params['converge_method'] = method
+        return calculator
+
+    def test_methods_agree(self):
+        plain = self.build('none')
+        dps = plain.get_dps()
+        self.assertTrue(plain.converged)
+        self.assertTrue(plain.convergence_iterations > 1)
+        for method in ('aitken', 'anderson'):
+            calculator = self.build(method)
+            self.assertAlmostEqual(calculator.get_dps() / dps, 1., places=8)
+            self.assertTrue(calculator.convergence_iterations <= plain.convergence_iterations)
+
+    def test_iteration_cap(self):
+        calculator = self.build('none')
+        calculator.settings.adv_params['converge_max_iterations'] = 1
+        calculator.get_dps()
+        self.assertEqual(calculator.convergence_iterations, 1)
+        self.assertFalse(calculator.converged)
+
+    def test_no_convergence_needed(self):
+        calculator = build_calculator('combat')
+        calculator.get_dps()
+        self.assertEqual(calculator.convergence_iterations, 0)
+        self.assertTrue(calculator.converged)
+        # A run that needs no converging doesn't keep the last run's result.
+        capped = self.build('none')
+        capped.settings.adv_params['converge_max_iterations'] = 1
+        capped.get_dps()
+        self.assertFalse(capped.converged)
+        capped.stats.procs.haromms_talisman = procs.Proc(stat='stats', value={'haste': 20000}, duration=15,
+                                                         proc_name='test', type='perc', icd=60, proc_rate=.2)
+        capped.get_dps()
+        self.assertEqual(capped.convergence_iterations, 0)
+        self.assertTrue(capped.converged)
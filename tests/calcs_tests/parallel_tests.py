@@ -0,0 +1,24 @@
+import unittest
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestParallelRanking(unittest.TestCase):
+    def setUp(self):
+        self.calculator = build_calculator('combat')
+
+    def test_talents_ranking(self):
+        self.assertEqual(self.calculator.get_talents_ranking(), self.calculator.get_talents_ranking(processes=2))
+
+    def test_glyphs_ranking(self):
+        self.assertEqual(self.calculator.get_glyphs_ranking(), self.calculator.get_glyphs_ranking(processes=2))
+
+    def test_other_ep(self):
+        candidates = ['rogue_t16_2pc', 'rogue_t16_4pc', 'sigil_of_rampage', 'haromms_talisman', 'not_a_proc']
+        self.assertEqual(self.calculator.get_other_ep(candidates), self.calculator.get_other_ep(candidates, processes=2))
+
+    def test_toggles_restore_inputs(self):
+        dps = self.calculator.get_dps()
+        toggles = [('talents', 'anticipation'), ('glyphs', 'energy'), ('procs', 'haromms_talisman')]
+        self.calculator.get_dps_for_toggles(toggles)
+        self.assertTrue(self.calculator.stats.procs.haromms_talisman)
+        self.assertFalse(self.calculator.glyphs.vendetta)
+        self.assertAlmostEqual(self.calculator.get_dps(), dps)
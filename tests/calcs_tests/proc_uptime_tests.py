@@ -0,0 +1,35 @@
+import math
+import unittest
+from shadowcraft.calcs import proc_uptime
+from shadowcraft.objects import procs
+
+class TestProcUptime(unittest.TestCase):
+    def setUp(self):
+        self.rppm = procs.Proc(stat='stats', value={'agi': 1000}, duration=20, proc_name='rppm', proc_rate=1.2, haste_scales=True)
+        self.stacking = procs.Proc(stat='stats', value={'agi': 100}, duration=10, proc_name='stacking', proc_rate=3., max_stacks=10)
+        self.rppm_icd = procs.Proc(stat='stats', value={'agi': 1000}, duration=10, proc_name='rppm_icd', proc_rate=1., icd=55, haste_scales=True)
+        self.chance = procs.Proc(stat='stats', value={'agi': 1000}, duration=15, proc_name='chance', type='perc', proc_rate=.1, icd=0)
+        self.chance_icd = procs.Proc(stat='stats', value={'agi': 1000}, duration=15, proc_name='chance_icd', type='perc', proc_rate=.1, icd=45)
+
+    def test_rppm_uptimes(self):
+        hastes = [1., 1.25, 1.5]
+        rows = proc_uptime.rppm_uptimes([self.rppm, self.stacking, self.rppm_icd], hastes)
+        for haste, uptime in zip(hastes, rows[0]):
+            self.assertAlmostEqual(uptime, 1.1307 * (1 - math.e ** (-haste * 1.2 * 20 / 60)))
+        # Doesn't scale with haste
+        self.assertEqual(len(set(rows[1])), 1)
+        lambd = 3. * 10 / 60
+        self.assertAlmostEqual(rows[1][0], 1.1307 * (math.e ** lambd - 1) * (1 - (1 - math.e ** -lambd) ** 10))
+        for haste, uptime in zip(hastes, rows[2]):
+            self.assertAlmostEqual(uptime, 1.1307 * 10 / (60. / haste + 45))
+
+    def test_triggered_uptimes(self):
+        rows = proc_uptime.triggered_uptimes([self.chance, self.chance_icd], [[.05, .1], [.05, .1]], 300)
+        Q = .95 ** 15
+        self.assertAlmostEqual(rows[0][0], (1 - Q) * (1 - (1 - Q)) / Q)
+        self.assertAlmostEqual(rows[1][1], 15 / (45 + 10.))
+
+    def test_ramping_uptime(self):
+        self.chance.max_stacks = 5
+        self.assertAlmostEqual(proc_uptime.ramping_uptime(self.chance, 2., 300), 5 - 15 * .5 / 300)
+        self.assertAlmostEqual(proc_uptime.ramping_uptime(self.chance, .01, 300), 1.5)
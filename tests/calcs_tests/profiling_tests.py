@@ -0,0 +1,60 @@
+import cPickle
+import json
+import os
+import tempfile
+import unittest
+from shadowcraft.calcs import profiling
+from shadowcraft.calcs.darkmantle import DarkmantleCalculator
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestProfiler(unittest.TestCase):
+    def test_spans(self):
+        calculator = build_calculator('assassination')
+        dps = calculator.get_dps()
+        spans = []
+        profiler = profiling.Profiler(callback=spans.append)
+        with profiler.profile(calculator):
+            self.assertEqual(calculator.get_dps(), dps)
+        self.assertEqual(spans, profiler.spans)
+        totals = profiler.get_totals()
+        for name in ('get_dps', 'init_spec', 'set_constants', 'determine_stats', 'attack_counts', 'damage_breakdown', 'proc_uptimes'):
+            self.assertTrue(totals[name][0] > 0, name)
+        self.assertEqual(totals['get_dps'][0], 1)
+        top = spans[-1]
+        self.assertEqual((top.name, top.depth), ('get_dps', 0))
+        for span in spans[:-1]:
+            self.assertTrue(span.depth > 0)
+            self.assertTrue(top.start <= span.start and span.start + span.duration <= top.start + top.duration)
+        self.assertTrue('iterations' in [span for span in spans if span.name == 'determine_stats'][0].args)
+        self.assertTrue([span for span in spans if span.name == 'proc_uptimes'][0].args['procs'])
+
+    def test_detach(self):
+        calculator = build_calculator('combat')
+        profiler = profiling.Profiler()
+        with profiler.profile(calculator):
+            calculator.get_dps()
+        count = len(profiler.spans)
+        calculator.get_dps()
+        self.assertEqual(len(profiler.spans), count)
+        cPickle.dumps(calculator, cPickle.HIGHEST_PROTOCOL)
+
+    def test_chrome_trace(self):
+        calculator = build_calculator('subtlety')
+        profiler = profiling.Profiler()
+        with profiler.profile(calculator):
+            calculator.get_ep(ep_stats=['agi', 'haste'])
+        path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+        profiler.write_chrome_trace(path)
+        with open(path) as trace_file:
+            events = json.load(trace_file)['traceEvents']
+        os.remove(path)
+        self.assertEqual(len(events), len(profiler.spans))
+        self.assertTrue('ep_perturbations' in [event['name'] for event in events])
+        for event in events:
+            self.assertEqual(event['ph'], 'X')
+            self.assertTrue(event['dur'] >= 0)
+
+    def test_profiled_methods(self):
+        for calculator_class in (type(build_calculator('combat')), DarkmantleCalculator):
+            for method in calculator_class.profiled_methods:
+                self.assertTrue(callable(getattr(calculator_class, method)), method)
@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from shadowcraft.calcs import result_cache
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestCanonicalInputs(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(result_cache.canonical({'a': 1, 'b': [2, set([3])]}),
+                         result_cache.canonical({'b': (2., frozenset([3.])), 'a': 1.}))
+        self.assertNotEqual(result_cache.canonical(1), result_cache.canonical(True))
+
+    def test_same_inputs(self):
+        calculator = build_calculator('combat')
+        key = result_cache.get_key(calculator, ['get_dps'])
+        self.assertEqual(result_cache.get_key(build_calculator('combat'), ['get_dps']), key)
+        self.assertNotEqual(result_cache.get_key(build_calculator('subtlety'), ['get_dps']), key)
+        self.assertNotEqual(result_cache.get_key(calculator, ['get_dps_breakdown']), key)
+
+    def test_key_survives_run(self):
+        # Running the model mustn't change the key of the same calculator.
+        for spec in ('combat', 'subtlety', 'assassination'):
+            calculator = build_calculator(spec)
+            key = result_cache.get_key(calculator, ['get_dps'])
+            calculator.get_dps()
+            self.assertEqual(result_cache.get_key(calculator, ['get_dps']), key)
+
+    def test_changed_inputs(self):
+        key = result_cache.get_key(build_calculator('combat'), ['get_dps'])
+        for change in (lambda c: setattr(c.stats, 'haste', c.stats.haste + 1),
+                       lambda c: c.stats.procs.set_proc('haromms_talisman', 600),
+                       lambda c: c.stats.mh.set_enchant('elemental_force'),
+                       lambda c: setattr(c.settings.cycle, 'blade_flurry', True),
+                       lambda c: setattr(c.talents, 'anticipation', not c.talents.anticipation)):
+            calculator = build_calculator('combat')
+            change(calculator)
+            self.assertNotEqual(result_cache.get_key(calculator, ['get_dps']), key)
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'results.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hits(self):
+        cache = result_cache.ResultCache(self.path)
+        calculator = build_calculator('subtlety')
+        breakdown = calculator.get_dps_breakdown()
+        self.assertEqual(cache.get_dps_breakdown(build_calculator('subtlety')), breakdown)
+        self.assertEqual(cache.get_dps_breakdown(build_calculator('subtlety')), breakdown)
+        ep = cache.get_ep(build_calculator('subtlety'), ep_stats=['agi', 'haste'])
+        self.assertEqual(cache.get_ep(build_calculator('subtlety'), ep_stats=['agi', 'haste']), ep)
+        self.assertNotEqual(cache.get_ep(build_calculator('subtlety'), ep_stats=['agi', 'crit']), ep)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        cache.close()
+        cache = result_cache.ResultCache(self.path)
+        self.assertEqual(cache.get_dps_breakdown(build_calculator('subtlety')), breakdown)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_lru(self):
+        cache = result_cache.ResultCache(self.path, max_entries=2)
+        for key in ('a', 'b'):
+            cache.put(key, key)
+            time.sleep(.001)
+        cache.get('a')
+        time.sleep(.001)
+        cache.put('c', 'c')
+        self.assertEqual(len(cache), 2)
+        self.assertEqual([cache.get(key) for key in ('a', 'b', 'c')], ['a', None, 'c'])
+
+    def test_ttl(self):
+        cache = result_cache.ResultCache(self.path, ttl=60)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        cache.ttl = -1
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(len(cache), 0)
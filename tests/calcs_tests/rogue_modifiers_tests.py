@@ -0,0 +1,29 @@
+import unittest
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestRogueModifiersCache(unittest.TestCase):
+    def test_not_shared_between_calculators(self):
+        debuffed = build_calculator('combat')
+        debuffed.get_dps()
+        calculator = build_calculator('combat')
+        calculator.buffs.physical_vulnerability_debuff = False
+        self.assertNotEqual(calculator.get_modifiers('physical'), debuffed.get_modifiers('physical'))
+        self.assertFalse(calculator.raid_modifiers_cache is debuffed.raid_modifiers_cache)
+
+    def test_invalidated_by_input_changes(self):
+        calculator = build_calculator('combat')
+        physical_modifier = calculator.get_modifiers('physical')[0]
+        crit_modifier = calculator.get_modifiers('physical')[1]
+        calculator.buffs.physical_vulnerability_debuff = False
+        self.assertAlmostEqual(calculator.get_modifiers('physical')[0], physical_modifier / 1.04)
+        calculator.stats.gear_buffs.chaotic_metagem = True
+        self.assertNotEqual(calculator.get_modifiers('physical')[1], crit_modifier)
+        calculator.buffs.physical_vulnerability_debuff = True
+        calculator.stats.gear_buffs.chaotic_metagem = False
+        self.assertEqual(calculator.get_modifiers('physical'), (physical_modifier, crit_modifier))
+
+    def test_buff_toggle_changes_dps(self):
+        calculator = build_calculator('combat')
+        dps = calculator.get_dps()
+        calculator.buffs.spell_damage_debuff = False
+        self.assertTrue(calculator.get_dps() < dps)
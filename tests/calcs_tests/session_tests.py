@@ -0,0 +1,42 @@
+import unittest
+from shadowcraft.calcs import session
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        self.calculator = build_calculator('combat')
+        self.session = session.Session(self.calculator)
+
+    def test_matches_calculator(self):
+        self.assertAlmostEqual(self.session.get_dps(), self.calculator.get_dps(), places=6)
+        breakdown = self.calculator.get_dps_breakdown()
+        for attack, dps in self.session.get_dps_breakdown().items():
+            self.assertAlmostEqual(dps, breakdown[attack], places=6)
+
+    def test_repeated_query_is_cached(self):
+        self.session.get_dps()
+        self.session.get_dps()
+        self.assertEqual(self.session.rebuilds, {'spec': 1, 'base_stats': 0, 'results': 1})
+
+    def test_rating_change_skips_spec(self):
+        self.session.get_dps()
+        self.calculator.stats.haste += 500
+        self.assertAlmostEqual(self.session.get_dps(), self.calculator.get_dps(), places=6)
+        self.assertEqual(self.session.rebuilds, {'spec': 1, 'base_stats': 1, 'results': 2})
+
+    def test_input_changes_rebuild_spec(self):
+        dps = self.session.get_dps()
+        self.calculator.talents.anticipation = not self.calculator.talents.anticipation
+        self.assertNotAlmostEqual(self.session.get_dps(), dps)
+        self.calculator.talents.anticipation = not self.calculator.talents.anticipation
+        self.calculator.settings.cycle.revealing_strike_pooling = False
+        self.assertAlmostEqual(self.session.get_dps(), self.calculator.get_dps(), places=6)
+        self.calculator.stats.procs.set_proc('sigil_of_rampage')
+        self.assertAlmostEqual(self.session.get_dps(), self.calculator.get_dps(), places=6)
+        self.assertEqual(self.session.rebuilds['spec'], 4)
+
+    def test_invalidate(self):
+        self.session.get_dps()
+        self.session.invalidate()
+        self.session.get_dps()
+        self.assertEqual(self.session.rebuilds['spec'], 1)
@@ -0,0 +1,48 @@
+import unittest
+from shadowcraft.calcs import DamageCalculator
+from shadowcraft.calcs.rogue.Aldriana import settings
+from shadowcraft.core import exceptions
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestTargetCounts(unittest.TestCase):
+    def assertSweepMatches(self, calculator, max_targets=6):
+        swept = calculator.get_dps_for_target_counts(max_targets)
+        generic = DamageCalculator.get_dps_for_target_counts(calculator, max_targets)
+        self.assertEqual(len(swept), max_targets)
+        for swept_dps, generic_dps in zip(swept, generic):
+            self.assertAlmostEqual(swept_dps, generic_dps, places=6)
+        self.assertEqual(calculator.settings.num_boss_adds, 0)
+        return swept
+
+    def test_assassination(self):
+        dps = self.assertSweepMatches(build_calculator('assassination'))
+        # Fury of Xuen hits up to five targets.
+        self.assertTrue(dps[0] < dps[1] < dps[4])
+        self.assertAlmostEqual(dps[4], dps[5], places=6)
+
+    def test_subtlety(self):
+        self.assertSweepMatches(build_calculator('subtlety'))
+
+    def test_no_lemon_zest(self):
+        calculator = build_calculator('subtlety')
+        calculator.talents.lemon_zest = False
+        self.assertSweepMatches(calculator)
+
+    def test_blade_flurry(self):
+        calculator = build_calculator('combat')
+        calculator.settings.cycle = settings.CombatCycle(blade_flurry=True)
+        dps = self.assertSweepMatches(calculator, 3)
+        breakdowns = calculator.get_dps_breakdowns_for_target_counts(3)
+        self.assertEqual(breakdowns[0]['blade_flurry'], 0)
+        self.assertTrue(breakdowns[1]['blade_flurry'] < breakdowns[2]['blade_flurry'])
+
+    def test_timeline(self):
+        calculator = build_calculator('combat')
+        calculator.settings.timeline = settings.FightTimeline.from_settings(360)
+        self.assertSweepMatches(calculator, 3)
+
+    def test_invalid(self):
+        calculator = build_calculator('combat')
+        self.assertRaises(exceptions.InvalidInputException, calculator.get_dps_for_target_counts, 0)
+        self.assertRaises(exceptions.InvalidInputException, calculator.get_dps_for_target_counts, calculator.AOE_TARGET_CAP + 1)
+        self.assertEqual(len(calculator.get_dps_for_target_counts()), calculator.AOE_TARGET_CAP)
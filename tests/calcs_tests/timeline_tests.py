@@ -0,0 +1,83 @@
+import unittest
+from shadowcraft.calcs.rogue.Aldriana import AldrianasRogueDamageCalculator
+from shadowcraft.calcs.rogue.Aldriana import InputNotModeledException
+from shadowcraft.calcs.rogue.Aldriana import settings
+from shadowcraft.calcs.darkmantle import DarkmantleCalculator
+from shadowcraft.core import exceptions
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class CountingCalculator(AldrianasRogueDamageCalculator):
+    def phase_dps_breakdown(self, phase):
+        self.phases_evaluated.append(phase.name)
+        return super(CountingCalculator, self).phase_dps_breakdown(phase)
+
+class TestFightTimeline(unittest.TestCase):
+    def test_from_settings(self):
+        timeline = settings.FightTimeline.from_settings(700, .2)
+        self.assertEqual([(phase.name, phase.duration) for phase in timeline.phases],
+                         [('heroism', 40), ('normal', 520), ('execute', 40), ('heroism_execute', 40), ('execute', 60)])
+        self.assertEqual(timeline.get_duration(), 700)
+        self.assertAlmostEqual(timeline.get_execute_fraction(), .2)
+        self.assertEqual(timeline.phases[3].haste_multiplier, 1.3)
+        self.assertEqual([phase.name for phase in settings.FightTimeline.from_settings(300, .5, heroism=False).phases],
+                         ['normal', 'execute'])
+
+    def test_settings(self):
+        timeline = settings.FightTimeline([settings.Phase('normal', 200), settings.Phase('execute', 50, execute=True)])
+        test_settings = settings.Settings(settings.AssassinationCycle(), duration=360, timeline=timeline)
+        self.assertEqual(test_settings.duration, 250)
+        self.assertAlmostEqual(test_settings.time_in_execute_range, .2)
+
+    def test_group_phases(self):
+        timeline = settings.FightTimeline([settings.Phase('a', 10), settings.Phase('b', 20, 1.3), settings.Phase('c', 30)])
+        groups = timeline.group_phases(lambda phase: phase.haste_multiplier)
+        self.assertEqual([(phase.name, duration) for phase, duration in groups], [('a', 40), ('b', 20)])
+
+    def test_invalid(self):
+        self.assertRaises(exceptions.InvalidInputException, settings.Phase, 'a', 0)
+        self.assertRaises(exceptions.InvalidInputException, settings.Phase, 'a', 10, 0)
+        self.assertRaises(exceptions.InvalidInputException, settings.FightTimeline, [])
+
+    def test_settings_sync(self):
+        # Assigning a timeline after the settings are made syncs them too.
+        test_settings = settings.Settings(settings.CombatCycle(), duration=300, time_in_execute_range=.35)
+        test_settings.timeline = settings.FightTimeline([settings.Phase('normal', 200), settings.Phase('execute', 50, execute=True)])
+        self.assertEqual(test_settings.duration, 250)
+        self.assertAlmostEqual(test_settings.time_in_execute_range, .2)
+
+class TestTimelineDps(unittest.TestCase):
+    def test_matches_execute_blend(self):
+        # Without heroism the averaged model weights the execute range the
+        # same way a two phase timeline does.
+        calculator = build_calculator('assassination')
+        calculator.buffs.short_term_haste_buff = False
+        # The timeline's duration is a float, which the poison model
+        # doesn't treat quite like an int one.
+        calculator.settings.duration = 360.
+        dps = calculator.get_dps()
+        calculator.settings.timeline = settings.FightTimeline.from_settings(360, .35, heroism=False)
+        self.assertAlmostEqual(calculator.get_dps(), dps, places=6)
+        breakdown = calculator.get_dps_breakdown()
+        self.assertAlmostEqual(sum(breakdown.values()), dps, places=6)
+
+    def test_distinct_phases(self):
+        calculator = build_calculator('combat', CountingCalculator)
+        calculator.phases_evaluated = []
+        phases = [settings.Phase('normal', 50), settings.Phase('heroism', 40, 1.3), settings.Phase('normal', 60),
+                  settings.Phase('execute', 50, execute=True), settings.Phase('adds', 30, num_boss_adds=2)]
+        calculator.settings.timeline = settings.FightTimeline(phases)
+        calculator.get_dps()
+        self.assertEqual(calculator.phases_evaluated, ['normal', 'heroism', 'adds'])
+        self.assertEqual(calculator.settings.num_boss_adds, 0)
+
+    def test_ep(self):
+        calculator = build_calculator('subtlety')
+        calculator.settings.timeline = settings.FightTimeline.from_settings(360, .35)
+        ep = calculator.get_ep(ep_stats=['agi', 'haste'])
+        self.assertEqual(ep['agi'], 1.)
+        self.assertTrue(0 < ep['haste'] < 1)
+
+    def test_darkmantle(self):
+        calculator = build_calculator('combat', DarkmantleCalculator)
+        calculator.settings.timeline = settings.FightTimeline.from_settings(360, .35)
+        self.assertRaises(InputNotModeledException, calculator.get_dps)
@@ -0,0 +1,43 @@
+import unittest
+from shadowcraft.objects import procs
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestTriggerRows(unittest.TestCase):
+    def setUp(self):
+        self.calculator = build_calculator('assassination')
+        self.calculator.get_dps()
+        self.attacks_per_second = {
+            'mh_autoattacks': 1., 'mh_autoattack_hits': .8, 'oh_autoattacks': 1.1, 'oh_autoattack_hits': .9,
+            'mutilate': .3, 'dispatch': .2, 'main_gauche': .4, 'envenom': [0, 0, 0, .1, .05, .15],
+            'rupture': .05, 'rupture_ticks': [0, 0, 0, .2, .1, .3], 'deadly_instant_poison': .7,
+            'deadly_poison': .33, 'venomous_wounds': .25,
+        }
+        self.crit_rates = dict((key, .5) for key in self.attacks_per_second)
+
+    def proc(self, **kwargs):
+        return procs.Proc(stat='stats', value={'agi': 100}, duration=10, proc_name='test', type='perc', **kwargs)
+
+    def test_all_attacks(self):
+        proc = self.proc(trigger='all_attacks')
+        mh = .8 + .3 + .2 + .4 + .3 + .05
+        oh = .9 + .3
+        self.assertAlmostEqual(self.calculator.get_procs_per_second(proc, self.attacks_per_second, self.crit_rates), mh + oh)
+
+    def test_crit_only(self):
+        proc = self.proc(trigger='all_attacks', on_crit=True, on_procced_strikes=False)
+        mh = .5 * (1. + .3 + .2 + .3)
+        oh = .5 * (1.1 + .3)
+        self.assertAlmostEqual(self.calculator.get_procs_per_second(proc, self.attacks_per_second, self.crit_rates), mh + oh)
+
+    def test_spells_and_bleeds(self):
+        proc = self.proc(trigger='all_spells')
+        self.assertAlmostEqual(self.calculator.get_procs_per_second(proc, self.attacks_per_second, self.crit_rates), .7 + .25)
+        proc = self.proc(trigger='all_periodic_damage')
+        self.assertAlmostEqual(self.calculator.get_procs_per_second(proc, self.attacks_per_second, self.crit_rates), .33 + .6)
+
+    def test_shared_rows(self):
+        first = self.proc(trigger='strikes', proc_rate=.1)
+        second = self.proc(trigger='strikes', proc_rate=.3)
+        rates = self.calculator.get_procs_per_second_for_procs([first, second], self.attacks_per_second, self.crit_rates)
+        self.assertAlmostEqual(rates[1], 3 * rates[0])
+        self.assertTrue(self.calculator.get_trigger_row(first, 'mh') is self.calculator.get_trigger_row(second, 'mh'))
@@ -0,0 +1,57 @@
+import unittest
+from calcs_tests.aldriana_ep_tests import build_calculator
+
+class TestUpgradesEP(unittest.TestCase):
+    items = ['assurance_of_consequence', 'haromms_talisman', 'ticking_ebon_detonator', 'fury_of_xuen', 'rogue_t16_2pc', 'rogue_t14_2pc', 'bogus']
+
+    def get_brute_force_ladder(self, calculator, name, baseline_dps, normalize_dps):
+        item_level = calculator.stats.procs.item_levels.get(name, calculator.stats.procs.allowed_procs[name]['item_level'])
+        ep_values = []
+        for level in xrange(calculator.max_upgrade_level + 1):
+            calculator.stats.procs.set_proc(name, item_level + calculator.upgrade_item_level_step * level)
+            ep_values.append((calculator.get_dps() - baseline_dps) / (normalize_dps - baseline_dps))
+            delattr(calculator.stats.procs, name)
+        calculator.stats.procs.item_levels[name] = item_level
+        return ep_values
+
+    def assertLadderIsExact(self, spec):
+        calculator = build_calculator(spec)
+        dps = calculator.get_dps()
+        active_procs = calculator.stats.procs.active_procs
+        ep_values = calculator.get_upgrades_ep(self.items)
+        self.assertEqual(calculator.stats.procs.active_procs, active_procs)
+        self.assertTrue(calculator.stats.gear_buffs.rogue_t16_2pc)
+        self.assertEqual(calculator.get_dps(), dps)
+        self.assertEqual(calculator.get_upgrades_ep_fast(self.items), ep_values)
+
+        for name in self.items[:4]:
+            if getattr(calculator.stats.procs, name):
+                delattr(calculator.stats.procs, name)
+        calculator.stats.gear_buffs.rogue_t16_2pc = False
+        baseline_dps, normalize_dps = calculator.get_dps_for_stat_deltas([{}, {'agi': 1.}])
+        for name in self.items[:3]:
+            expected = self.get_brute_force_ladder(calculator, name, baseline_dps, normalize_dps)
+            for ep, expected_ep in zip(ep_values[name], expected):
+                self.assertAlmostEqual(ep, expected_ep, places=9)
+            self.assertEqual(len(ep_values[name]), calculator.max_upgrade_level + 1)
+            self.assertTrue(ep_values[name][0] < ep_values[name][1] < ep_values[name][2])
+        self.assertEqual(len(ep_values['fury_of_xuen']), 1)
+        self.assertEqual(len(ep_values['rogue_t16_2pc']), 1)
+        self.assertEqual(ep_values['bogus'], 'not allowed')
+
+    def test_assassination(self):
+        self.assertLadderIsExact('assassination')
+
+    def test_combat(self):
+        self.assertLadderIsExact('combat')
+
+    def test_subtlety(self):
+        self.assertLadderIsExact('subtlety')
+
+    def test_processes(self):
+        calculator = build_calculator('combat')
+        active_procs = calculator.stats.procs.active_procs
+        ep_values = calculator.get_upgrades_ep(self.items)
+        self.assertEqual(calculator.get_upgrades_ep(self.items, processes=2), ep_values)
+        self.assertEqual(calculator.stats.procs.active_procs, active_procs)
+        self.assertTrue(calculator.stats.gear_buffs.rogue_t16_2pc)
@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+from shadowcraft.core import data_bundle
+from shadowcraft.objects import class_data
+from shadowcraft.objects import class_data_tables
+
+class TestDataBundle(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'test.bundle')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_roundtrip(self):
+        data_bundle.write_bundle(self.path, [('ints', 'i', [1, -2, 3]), ('doubles', 'd', [.1, 2.5]), ('empty', 'd', [])], 'x' * 20)
+        bundle = data_bundle.Bundle(self.path)
+        self.assertEqual(bundle.digest, 'x' * 20)
+        self.assertTrue('ints' in bundle)
+        self.assertFalse('floats' in bundle)
+        ints = bundle.get_table('ints')
+        self.assertEqual(list(ints), [1, -2, 3])
+        self.assertEqual(ints[-1], 3)
+        self.assertRaises(IndexError, lambda: ints[3])
+        self.assertEqual(list(bundle.get_table('doubles')), [.1, 2.5])
+        self.assertEqual(len(bundle.get_table('empty')), 0)
+        self.assertRaises(data_bundle.InvalidBundleException, bundle.get_table, 'floats')
+
+    def test_invalid(self):
+        self.assertRaises(data_bundle.InvalidBundleException, data_bundle.write_bundle, self.path, [('floats', 'f', [1.])], 'x' * 20)
+        with open(self.path, 'wb') as bundle_file:
+            bundle_file.write('not a bundle, but long enough to have a header')
+        self.assertRaises(data_bundle.InvalidBundleException, data_bundle.Bundle, self.path)
+
+    def test_class_data_bundle(self):
+        # The shipped bundle must be built from the current tables.
+        bundle = data_bundle.Bundle(class_data.bundle_path)
+        self.assertEqual(bundle.digest, class_data.get_tables_digest())
+        for name, type_code, values in class_data.build_tables():
+            self.assertEqual(list(bundle.get_table(name)), list(values))
+        self.assertEqual(len(bundle.get_table('random_prop_points')), len(class_data_tables.RANDOM_PROP_POINTS) * class_data.random_prop_point_columns)
+
+    def test_stale_bundle(self):
+        data_bundle.write_bundle(self.path, [('random_prop_points', 'i', [])], 'x' * 20)
+        bundle_path = class_data.bundle_path
+        tables = [(name, getattr(class_data.Util(), name)) for name in class_data.Util.table_names]
+        class_data.bundle_path = self.path
+        try:
+            class_data.load_tables()
+            tools = class_data.Util()
+            self.assertEqual(tools.get_random_prop_point(572), class_data_tables.RANDOM_PROP_POINTS[572][1][0])
+            self.assertEqual(tools.get_spell_scaling('rogue', 90), class_data_tables.SPELL_SCALING_VALUES[4][89])
+        finally:
+            class_data.bundle_path = bundle_path
+            for name, table in tables:
+                setattr(class_data.Util, name, table)
@@ -0,0 +1,37 @@
+import cPickle
+import unittest
+from shadowcraft.core import exceptions
+from shadowcraft.objects import class_data
+from shadowcraft.objects import class_data_tables
+from shadowcraft.objects import procs
+
+class TestUtil(unittest.TestCase):
+    def setUp(self):
+        self.tools = class_data.Util()
+
+    def test_singleton(self):
+        self.assertTrue(class_data.Util() is self.tools)
+        self.assertTrue(cPickle.loads(cPickle.dumps(self.tools, cPickle.HIGHEST_PROTOCOL)) is self.tools)
+
+    def test_tables(self):
+        for item_level in (1, 90, 572, 999):
+            self.assertEqual(self.tools.get_random_prop_point(item_level), class_data_tables.RANDOM_PROP_POINTS[item_level][1][0])
+        self.assertEqual(self.tools.get_random_prop_points([572, 576, 580]), [self.tools.get_random_prop_point(item_level) for item_level in (572, 576, 580)])
+        self.assertEqual(self.tools.get_spell_scaling('rogue', 90), class_data_tables.SPELL_SCALING_VALUES[4][89])
+        self.assertEqual(self.tools.get_agi_per_crit('rogue', 90), class_data_tables.AGI_PER_CRIT_VALUES[4][89])
+        self.assertEqual(self.tools.get_constant_scale_point(90), class_data_tables.WEAPON_PROC_SCALE_POINTS[89])
+        self.assertEqual(self.tools.get_class_number('rogue'), 4)
+
+    def test_exceptions(self):
+        self.assertRaises(exceptions.InvalidInputException, self.tools.get_random_prop_point, 0)
+        self.assertRaises(exceptions.InvalidInputException, self.tools.get_random_prop_points, [572, 0])
+        self.assertRaises(exceptions.InvalidInputException, self.tools.get_constant_scale_point, 0)
+        self.assertRaises(exceptions.InvalidInputException, self.tools.get_class_number, 'demon_hunter')
+
+    def test_proc_values(self):
+        procs_list = procs.ProcsList(('assurance_of_consequence', 572))
+        proc = procs_list.assurance_of_consequence
+        values = proc.get_values_for_item_levels([572, 580])
+        self.assertEqual(values[0], proc.value)
+        procs_list.set_proc('assurance_of_consequence', 580)
+        self.assertEqual(values[1], procs_list.assurance_of_consequence.value)
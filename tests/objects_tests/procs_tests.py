@@ -1,3 +1,4 @@
+import cPickle
 import unittest
 from shadowcraft.objects import procs
     
@@ -26,6 +27,50 @@ class TestProcsList(unittest.TestCase):
         self.assertEqual(len(self.procsList.get_all_damage_procs()), 0)
 
 
+class TestActiveProcs(unittest.TestCase):
+    def setUp(self):
+        self.procsList = procs.ProcsList(('haromms_talisman', 580), ('assurance_of_consequence', 580), 'fury_of_xuen')
+
+    def test_active_procs_follow_allowed_order(self):
+        names = [name for name in procs.ProcsList.allowed_procs if getattr(self.procsList, name)]
+        self.assertEqual([proc.proc_name for proc in self.procsList.active_procs], [getattr(self.procsList, name).proc_name for name in names])
+
+    def test_set_and_delete(self):
+        delattr(self.procsList, 'fury_of_xuen')
+        self.assertEqual(len(self.procsList.get_all_procs_for_stat()), 2)
+        self.assertEqual(len(self.procsList.get_all_damage_procs()), 0)
+        self.procsList.set_proc('touch_of_the_grave')
+        self.assertEqual(len(self.procsList.get_all_damage_procs()), 1)
+        self.assertEqual(len(self.procsList.get_all_procs_for_stat('agi')), 2)
+
+    def test_set_proc_keeps_item_level(self):
+        value = dict(self.procsList.haromms_talisman.value)
+        delattr(self.procsList, 'haromms_talisman')
+        self.procsList.set_proc('haromms_talisman')
+        self.assertEqual(self.procsList.haromms_talisman.item_level, 580)
+        self.assertEqual(self.procsList.haromms_talisman.value, value)
+
+    def test_lists_do_not_share_proc_data(self):
+        other = procs.ProcsList(('haromms_talisman', 620))
+        self.assertNotEqual(other.haromms_talisman.value, self.procsList.haromms_talisman.value)
+        self.procsList.haromms_talisman.value['agi'] = 0
+        self.assertNotEqual(other.haromms_talisman.value['agi'], 0)
+
+    def test_slots(self):
+        proc = self.procsList.haromms_talisman
+        self.assertFalse(hasattr(proc, '__dict__'))
+        self.assertFalse(getattr(proc, 'mh_only', False))
+        self.assertRaises(AttributeError, setattr, proc, 'not_a_proc_attribute', 1)
+
+    def test_pickle(self):
+        self.procsList.haromms_talisman.uptime = .25
+        for protocol in (0, cPickle.HIGHEST_PROTOCOL):
+            copy = cPickle.loads(cPickle.dumps(self.procsList, protocol))
+            self.assertEqual(len(copy.active_procs), 3)
+            self.assertEqual(copy.haromms_talisman.uptime, .25)
+            self.assertEqual(copy.haromms_talisman.value, self.procsList.haromms_talisman.value)
+
+
 class TestProc(unittest.TestCase):
     def setUp(self):
         self.proc = procs.Proc(**procs.ProcsList.allowed_procs['prestors_talisman_of_machination'])
@@ -6,14 +6,35 @@ sys.path.append(path.abspath(path.join(path.dirname(__file__), '..')))
 
 from calcs_tests import TestDamageCalculator
 from calcs_tests.armor_mitigation_tests import TestArmorMitigation
+from calcs_tests.aldriana_ep_tests import TestAldrianasBatchedEP, TestAldrianasGradientEP
+from calcs_tests.dual_number_tests import TestDualNumber
+from calcs_tests.parallel_tests import TestParallelRanking
+from calcs_tests.rogue_modifiers_tests import TestRogueModifiersCache
+from calcs_tests.session_tests import TestSession
+from calcs_tests.fixed_point_tests import TestFixedPointSolver, TestDetermineStatsConvergence
+from calcs_tests.proc_uptime_tests import TestProcUptime
+from calcs_tests.trigger_rows_tests import TestTriggerRows
+from calcs_tests.character_batch_tests import TestCharacterBatch
+from calcs_tests.apl_tests import TestParser, TestPriorityList
+from calcs_tests.timeline_tests import TestFightTimeline, TestTimelineDps
+from calcs_tests.result_cache_tests import TestCanonicalInputs, TestResultCache
+from calcs_tests.damage_formula_tests import TestDamageFormulas
+from calcs_tests.target_count_tests import TestTargetCounts
+from calcs_tests.profiling_tests import TestProfiler
+from calcs_tests.benchmark_tests import TestBenchmark
+from calcs_tests.upgrades_ep_tests import TestUpgradesEP
+from calcs_tests.cold_start_tests import TestColdStart
+from calcs_tests.darkmantle_tests import TestEngine, TestDarkmantleCalculator, TestDarkmantleMonteCarlo, TestDarkmantleScaleFactors
 from calcs_tests.rogue_tests import TestRogueDamageCalculator
 from calcs_tests.rogue_tests import TestRogueDamageCalculatorLevels
 from calcs_tests.rogue_tests.Aldriana_tests import TestAldrianasRogueDamageCalculator
 from core_tests.exceptions_tests import TestInvalidInputException
+from core_tests.data_bundle_tests import TestDataBundle
 from objects_tests.buffs_tests import TestBuffsTrue, TestBuffsFalse, TestBuffsLevel
 from objects_tests.stats_tests import TestStats, TestWeapon, TestGearBuffs
-from objects_tests.procs_tests import TestProcsList, TestProc
+from objects_tests.procs_tests import TestProcsList, TestActiveProcs, TestProc
 from objects_tests.race_tests import TestRace
+from objects_tests.class_data_tests import TestUtil
 from objects_tests.rogue_tests.rogue_glyphs_tests import TestRogueGlyphs
 from objects_tests.rogue_tests.rogue_talents_tests import TestAssassinationTalents
 from objects_tests.rogue_tests.rogue_talents_tests import TestCombatTalents